@@ -7,34 +7,56 @@ AIECS - AI Execute Services
 
 A powerful Python middleware framework for building AI-powered applications
 with tool orchestration, task execution, and multi-provider LLM support.
+
+Top-level exports are resolved lazily on first attribute access, so
+``import aiecs`` does not pull in Celery, database drivers or provider SDKs
+for processes that only need part of the package.
 """
 
+from typing import TYPE_CHECKING, Dict
+
+from aiecs.utils.lazy_exports import make_lazy_module
+
 __version__ = "2.1.2"
 __author__ = "AIECS Team"
 __email__ = "iretbl@gmail.com"
 
-# Core imports - these should work without configuration
-from .aiecs_client import (
-    AIECS,
-    create_aiecs_client,
-    create_simple_client,
-    create_full_client,
-)
-from .domain.task.task_context import TaskContext
-
-# Configuration
-from .config.config import get_settings, validate_required_settings
+# Export name -> defining module (relative to this package)
+_LAZY_IMPORTS: Dict[str, str] = {
+    # Core API
+    "AIECS": ".aiecs_client",
+    "create_aiecs_client": ".aiecs_client",
+    "create_simple_client": ".aiecs_client",
+    "create_full_client": ".aiecs_client",
+    "TaskContext": ".domain.task.task_context",
+    # Configuration
+    "get_settings": ".config.config",
+    "validate_required_settings": ".config.config",
+    # Tool system
+    "discover_tools": ".tools",
+    "list_tools": ".tools",
+    "get_tool": ".tools",
+    "register_tool": ".tools",
+    # Infrastructure components (advanced usage)
+    # These classes only require configuration when actually used
+    "DatabaseManager": ".infrastructure.persistence.database_manager",
+    "CeleryTaskManager": ".infrastructure.messaging.celery_task_manager",
+    # LLM providers
+    "LLMClientFactory": ".llm.client_factory",
+    "AIProvider": ".llm.client_factory",
+}
 
-# Tool system - safe to import
-from .tools import discover_tools, list_tools, get_tool, register_tool
+if TYPE_CHECKING:
+    from .aiecs_client import AIECS, create_aiecs_client, create_simple_client, create_full_client
+    from .domain.task.task_context import TaskContext
+    from .config.config import get_settings, validate_required_settings
+    from .tools import discover_tools, list_tools, get_tool, register_tool
+    from .infrastructure.persistence.database_manager import DatabaseManager
+    from .infrastructure.messaging.celery_task_manager import CeleryTaskManager
+    from .llm.client_factory import LLMClientFactory, AIProvider
 
-# Infrastructure components - can be imported safely (for advanced usage)
-# These classes only require configuration when actually used
-from .infrastructure.persistence.database_manager import DatabaseManager
-from .infrastructure.messaging.celery_task_manager import CeleryTaskManager
 
-# LLM providers
-from .llm.client_factory import LLMClientFactory, AIProvider
+__getattr__, __dir__ = make_lazy_module(__name__, _LAZY_IMPORTS)
 
 
 def get_fastapi_app():
@@ -69,6 +69,26 @@ class Settings(BaseSettings):
 
     # Infrastructure Configuration (with sensible defaults)
     celery_broker_url: str = Field(default="redis://localhost:6379/0", alias="CELERY_BROKER_URL")
+    celery_worker_reuse_services: bool = Field(
+        default=True,
+        alias="CELERY_WORKER_REUSE_SERVICES",
+        description="Reuse one service instance per (mode, service) across tasks in a worker process",
+    )
+    progress_channel_backend: str = Field(
+        default="redis",
+        alias="PROGRESS_CHANNEL_BACKEND",
+        description="Pub/sub channel carrying task progress from workers to Socket.IO replicas: redis | memory",
+    )
+    progress_channel_url: str = Field(
+        default="",
+        alias="PROGRESS_CHANNEL_URL",
+        description="Redis URL for the progress channel (defaults to CELERY_BROKER_URL)",
+    )
+    progress_coalesce_ms: int = Field(
+        default=100,
+        alias="PROGRESS_COALESCE_MS",
+        description="Window for coalescing non-terminal progress updates per task before emitting (0 disables)",
+    )
     cors_allowed_origins: str = Field(
         default="http://localhost:3000,http://express-gateway:3001",
         alias="CORS_ALLOWED_ORIGINS",
@@ -141,6 +161,16 @@ class Settings(BaseSettings):
         alias="TM_POSTGRES_AUTO_CREATE_TABLES",
         description="Auto-apply tm_episode/tm_fact DDL on initialize (dev); use migration in prod",
     )
+    tm_postgres_text_search_config: str = Field(
+        default="simple",
+        alias="TM_POSTGRES_TEXT_SEARCH_CONFIG",
+        description="Postgres text search configuration for tm_fact.text_tsv (e.g. simple, english)",
+    )
+    tm_postgres_trigram: bool = Field(
+        default=False,
+        alias="TM_POSTGRES_TRIGRAM",
+        description="Use the pg_trgm index on tm_fact.text for substring and fuzzy matching",
+    )
     tm_graph_backend: str = Field(
         default="falkordb",
         alias="TM_GRAPH_BACKEND",
@@ -11,32 +11,59 @@ This module provides the core interfaces and abstractions including:
 - Service registry (no dependencies, safe to import anywhere)
 """
 
-# Core interfaces
-from .interface.execution_interface import (
-    ExecutionInterface,
-    IToolProvider,
-    IToolExecutor,
-    ICacheProvider,
-    IOperationExecutor,
-)
+from typing import TYPE_CHECKING, Dict
 
-from .interface.storage_interface import (
-    ISessionStorage,
-    IConversationStorage,
-    ICheckpointStorage,
-    ITaskContextStorage,
-    IStorageBackend,
-    ICheckpointerBackend,
-)
+from aiecs.utils.lazy_exports import make_lazy_module
+
+# Resolved on first access: the service registry has no dependencies, but the
+# execution interfaces import the domain models, which must not load just because
+# something imported aiecs.core.registry (e.g. via aiecs.config).
+_LAZY_IMPORTS: Dict[str, str] = {
+    "ExecutionInterface": ".interface.execution_interface",
+    "IToolProvider": ".interface.execution_interface",
+    "IToolExecutor": ".interface.execution_interface",
+    "ICacheProvider": ".interface.execution_interface",
+    "IOperationExecutor": ".interface.execution_interface",
+    "ISessionStorage": ".interface.storage_interface",
+    "IConversationStorage": ".interface.storage_interface",
+    "ICheckpointStorage": ".interface.storage_interface",
+    "ITaskContextStorage": ".interface.storage_interface",
+    "IStorageBackend": ".interface.storage_interface",
+    "ICheckpointerBackend": ".interface.storage_interface",
+    "AI_SERVICE_REGISTRY": ".registry",
+    "register_ai_service": ".registry",
+    "get_ai_service": ".registry",
+    "list_registered_services": ".registry",
+    "clear_registry": ".registry",
+}
+
+if TYPE_CHECKING:
+    from .interface.execution_interface import (
+        ExecutionInterface,
+        IToolProvider,
+        IToolExecutor,
+        ICacheProvider,
+        IOperationExecutor,
+    )
+    from .interface.storage_interface import (
+        ISessionStorage,
+        IConversationStorage,
+        ICheckpointStorage,
+        ITaskContextStorage,
+        IStorageBackend,
+        ICheckpointerBackend,
+    )
+    from .registry import (
+        AI_SERVICE_REGISTRY,
+        register_ai_service,
+        get_ai_service,
+        list_registered_services,
+        clear_registry,
+    )
+
+
+__getattr__, __dir__ = make_lazy_module(__name__, _LAZY_IMPORTS)
 
-# Service registry (zero dependencies, safe for module-level imports)
-from .registry import (
-    AI_SERVICE_REGISTRY,
-    register_ai_service,
-    get_ai_service,
-    list_registered_services,
-    clear_registry,
-)
 
 __all__ = [
     # Execution interfaces
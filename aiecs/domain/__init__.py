@@ -7,147 +7,260 @@
 Contains business logic and domain models.
 """
 
-from .execution.model import TaskStepResult, TaskStatus, ErrorCode
-from .task.model import TaskContext, DSLStep
-from .task.dsl_processor import DSLProcessor
-from .context import (
-    ContextEngine,
-    SessionMetrics,
-    ConversationMessage,
-    ConversationParticipant,
-    ConversationSession,
-    AgentCommunicationMessage,
-    create_session_key,
-    validate_conversation_isolation_pattern,
-)
-from .community import (
-    # Core managers
-    CommunityManager,
-    CommunityIntegration,
-    DecisionEngine,
-    ResourceManager,
-    CollaborativeWorkflowEngine,
-    CommunityAnalytics,
-    MemberLifecycleHooks,
-    # Communication and context
-    CommunicationHub,
-    Message,
-    Event,
-    MessageType,
-    EventType,
-    SharedContextManager,
-    SharedContext,
-    ContextScope,
-    ContextConflictStrategy,
-    # Agent adapters
-    AgentAdapter,
-    StandardLLMAdapter,
-    CustomAgentAdapter,
-    AgentAdapterRegistry,
-    AgentCapability,
-    # Builder
-    CommunityBuilder,
-    builder,
-    # Enums
-    CommunityRole,
-    GovernanceType,
-    DecisionStatus,
-    ResourceType,
-    ConsensusAlgorithm,
-    ConflictResolutionStrategy,
-    # Models
-    CommunityMember,
-    CommunityResource,
-    CommunityDecision,
-    AgentCommunity,
-    CollaborationSession,
-    # Exceptions
-    CommunityException,
-    CommunityNotFoundError,
-    MemberNotFoundError,
-    ResourceNotFoundError,
-    DecisionNotFoundError,
-    AccessDeniedError,
-    MembershipError,
-    VotingError,
-    GovernanceError,
-    CollaborationError,
-    CommunityInitializationError,
-    CommunityValidationError,
-    QuorumNotMetError,
-    ConflictResolutionError,
-    CommunityCapacityError,
-    AgentAdapterError,
-    CommunicationError,
-    ContextError,
-)
+from typing import TYPE_CHECKING, Dict
+
+from aiecs.utils.lazy_exports import make_lazy_module
+
+# Export name -> defining module, resolved on first access. Importing one domain
+# model (e.g. aiecs.domain.execution.model) must not load agents, LLM clients and
+# community features through this package.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "TaskStepResult": ".execution.model",
+    "TaskStatus": ".execution.model",
+    "ErrorCode": ".execution.model",
+    "TaskContext": ".task.model",
+    "DSLStep": ".task.model",
+    "DSLProcessor": ".task.dsl_processor",
+    "ContextEngine": ".context",
+    "SessionMetrics": ".context",
+    "ConversationMessage": ".context",
+    "ConversationParticipant": ".context",
+    "ConversationSession": ".context",
+    "AgentCommunicationMessage": ".context",
+    "create_session_key": ".context",
+    "validate_conversation_isolation_pattern": ".context",
+    "CommunityManager": ".community",
+    "CommunityIntegration": ".community",
+    "DecisionEngine": ".community",
+    "ResourceManager": ".community",
+    "CollaborativeWorkflowEngine": ".community",
+    "CommunityAnalytics": ".community",
+    "MemberLifecycleHooks": ".community",
+    "CommunicationHub": ".community",
+    "Message": ".community",
+    "Event": ".community",
+    "MessageType": ".community",
+    "EventType": ".community",
+    "SharedContextManager": ".community",
+    "SharedContext": ".community",
+    "ContextScope": ".community",
+    "ContextConflictStrategy": ".community",
+    "AgentAdapter": ".community",
+    "StandardLLMAdapter": ".community",
+    "CustomAgentAdapter": ".community",
+    "AgentAdapterRegistry": ".community",
+    "AgentCapability": ".community",
+    "CommunityBuilder": ".community",
+    "builder": ".community",
+    "CommunityRole": ".community",
+    "GovernanceType": ".community",
+    "DecisionStatus": ".community",
+    "ResourceType": ".community",
+    "ConsensusAlgorithm": ".community",
+    "ConflictResolutionStrategy": ".community",
+    "CommunityMember": ".community",
+    "CommunityResource": ".community",
+    "CommunityDecision": ".community",
+    "AgentCommunity": ".community",
+    "CollaborationSession": ".community",
+    "CommunityException": ".community",
+    "CommunityNotFoundError": ".community",
+    "MemberNotFoundError": ".community",
+    "ResourceNotFoundError": ".community",
+    "DecisionNotFoundError": ".community",
+    "AccessDeniedError": ".community",
+    "MembershipError": ".community",
+    "VotingError": ".community",
+    "GovernanceError": ".community",
+    "CollaborationError": ".community",
+    "CommunityInitializationError": ".community",
+    "CommunityValidationError": ".community",
+    "QuorumNotMetError": ".community",
+    "ConflictResolutionError": ".community",
+    "CommunityCapacityError": ".community",
+    "AgentAdapterError": ".community",
+    "CommunicationError": ".community",
+    "ContextError": ".community",
+    "AgentException": ".agent",
+    "AgentNotFoundError": ".agent",
+    "AgentAlreadyRegisteredError": ".agent",
+    "InvalidStateTransitionError": ".agent",
+    "ConfigurationError": ".agent",
+    "TaskExecutionError": ".agent",
+    "ToolAccessDeniedError": ".agent",
+    "SerializationError": ".agent",
+    "AgentInitializationError": ".agent",
+    "AgentState": ".agent",
+    "AgentType": ".agent",
+    "GoalStatus": ".agent",
+    "GoalPriority": ".agent",
+    "CapabilityLevel": ".agent",
+    "MemoryType": ".agent",
+    "RetryPolicy": ".agent",
+    "AgentConfiguration": ".agent",
+    "AgentGoal": ".agent",
+    "AgentCapabilityDeclaration": ".agent",
+    "AgentMetrics": ".agent",
+    "AgentInteraction": ".agent",
+    "AgentMemory": ".agent",
+    "BaseAIAgent": ".agent",
+    "LLMAgent": ".agent",
+    "ToolAgent": ".agent",
+    "HybridAgent": ".agent",
+    "AgentRegistry": ".agent",
+    "AgentLifecycleManager": ".agent",
+    "get_global_registry": ".agent",
+    "get_global_lifecycle_manager": ".agent",
+    "InMemoryPersistence": ".agent",
+    "FilePersistence": ".agent",
+    "get_global_persistence": ".agent",
+    "set_global_persistence": ".agent",
+    "AgentController": ".agent",
+    "LoggingObserver": ".agent",
+    "MetricsObserver": ".agent",
+    "PromptTemplate": ".agent",
+    "ChatPromptTemplate": ".agent",
+    "MessageBuilder": ".agent",
+    "ToolSchemaGenerator": ".agent",
+    "generate_tool_schema": ".agent",
+    "ConversationMemory": ".agent",
+    "Session": ".agent",
+    "ContextEngineAdapter": ".agent",
+    "EnhancedRetryPolicy": ".agent",
+    "RoleConfiguration": ".agent",
+    "ContextCompressor": ".agent",
+    "compress_messages": ".agent",
+    "LegacyAgentWrapper": ".agent",
+    "convert_langchain_prompt": ".agent",
+    "convert_legacy_config": ".agent",
+}
+
+if TYPE_CHECKING:
+    from .execution.model import TaskStepResult, TaskStatus, ErrorCode
+    from .task.model import TaskContext, DSLStep
+    from .task.dsl_processor import DSLProcessor
+    from .context import (
+        ContextEngine,
+        SessionMetrics,
+        ConversationMessage,
+        ConversationParticipant,
+        ConversationSession,
+        AgentCommunicationMessage,
+        create_session_key,
+        validate_conversation_isolation_pattern,
+    )
+    from .community import (
+        CommunityManager,
+        CommunityIntegration,
+        DecisionEngine,
+        ResourceManager,
+        CollaborativeWorkflowEngine,
+        CommunityAnalytics,
+        MemberLifecycleHooks,
+        CommunicationHub,
+        Message,
+        Event,
+        MessageType,
+        EventType,
+        SharedContextManager,
+        SharedContext,
+        ContextScope,
+        ContextConflictStrategy,
+        AgentAdapter,
+        StandardLLMAdapter,
+        CustomAgentAdapter,
+        AgentAdapterRegistry,
+        AgentCapability,
+        CommunityBuilder,
+        builder,
+        CommunityRole,
+        GovernanceType,
+        DecisionStatus,
+        ResourceType,
+        ConsensusAlgorithm,
+        ConflictResolutionStrategy,
+        CommunityMember,
+        CommunityResource,
+        CommunityDecision,
+        AgentCommunity,
+        CollaborationSession,
+        CommunityException,
+        CommunityNotFoundError,
+        MemberNotFoundError,
+        ResourceNotFoundError,
+        DecisionNotFoundError,
+        AccessDeniedError,
+        MembershipError,
+        VotingError,
+        GovernanceError,
+        CollaborationError,
+        CommunityInitializationError,
+        CommunityValidationError,
+        QuorumNotMetError,
+        ConflictResolutionError,
+        CommunityCapacityError,
+        AgentAdapterError,
+        CommunicationError,
+        ContextError,
+    )
+    from .agent import (
+        AgentException,
+        AgentNotFoundError,
+        AgentAlreadyRegisteredError,
+        InvalidStateTransitionError,
+        ConfigurationError,
+        TaskExecutionError,
+        ToolAccessDeniedError,
+        SerializationError,
+        AgentInitializationError,
+        AgentState,
+        AgentType,
+        GoalStatus,
+        GoalPriority,
+        CapabilityLevel,
+        MemoryType,
+        RetryPolicy,
+        AgentConfiguration,
+        AgentGoal,
+        AgentCapabilityDeclaration,
+        AgentMetrics,
+        AgentInteraction,
+        AgentMemory,
+        BaseAIAgent,
+        LLMAgent,
+        ToolAgent,
+        HybridAgent,
+        AgentRegistry,
+        AgentLifecycleManager,
+        get_global_registry,
+        get_global_lifecycle_manager,
+        InMemoryPersistence,
+        FilePersistence,
+        get_global_persistence,
+        set_global_persistence,
+        AgentController,
+        LoggingObserver,
+        MetricsObserver,
+        PromptTemplate,
+        ChatPromptTemplate,
+        MessageBuilder,
+        ToolSchemaGenerator,
+        generate_tool_schema,
+        ConversationMemory,
+        Session,
+        ContextEngineAdapter,
+        EnhancedRetryPolicy,
+        RoleConfiguration,
+        ContextCompressor,
+        compress_messages,
+        LegacyAgentWrapper,
+        convert_langchain_prompt,
+        convert_legacy_config,
+    )
+
+
+__getattr__, __dir__ = make_lazy_module(__name__, _LAZY_IMPORTS)
 
-from .agent import (
-    # Exceptions
-    AgentException,
-    AgentNotFoundError,
-    AgentAlreadyRegisteredError,
-    InvalidStateTransitionError,
-    ConfigurationError,
-    TaskExecutionError,
-    ToolAccessDeniedError,
-    SerializationError,
-    AgentInitializationError,
-    # Enums
-    AgentState,
-    AgentType,
-    GoalStatus,
-    GoalPriority,
-    CapabilityLevel,
-    MemoryType,
-    # Models
-    RetryPolicy,
-    AgentConfiguration,
-    AgentGoal,
-    AgentCapabilityDeclaration,
-    AgentMetrics,
-    AgentInteraction,
-    AgentMemory,
-    # Base and Concrete Agents
-    BaseAIAgent,
-    LLMAgent,
-    ToolAgent,
-    HybridAgent,
-    # Lifecycle Management
-    AgentRegistry,
-    AgentLifecycleManager,
-    get_global_registry,
-    get_global_lifecycle_manager,
-    # Persistence
-    InMemoryPersistence,
-    FilePersistence,
-    get_global_persistence,
-    set_global_persistence,
-    # Observability
-    AgentController,
-    LoggingObserver,
-    MetricsObserver,
-    # Prompts
-    PromptTemplate,
-    ChatPromptTemplate,
-    MessageBuilder,
-    # Tools
-    ToolSchemaGenerator,
-    generate_tool_schema,
-    # Memory
-    ConversationMemory,
-    Session,
-    # Integration
-    ContextEngineAdapter,
-    EnhancedRetryPolicy,
-    RoleConfiguration,
-    ContextCompressor,
-    compress_messages,
-    # Migration
-    LegacyAgentWrapper,
-    convert_langchain_prompt,
-    convert_legacy_config,
-)
 
 __all__ = [
     # Execution domain
@@ -1994,6 +1994,41 @@ class HybridAgent(BaseAIAgent):
             ]
         return []
 
+    def _is_parallel_safe_tool(self, tool_name: str) -> bool:
+        """Whether calls to ``tool_name`` may run concurrently with other parallel-safe calls."""
+        if tool_name in self._config.parallel_safe_tools:
+            return True
+        tool = (self._tool_instances or {}).get(tool_name)
+        return getattr(type(tool), "parallel_safe", False) is True
+
+    def _parse_parallel_safe_tool_call(
+        self,
+        tool_call: Dict[str, Any],
+        excluded_tool_names: Any,
+    ) -> Optional[tuple]:
+        """Parse ``tool_call`` into ``(tool_name, operation, parameters)`` when it can run concurrently.
+
+        Returns None for calls that must stay on the serial path (unknown or
+        non parallel-safe tools, kernel-excluded tools, malformed arguments).
+        """
+        try:
+            func_name = tool_call["function"]["name"]
+            func_args = tool_call["function"]["arguments"]
+            if func_name in excluded_tool_names:
+                return None
+            tool_name, operation = self._parse_function_name(func_name)
+            if not self._is_parallel_safe_tool(tool_name):
+                return None
+            if isinstance(func_args, str):
+                parameters = json.loads(func_args)
+            else:
+                parameters = func_args if func_args else {}
+        except Exception:
+            return None
+        if not isinstance(parameters, dict):
+            return None
+        return tool_name, operation, parameters
+
     async def _process_tool_calls_batch(
         self,
         *,
@@ -2012,6 +2047,8 @@ class HybridAgent(BaseAIAgent):
         Execute a batch of tool calls, append messages, and update ``state``.
 
         When ``event_callback`` is provided (streaming), it is awaited with event dicts.
+        With ``parallel_tool_calls`` enabled, consecutive parallel-safe calls run
+        concurrently while messages, steps and events keep the original call order.
         """
         if compression_ctx is None:
             compression_ctx = ToolLoopCompressionContext(enabled=False)
@@ -2039,10 +2076,81 @@ class HybridAgent(BaseAIAgent):
         # D13 (D2-04): import here so the check below can use it without a per-iteration import.
         from aiecs.domain.agent.plugins.dawp.tools_filter import DAWP_EXCLUDED_TOOL_NAMES
 
+        async def _dispatch(
+            index: int,
+            tool_name: str,
+            operation: str | None,
+            parameters: Dict[str, Any],
+            tool_call_id: str,
+        ) -> Any:
+            async def _execute() -> Any:
+                return await self._execute_tool(tool_name, operation, parameters)
+
+            if plugin_ctx is not None:
+                nested_hooks = bool(plugin_ctx.plugin_state.get("dawp.active_run_id"))
+                return await dispatch_tool_with_hooks(
+                    plugin_ctx,
+                    tool_name=tool_name,
+                    tool_input=parameters,
+                    tool_call_id=tool_call_id,
+                    iteration=iteration,
+                    batch_tool_call_count=batch_count,
+                    batch_index=index,
+                    assistant_turn_committed=True,
+                    offload=True,
+                    compression_ctx=compression_ctx,
+                    execute_tool=_execute,
+                    nested=nested_hooks,
+                )
+            return await self._dispatch_tool_without_hooks(
+                tool_name=tool_name,
+                operation=operation,
+                parameters=parameters,
+                tool_call_id=tool_call_id,
+                compression_ctx=compression_ctx,
+            )
+
+        # Concurrent batch mode: runs of consecutive parallel-safe calls are started
+        # together (bounded by a per-batch semaphore) and their results are consumed
+        # below in the original call order. Non parallel-safe calls act as barriers.
+        parallel_limit = self._config.parallel_tool_calls_max_concurrency if self._config.parallel_tool_calls and batch_count > 1 else 0
+        parallel_semaphore = asyncio.Semaphore(parallel_limit) if parallel_limit else None
+        prefetched: Dict[int, tuple] = {}
+
+        async def _launch_parallel_segment(start: int) -> None:
+            segment: List[tuple] = []
+            for j in range(start, batch_count):
+                parsed = self._parse_parallel_safe_tool_call(tool_calls_to_process[j], DAWP_EXCLUDED_TOOL_NAMES)
+                if parsed is None:
+                    break
+                segment.append((j, *parsed))
+            if len(segment) < 2:
+                return
+
+            async def _run_bounded(j: int, name: str, op: str | None, params: Dict[str, Any]) -> Any:
+                assert parallel_semaphore is not None
+                async with parallel_semaphore:
+                    return await _dispatch(j, name, op, params, tool_calls_to_process[j].get("id") or f"call_{j}")
+
+            for j, name, op, params in segment:
+                if event_callback is not None:
+                    await event_callback(
+                        {
+                            "type": "tool_call",
+                            "tool_name": name,
+                            "operation": op,
+                            "parameters": params,
+                            "timestamp": datetime.utcnow().isoformat(),
+                        }
+                    )
+                prefetched[j] = (name, op, params, asyncio.ensure_future(_run_bounded(j, name, op, params)))
+
         try:
             for i, tool_call in enumerate(tool_calls_to_process):
                 tool_name = "unknown"
                 tool_call_id = tool_call.get("id") or f"call_{i}"
+                if parallel_limit and i not in prefetched:
+                    await _launch_parallel_segment(i)
                 try:
                     func_name = tool_call["function"]["name"]
                     func_args = tool_call["function"]["arguments"]
@@ -2104,55 +2212,29 @@ class HybridAgent(BaseAIAgent):
                         )
                         continue
 
-                    tool_name, operation = self._parse_function_name(func_name)
-
-                    if isinstance(func_args, str):
-                        parameters = json.loads(func_args)
+                    if i in prefetched:
+                        tool_name, operation, parameters, pending = prefetched.pop(i)
+                        hook_result = await pending
                     else:
-                        parameters = func_args if func_args else {}
+                        tool_name, operation = self._parse_function_name(func_name)
 
-                    if event_callback is not None:
-                        await event_callback(
-                            {
-                                "type": "tool_call",
-                                "tool_name": tool_name,
-                                "operation": operation,
-                                "parameters": parameters,
-                                "timestamp": datetime.utcnow().isoformat(),
-                            }
-                        )
+                        if isinstance(func_args, str):
+                            parameters = json.loads(func_args)
+                        else:
+                            parameters = func_args if func_args else {}
 
-                    async def _execute(
-                        _tool_name: str = tool_name,
-                        _operation: str | None = operation,
-                        _parameters: Dict[str, Any] = parameters,
-                    ) -> Any:
-                        return await self._execute_tool(_tool_name, _operation, _parameters)
+                        if event_callback is not None:
+                            await event_callback(
+                                {
+                                    "type": "tool_call",
+                                    "tool_name": tool_name,
+                                    "operation": operation,
+                                    "parameters": parameters,
+                                    "timestamp": datetime.utcnow().isoformat(),
+                                }
+                            )
 
-                    if plugin_ctx is not None:
-                        nested_hooks = bool(plugin_ctx.plugin_state.get("dawp.active_run_id"))
-                        hook_result = await dispatch_tool_with_hooks(
-                            plugin_ctx,
-                            tool_name=tool_name,
-                            tool_input=parameters,
-                            tool_call_id=tool_call_id,
-                            iteration=iteration,
-                            batch_tool_call_count=batch_count,
-                            batch_index=i,
-                            assistant_turn_committed=True,
-                            offload=True,
-                            compression_ctx=compression_ctx,
-                            execute_tool=_execute,
-                            nested=nested_hooks,
-                        )
-                    else:
-                        hook_result = await self._dispatch_tool_without_hooks(
-                            tool_name=tool_name,
-                            operation=operation,
-                            parameters=parameters,
-                            tool_call_id=tool_call_id,
-                            compression_ctx=compression_ctx,
-                        )
+                        hook_result = await _dispatch(i, tool_name, operation, parameters, tool_call_id)
 
                     if hook_result.blocked or hook_result.error_message:
                         error_content = hook_result.tool_content or hook_result.error_message or hook_result.block_reason
@@ -2293,6 +2375,11 @@ class HybridAgent(BaseAIAgent):
                         )
                     )
         finally:
+            # Early exits (stop conditions) leave already-started parallel calls behind.
+            for _name, _op, _params, pending in prefetched.values():
+                pending.cancel()
+            if prefetched:
+                await asyncio.gather(*(entry[3] for entry in prefetched.values()), return_exceptions=True)
             if plugin_ctx is not None:
                 plugin_ctx.event_sink = event_sink_backup
 
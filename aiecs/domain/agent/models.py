@@ -263,6 +263,21 @@ class AgentConfiguration(BaseModel):
         "(contains '<!DOCTYPE html>' or '<html' AND '</html>'). "
         "Example: [{'type': 'html_document'}, {'type': 'regex', 'pattern': r'FINAL_ANSWER:'}].",
     )
+    parallel_tool_calls: bool = Field(
+        default=False,
+        description="Run consecutive parallel-safe tool calls of one LLM tool batch concurrently. "
+        "Tool messages, steps and streaming events are still emitted in the original call order; "
+        "tools that are not parallel-safe act as ordering barriers and run alone.",
+    )
+    parallel_tool_calls_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of tool calls executed concurrently within one tool batch.",
+    )
+    parallel_safe_tools: List[str] = Field(
+        default_factory=list,
+        description="Tool names treated as parallel-safe (read-only) in addition to tools whose " "class sets ``parallel_safe = True``.",
+    )
     deterministic_gates: Optional[List[str]] = Field(
         default=None,
         description="GVR deterministic gate ids for L2 pre-exit scoring (A-4). "
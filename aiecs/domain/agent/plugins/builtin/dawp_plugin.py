@@ -119,6 +119,7 @@ class DawpPlugin(BaseAgentPlugin):
 
         from aiecs.domain.agent.plugins.dawp.document_path_policy import (
             configure_document_path_policy,
+            document_path_policy_key,
         )
 
         configure_document_path_policy(ctx.plugin_state, self._config.options)
@@ -126,7 +127,10 @@ class DawpPlugin(BaseAgentPlugin):
         if document_path:
             path = Path(document_path)
             try:
-                workflow = document_loader.compile_file(path)
+                workflow = document_loader.compile_file(
+                    path,
+                    policy_key=document_path_policy_key(ctx.plugin_state),
+                )
             except DawpDocumentError as exc:
                 logger.warning(
                     "DawpPlugin: failed to compile %s: %s",
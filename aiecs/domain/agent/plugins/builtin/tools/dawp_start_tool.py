@@ -104,6 +104,7 @@ async def handle_dawp_start(
         workflow = None
         if document_path:
             from aiecs.domain.agent.plugins.dawp.document_path_policy import (
+                document_path_policy_key,
                 validate_static_document_path,
             )
 
@@ -116,7 +117,10 @@ async def handle_dawp_start(
 
             assert resolved is not None
             try:
-                workflow = document_loader.compile_file(resolved)
+                workflow = document_loader.compile_file(
+                    resolved,
+                    policy_key=document_path_policy_key(plugin_state),
+                )
             except DawpDocumentError as exc:
                 return {"status": "rejected", "reason": str(exc)}
             except OSError as exc:
@@ -174,7 +178,7 @@ async def handle_dawp_start(
         from aiecs.domain.agent.plugins.dawp.schema import DawpDocumentError
 
         try:
-            workflow = document_loader.compile(
+            workflow = document_loader.compile_cached(
                 document_content,
                 dynamic_workflow_limits=limits or None,
             )
@@ -0,0 +1,169 @@
+# /*---------------------------------------------------------------------------------------------
+#  *  Copyright (c) IRETBL Corporation. All rights reserved.
+#  *  Licensed under the Apache-2.0. See License.txt in the project root for license information.
+#  *--------------------------------------------------------------------------------------------*/
+"""
+Process-wide compile cache for DAWP workflow documents.
+
+``DawpPlugin.on_pre_task``, ``dawp_start`` and ``workflow_registry`` compile the
+same ``*.dawp.md`` documents over and over; this module keeps the compiled
+:class:`~aiecs.domain.agent.plugins.dawp.schema.DAWPWorkflow` objects so a
+document is parsed once per content version.
+
+Keys
+----
+- **File documents** — ``(content sha256, limits, policy)``.  A side index maps
+  ``(resolved path, st_mtime_ns, st_size)`` to the content digest so unchanged
+  files are served from a single ``stat`` without being re-read; an edited file
+  gets a new stat key, is re-read and re-hashed.
+- **Inline documents** (``workflow_source='dynamic'``) — ``(content sha256, limits)``.
+
+``limits`` is the ``dynamic_workflow_limits`` dict (it changes the compiled
+result); ``policy`` is the caller's document-path policy key (see
+:func:`~aiecs.domain.agent.plugins.dawp.document_path_policy.document_path_policy_key`)
+so entries compiled under one allowlist are never served under another.
+
+Cached workflows are shared between callers and therefore immutable (the
+schema models are frozen).  Only successful compilations are cached; failures
+raise every time.  The cache is an LRU bounded by ``DAWP_COMPILE_CACHE_MAX_ENTRIES``
+(default 256).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Literal
+
+from .metrics import get_dawp_metrics
+from .schema import DAWPWorkflow
+
+CompileSourceLabel = Literal["file", "inline"]
+
+DEFAULT_MAX_ENTRIES = 256
+
+_StatKey = tuple[str, int, int]
+
+
+def content_digest(source: str) -> str:
+    """Return the sha256 hex digest of document *source*."""
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def limits_key(limits: dict[str, Any] | None) -> str | None:
+    """Return a stable key for a ``dynamic_workflow_limits`` dict (``None`` when unset)."""
+    if limits is None:
+        return None
+    return json.dumps(limits, sort_keys=True, default=str)
+
+
+class DawpCompileCache:
+    """Bounded LRU of compiled workflows plus a stat → content-digest index."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[Hashable, DAWPWorkflow] = OrderedDict()
+        self._file_digests: OrderedDict[_StatKey, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # -- file stat index ---------------------------------------------------
+
+    def file_digest(self, stat_key: _StatKey) -> str | None:
+        """Return the content digest recorded for *stat_key*, if any."""
+        with self._lock:
+            digest = self._file_digests.get(stat_key)
+            if digest is not None:
+                self._file_digests.move_to_end(stat_key)
+            return digest
+
+    def remember_file_digest(self, stat_key: _StatKey, digest: str) -> None:
+        """Record that the file at *stat_key* has content *digest*."""
+        with self._lock:
+            self._file_digests[stat_key] = digest
+            self._file_digests.move_to_end(stat_key)
+            while len(self._file_digests) > self.max_entries:
+                self._file_digests.popitem(last=False)
+
+    # -- compiled entries --------------------------------------------------
+
+    def get(self, key: Hashable, *, source: CompileSourceLabel) -> DAWPWorkflow | None:
+        """Return the cached workflow for *key* and record a hit or miss."""
+        with self._lock:
+            workflow = self._entries.get(key)
+            if workflow is None:
+                self._misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        get_dawp_metrics().record_compile_cache(source=source, hit=workflow is not None)
+        return workflow
+
+    def put(self, key: Hashable, workflow: DAWPWorkflow) -> DAWPWorkflow:
+        """Store *workflow* under *key*, evicting least-recently-used entries."""
+        with self._lock:
+            self._entries[key] = workflow
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return workflow
+
+    def get_or_compile(
+        self,
+        key: Hashable,
+        compile_fn: Callable[[], DAWPWorkflow],
+        *,
+        source: CompileSourceLabel,
+    ) -> DAWPWorkflow:
+        """Return the cached workflow for *key*, compiling and storing it on a miss.
+
+        Concurrent misses on the same key may both compile; the result is identical.
+        """
+        workflow = self.get(key, source=source)
+        if workflow is not None:
+            return workflow
+        return self.put(key, compile_fn())
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._file_digests.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+
+_cache: DawpCompileCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_compile_cache() -> DawpCompileCache:
+    """Return the process-wide compile cache (sized by ``DAWP_COMPILE_CACHE_MAX_ENTRIES``)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = DawpCompileCache(int(os.environ.get("DAWP_COMPILE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)))
+    return _cache
+
+
+def reset_compile_cache_for_tests() -> None:
+    """Reset singleton (unit tests only)."""
+    global _cache
+    _cache = None
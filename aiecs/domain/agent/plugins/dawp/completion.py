@@ -11,6 +11,8 @@ Public API
 - :func:`_visible_assistant_text` — strip ``<thinking>…</thinking>`` from raw LLM output
 - :func:`iter_scannable_lines`    — yield scannable lines (skip fences & blockquotes)
 - :func:`marker_detected`         — whole-line exact match on scannable lines
+- :class:`MarkerMatcher`          — all tokens of a workflow, one pass per text
+- :class:`IncrementalMarkerScanner`— per-run scanner that only scans newly streamed text
 - :func:`prompt_step_complete`    — state-machine result for one DAWP step iteration
 - :func:`matches_response_trigger`— ``on_response_trigger`` check with ``trigger_once`` guard
 
@@ -34,15 +36,26 @@ Rule references (§6.0.2, §6.0.2.2):
 - Blockquote lines (``>`` prefix) — skipped entirely.
 - ``<thinking>`` blocks — stripped by ``_visible_assistant_text`` before line scan.
 - Indented code blocks (4-space/tab) — optional; v2.5.1 minimum is fence + blockquote only.
+
+Multi-token scanning
+--------------------
+Markers and triggers are whole-line exact matches, so every token of a workflow
+is checked with one set lookup per scannable line (:class:`MarkerMatcher`):
+the text is stripped and line-scanned once no matter how many Markers and
+triggers are configured.  :class:`IncrementalMarkerScanner` keeps an offset into
+accumulated assistant text and, at each checkpoint, only scans what was
+appended since the last committed line boundary.
 """
 
 from __future__ import annotations
 
 import re
-from typing import Any, Iterator, Literal
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Literal
 
 _MARKER_RE = re.compile(r"^<[A-Z0-9_]+>$")
 _THINKING_RE = re.compile(r"<thinking>.*?</thinking>", re.DOTALL | re.IGNORECASE)
+_THINKING_OPEN_RE = re.compile(r"<thinking>", re.IGNORECASE)
 
 
 # ---------------------------------------------------------------------------
@@ -105,11 +118,17 @@ def iter_scannable_lines(visible_text: str) -> Iterator[str]:
         ``line.strip()`` for each scannable line (empty strings included when the
         original line was blank but scannable).
     """
-    inside_fence = False
+    yield from _scan_lines(visible_text, [False])
+
+
+def _scan_lines(visible_text: str, fence_state: list[bool]) -> Iterator[str]:
+    """:func:`iter_scannable_lines` with the fence flag carried in ``fence_state[0]``."""
+    inside_fence = fence_state[0]
     for line in visible_text.splitlines():
         stripped = line.strip()
         if stripped.startswith("```"):
             inside_fence = not inside_fence
+            fence_state[0] = inside_fence
             continue
         if inside_fence:
             continue
@@ -136,6 +155,120 @@ def marker_detected(visible_text: str, marker: str) -> bool:
     return any(line == marker for line in iter_scannable_lines(visible_text))
 
 
+# ---------------------------------------------------------------------------
+# Multi-token matching
+# ---------------------------------------------------------------------------
+
+
+class MarkerMatcher:
+    """All Marker / trigger tokens of a workflow, matched in a single line scan.
+
+    ``matcher.scan(raw)`` returns exactly the tokens for which
+    ``marker_detected(_visible_assistant_text(raw), token)`` is ``True``, but
+    strips ``<thinking>`` and walks the scannable lines only once.
+    """
+
+    __slots__ = ("tokens",)
+
+    def __init__(self, tokens: Iterable[str]) -> None:
+        self.tokens: frozenset[str] = frozenset(tokens)
+
+    def match_lines(self, visible_text: str, fence_state: list[bool] | None = None) -> set[str]:
+        """Return tokens found on scannable lines of already-visible text."""
+        tokens = self.tokens
+        found: set[str] = set()
+        if not tokens:
+            return found
+        for line in _scan_lines(visible_text, fence_state if fence_state is not None else [False]):
+            if line in tokens:
+                found.add(line)
+        return found
+
+    def scan(self, assistant_text: str) -> set[str]:
+        """Return tokens detected in raw *assistant_text* (``<thinking>`` stripped here)."""
+        return self.match_lines(_visible_assistant_text(assistant_text))
+
+
+@lru_cache(maxsize=256)
+def _matcher_for(tokens: frozenset[str]) -> MarkerMatcher:
+    return MarkerMatcher(tokens)
+
+
+def get_marker_matcher(tokens: Iterable[str]) -> MarkerMatcher:
+    """Return a shared :class:`MarkerMatcher` for *tokens* (cached per token set)."""
+    return _matcher_for(frozenset(tokens))
+
+
+class IncrementalMarkerScanner:
+    """Per-run scanner over *accumulated* assistant text.
+
+    Each :meth:`feed` receives the full text so far.  When it extends the text
+    seen before, only the part after the last committed line boundary is
+    scanned; otherwise (a new response) the scanner restarts from offset 0.
+
+    The committed offset only advances to just after a newline that lies
+    outside any ``<thinking>`` block, together with the fence state at that
+    point.  The remainder (the current partial line and an unclosed
+    ``<thinking>`` block, which the full-text regex still treats as visible)
+    is re-scanned provisionally on every feed, so results always equal a full
+    scan of the text at that checkpoint.
+    """
+
+    def __init__(self, matcher: MarkerMatcher) -> None:
+        self.matcher = matcher
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all scanned text."""
+        self._prefix = ""
+        self._inside_fence = False
+        self._committed: set[str] = set()
+
+    @property
+    def offset(self) -> int:
+        """Length of the committed (fully scanned) prefix."""
+        return len(self._prefix)
+
+    def feed(self, assistant_text: str) -> set[str]:
+        """Return tokens detected in *assistant_text*, scanning only new text."""
+        if not assistant_text.startswith(self._prefix):
+            self.reset()
+
+        start = len(self._prefix)
+        pos = start
+        commit_raw = start
+        commit_visible = 0
+        parts: list[str] = []
+        visible_len = 0
+
+        for block in _THINKING_RE.finditer(assistant_text, start):
+            segment = assistant_text[pos : block.start()]
+            newline = segment.rfind("\n")
+            if newline != -1:
+                commit_raw = pos + newline + 1
+                commit_visible = visible_len + newline + 1
+            parts.append(segment)
+            visible_len += len(segment)
+            pos = block.end()
+
+        segment = assistant_text[pos:]
+        opener = _THINKING_OPEN_RE.search(segment)
+        newline = segment.rfind("\n", 0, opener.start() if opener else len(segment))
+        if newline != -1:
+            commit_raw = pos + newline + 1
+            commit_visible = visible_len + newline + 1
+        parts.append(segment)
+
+        visible = "".join(parts)
+        fence_state = [self._inside_fence]
+        self._committed |= self.matcher.match_lines(visible[:commit_visible], fence_state)
+        self._inside_fence = fence_state[0]
+        if commit_raw != start:
+            self._prefix = assistant_text[:commit_raw]
+
+        return self._committed | self.matcher.match_lines(visible[commit_visible:], [self._inside_fence])
+
+
 # ---------------------------------------------------------------------------
 # Step completion state machine
 # ---------------------------------------------------------------------------
@@ -166,18 +299,28 @@ def prompt_step_complete(
           output; the step must produce ``dawp_marker`` to complete (§6.0.2 末步规则).
         - **Non-last step, ``dawp_marker`` seen**: ``"dawp_done"`` — early run handoff allowed.
     """
-    visible = _visible_assistant_text(assistant_text)
+    found = get_marker_matcher((prompt_marker, dawp_marker)).scan(assistant_text)
+    return step_state_from_markers(found, prompt_marker=prompt_marker, dawp_marker=dawp_marker, is_last=is_last)
 
+
+def step_state_from_markers(
+    found: set[str],
+    *,
+    prompt_marker: str,
+    dawp_marker: str,
+    is_last: bool,
+) -> Literal["prompt_done", "dawp_done", "continue"]:
+    """Apply the :func:`prompt_step_complete` rules to an already-scanned token set."""
     if is_last:
-        if marker_detected(visible, dawp_marker):
+        if dawp_marker in found:
             return "dawp_done"
         # Last step: seeing only prompt_marker is a mis-label → keep running
         return "continue"
 
     # Non-last step
-    if marker_detected(visible, prompt_marker):
+    if prompt_marker in found:
         return "prompt_done"
-    if marker_detected(visible, dawp_marker):
+    if dawp_marker in found:
         # Early handoff: non-last step signals run completion
         return "dawp_done"
     return "continue"
@@ -214,14 +357,30 @@ def matches_response_trigger(
         ``True`` when the trigger is detected *and* (``trigger_once`` is ``False`` or the
         trigger has not fired yet in this task).
     """
+    if trigger_once and plugin_state.get(f"dawp.triggered.{dawp_trigger}"):
+        return False
+
+    detected = dawp_trigger in get_marker_matcher((dawp_trigger,)).scan(assistant_text)
+    return response_trigger_fired(dawp_trigger, detected, trigger_once=trigger_once, plugin_state=plugin_state)
+
+
+def response_trigger_fired(
+    dawp_trigger: str,
+    detected: bool,
+    *,
+    trigger_once: bool = True,
+    plugin_state: dict[str, Any],
+) -> bool:
+    """Apply the ``trigger_once`` guard to an already-scanned detection result.
+
+    Used with a shared :class:`MarkerMatcher` scan so several triggers are checked
+    against one pass over the text; semantics match :func:`matches_response_trigger`.
+    """
     state_key = f"dawp.triggered.{dawp_trigger}"
 
     if trigger_once and plugin_state.get(state_key):
         return False
 
-    visible = _visible_assistant_text(assistant_text)
-    detected = marker_detected(visible, dawp_trigger)
-
     if detected and trigger_once:
         plugin_state[state_key] = True
 
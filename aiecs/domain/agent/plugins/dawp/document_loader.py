@@ -31,6 +31,11 @@ When ``dynamic_workflow_limits`` is provided :func:`compile` enforces hard caps
 - ``max_iterations_per_prompt`` — per-step iteration cap; applied as
   ``min(declared, limit)`` (or just ``limit`` when the step has no explicit cap).
 
+Caching
+-------
+:func:`compile_file` and :func:`compile_cached` go through the process-wide
+:mod:`~aiecs.domain.agent.plugins.dawp.compile_cache`; :func:`compile` always parses.
+
 ``require_remaining_budget`` is intentionally **not** checked here; that guard
 lives in the ``dawp_start`` handler which has access to the live budget object.
 """
@@ -44,6 +49,7 @@ from typing import Any
 import yaml
 from pydantic import ValidationError
 
+from .compile_cache import content_digest, get_compile_cache, limits_key
 from .schema import (
     Activation,
     Contract,
@@ -401,10 +407,11 @@ def _apply_dynamic_limits(
     *,
     path: str | None,
 ) -> DAWPWorkflow:
-    """Enforce post-parse limits on *workflow*; return (possibly mutated) workflow.
+    """Enforce post-parse limits on *workflow*; return the capped workflow.
 
     Checks ``max_prompts`` and ``max_contract_action_chars``; applies
-    ``max_iterations_per_prompt`` cap to each step in place.
+    ``max_iterations_per_prompt`` cap to each step (steps are frozen, so a
+    new workflow is returned).
 
     Raises:
         DawpDocumentError: When ``max_prompts`` or ``max_contract_action_chars`` exceeded.
@@ -426,13 +433,9 @@ def _apply_dynamic_limits(
 
     max_iter = int(limits.get("max_iterations_per_prompt", _DEFAULT_LIMITS["max_iterations_per_prompt"]))
     # Apply iteration cap to each step: min(declared, limit), or just limit when unset
-    for step in workflow.steps:
-        if step.max_iterations is None:
-            step.max_iterations = max_iter
-        else:
-            step.max_iterations = min(step.max_iterations, max_iter)
+    steps = [step.model_copy(update={"max_iterations": max_iter if step.max_iterations is None else min(step.max_iterations, max_iter)}) for step in workflow.steps]
 
-    return workflow
+    return workflow.model_copy(update={"steps": steps})
 
 
 # ---------------------------------------------------------------------------
@@ -490,26 +493,79 @@ def compile(  # noqa: A001  (shadows builtin; intentional for this domain)
 
     # 7. Post-parse limits enforcement (§4.6, D11 — dynamic only)
     if dynamic_workflow_limits is not None:
-        _apply_dynamic_limits(workflow, dynamic_workflow_limits, path=path)
+        workflow = _apply_dynamic_limits(workflow, dynamic_workflow_limits, path=path)
 
     return workflow
 
 
+def compile_cached(
+    source: str,
+    *,
+    path: str | None = None,
+    dynamic_workflow_limits: dict[str, Any] | None = None,
+) -> DAWPWorkflow:
+    """Like :func:`compile`, but served from the process-wide compile cache.
+
+    Used for inline (``workflow_source='dynamic'``) documents; entries are keyed
+    by the sha256 of *source* and the limits.  The returned workflow is shared
+    and frozen.
+
+    Raises:
+        DawpDocumentError: On any parse or validation failure (never cached).
+    """
+    cache = get_compile_cache()
+    key = ("inline", content_digest(source), limits_key(dynamic_workflow_limits))
+    return cache.get_or_compile(
+        key,
+        lambda: compile(source, path=path, dynamic_workflow_limits=dynamic_workflow_limits),
+        source="inline",
+    )
+
+
 def compile_file(
     path: str | Path,
     *,
     dynamic_workflow_limits: dict[str, Any] | None = None,
+    policy_key: str | None = None,
+    use_cache: bool = True,
 ) -> DAWPWorkflow:
-    """Convenience wrapper: read ``path`` and compile via :func:`compile`.
+    """Read ``path`` and compile via :func:`compile`, using the compile cache.
+
+    Unchanged files (same resolved path, ``st_mtime_ns`` and ``st_size``) are
+    served without re-reading; otherwise the file is read and looked up by
+    content hash, so only new content is parsed.  The returned workflow is
+    shared and frozen.
 
     Args:
         path:                    Path to a ``*.dawp.md`` file.
         dynamic_workflow_limits: Passed through to :func:`compile`.
+        policy_key:              Document-path policy the caller validated *path*
+                                 against (``document_path_policy_key``); part of the key.
+        use_cache:               ``False`` always re-reads and re-compiles.
 
     Raises:
         DawpDocumentError: On any parse or validation failure.
         OSError:           If the file cannot be read.
     """
     p = Path(path)
-    source = p.read_text(encoding="utf-8")
-    return compile(source, path=str(p), dynamic_workflow_limits=dynamic_workflow_limits)
+    if not use_cache:
+        text = p.read_text(encoding="utf-8")
+        return compile(text, path=str(p), dynamic_workflow_limits=dynamic_workflow_limits)
+
+    cache = get_compile_cache()
+    resolved = p.resolve()
+    st = resolved.stat()
+    stat_key = (str(resolved), st.st_mtime_ns, st.st_size)
+
+    digest = cache.file_digest(stat_key)
+    source: str | None = None
+    if digest is None:
+        source = p.read_text(encoding="utf-8")
+        digest = content_digest(source)
+        cache.remember_file_digest(stat_key, digest)
+
+    def _compile() -> DAWPWorkflow:
+        text = source if source is not None else p.read_text(encoding="utf-8")
+        return compile(text, path=str(p), dynamic_workflow_limits=dynamic_workflow_limits)
+
+    return cache.get_or_compile(("file", digest, limits_key(dynamic_workflow_limits), policy_key), _compile, source="file")
@@ -71,3 +71,10 @@ def validate_static_document_path(
             continue
 
     return None, f"document_path {document_path!r} is not under allowed DAWP document roots"
+
+
+def document_path_policy_key(plugin_state: dict[str, Any]) -> str:
+    """Return a stable key for the configured allowlist (compile cache partitioning)."""
+    roots = sorted(plugin_state.get("dawp.allowed_document_roots") or [])
+    files = sorted(plugin_state.get("dawp.allowed_document_files") or [])
+    return "roots=" + "|".join(roots) + ";files=" + "|".join(files)
@@ -15,6 +15,7 @@ logger = logging.getLogger(__name__)
 
 TriggerLabel = Literal["config", "tool"]
 SourceLabel = Literal["static", "dynamic"]
+CompileCacheSourceLabel = Literal["file", "inline"]
 
 _MetricHandle = Any
 
@@ -38,6 +39,8 @@ class DawpMetrics:
         self._run_total: _MetricHandle = _NoOpLabeled()
         self._run_failed_total: _MetricHandle = _NoOpLabeled()
         self._step_duration: _MetricHandle = _NoOpLabeled()
+        self._compile_cache_hits: _MetricHandle = _NoOpLabeled()
+        self._compile_cache_misses: _MetricHandle = _NoOpLabeled()
         self._init_prometheus()
 
     def _init_prometheus(self) -> None:
@@ -63,6 +66,16 @@ class DawpMetrics:
                 "DAWP prompt-chain step duration in seconds",
                 ["workflow_id", "trigger", "workflow_source"],
             )
+            self._compile_cache_hits = Counter(
+                "dawp_compile_cache_hits_total",
+                "DAWP document compilations served from the compile cache",
+                ["source"],
+            )
+            self._compile_cache_misses = Counter(
+                "dawp_compile_cache_misses_total",
+                "DAWP document compilations that missed the compile cache",
+                ["source"],
+            )
             self.available = True
         except Exception as exc:
             logger.warning("Failed to register DAWP metrics: %s", exc)
@@ -100,6 +113,11 @@ class DawpMetrics:
             workflow_source=workflow_source,
         ).observe(duration_seconds)
 
+    def record_compile_cache(self, *, source: CompileCacheSourceLabel, hit: bool) -> None:
+        """Record a compile cache lookup for a file or inline document."""
+        counter = self._compile_cache_hits if hit else self._compile_cache_misses
+        counter.labels(source=source).inc()
+
     @contextmanager
     def observe_step_duration(
         self,
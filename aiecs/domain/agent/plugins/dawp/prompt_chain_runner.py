@@ -179,10 +179,13 @@ async def run_prompt_chain(
     plugin_state["dawp._steps_completed"] = []
     plugin_state.pop("dawp._failed_step_index", None)
 
+    from aiecs.domain.agent.plugins.dawp.completion import IncrementalMarkerScanner, get_marker_matcher
     from aiecs.domain.agent.plugins.dawp.step_handlers import (
         StepIterationContext,
         evaluate_step_completion,
     )
+
+    marker_scanner = IncrementalMarkerScanner(get_marker_matcher((contract.prompt_marker, contract.dawp_marker)))
     from aiecs.domain.agent.plugins.dawp.loop_scope import (
         build_dawp_step_completed,
         build_dawp_step_started,
@@ -311,6 +314,7 @@ async def run_prompt_chain(
                             had_tool_calls=had_tool_calls,
                             result_success=True,
                             completion=step.completion,
+                            scanner=marker_scanner,
                         )
                     )
                     logger.debug(
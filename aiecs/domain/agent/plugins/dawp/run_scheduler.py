@@ -19,7 +19,10 @@ Supported placement types (§4.2)
     Matches when ``phase="on_iteration_end"`` and the ``dawp_trigger`` token appears
     on a *scannable line* (§6.0.2.2) of *assistant_text*.  Respects ``trigger_once``
     via ``plugin_state["dawp.triggered.<token>"]`` (managed by
-    :func:`~completion.matches_response_trigger`).
+    :func:`~completion.response_trigger_fired`).  All triggers are matched in one
+    pass over the text by a per-task :class:`~completion.IncrementalMarkerScanner`
+    (``plugin_state["dawp._trigger_scanner"]``), which only scans newly appended
+    text when the same response grows between checkpoints.
 
 Design constraints
 ------------------
@@ -38,12 +41,17 @@ from typing import Any, Callable, Literal
 
 from typing import cast
 
-from aiecs.domain.agent.plugins.dawp.completion import matches_response_trigger
+from aiecs.domain.agent.plugins.dawp.completion import (
+    IncrementalMarkerScanner,
+    get_marker_matcher,
+    response_trigger_fired,
+)
 from aiecs.domain.agent.plugins.dawp.schema import Activation, DawpPendingRun
 
 logger = logging.getLogger(__name__)
 
 _PENDING_KEY = "dawp.pending"
+_TRIGGER_SCANNER_KEY = "dawp._trigger_scanner"
 
 # ---------------------------------------------------------------------------
 # Guard type alias
@@ -70,6 +78,23 @@ def _ensure_pending_queue(plugin_state: dict[str, Any]) -> list[DawpPendingRun]:
     return cast(list[DawpPendingRun], plugin_state[_PENDING_KEY])
 
 
+def _detect_triggers(
+    workflow_activations: list[tuple[str, Activation]],
+    plugin_state: dict[str, Any],
+    assistant_text: str,
+) -> set[str]:
+    """Scan *assistant_text* once for every ``on_response_trigger`` token."""
+    tokens = [activation.placement.dawp_trigger for _, activation in workflow_activations if activation.placement.type == "on_response_trigger"]
+    if not tokens:
+        return set()
+    matcher = get_marker_matcher(tokens)
+    scanner = plugin_state.get(_TRIGGER_SCANNER_KEY)
+    if not isinstance(scanner, IncrementalMarkerScanner) or scanner.matcher is not matcher:
+        scanner = IncrementalMarkerScanner(matcher)
+        plugin_state[_TRIGGER_SCANNER_KEY] = scanner
+    return scanner.feed(assistant_text)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -107,7 +132,8 @@ def schedule_at_checkpoint(
             - ``"dawp.pending"`` — FIFO queue of :class:`~schema.DawpPendingRun`
               (auto-created if absent).
             - ``"dawp.triggered.<token>"`` — trigger_once guard flags (maintained
-              by :func:`~completion.matches_response_trigger`).
+              by :func:`~completion.response_trigger_fired`).
+            - ``"dawp._trigger_scanner"`` — incremental trigger scanner for the task.
         assistant_text:
             Most-recent assistant response (raw; ``<thinking>`` stripped internally).
             Required for ``on_response_trigger`` matching; ignored for
@@ -130,6 +156,9 @@ def schedule_at_checkpoint(
     """
     pending = _ensure_pending_queue(plugin_state)
     newly_enqueued: list[DawpPendingRun] = []
+    detected: set[str] = set()
+    if phase == "on_iteration_end" and assistant_text is not None:
+        detected = _detect_triggers(workflow_activations, plugin_state, assistant_text)
 
     for workflow_id, activation in workflow_activations:
         placement = activation.placement
@@ -145,9 +174,9 @@ def schedule_at_checkpoint(
                     workflow_id,
                 )
             else:
-                matched = matches_response_trigger(
-                    assistant_text,
+                matched = response_trigger_fired(
                     placement.dawp_trigger,
+                    placement.dawp_trigger in detected,
                     trigger_once=placement.trigger_once,
                     plugin_state=plugin_state,
                 )
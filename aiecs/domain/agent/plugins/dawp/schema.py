@@ -17,6 +17,9 @@ Defines the internal compiled representation of a DAWP workflow and supporting t
 - :class:`DawpPendingRun` — enqueued run awaiting drain
 - :class:`DawpDocumentError` — compilation failure exception
 
+Compiled workflow models are frozen: ``document_loader`` shares them process-wide
+through the compile cache, so derive variants with ``model_copy(update=...)``.
+
 References: CUSTOM_REASONING_PLUGIN_DESIGN.md §5.4, §6.1, §6.0.2.1.
 Rejected placement types (v2.3+): ``after_response_index``, ``on_tool_result_trigger``.
 """
@@ -26,7 +29,7 @@ from __future__ import annotations
 import re
 from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 _MARKER_RE = re.compile(r"^<[A-Z0-9_]+>$")
 
@@ -48,6 +51,8 @@ def _validate_marker_format(name: str, value: str) -> str:
 class PreMainLoopPlacement(BaseModel):
     """Run DAWP before the main loop starts (§4.2)."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["pre_main_loop"] = "pre_main_loop"
 
 
@@ -58,6 +63,8 @@ class OnResponseTriggerPlacement(BaseModel):
     ``trigger_once`` (default ``True``) prevents re-activation after the first match.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["on_response_trigger"] = "on_response_trigger"
     dawp_trigger: str
     trigger_once: bool = True
@@ -91,6 +98,8 @@ class Contract(BaseModel):
     and be ≤25 characters total (§6.0.2.1).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     action: str
     prompt_marker: str
     dawp_marker: str
@@ -120,6 +129,8 @@ class Contract(BaseModel):
 class MarkerCompletion(BaseModel):
     """Step completion via marker detection; compiled default for ``*.dawp.md`` steps (§6.0, §7.1)."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["marker"] = "marker"
     prompt_marker: str
     dawp_marker: str
@@ -129,6 +140,8 @@ class MarkerCompletion(BaseModel):
 class NoToolCallsCompletion(BaseModel):
     """Legacy completion: step succeeds when iteration has no tool calls (§7.2)."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["no_tool_calls"] = "no_tool_calls"
     is_last: bool
 
@@ -144,6 +157,8 @@ StepCompletion = MarkerCompletion | NoToolCallsCompletion
 class DAWPStep(BaseModel):
     """Single Prompt N step compiled from a ``<Prompt N>…</Prompt N>`` block (§5.0.1, §6.0)."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     instruction: str
     completion: StepCompletion
@@ -158,6 +173,8 @@ class DAWPStep(BaseModel):
 class Activation(BaseModel):
     """Compiled activation descriptor: placement + scheduling options (§4.2, §5.0.2)."""
 
+    model_config = ConfigDict(frozen=True)
+
     placement: Placement
     trigger_instruction: str | None = None
     merge_back: Literal["append", "inject_only"] = "append"
@@ -173,6 +190,8 @@ class Activation(BaseModel):
 class WorkflowMetadata(BaseModel):
     """Workflow identity parsed from front-matter (§5.0.2)."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     trigger_hint: str | None = None
 
@@ -180,6 +199,8 @@ class WorkflowMetadata(BaseModel):
 class WorkflowSpec(BaseModel):
     """Parsed body of a ``*.dawp.md`` document: instruction, contract, and appendix (§5.0.1)."""
 
+    model_config = ConfigDict(frozen=True)
+
     instruction: str = ""
     contract: Contract
     appendix: str = ""
@@ -192,6 +213,8 @@ class DAWPWorkflow(BaseModel):
     ``steps`` follow the ``<Prompt N>`` order; ``activations`` drive scheduling.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     metadata: WorkflowMetadata
     spec: WorkflowSpec
     steps: list[DAWPStep]
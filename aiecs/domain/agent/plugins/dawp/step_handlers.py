@@ -15,7 +15,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Literal
 
-from aiecs.domain.agent.plugins.dawp.completion import prompt_step_complete
+from aiecs.domain.agent.plugins.dawp.completion import (
+    IncrementalMarkerScanner,
+    prompt_step_complete,
+    step_state_from_markers,
+)
 from aiecs.domain.agent.plugins.dawp.schema import MarkerCompletion, NoToolCallsCompletion
 
 StepCompletionResult = Literal["prompt_done", "dawp_done", "continue"]
@@ -32,6 +36,8 @@ class StepIterationContext:
     had_tool_calls: bool
     result_success: bool
     completion: MarkerCompletion | NoToolCallsCompletion
+    scanner: IncrementalMarkerScanner | None = None
+    """Per-run marker scanner; when it covers both markers only new text is scanned."""
 
 
 class StepHandlerRegistry:
@@ -58,6 +64,14 @@ def _marker_handler(ctx: StepIterationContext) -> StepCompletionResult:
         return "continue"
     if not ctx.result_success:
         return "continue"
+    markers = (ctx.completion.prompt_marker, ctx.completion.dawp_marker)
+    if ctx.scanner is not None and ctx.scanner.matcher.tokens.issuperset(markers):
+        return step_state_from_markers(
+            ctx.scanner.feed(ctx.assistant_text),
+            prompt_marker=ctx.completion.prompt_marker,
+            dawp_marker=ctx.completion.dawp_marker,
+            is_last=ctx.completion.is_last,
+        )
     return prompt_step_complete(
         ctx.assistant_text,
         prompt_marker=ctx.completion.prompt_marker,
@@ -0,0 +1,426 @@
+# /*---------------------------------------------------------------------------------------------
+#  *  Copyright (c) IRETBL Corporation. All rights reserved.
+#  *  Licensed under the Apache-2.0. See License.txt in the project root for license information.
+#  *--------------------------------------------------------------------------------------------*/
+"""
+Skill Index
+
+Precomputed matching data for registered skills, maintained by
+``SkillRegistry`` on register/unregister so that ``SkillMatcher`` only
+scores skills that can actually reach a match threshold.
+
+The index keeps:
+- Normalized (lowercase) trigger phrases, keywords and tags per skill
+- A keyword inverted index (description keywords and tags -> skills)
+- A leading n-gram index over trigger phrases and tags, used to find the
+  phrases that occur verbatim in a request without scanning every skill
+- Trigger and description lengths, used to bound fuzzy similarity
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from .models import SkillDefinition
+
+# Regex to extract quoted phrases from descriptions
+# Matches: "phrase", 'phrase', or "phrase" (smart quotes)
+TRIGGER_PHRASE_PATTERN = re.compile(r'["\'\u201c\u201d]([^"\'\u201c\u201d]+)["\'\u201c\u201d]')
+
+# Common words to ignore in keyword matching
+STOP_WORDS = frozenset(
+    {
+        "a",
+        "an",
+        "the",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "must",
+        "shall",
+        "can",
+        "need",
+        "dare",
+        "to",
+        "of",
+        "in",
+        "for",
+        "on",
+        "with",
+        "at",
+        "by",
+        "from",
+        "up",
+        "about",
+        "into",
+        "through",
+        "during",
+        "before",
+        "after",
+        "above",
+        "below",
+        "between",
+        "under",
+        "again",
+        "further",
+        "then",
+        "once",
+        "and",
+        "but",
+        "or",
+        "nor",
+        "so",
+        "yet",
+        "both",
+        "either",
+        "neither",
+        "not",
+        "only",
+        "own",
+        "same",
+        "than",
+        "too",
+        "very",
+        "just",
+        "also",
+        "this",
+        "that",
+        "these",
+        "those",
+        "it",
+        "its",
+        "i",
+        "me",
+        "my",
+        "you",
+        "your",
+        "he",
+        "she",
+        "we",
+        "they",
+        "who",
+        "which",
+        "when",
+        "where",
+        "why",
+        "how",
+        "all",
+        "each",
+        "every",
+        "any",
+        "some",
+        "no",
+        "user",
+        "asks",
+        "mentions",
+        "wants",
+        "skill",
+        "used",
+    }
+)
+
+_WORD_SPLIT_PATTERN = re.compile(r"\W+")
+
+
+def extract_trigger_phrases(description: str) -> List[str]:
+    """
+    Extract trigger phrases (quoted strings) from a skill description.
+
+    Args:
+        description: Skill description text
+
+    Returns:
+        List of trigger phrases (lowercase, stripped)
+    """
+    matches = TRIGGER_PHRASE_PATTERN.findall(description)
+    return [phrase.strip().lower() for phrase in matches if phrase.strip()]
+
+
+def extract_keywords(text: str) -> Set[str]:
+    """
+    Extract meaningful keywords from text.
+
+    Splits on non-word characters and drops stop words and words of two
+    characters or fewer.
+
+    Args:
+        text: Text to extract keywords from
+
+    Returns:
+        Set of lowercase keywords
+    """
+    words = _WORD_SPLIT_PATTERN.split(text.lower())
+    return {word for word in words if word and len(word) > 2 and word not in STOP_WORDS}
+
+
+def length_window(length: int, cutoff: float) -> Optional[Tuple[int, float]]:
+    """
+    Lengths whose ``SequenceMatcher`` ratio against ``length`` can reach ``cutoff``.
+
+    ``ratio()`` is bounded by ``2 * min(a, b) / (a + b)`` (``real_quick_ratio``),
+    so only lengths inside this (slightly widened) window can score ``cutoff``.
+
+    Args:
+        length: Length of the fixed string (the request)
+        cutoff: Minimum ratio of interest
+
+    Returns:
+        Inclusive ``(low, high)`` length bounds, or None if no length can reach ``cutoff``
+    """
+    if cutoff <= 0:
+        return 0, float("inf")
+    if cutoff > 1:
+        return None
+    return int(length * cutoff / (2 - cutoff)), length * (2 - cutoff) / cutoff + 1
+
+
+@dataclass(frozen=True)
+class IndexedSkill:
+    """Normalized matching data for one skill."""
+
+    skill: SkillDefinition
+    triggers: Tuple[str, ...]
+    keywords: FrozenSet[str]
+    tags: Tuple[str, ...]
+    description_lower: str
+
+    @classmethod
+    def from_skill(cls, skill: SkillDefinition, triggers: Optional[Iterable[str]] = None, keywords: Optional[Iterable[str]] = None) -> "IndexedSkill":
+        """
+        Build the index entry for a skill.
+
+        Args:
+            skill: Skill to index
+            triggers: Pre-extracted trigger phrases (extracted from the description if None)
+            keywords: Pre-extracted keywords including tags (extracted if None)
+        """
+        metadata = skill.metadata
+        tags = tuple(metadata.tags or ())
+        if triggers is None:
+            triggers = extract_trigger_phrases(metadata.description)
+        if keywords is None:
+            keywords = extract_keywords(metadata.description)
+            keywords.update(tag.lower() for tag in tags)
+        return cls(
+            skill=skill,
+            triggers=tuple(triggers),
+            keywords=frozenset(keywords),
+            tags=tags,
+            description_lower=metadata.description.lower(),
+        )
+
+    @property
+    def name(self) -> str:
+        return self.skill.metadata.name
+
+
+class SkillIndex:
+    """
+    Inverted index over registered skills.
+
+    Thread-safe; every query returns skill names, which callers resolve
+    with ``get()`` (an entry may disappear between the two calls if the
+    skill is unregistered concurrently).
+    """
+
+    NGRAM_SIZE = 3
+
+    def __init__(self):
+        self._entries: Dict[str, IndexedSkill] = {}
+        self._order: Dict[str, int] = {}
+        self._sequence = 0
+        # keyword/tag -> skill names
+        self._keyword_postings: Dict[str, Set[str]] = {}
+        # lowercase trigger phrase or tag -> skill names
+        self._phrase_owners: Dict[str, Set[str]] = {}
+        # leading n-gram -> phrases starting with it
+        self._phrase_grams: Dict[str, Set[str]] = {}
+        # phrases shorter than NGRAM_SIZE, checked against every request
+        self._short_phrases: Set[str] = set()
+        # trigger / description length -> skill names
+        self._trigger_lengths: Dict[int, Set[str]] = {}
+        self._description_lengths: Dict[int, Set[str]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, name: object) -> bool:
+        with self._lock:
+            return name in self._entries
+
+    def add(self, skill: SkillDefinition) -> IndexedSkill:
+        """
+        Index a skill, replacing any entry with the same name.
+
+        Args:
+            skill: Skill to index
+
+        Returns:
+            The new index entry
+        """
+        entry = IndexedSkill.from_skill(skill)
+        name = entry.name
+        with self._lock:
+            if name in self._entries:
+                self._remove_locked(name)
+            self._entries[name] = entry
+            self._order[name] = self._sequence
+            self._sequence += 1
+
+            for keyword in entry.keywords:
+                self._keyword_postings.setdefault(keyword, set()).add(name)
+            for phrase in set(entry.triggers).union(tag.lower() for tag in entry.tags):
+                owners = self._phrase_owners.setdefault(phrase, set())
+                if not owners:
+                    self._add_phrase_locked(phrase)
+                owners.add(name)
+            for trigger in entry.triggers:
+                self._trigger_lengths.setdefault(len(trigger), set()).add(name)
+            self._description_lengths.setdefault(len(entry.description_lower), set()).add(name)
+        return entry
+
+    def remove(self, name: str) -> bool:
+        """
+        Remove a skill from the index.
+
+        Args:
+            name: Name of the skill
+
+        Returns:
+            True if the skill was indexed
+        """
+        with self._lock:
+            if name not in self._entries:
+                return False
+            self._remove_locked(name)
+            return True
+
+    def clear(self) -> None:
+        """Remove all skills from the index."""
+        with self._lock:
+            self._entries.clear()
+            self._order.clear()
+            self._keyword_postings.clear()
+            self._phrase_owners.clear()
+            self._phrase_grams.clear()
+            self._short_phrases.clear()
+            self._trigger_lengths.clear()
+            self._description_lengths.clear()
+
+    def get(self, name: str) -> Optional[IndexedSkill]:
+        """Get the index entry for a skill, or None if not indexed."""
+        with self._lock:
+            return self._entries.get(name)
+
+    def get_entries(self, names: Iterable[str]) -> List[IndexedSkill]:
+        """
+        Resolve skill names to entries in registration order.
+
+        Names that are no longer indexed are skipped.
+        """
+        with self._lock:
+            present = [name for name in names if name in self._entries]
+            present.sort(key=self._order.__getitem__)
+            return [self._entries[name] for name in present]
+
+    def keyword_matches(self, keywords: Iterable[str]) -> Set[str]:
+        """Names of skills sharing at least one keyword or tag with ``keywords``."""
+        result: Set[str] = set()
+        with self._lock:
+            for keyword in keywords:
+                names = self._keyword_postings.get(keyword)
+                if names:
+                    result.update(names)
+        return result
+
+    def phrase_matches(self, text_lower: str) -> Set[str]:
+        """
+        Names of skills with a trigger phrase or tag contained in ``text_lower``.
+
+        Only phrases whose leading n-gram occurs in the text are checked.
+        """
+        n = self.NGRAM_SIZE
+        result: Set[str] = set()
+        with self._lock:
+            candidates = set(self._short_phrases)
+            grams = self._phrase_grams
+            for gram in {text_lower[i : i + n] for i in range(len(text_lower) - n + 1)}:
+                phrases = grams.get(gram)
+                if phrases:
+                    candidates.update(phrases)
+            for phrase in candidates:
+                if phrase in text_lower:
+                    result.update(self._phrase_owners[phrase])
+        return result
+
+    def trigger_length_matches(self, low: float, high: float) -> Set[str]:
+        """Names of skills with a trigger phrase whose length is in ``[low, high]``."""
+        return self._length_matches(self._trigger_lengths, low, high)
+
+    def description_length_matches(self, low: float, high: float) -> Set[str]:
+        """Names of skills whose description length is in ``[low, high]``."""
+        return self._length_matches(self._description_lengths, low, high)
+
+    def _length_matches(self, lengths: Dict[int, Set[str]], low: float, high: float) -> Set[str]:
+        result: Set[str] = set()
+        with self._lock:
+            for length, names in lengths.items():
+                if low <= length <= high:
+                    result.update(names)
+        return result
+
+    def _add_phrase_locked(self, phrase: str) -> None:
+        if len(phrase) < self.NGRAM_SIZE:
+            self._short_phrases.add(phrase)
+        else:
+            self._phrase_grams.setdefault(phrase[: self.NGRAM_SIZE], set()).add(phrase)
+
+    def _remove_locked(self, name: str) -> None:
+        entry = self._entries.pop(name)
+        del self._order[name]
+
+        for keyword in entry.keywords:
+            _discard(self._keyword_postings, keyword, name)
+        for phrase in set(entry.triggers).union(tag.lower() for tag in entry.tags):
+            owners = self._phrase_owners.get(phrase)
+            if owners is None:
+                continue
+            owners.discard(name)
+            if not owners:
+                del self._phrase_owners[phrase]
+                if len(phrase) < self.NGRAM_SIZE:
+                    self._short_phrases.discard(phrase)
+                else:
+                    _discard(self._phrase_grams, phrase[: self.NGRAM_SIZE], phrase)
+        for trigger in entry.triggers:
+            _discard(self._trigger_lengths, len(trigger), name)
+        _discard(self._description_lengths, len(entry.description_lower), name)
+
+
+def _discard(postings: Dict, key, value) -> None:
+    """Remove ``value`` from ``postings[key]``, dropping the key when empty."""
+    values = postings.get(key)
+    if values is None:
+        return
+    values.discard(value)
+    if not values:
+        del postings[key]
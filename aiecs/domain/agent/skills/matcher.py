@@ -30,6 +30,7 @@ from dataclasses import dataclass
 from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Set, Tuple
 
+from .index import STOP_WORDS, TRIGGER_PHRASE_PATTERN, IndexedSkill, length_window
 from .models import SkillDefinition
 from .registry import SkillRegistry
 
@@ -72,121 +73,20 @@ class SkillMatcher:
     """
 
     # Regex to extract quoted phrases from descriptions
-    # Matches: "phrase", 'phrase', or "phrase" (smart quotes)
-    TRIGGER_PHRASE_PATTERN = re.compile(r'["\'\u201c\u201d]([^"\'\u201c\u201d]+)["\'\u201c\u201d]')
+    TRIGGER_PHRASE_PATTERN = TRIGGER_PHRASE_PATTERN
 
     # Common words to ignore in keyword matching
-    STOP_WORDS = {
-        "a",
-        "an",
-        "the",
-        "is",
-        "are",
-        "was",
-        "were",
-        "be",
-        "been",
-        "being",
-        "have",
-        "has",
-        "had",
-        "do",
-        "does",
-        "did",
-        "will",
-        "would",
-        "could",
-        "should",
-        "may",
-        "might",
-        "must",
-        "shall",
-        "can",
-        "need",
-        "dare",
-        "to",
-        "of",
-        "in",
-        "for",
-        "on",
-        "with",
-        "at",
-        "by",
-        "from",
-        "up",
-        "about",
-        "into",
-        "through",
-        "during",
-        "before",
-        "after",
-        "above",
-        "below",
-        "between",
-        "under",
-        "again",
-        "further",
-        "then",
-        "once",
-        "and",
-        "but",
-        "or",
-        "nor",
-        "so",
-        "yet",
-        "both",
-        "either",
-        "neither",
-        "not",
-        "only",
-        "own",
-        "same",
-        "than",
-        "too",
-        "very",
-        "just",
-        "also",
-        "this",
-        "that",
-        "these",
-        "those",
-        "it",
-        "its",
-        "i",
-        "me",
-        "my",
-        "you",
-        "your",
-        "he",
-        "she",
-        "we",
-        "they",
-        "who",
-        "which",
-        "when",
-        "where",
-        "why",
-        "how",
-        "all",
-        "each",
-        "every",
-        "any",
-        "some",
-        "no",
-        "user",
-        "asks",
-        "mentions",
-        "wants",
-        "skill",
-        "used",
-        "when",
-    }
+    STOP_WORDS = STOP_WORDS
 
     # Weights for different match types
     EXACT_PHRASE_WEIGHT = 1.0
     FUZZY_PHRASE_WEIGHT = 0.7
     KEYWORD_WEIGHT = 0.5  # Increased from 0.3 to give description keywords more weight
     TAG_WEIGHT = 0.4  # Increased from 0.2 to give tags more weight
+    DESCRIPTION_SIMILARITY_WEIGHT = 0.4  # Fallback when nothing else matches (increased from 0.3)
+
+    # Minimum SequenceMatcher ratio for a fuzzy trigger phrase match
+    FUZZY_PHRASE_THRESHOLD = 0.6
 
     def __init__(self, registry: Optional[SkillRegistry] = None, default_threshold: float = 0.3, default_max_results: int = 5):
         """
@@ -205,6 +105,16 @@ class SkillMatcher:
         self._trigger_cache: Dict[str, List[str]] = {}
         self._keyword_cache: Dict[str, Set[str]] = {}
 
+        # The registry index is built with the default extraction rules, so
+        # subclasses that customize them score registry skills directly.
+        cls = type(self)
+        self._use_registry_index = (
+            cls.extract_trigger_phrases is SkillMatcher.extract_trigger_phrases
+            and cls.extract_keywords is SkillMatcher.extract_keywords
+            and cls.TRIGGER_PHRASE_PATTERN is SkillMatcher.TRIGGER_PHRASE_PATTERN
+            and cls.STOP_WORDS is SkillMatcher.STOP_WORDS
+        )
+
     def extract_trigger_phrases(self, description: str) -> List[str]:
         """
         Extract trigger phrases from a skill description.
@@ -256,20 +166,56 @@ class SkillMatcher:
             self._keyword_cache[name] = keywords
         return self._keyword_cache[name]
 
-    def _fuzzy_match_score(self, s1: str, s2: str) -> float:
+    def _get_entry(self, skill: SkillDefinition) -> IndexedSkill:
+        """
+        Get normalized matching data for a skill.
+
+        Uses the registry's index entry when the skill is the registered
+        instance, otherwise builds one from the matcher's caches.
+        """
+        if self._use_registry_index:
+            entry = self._registry.get_index().get(skill.metadata.name)
+            if entry is not None and entry.skill is skill:
+                return entry
+        return IndexedSkill.from_skill(skill, triggers=self._get_skill_triggers(skill), keywords=self._get_skill_keywords(skill))
+
+    def _fuzzy_match_score(self, s1: str, s2: str, cutoff: float = 0.0) -> float:
         """
         Calculate fuzzy match score between two strings.
 
-        Uses SequenceMatcher for similarity calculation.
+        Uses SequenceMatcher for similarity calculation. When ``cutoff`` is
+        set, the cheap ``real_quick_ratio``/``quick_ratio`` upper bounds are
+        checked first and 0.0 is returned if the score cannot reach it.
 
         Args:
             s1: First string
             s2: Second string
+            cutoff: Scores below this value may be reported as 0.0
 
         Returns:
             Similarity score between 0.0 and 1.0
         """
-        return SequenceMatcher(None, s1.lower(), s2.lower()).ratio()
+        sequence_matcher = SequenceMatcher(None)
+        sequence_matcher.set_seq2(s2.lower())
+        return self._bounded_ratio(sequence_matcher, s1.lower(), cutoff)
+
+    @staticmethod
+    def _bounded_ratio(sequence_matcher: SequenceMatcher, text: str, cutoff: float) -> float:
+        """
+        ``ratio()`` of ``text`` against the matcher's second sequence.
+
+        The second sequence (the request) is set once per match so its
+        lookup tables are reused for every trigger and description.
+        """
+        sequence_matcher.set_seq1(text)
+        if cutoff > 0 and (sequence_matcher.real_quick_ratio() < cutoff or sequence_matcher.quick_ratio() < cutoff):
+            return 0.0
+        return sequence_matcher.ratio()
+
+    def _description_cutoff(self, threshold: float) -> float:
+        """Minimum description similarity for the fallback score to reach ``threshold``."""
+        # Widened by a hair so float rounding never prunes a skill at exactly the threshold
+        return max(threshold / self.DESCRIPTION_SIMILARITY_WEIGHT - 1e-9, 0.0)
 
     def _phrase_in_text(self, phrase: str, text: str) -> bool:
         """Check if phrase appears in text (case-insensitive)."""
@@ -279,6 +225,30 @@ class SkillMatcher:
         """
         Score how well a skill matches a request.
 
+        Args:
+            skill: Skill to score
+            request: User request text
+            request_keywords: Pre-extracted keywords from request
+
+        Returns:
+            MatchResult with score and match details
+        """
+        request_lower = request.lower()
+        sequence_matcher = SequenceMatcher(None)
+        sequence_matcher.set_seq2(request_lower)
+        return self._score_entry(self._get_entry(skill), request_lower, request_keywords, sequence_matcher)
+
+    def _score_entry(
+        self,
+        entry: IndexedSkill,
+        request_lower: str,
+        request_keywords: Set[str],
+        sequence_matcher: SequenceMatcher,
+        min_score: float = 0.0,
+    ) -> MatchResult:
+        """
+        Score how well an indexed skill matches a request.
+
         Uses a "best match" scoring strategy where matching any single trigger
         phrase yields a high score. Multiple triggers increase matching
         opportunities, not difficulty.
@@ -286,37 +256,36 @@ class SkillMatcher:
         Scoring considers:
         - Exact trigger phrase matches (weight: 1.0)
         - Fuzzy trigger phrase matches (weight: 0.7)
-        - Keyword overlap (weight: 0.3)
-        - Tag matches (weight: 0.2)
+        - Keyword overlap (weight: 0.5)
+        - Tag matches (weight: 0.4)
 
         Args:
-            skill: Skill to score
-            request: User request text
+            entry: Index entry of the skill to score
+            request_lower: Lowercased user request text
             request_keywords: Pre-extracted keywords from request
+            sequence_matcher: SequenceMatcher with the request as second sequence
+            min_score: Description-similarity fallback scores below this may be reported as 0.0
 
         Returns:
             MatchResult with score and match details
         """
-        triggers = self._get_skill_triggers(skill)
-        skill_keywords = self._get_skill_keywords(skill)
-
+        skill = entry.skill
         matched_phrases: List[str] = []
         matched_keywords: List[str] = []
 
         # === New "best match" scoring logic ===
         # Track the best trigger score (not cumulative)
         best_trigger_score = 0.0
-        request_lower = request.lower()
 
-        for trigger in triggers:
+        for trigger in entry.triggers:
             # Check exact match
             if trigger in request_lower:
                 best_trigger_score = max(best_trigger_score, self.EXACT_PHRASE_WEIGHT)
                 matched_phrases.append(trigger)
             else:
                 # Check fuzzy match
-                fuzzy_score = self._fuzzy_match_score(trigger, request_lower)
-                if fuzzy_score > 0.6:  # Threshold for fuzzy match consideration
+                fuzzy_score = self._bounded_ratio(sequence_matcher, trigger, self.FUZZY_PHRASE_THRESHOLD)
+                if fuzzy_score > self.FUZZY_PHRASE_THRESHOLD:
                     score_contribution = fuzzy_score * self.FUZZY_PHRASE_WEIGHT
                     best_trigger_score = max(best_trigger_score, score_contribution)
                     matched_phrases.append(f"~{trigger}")
@@ -332,7 +301,7 @@ class SkillMatcher:
         # Use the ratio of matched keywords relative to REQUEST keywords (not skill keywords)
         # This way, if user's request keywords mostly match the skill, we get a high score
         keyword_score = 0.0
-        common_keywords = request_keywords.intersection(skill_keywords)
+        common_keywords = request_keywords.intersection(entry.keywords)
         if common_keywords and request_keywords:
             # How much of the user's request is covered by this skill?
             request_coverage = len(common_keywords) / len(request_keywords)
@@ -344,8 +313,8 @@ class SkillMatcher:
         # Score tag matches (0.0 to TAG_WEIGHT)
         # Tags are explicit markers, so matching ANY tag should give significant score
         tag_score = 0.0
-        if skill.metadata.tags:
-            tag_matches = [tag for tag in skill.metadata.tags if tag.lower() in request_lower]
+        if entry.tags:
+            tag_matches = [tag for tag in entry.tags if tag.lower() in request_lower]
             if tag_matches:
                 # Any tag match gives at least 0.7 of TAG_WEIGHT
                 base_score = 0.7
@@ -366,61 +335,101 @@ class SkillMatcher:
             final_score = keyword_score * 0.7 + tag_score * 0.5
         else:
             # No matches at all - use basic text similarity as fallback
-            final_score = self._fuzzy_match_score(skill.metadata.description, request) * 0.4  # Increased from 0.3
+            similarity = self._bounded_ratio(sequence_matcher, entry.description_lower, self._description_cutoff(min_score))
+            final_score = similarity * self.DESCRIPTION_SIMILARITY_WEIGHT
 
         # Ensure score is in valid range
         final_score = min(max(final_score, 0.0), 1.0)
 
-        logger.debug(
-            f"Skill '{skill.metadata.name}' scoring: "
-            f"trigger_score={trigger_score:.3f}, "
-            f"keyword_score={keyword_score:.3f}, "
-            f"tag_score={tag_score:.3f}, "
-            f"final={final_score:.3f}, "
-            f"matched_phrases={matched_phrases}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Skill '{skill.metadata.name}' scoring: "
+                f"trigger_score={trigger_score:.3f}, "
+                f"keyword_score={keyword_score:.3f}, "
+                f"tag_score={tag_score:.3f}, "
+                f"final={final_score:.3f}, "
+                f"matched_phrases={matched_phrases}"
+            )
 
         return MatchResult(skill=skill, score=final_score, matched_phrases=matched_phrases, matched_keywords=list(set(matched_keywords)))
 
-    def match(self, request: str, threshold: Optional[float] = None, max_results: Optional[int] = None, skills: Optional[List[SkillDefinition]] = None) -> List[Tuple[SkillDefinition, float]]:
+    def _candidate_entries(self, request_lower: str, request_keywords: Set[str], threshold: float) -> List[IndexedSkill]:
         """
-        Match a request to skills and return ranked results.
-
-        Args:
-            request: User request text
-            threshold: Minimum score threshold (uses default if None)
-            max_results: Maximum results to return (uses default if None)
-            skills: Skills to match against (uses registry if None)
-
-        Returns:
-            List of (skill, score) tuples, sorted by score descending
+        Registered skills that can reach ``threshold`` for a request.
+
+        A skill scores above zero only through a shared keyword, a trigger
+        phrase or tag contained in the request, a fuzzy trigger match, or
+        the description-similarity fallback. The first two come from the
+        inverted indexes; the last two are bounded by string length, since
+        ``SequenceMatcher.ratio()`` cannot exceed ``2 * min(a, b) / (a + b)``.
+        Every other skill scores below ``threshold`` and is skipped.
         """
+        index = self._registry.get_index()
+        request_length = len(request_lower)
+
+        names = index.keyword_matches(request_keywords)
+        names |= index.phrase_matches(request_lower)
+        window = length_window(request_length, self.FUZZY_PHRASE_THRESHOLD)
+        if window is not None:
+            names |= index.trigger_length_matches(*window)
+        window = length_window(request_length, self._description_cutoff(threshold))
+        if window is not None:
+            names |= index.description_length_matches(*window)
+
+        return index.get_entries(names)
+
+    def _rank(self, request: str, threshold: Optional[float], max_results: Optional[int], skills: Optional[List[SkillDefinition]]) -> List[MatchResult]:
+        """Score candidate skills and return the best results above threshold."""
         if not request or not request.strip():
             return []
 
         threshold = threshold if threshold is not None else self._default_threshold
         max_results = max_results if max_results is not None else self._default_max_results
 
+        # Pre-compute request data once for every skill
+        request_lower = request.lower()
+        request_keywords = self.extract_keywords(request)
+
         # Get skills to match against
-        skills_to_match = skills or self._registry.get_all_skills()
-        if not skills_to_match:
+        if skills:
+            entries = [self._get_entry(skill) for skill in skills]
+        elif self._use_registry_index:
+            entries = self._candidate_entries(request_lower, request_keywords, threshold)
+        else:
+            entries = [self._get_entry(skill) for skill in self._registry.get_all_skills()]
+        if not entries:
             return []
 
-        # Pre-extract request keywords
-        request_keywords = self.extract_keywords(request)
+        sequence_matcher = SequenceMatcher(None)
+        sequence_matcher.set_seq2(request_lower)
 
-        # Score all skills
         results: List[MatchResult] = []
-        for skill in skills_to_match:
-            result = self._score_skill(skill, request, request_keywords)
+        for entry in entries:
+            result = self._score_entry(entry, request_lower, request_keywords, sequence_matcher, min_score=threshold)
             if result.score >= threshold:
                 results.append(result)
 
         # Sort by score descending
         results.sort(key=lambda r: r.score, reverse=True)
+        return results[:max_results]
 
-        # Limit results
-        results = results[:max_results]
+    def match(self, request: str, threshold: Optional[float] = None, max_results: Optional[int] = None, skills: Optional[List[SkillDefinition]] = None) -> List[Tuple[SkillDefinition, float]]:
+        """
+        Match a request to skills and return ranked results.
+
+        Registered skills are narrowed to candidates through the registry's
+        ``SkillIndex``; explicit ``skills`` are all scored.
+
+        Args:
+            request: User request text
+            threshold: Minimum score threshold (uses default if None)
+            max_results: Maximum results to return (uses default if None)
+            skills: Skills to match against (uses registry if None)
+
+        Returns:
+            List of (skill, score) tuples, sorted by score descending
+        """
+        results = self._rank(request, threshold, max_results, skills)
 
         # Log matches
         if results:
@@ -447,26 +456,7 @@ class SkillMatcher:
         Returns:
             List of MatchResult objects, sorted by score descending
         """
-        if not request or not request.strip():
-            return []
-
-        threshold = threshold if threshold is not None else self._default_threshold
-        max_results = max_results if max_results is not None else self._default_max_results
-
-        skills_to_match = skills or self._registry.get_all_skills()
-        if not skills_to_match:
-            return []
-
-        request_keywords = self.extract_keywords(request)
-
-        results: List[MatchResult] = []
-        for skill in skills_to_match:
-            result = self._score_skill(skill, request, request_keywords)
-            if result.score >= threshold:
-                results.append(result)
-
-        results.sort(key=lambda r: r.score, reverse=True)
-        return results[:max_results]
+        return self._rank(request, threshold, max_results, skills)
 
     def clear_cache(self) -> None:
         """Clear the trigger phrase and keyword caches."""
@@ -7,12 +7,14 @@ Skill Registry
 
 Central registry for managing available skills with discovery, registration,
 and lookup capabilities. Implements singleton pattern with thread-safe access.
+Keeps a SkillIndex in sync with registrations for fast request matching.
 """
 
 import logging
 import threading
 from typing import Dict, List, Optional
 
+from .index import SkillIndex
 from .models import SkillDefinition, SkillMetadata
 
 logger = logging.getLogger(__name__)
@@ -58,6 +60,7 @@ class SkillRegistry:
 
         self._skills: Dict[str, SkillDefinition] = {}
         self._metadata_cache: Dict[str, SkillMetadata] = {}
+        self._index = SkillIndex()
         self._access_lock = threading.RLock()
         self._initialized = True
 
@@ -93,6 +96,7 @@ class SkillRegistry:
 
             self._skills[name] = skill
             self._metadata_cache[name] = skill.metadata
+            self._index.add(skill)
             logger.info(f"Registered skill: {name} v{skill.metadata.version}")
 
     def unregister_skill(self, name: str) -> bool:
@@ -109,10 +113,23 @@ class SkillRegistry:
             if name in self._skills:
                 del self._skills[name]
                 del self._metadata_cache[name]
+                self._index.remove(name)
                 logger.info(f"Unregistered skill: {name}")
                 return True
             return False
 
+    def get_index(self) -> SkillIndex:
+        """
+        Get the matching index over registered skills.
+
+        The index is updated by register_skill(), unregister_skill() and
+        clear(); it is used by SkillMatcher to score only candidate skills.
+
+        Returns:
+            SkillIndex for this registry
+        """
+        return self._index
+
     def get_skill(self, name: str) -> Optional[SkillDefinition]:
         """
         Get a skill by name.
@@ -223,6 +240,7 @@ class SkillRegistry:
             count = len(self._skills)
             self._skills.clear()
             self._metadata_cache.clear()
+            self._index.clear()
             logger.info(f"Cleared {count} skills from registry")
 
     def get_skills_by_tag(self, tag: str) -> List[SkillDefinition]:
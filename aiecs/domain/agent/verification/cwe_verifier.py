@@ -5,8 +5,9 @@
 """
 CWE multi-perspective verifier (A-11).
 
-Delegates to ``CollaborativeWorkflowEngine.review_refinement`` — sequential fact→style
-via ``spawn_verifier`` (host analogue: ``spawn_subagent(verifier)``).
+Delegates to ``CollaborativeWorkflowEngine.review_refinement`` — fact→style via
+``spawn_verifier`` (host analogue: ``spawn_subagent(verifier)``), sequential unless
+``cwe_verifier.spawn="parallel"``.
 """
 
 from __future__ import annotations
@@ -134,6 +135,9 @@ class CweVerifier:
             result=result,
             criteria=criteria,
             spawn_verifier=self._spawn_verifier,
+            spawn=self._policy.spawn,
+            max_concurrency=self._policy.max_concurrent_roles,
+            role_timeout_seconds=self._policy.role_timeout_seconds,
         )
         return Verdict.from_dict(payload["verdict"])
 
@@ -6,9 +6,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 H1_DELIVERY_KINDS = frozenset({"report", "analysis"})
 H1_MIN_CRITERIA = 5
@@ -18,6 +18,9 @@ class CweVerifierPolicy(BaseModel):
     """Engine-level CWE multi-perspective verifier (A-11). Default off preserves rc4."""
 
     enabled: bool = False
+    spawn: Literal["sequential", "parallel"] = "sequential"
+    max_concurrent_roles: Optional[int] = Field(default=None, ge=1)
+    role_timeout_seconds: Optional[float] = Field(default=None, gt=0.0)
 
     model_config = ConfigDict(extra="forbid")
 
@@ -49,6 +49,9 @@ class VerificationPolicy(BaseModel):
     skip_threshold_by_kind: dict[str, float] = Field(default_factory=lambda: dict(DEFAULT_SKIP_THRESHOLD_BY_KIND))
     registered_verifiers: list[str] = Field(default_factory=list)
     blocking: bool = True
+    max_concurrent_verifiers: int = Field(default=4, ge=1)
+    verifier_timeout_seconds: Optional[float] = Field(default=None, gt=0.0)
+    short_circuit_on_failure: bool = False
 
     model_config = ConfigDict(extra="forbid")
 
@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass, field
 from typing import Any, Literal, Optional, Sequence, cast
 
@@ -21,7 +23,7 @@ from aiecs.domain.agent.verification.gvr_checkpoints import gates_already_run, g
 from aiecs.domain.agent.verification.criteria import normalize_acceptance_criteria
 from aiecs.domain.agent.verification.gates.conversion import gate_aggregate_to_verdict
 from aiecs.domain.agent.verification.gates.registry import BUILTIN_GATES, GateRegistry, build_gate_registry_from_config
-from aiecs.domain.agent.verification.models import Verdict
+from aiecs.domain.agent.verification.models import AcceptanceCriterion, Verdict, VerificationContext
 from aiecs.domain.agent.verification.policy_models import VerificationPolicy, resolve_verification_policy
 from aiecs.domain.agent.verification.verifier import Verifier, merge_verdicts
 from aiecs.llm import LLMMessage
@@ -124,6 +126,104 @@ def _record_event(plugin_state: dict[str, Any], event: dict[str, Any]) -> None:
     plugin_state.setdefault(_EVENTS_KEY, []).append(event)
 
 
+def _verifier_kind(verifier: Any) -> str:
+    return str(getattr(verifier, "kind", type(verifier).__name__))
+
+
+def _is_certain_failure(verdict: Verdict) -> bool:
+    """A FAIL verdict fixes the merged outcome (merge_verdicts: any FAIL -> FAIL, not passed)."""
+    return not verdict.passed and verdict.kind == "FAIL"
+
+
+async def _run_llm_verifiers(
+    verifiers: Sequence[Verifier],
+    *,
+    policy: VerificationPolicy,
+    goal: AgentGoal | dict[str, Any] | None,
+    loop_result: dict[str, Any],
+    criteria: list[AcceptanceCriterion],
+    context: VerificationContext,
+    plugin_state: dict[str, Any],
+) -> list[Verdict]:
+    """
+    Run verifiers concurrently (bounded by ``max_concurrent_verifiers``).
+
+    Returns verdicts in *verifiers* order regardless of completion order.  Verifiers
+    still running at ``verifier_timeout_seconds`` are cancelled and contribute a failing
+    PARTIAL verdict; with ``short_circuit_on_failure`` on a blocking policy, the first
+    FAIL verdict cancels the rest (they contribute nothing).  A verifier exception
+    cancels the others and propagates.
+    """
+    semaphore = asyncio.Semaphore(policy.max_concurrent_verifiers)
+    loop = asyncio.get_running_loop()
+    deadline = None if policy.verifier_timeout_seconds is None else loop.time() + policy.verifier_timeout_seconds
+    short_circuit = policy.short_circuit_on_failure and policy.blocking
+    latencies: dict[int, float] = {}
+
+    async def _verify(index: int, verifier: Verifier) -> Verdict:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                return await verifier.verify(
+                    goal=goal or {},
+                    result=loop_result,
+                    criteria=criteria,
+                    context=context,
+                )
+            finally:
+                latencies[index] = time.perf_counter() - started
+
+    tasks = {asyncio.create_task(_verify(index, verifier)): index for index, verifier in enumerate(verifiers)}
+    slots: list[Verdict | None] = [None] * len(verifiers)
+    statuses: dict[int, str] = {}
+    pending: set[asyncio.Task[Verdict]] = set(tasks)
+    try:
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                for task in pending:
+                    index = tasks[task]
+                    statuses[index] = "timeout"
+                    slots[index] = Verdict(
+                        passed=False,
+                        kind="PARTIAL",
+                        feedback=f"Verifier '{_verifier_kind(verifiers[index])}' did not finish within {policy.verifier_timeout_seconds}s.",
+                    )
+                break
+            for task in sorted(done, key=tasks.__getitem__):
+                index = tasks[task]
+                slots[index] = task.result()
+                statuses[index] = "completed"
+            if short_circuit and pending and any(_is_certain_failure(cast(Verdict, slots[tasks[task]])) for task in done):
+                for task in pending:
+                    statuses[tasks[task]] = "cancelled"
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    for index, verifier in enumerate(verifiers):
+        verdict = slots[index]
+        latency = latencies.get(index)
+        _record_event(
+            plugin_state,
+            {
+                "type": "verification_policy",
+                "event": "verifier_run",
+                "verifier": _verifier_kind(verifier),
+                "index": index,
+                "status": statuses.get(index, "cancelled"),
+                "latency_ms": None if latency is None else round(latency * 1000, 1),
+                "passed": None if verdict is None else verdict.passed,
+                "kind": None if verdict is None else verdict.kind,
+            },
+        )
+    return [verdict for verdict in slots if verdict is not None]
+
+
 async def run_verification_policy(
     *,
     policy: VerificationPolicy,
@@ -218,18 +318,25 @@ async def run_verification_policy(
     if gate_verdict is not None:
         verdicts.append(gate_verdict)
 
+    if llm_verifiers and not skipped_llm and gate_verdict is not None and policy.short_circuit_on_failure and policy.blocking and _is_certain_failure(gate_verdict):
+        skipped_llm = True
+        _record_event(
+            plugin_state,
+            {"type": "verification_policy", "event": "skip_llm", "reason": "gate_failed"},
+        )
+
     if llm_verifiers and not skipped_llm:
-        for verifier in llm_verifiers:
-            if not isinstance(verifier, Verifier):
-                continue
-            verdicts.append(
-                await verifier.verify(
-                    goal=goal or {},
-                    result=loop_result,
-                    criteria=criteria,
-                    context=context,
-                )
+        verdicts.extend(
+            await _run_llm_verifiers(
+                [verifier for verifier in llm_verifiers if isinstance(verifier, Verifier)],
+                policy=policy,
+                goal=goal,
+                loop_result=loop_result,
+                criteria=criteria,
+                context=context,
+                plugin_state=plugin_state,
             )
+        )
 
     if not verdicts:
         final = Verdict(passed=True, kind="NA", feedback="No verifiers resolved for policy run.")
@@ -10,8 +10,9 @@ including brainstorming, problem-solving, and knowledge synthesis.
 """
 
 import logging
+import time
 from datetime import datetime
-from typing import Any, Awaitable, Callable, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .community_manager import CommunityManager
@@ -25,7 +26,8 @@ from .exceptions import CommunityValidationError as TaskValidationError
 logger = logging.getLogger(__name__)
 
 # GVR A-11: canonical review_refinement phase (resource_creation workflow phase 3).
-# Roles run sequentially (fact→style) — never parallel SSE.
+# Roles run sequentially (fact→style) by default; review_refinement(spawn="parallel")
+# is an opt-in for hosts whose spawn_verifier does not stream over a shared SSE channel.
 REVIEW_REFINEMENT_PHASE_CONFIG: Dict[str, Any] = {
     "instructions": "Review and refine the created resource",
     "time_limit_minutes": 15,
@@ -35,6 +37,7 @@ REVIEW_REFINEMENT_PHASE_CONFIG: Dict[str, Any] = {
 }
 
 SpawnVerifierCallback = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+ReviewSpawnMode = Literal["sequential", "parallel"]
 
 
 class CollaborativeWorkflowEngine:
@@ -589,22 +592,33 @@ class CollaborativeWorkflowEngine:
         result: Dict[str, Any],
         criteria: List[Any],
         spawn_verifier: SpawnVerifierCallback,
+        spawn: ReviewSpawnMode = "sequential",
+        max_concurrency: Optional[int] = None,
+        role_timeout_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
-        Run the review_refinement template sequentially (fact→style).
+        Run the review_refinement template (fact→style).
 
         Each role invokes ``spawn_verifier(review_task)`` — the aiecs analogue of
-        host ``spawn_subagent(verifier)``. No parallel SSE streams.
+        host ``spawn_subagent(verifier)``. Roles run one after another unless
+        ``spawn="parallel"``, which runs up to ``max_concurrency`` roles at once
+        (default: all). A role that exceeds ``role_timeout_seconds`` or raises is
+        recorded as an inconclusive (failing ``PARTIAL``) verdict instead of
+        aborting the phase. Role verdicts are merged in role order.
 
         Returns phase metadata plus merged A-1 ``Verdict`` payload under ``verdict``.
+        The phase record reports ``wall_clock_ms`` against ``role_time_ms`` (sum of
+        per-role durations).
         """
         from aiecs.domain.agent.verification.models import AcceptanceCriterion
-        from aiecs.domain.agent.verification.review_refinement import (
-            build_review_refinement_task,
-            review_refinement_response_to_verdict,
-        )
+        from aiecs.domain.agent.verification.review_refinement import build_review_refinement_task
         from aiecs.domain.agent.verification.verifier import merge_verdicts
 
+        if spawn not in ("sequential", "parallel"):
+            raise TaskValidationError(f"Unsupported review_refinement spawn mode: {spawn}")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise TaskValidationError("max_concurrency must be at least 1")
+
         normalized: List[AcceptanceCriterion] = []
         for item in criteria:
             if isinstance(item, AcceptanceCriterion):
@@ -619,27 +633,40 @@ class CollaborativeWorkflowEngine:
             "phase_name": "review_refinement",
             "started_at": datetime.utcnow().isoformat(),
             "config": dict(REVIEW_REFINEMENT_PHASE_CONFIG),
+            "spawn": spawn,
             "roles_executed": [],
         }
 
-        verdicts = []
-        for role in roles:
-            review_task = build_review_refinement_task(
+        review_tasks = [
+            build_review_refinement_task(
                 role=role,  # type: ignore[arg-type]
                 task=task,
                 result=result,
                 criteria=normalized,
             )
-            review_payload = await spawn_verifier(review_task)
-            phase_record["roles_executed"].append({"role": role, "task_id": review_task.get("task_id"), "spawn": "sequential"})
-            verdicts.append(
-                review_refinement_response_to_verdict(
-                    review_payload,
-                    role=role,  # type: ignore[arg-type]
-                    criteria=normalized,
-                )
-            )
-
+            for role in roles
+        ]
+
+        started = time.perf_counter()
+        if spawn == "parallel":
+            semaphore = asyncio.Semaphore(max_concurrency or len(roles) or 1)
+
+            async def _bounded(role: str, review_task: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+                async with semaphore:
+                    return await self._run_review_role(role, review_task, spawn_verifier, normalized, spawn, role_timeout_seconds)
+
+            outcomes = list(await asyncio.gather(*(_bounded(role, rt) for role, rt in zip(roles, review_tasks))))
+            phase_record["max_concurrency"] = max_concurrency or len(roles)
+        else:
+            outcomes = []
+            for role, review_task in zip(roles, review_tasks):
+                outcomes.append(await self._run_review_role(role, review_task, spawn_verifier, normalized, spawn, role_timeout_seconds))
+        wall_clock_s = time.perf_counter() - started
+
+        verdicts = [verdict for verdict, _ in outcomes]
+        phase_record["roles_executed"] = [entry for _, entry in outcomes]
+        phase_record["wall_clock_ms"] = round(wall_clock_s * 1000, 1)
+        phase_record["role_time_ms"] = round(sum(entry["duration_ms"] for _, entry in outcomes), 1)
         phase_record["completed_at"] = datetime.utcnow().isoformat()
         phase_record["status"] = "completed"
 
@@ -650,6 +677,52 @@ class CollaborativeWorkflowEngine:
             "role_reviews": [v.to_dict() for v in verdicts],
         }
 
+    async def _run_review_role(
+        self,
+        role: str,
+        review_task: Dict[str, Any],
+        spawn_verifier: SpawnVerifierCallback,
+        criteria: List[Any],
+        spawn: ReviewSpawnMode,
+        timeout_seconds: Optional[float],
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Run one review role; timeouts and failures become an inconclusive verdict."""
+        from aiecs.domain.agent.verification.models import Verdict
+        from aiecs.domain.agent.verification.review_refinement import review_refinement_response_to_verdict
+
+        entry: Dict[str, Any] = {"role": role, "task_id": review_task.get("task_id"), "spawn": spawn}
+        started = time.perf_counter()
+        try:
+            if timeout_seconds is None:
+                review_payload = await spawn_verifier(review_task)
+            else:
+                review_payload = await asyncio.wait_for(spawn_verifier(review_task), timeout=timeout_seconds)
+            verdict = review_refinement_response_to_verdict(
+                review_payload,
+                role=role,  # type: ignore[arg-type]
+                criteria=criteria,
+            )
+            entry["status"] = "completed"
+        except asyncio.TimeoutError:
+            logger.warning(f"review_refinement role '{role}' timed out after {timeout_seconds}s")
+            verdict = Verdict(
+                passed=False,
+                kind="PARTIAL",
+                feedback=f"[{role}] Review inconclusive: no verdict within {timeout_seconds}s.",
+            )
+            entry["status"] = "timeout"
+        except Exception as e:
+            logger.warning(f"review_refinement role '{role}' failed: {e}")
+            verdict = Verdict(
+                passed=False,
+                kind="PARTIAL",
+                feedback=f"[{role}] Review inconclusive: {type(e).__name__}: {e}",
+            )
+            entry["status"] = "error"
+            entry["error"] = str(e)
+        entry["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return verdict, entry
+
     async def _execute_phase(
         self,
         session: CollaborationSession,
@@ -47,6 +47,7 @@ from aiecs.domain.context.compression.policy import (
     get_autocompact_threshold,
     resolve_compact_chain,
     should_compress,
+    should_compress_tokens,
 )
 from aiecs.domain.context.compression.progress import (
     COMPACT_PROGRESS_PHASES,
@@ -71,6 +72,7 @@ from aiecs.domain.context.compression.pairs import (
 from aiecs.domain.context.compression.ptl import truncate_head_for_ptl_retry
 from aiecs.domain.context.compression.tokens import (
     estimate_message_tokens,
+    estimate_raw_message_tokens,
     estimate_tokens,
     estimate_transcript_tokens,
     should_compress_messages,
@@ -110,6 +112,7 @@ __all__ = [
     "auto_compact_if_needed",
     "resolve_compact_chain",
     "should_compress",
+    "should_compress_tokens",
     "CONTEXT_COLLAPSE_HEAD_CHARS",
     "CONTEXT_COLLAPSE_TAIL_CHARS",
     "CONTEXT_COLLAPSE_TEXT_CHAR_LIMIT",
@@ -157,6 +160,7 @@ __all__ = [
     "compress_to_token_limit",
     "compress_with_earlier_placeholder",
     "estimate_message_tokens",
+    "estimate_raw_message_tokens",
     "estimate_tokens",
     "estimate_transcript_tokens",
     "get_autocompact_threshold",
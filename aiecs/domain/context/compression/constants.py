@@ -28,6 +28,11 @@ COMPACT_TIMEOUT_SECONDS = 25
 MAX_COMPACT_STREAMING_RETRIES = 2
 MAX_PTL_RETRIES = 3
 
+# A5 chunked summarization: parallel map fan-out and tree-reduce fan-in
+DEFAULT_SUMMARY_MAX_CONCURRENCY = 4
+DEFAULT_SUMMARY_MERGE_FAN_IN = 8
+SUMMARY_CHUNK_FALLBACK_HEADER = "[Section summary unavailable; truncated transcript follows]"
+
 SESSION_MEMORY_KEEP_RECENT = 12
 SESSION_MEMORY_MAX_LINES = 48
 SESSION_MEMORY_MAX_CHARS = 4_000
@@ -6,16 +6,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import re
 from typing import Any, Literal
 
 from aiecs.llm import LLMMessage
 
 from aiecs.domain.context.compression.constants import (
+    DEFAULT_SUMMARY_MAX_CONCURRENCY,
+    DEFAULT_SUMMARY_MERGE_FAN_IN,
     ERROR_MESSAGE_INCOMPLETE_RESPONSE,
     MAX_COMPACT_STREAMING_RETRIES,
     MAX_OUTPUT_TOKENS_FOR_SUMMARY,
     MAX_PTL_RETRIES,
+    SUMMARY_CHUNK_FALLBACK_HEADER,
 )
 from aiecs.domain.context.compression.collapse import try_context_collapse
 from aiecs.domain.context.compression.images import replace_images_for_compaction
@@ -25,7 +30,7 @@ from aiecs.domain.context.compression.ptl import (
     is_prompt_too_long_error,
     truncate_head_for_ptl_retry,
 )
-from aiecs.domain.context.compression.tokens import estimate_message_tokens
+from aiecs.domain.context.compression.tokens import estimate_message_tokens, max_text_chars_for_tokens
 from aiecs.domain.context.compression.result import (
     build_post_compact_messages,
     create_compact_boundary_message,
@@ -45,6 +50,8 @@ from aiecs.domain.context.compression.types import (
     SessionMemoryPort,
 )
 
+logger = logging.getLogger(__name__)
+
 NO_TOOLS_PREAMBLE = """\
 CRITICAL: Respond with TEXT ONLY. Do NOT call any tools.
 
@@ -200,52 +207,40 @@ async def _summarize_old_messages(
     raise RuntimeError(ERROR_MESSAGE_INCOMPLETE_RESPONSE)
 
 
+def _fits_text_budget(length: int, max_chars: int, max_tokens: int) -> bool:
+    """Whether a plain user message of *length* chars fits (see ``max_text_chars_for_tokens``)."""
+    if length == 0:
+        return max_tokens >= 0
+    return length <= max_chars
+
+
 def _split_text_for_token_budget(text: str, max_tokens: int) -> list[str]:
     """Split *text* into contiguous parts each estimated within *max_tokens*."""
     if not text:
         return [""]
 
-    def _fits(chunk: str) -> bool:
-        return estimate_message_tokens([LLMMessage(role="user", content=chunk)]) <= max_tokens
-
-    if _fits(text):
+    max_chars = max_text_chars_for_tokens(max_tokens)
+    if _fits_text_budget(len(text), max_chars, max_tokens):
         return [text]
 
-    parts: list[str] = []
-    start = 0
-    length = len(text)
-    while start < length:
-        low, high = 1, length - start
-        best = 1
-        while low <= high:
-            mid = (low + high) // 2
-            if _fits(text[start : start + mid]):
-                best = mid
-                low = mid + 1
-            else:
-                high = mid - 1
-        parts.append(text[start : start + best])
-        start += best
-    return parts
+    step = max(1, max_chars)
+    return [text[start : start + step] for start in range(0, len(text), step)]
 
 
 def _truncate_text_for_token_budget(text: str, max_tokens: int) -> str:
     """Head-truncate *text* with a marker when it cannot be split further."""
     marker_prefix = "\n...[truncated "
     marker_suffix = " chars for summarize chunk]..."
+    max_chars = max_text_chars_for_tokens(max_tokens)
 
-    def _within_budget(candidate: str) -> bool:
-        return estimate_message_tokens([LLMMessage(role="user", content=candidate)]) <= max_tokens
-
-    if _within_budget(text):
+    if _fits_text_budget(len(text), max_chars, max_tokens):
         return text
 
+    marker_chars = len(marker_prefix) + len(marker_suffix)
     low, high = 0, len(text)
     while low < high:
         mid = (low + high + 1) // 2
-        omitted = len(text) - mid
-        candidate = text[:mid] + f"{marker_prefix}{omitted}{marker_suffix}"
-        if _within_budget(candidate):
+        if _fits_text_budget(mid + marker_chars + len(str(len(text) - mid)), max_chars, max_tokens):
             low = mid
         else:
             high = mid - 1
@@ -317,6 +312,91 @@ def _split_messages_by_token_budget(
     return chunks or [[]]
 
 
+def _render_chunk_transcript(chunk: list[LLMMessage]) -> str:
+    """Plain ``role: content`` transcript of *chunk* for degraded summaries."""
+    lines: list[str] = []
+    for message in chunk:
+        text = message.content or ""
+        if message.tool_calls:
+            names = ", ".join(str((call.get("function") or {}).get("name", "")) for call in message.tool_calls if isinstance(call, dict))
+            text = f"{text}\n[tool calls: {names}]" if text else f"[tool calls: {names}]"
+        lines.append(f"{message.role}: {text}")
+    return "\n".join(lines)
+
+
+def _merge_prompt(summaries: list[str]) -> str:
+    return (
+        "Merge the following section summaries of a long conversation into one "
+        "coherent structured summary. Preserve all key facts, file paths, errors, "
+        "and pending tasks. Respond with <analysis> followed by <summary>.\n\n" + "\n\n---\n\n".join(f"Section {index + 1}:\n{summary}" for index, summary in enumerate(summaries))
+    )
+
+
+async def _map_reduce_summaries(
+    llm_client: Any,
+    chunks: list[list[LLMMessage]],
+    *,
+    compact_prompt: str,
+    summary_max_tokens: int,
+    system_prompt: str,
+    max_concurrency: int,
+    merge_fan_in: int,
+) -> str:
+    """A5: summarize *chunks* concurrently, then merge with a tree reduce.
+
+    At most *max_concurrency* LLM calls run at once across both phases. A chunk
+    whose summarize call fails is replaced by its truncated transcript, and a
+    failed merge by its truncated input sections, so one bad call degrades the
+    summary instead of aborting the compaction. Only when every chunk fails is
+    the first error raised.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    fan_in = max(2, merge_fan_in)
+
+    async def _summarize(batch: list[LLMMessage]) -> str:
+        async with semaphore:
+            return await _summarize_old_messages(
+                llm_client,
+                batch,
+                summary_max_tokens=summary_max_tokens,
+                system_prompt=system_prompt,
+            )
+
+    map_results = await asyncio.gather(
+        *(_summarize(replace_images_for_compaction(list(chunk)) + [LLMMessage(role="user", content=compact_prompt)]) for chunk in chunks),
+        return_exceptions=True,
+    )
+    failures = [result for result in map_results if isinstance(result, BaseException)]
+    if len(failures) == len(map_results):
+        raise failures[0]
+
+    summaries: list[str] = []
+    for index, (chunk, result) in enumerate(zip(chunks, map_results)):
+        if isinstance(result, BaseException):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            logger.warning("Chunk %d/%d summarize failed (%s); using truncated transcript", index + 1, len(chunks), result)
+            fallback = _truncate_text_for_token_budget(_render_chunk_transcript(chunk), summary_max_tokens)
+            summaries.append(f"{SUMMARY_CHUNK_FALLBACK_HEADER}\n{fallback}")
+        else:
+            summaries.append(result)
+
+    async def _merge(group: list[str]) -> str:
+        if len(group) == 1:
+            return group[0]
+        try:
+            return await _summarize([LLMMessage(role="user", content=_merge_prompt(group))])
+        except Exception as exc:
+            logger.warning("Summary merge of %d sections failed (%s); concatenating sections", len(group), exc)
+            return _truncate_text_for_token_budget("\n\n---\n\n".join(group), summary_max_tokens)
+
+    level = summaries
+    while len(level) > fan_in:
+        groups = [level[start : start + fan_in] for start in range(0, len(level), fan_in)]
+        level = list(await asyncio.gather(*(_merge(group) for group in groups)))
+    return await _merge(level)
+
+
 async def _summarize_older_messages(
     llm_client: Any,
     older: list[LLMMessage],
@@ -325,8 +405,10 @@ async def _summarize_older_messages(
     summary_max_tokens: int,
     system_prompt: str,
     custom_instructions: str | None,
+    summary_max_concurrency: int = DEFAULT_SUMMARY_MAX_CONCURRENCY,
+    summary_merge_fan_in: int = DEFAULT_SUMMARY_MERGE_FAN_IN,
 ) -> str:
-    """Summarize *older* segment; chunk + merge when A5 ``summary_chunk_size`` is set."""
+    """Summarize *older* segment; chunk + map-reduce when A5 ``summary_chunk_size`` is set."""
     compact_prompt = get_compact_prompt(custom_instructions)
     older_tokens = estimate_message_tokens(older)
     if summary_chunk_size is None or older_tokens <= summary_chunk_size:
@@ -338,31 +420,14 @@ async def _summarize_older_messages(
             system_prompt=system_prompt,
         )
 
-    chunk_summaries: list[str] = []
-    for chunk in _split_messages_by_token_budget(older, summary_chunk_size):
-        summarize_batch = replace_images_for_compaction(list(chunk)) + [LLMMessage(role="user", content=compact_prompt)]
-        chunk_summaries.append(
-            await _summarize_old_messages(
-                llm_client,
-                summarize_batch,
-                summary_max_tokens=summary_max_tokens,
-                system_prompt=system_prompt,
-            )
-        )
-
-    if len(chunk_summaries) == 1:
-        return chunk_summaries[0]
-
-    merge_prompt = (
-        "Merge the following section summaries of a long conversation into one "
-        "coherent structured summary. Preserve all key facts, file paths, errors, "
-        "and pending tasks. Respond with <analysis> followed by <summary>.\n\n" + "\n\n---\n\n".join(f"Section {index + 1}:\n{summary}" for index, summary in enumerate(chunk_summaries))
-    )
-    return await _summarize_old_messages(
+    return await _map_reduce_summaries(
         llm_client,
-        [LLMMessage(role="user", content=merge_prompt)],
+        _split_messages_by_token_budget(older, summary_chunk_size),
+        compact_prompt=compact_prompt,
         summary_max_tokens=summary_max_tokens,
         system_prompt=system_prompt,
+        max_concurrency=summary_max_concurrency,
+        merge_fan_in=summary_merge_fan_in,
     )
 
 
@@ -401,6 +466,8 @@ async def compact_conversation(
     custom_instructions: str | None = None,
     summary_max_tokens: int = MAX_OUTPUT_TOKENS_FOR_SUMMARY,
     summary_chunk_size: int | None = None,
+    summary_max_concurrency: int = DEFAULT_SUMMARY_MAX_CONCURRENCY,
+    summary_merge_fan_in: int = DEFAULT_SUMMARY_MERGE_FAN_IN,
     suppress_follow_up: bool = True,
     trigger: CompactTrigger = "manual",
     system_prompt: str = "",
@@ -449,6 +516,8 @@ async def compact_conversation(
         summary_max_tokens=summary_max_tokens,
         system_prompt=system_prompt,
         custom_instructions=instructions,
+        summary_max_concurrency=summary_max_concurrency,
+        summary_merge_fan_in=summary_merge_fan_in,
     )
 
     summary_content = build_compact_summary_message(
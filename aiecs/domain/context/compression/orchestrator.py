@@ -357,6 +357,8 @@ async def auto_compact_if_needed(
                     preserve_recent=effective_policy.preserve_recent,
                     summary_role=effective_policy.summary_role,
                     summary_chunk_size=effective_policy.summary_chunk_size,
+                    summary_max_concurrency=effective_policy.summary_max_concurrency,
+                    summary_merge_fan_in=effective_policy.summary_merge_fan_in,
                     trigger=trigger,
                 )
                 compacted = build_post_compact_messages(llm_result)
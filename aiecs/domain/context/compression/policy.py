@@ -11,7 +11,11 @@ from typing import Literal, Sequence
 
 from aiecs.llm import LLMMessage
 
-from aiecs.domain.context.compression.constants import AUTOCOMPACT_BUFFER_TOKENS
+from aiecs.domain.context.compression.constants import (
+    AUTOCOMPACT_BUFFER_TOKENS,
+    DEFAULT_SUMMARY_MAX_CONCURRENCY,
+    DEFAULT_SUMMARY_MERGE_FAN_IN,
+)
 from aiecs.domain.context.compression.state import AutoCompactState
 from aiecs.domain.context.compression.tokens import (
     get_autocompact_threshold as _get_autocompact_threshold,
@@ -33,6 +37,8 @@ class CompressionPolicy:
     chain: tuple[str, ...] = ("microcompact", "collapse", "session_memory", "llm")
     summary_role: Literal["user", "system"] = "user"
     summary_chunk_size: int | None = None
+    summary_max_concurrency: int = DEFAULT_SUMMARY_MAX_CONCURRENCY
+    summary_merge_fan_in: int = DEFAULT_SUMMARY_MERGE_FAN_IN
     truncation_mode: TruncationMode = TruncationMode.EARLIER_PLACEHOLDER
 
 
@@ -69,6 +75,24 @@ def should_compress(
     )
 
 
+def should_compress_tokens(
+    estimated_tokens: int,
+    policy: CompressionPolicy,
+    *,
+    state: AutoCompactState | None = None,
+) -> bool:
+    """O2 gate for an already-estimated (padded) token count.
+
+    Mirrors ``should_compress`` for callers that track a running token total
+    instead of holding the message list.
+    """
+    if not policy.enabled:
+        return False
+    if state is not None and state.consecutive_failures >= policy.max_consecutive_failures:
+        return False
+    return estimated_tokens >= get_autocompact_threshold(policy)
+
+
 LEGACY_STRATEGY_CHAINS: dict[str, tuple[str, ...]] = {
     "truncate": ("microcompact",),
     "summarize": ("microcompact", "llm"),
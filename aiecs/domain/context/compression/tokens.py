@@ -46,8 +46,12 @@ def _vision_token_budget_per_image() -> int:
     return DEFAULT_VISION_IMAGE_TOKEN_ESTIMATE
 
 
-def estimate_message_tokens(messages: Sequence[LLMMessage]) -> int:
-    """Estimate total tokens for messages, including 4/3 padding."""
+def estimate_raw_message_tokens(messages: Sequence[LLMMessage]) -> int:
+    """Estimate tokens for messages without padding.
+
+    Unlike the padded estimate this is additive across messages, so callers can
+    keep a running total and apply ``padded_token_estimate`` at the gate.
+    """
     total = 0
     image_token_estimate = _vision_token_budget_per_image()
     for message in messages:
@@ -61,7 +65,33 @@ def estimate_message_tokens(messages: Sequence[LLMMessage]) -> int:
                 total += estimate_tokens(str(block.input))
             elif isinstance(block, ImageBlock):
                 total += image_token_estimate
-    return int(total * TOKEN_ESTIMATION_PADDING)
+    return total
+
+
+def padded_token_estimate(raw_tokens: int) -> int:
+    """Apply the 4/3 estimation padding to a raw token total."""
+    return int(raw_tokens * TOKEN_ESTIMATION_PADDING)
+
+
+def estimate_message_tokens(messages: Sequence[LLMMessage]) -> int:
+    """Estimate total tokens for messages, including 4/3 padding."""
+    return padded_token_estimate(estimate_raw_message_tokens(messages))
+
+
+def max_text_chars_for_tokens(max_tokens: int) -> int:
+    """Longest plain-text length whose padded estimate fits *max_tokens*.
+
+    Inverse of ``estimate_tokens`` plus padding, so callers can size text
+    slices arithmetically instead of re-estimating candidate strings.
+    Returns 0 when no non-empty text fits.
+    """
+    raw = max(0, int(max_tokens / TOKEN_ESTIMATION_PADDING))
+    while raw > 0 and padded_token_estimate(raw) > max_tokens:
+        raw -= 1
+    while padded_token_estimate(raw + 1) <= max_tokens:
+        raw += 1
+    # estimate_tokens(text) == ceil(len(text) / 4), so 4 * raw chars map to raw tokens.
+    return 4 * raw
 
 
 def estimate_transcript_tokens(history: list[dict[str, Any]]) -> int:
@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from typing import Sequence
 
 from aiecs.llm import LLMMessage
@@ -14,7 +15,11 @@ from aiecs.domain.context.compression.pairs import (
     sanitize_messages_for_compaction,
     split_preserving_tool_pairs,
 )
-from aiecs.domain.context.compression.tokens import estimate_message_tokens
+from aiecs.domain.context.compression.tokens import (
+    estimate_message_tokens,
+    estimate_raw_message_tokens,
+    padded_token_estimate,
+)
 from aiecs.domain.context.compression.types import TruncationMode
 
 MIDDLE_PLACEHOLDER = "[... conversation history compressed ...]"
@@ -153,37 +158,51 @@ def compress_preserve_recent(
     priority_indices: set[int] | None = None,
     preserve_system: bool = True,
 ) -> list[LLMMessage]:
-    """Preserve recent and optional priority messages within token budget."""
+    """Preserve recent and optional priority messages within token budget.
+
+    Per-message raw token counts and the tool-pair index are built once; the
+    tail search then prices each candidate from suffix/prefix sums, so the whole
+    pass is linear in the number of messages.
+    """
     message_list = list(messages)
-    if estimate_message_tokens(message_list) <= max_tokens:
+    raw_tokens = [estimate_raw_message_tokens([message]) for message in message_list]
+    if padded_token_estimate(sum(raw_tokens)) <= max_tokens:
         return message_list
 
+    count = len(message_list)
     priority_indices = priority_indices or set()
     system_indices = {index for index, message in enumerate(message_list) if message.role == "system"} if preserve_system else set()
     system_msgs = [message_list[index] for index in sorted(system_indices)]
+    system_raw = sum(raw_tokens[index] for index in system_indices)
     keep_indices: set[int] = set()
-    budget = max_tokens - estimate_message_tokens(system_msgs)
+    budget = max_tokens - padded_token_estimate(system_raw)
 
+    pair_index = _build_tool_pair_index(message_list)
     for index in sorted(priority_indices):
-        if index >= len(message_list):
+        if index >= count:
             continue
-        block_indices = _expand_tool_pair_indices(message_list, index)
-        block = [message_list[i] for i in sorted(block_indices)]
-        block_tokens = estimate_message_tokens(block)
+        block_indices = _expand_tool_pair_indices(message_list, index, pair_index)
+        block_tokens = padded_token_estimate(sum(raw_tokens[i] for i in block_indices))
         if block_tokens <= budget:
             keep_indices |= block_indices
             budget -= block_tokens
 
+    # suffix_raw[k]: raw tokens of non-system messages at index >= k
+    suffix_raw = [0] * (count + 1)
+    for index in range(count - 1, -1, -1):
+        suffix_raw[index] = suffix_raw[index + 1] + (0 if index in system_indices else raw_tokens[index])
+    # keep_prefix_raw[j]: raw tokens of the first j non-system priority indices
+    kept_sorted = sorted(keep_indices - system_indices)
+    keep_prefix_raw = [0]
+    for index in kept_sorted:
+        keep_prefix_raw.append(keep_prefix_raw[-1] + raw_tokens[index])
+
     best_indices = set(keep_indices)
-    for tail_count in range(len(message_list), 0, -1):
-        split_at = split_preserving_tool_pairs(
-            message_list,
-            len(message_list) - tail_count,
-        )
-        candidate_indices = (keep_indices | set(range(split_at, len(message_list)))) - system_indices
-        candidate = [message_list[i] for i in sorted(candidate_indices)]
-        if estimate_message_tokens(system_msgs + candidate) <= max_tokens:
-            best_indices = candidate_indices | system_indices
+    for tail_count in range(count, 0, -1):
+        split_at = split_preserving_tool_pairs(message_list, count - tail_count)
+        kept_before_split = keep_prefix_raw[bisect_left(kept_sorted, split_at)]
+        if padded_token_estimate(system_raw + kept_before_split + suffix_raw[split_at]) <= max_tokens:
+            best_indices = ((keep_indices | set(range(split_at, count))) - system_indices) | system_indices
             break
 
     if not best_indices:
@@ -194,13 +213,15 @@ def compress_preserve_recent(
         )
 
     compressed = list(system_msgs)
+    compressed_raw = system_raw
     for index, message in enumerate(message_list):
         if index in system_indices:
             continue
         if index in best_indices:
             compressed.append(message)
+            compressed_raw += raw_tokens[index]
 
-    if estimate_message_tokens(compressed) <= max_tokens:
+    if padded_token_estimate(compressed_raw) <= max_tokens:
         return compressed
     return compress_with_earlier_placeholder(
         message_list,
@@ -209,20 +230,32 @@ def compress_preserve_recent(
     )
 
 
-def _expand_tool_pair_indices(messages: list[LLMMessage], index: int) -> set[int]:
+def _build_tool_pair_index(messages: list[LLMMessage]) -> tuple[dict[str, list[int]], dict[str, list[int]]]:
+    """Map tool_call_id -> assistant indices issuing it and -> tool result indices."""
+    assistants_by_id: dict[str, list[int]] = {}
+    results_by_id: dict[str, list[int]] = {}
+    for index, message in enumerate(messages):
+        if message.role == "assistant" and message.tool_calls:
+            for tool_call_id in {str(tool_call.get("id")) for tool_call in message.tool_calls}:
+                assistants_by_id.setdefault(tool_call_id, []).append(index)
+        elif message.role == "tool" and message.tool_call_id:
+            results_by_id.setdefault(message.tool_call_id, []).append(index)
+    return assistants_by_id, results_by_id
+
+
+def _expand_tool_pair_indices(
+    messages: list[LLMMessage],
+    index: int,
+    pair_index: tuple[dict[str, list[int]], dict[str, list[int]]] | None = None,
+) -> set[int]:
     """Include paired assistant/tool_use messages for a priority index."""
+    assistants_by_id, results_by_id = pair_index if pair_index is not None else _build_tool_pair_index(messages)
     indices = {index}
     message = messages[index]
     if message.role == "tool" and message.tool_call_id:
-        tool_call_id = message.tool_call_id
-        for candidate_index, candidate in enumerate(messages):
-            if candidate.role != "assistant" or not candidate.tool_calls:
-                continue
-            if any(str(tool_call.get("id")) == tool_call_id for tool_call in candidate.tool_calls):
-                indices.add(candidate_index)
+        indices.update(assistants_by_id.get(message.tool_call_id, ()))
     if message.role == "assistant" and message.tool_calls:
-        tool_ids = {str(tool_call.get("id")) for tool_call in message.tool_calls if tool_call.get("id")}
-        for candidate_index, candidate in enumerate(messages):
-            if candidate.role == "tool" and candidate.tool_call_id in tool_ids:
-                indices.add(candidate_index)
+        for tool_call in message.tool_calls:
+            if tool_call.get("id"):
+                indices.update(results_by_id.get(str(tool_call.get("id")), ()))
     return indices
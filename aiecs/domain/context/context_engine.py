@@ -27,7 +27,7 @@ import json
 import logging
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, cast, Tuple, Literal
+from typing import Dict, Any, List, Optional, Sequence, cast, Tuple, Literal
 from dataclasses import dataclass, asdict, is_dataclass
 
 
@@ -536,6 +536,7 @@ class ContextEngine(IStorageBackend, ICheckpointerBackend):
         # Fallback to memory storage if Redis not available
         self._memory_sessions: Dict[str, SessionMetrics] = {}
         self._memory_conversations: Dict[str, List[ConversationMessage]] = {}
+        self._memory_conversation_tokens: Dict[str, int] = {}
         self._memory_contexts: Dict[str, TaskContext] = {}
         self._memory_checkpoints: Dict[str, Dict[str, Any]] = {}
 
@@ -798,12 +799,14 @@ class ContextEngine(IStorageBackend, ICheckpointerBackend):
         """Store session to Redis or memory."""
         if self.redis_client:
             try:
-                await self.redis_client.hset(
-                    "sessions",
-                    session.session_id,
-                    json.dumps(session.to_dict(), cls=DateTimeEncoder),
-                )
-                await self.redis_client.expire("sessions", self.session_ttl)
+                async with self.redis_client.pipeline(transaction=True) as pipe:
+                    pipe.hset(
+                        "sessions",
+                        session.session_id,
+                        json.dumps(session.to_dict(), cls=DateTimeEncoder),
+                    )
+                    pipe.expire("sessions", self.session_ttl)
+                    await pipe.execute()
                 return
             except Exception as e:
                 logger.error(f"Failed to store session to Redis: {e}")
@@ -869,15 +872,23 @@ class ContextEngine(IStorageBackend, ICheckpointerBackend):
         """Store conversation message to Redis or memory."""
         if self.redis_client:
             try:
-                # Add to list
-                await self.redis_client.lpush(
-                    f"conversation:{session_id}",
-                    json.dumps(message.to_dict(), cls=DateTimeEncoder),
-                )
-                # Trim to limit
-                await self.redis_client.ltrim(f"conversation:{session_id}", -self.conversation_limit, -1)
-                # Set TTL
-                await self.redis_client.expire(f"conversation:{session_id}", self.session_ttl)
+                key = f"conversation:{session_id}"
+                tokens_key = f"conversation_tokens:{session_id}"
+                track_tokens = self._tracks_conversation_tokens
+                delta = self._estimate_conversation_tokens([message]) if track_tokens else 0
+                # Single atomic round trip: push, capture the entries the trim is
+                # about to drop, trim to limit and refresh TTLs.
+                async with self.redis_client.pipeline(transaction=True) as pipe:
+                    pipe.lpush(key, json.dumps(message.to_dict(), cls=DateTimeEncoder))
+                    pipe.lrange(key, 0, -self.conversation_limit - 1)
+                    pipe.ltrim(key, -self.conversation_limit, -1)
+                    pipe.expire(key, self.session_ttl)
+                    if track_tokens:
+                        pipe.incrby(tokens_key, delta)
+                        pipe.expire(tokens_key, self.session_ttl)
+                    results = await pipe.execute()
+                if track_tokens:
+                    await self._reconcile_appended_tokens(session_id, length=results[0], dropped=results[1], delta=delta, total=results[4])
                 # Dual-write: append to permanent backend
                 if self._permanent_backend:
                     await self._fire_permanent(
@@ -897,11 +908,21 @@ class ContextEngine(IStorageBackend, ICheckpointerBackend):
         if session_id not in self._memory_conversations:
             self._memory_conversations[session_id] = []
 
-        self._memory_conversations[session_id].append(message)
+        history = self._memory_conversations[session_id]
+        history.append(message)
 
         # Trim to limit
-        if len(self._memory_conversations[session_id]) > self.conversation_limit:
-            self._memory_conversations[session_id] = self._memory_conversations[session_id][-self.conversation_limit :]
+        dropped: List[ConversationMessage] = []
+        if len(history) > self.conversation_limit:
+            dropped = history[: -self.conversation_limit]
+            self._memory_conversations[session_id] = history[-self.conversation_limit :]
+
+        if self._tracks_conversation_tokens:
+            delta = self._estimate_conversation_tokens([message]) - self._estimate_conversation_tokens(dropped)
+            if len(history) == 1:
+                self._memory_conversation_tokens[session_id] = delta
+            elif session_id in self._memory_conversation_tokens:
+                self._memory_conversation_tokens[session_id] += delta
 
         # Dual-write when using memory fallback
         if self._permanent_backend:
@@ -915,6 +936,68 @@ class ContextEngine(IStorageBackend, ICheckpointerBackend):
                 )
             )
 
+    # ==================== Conversation Token Accounting ====================
+
+    @property
+    def _tracks_conversation_tokens(self) -> bool:
+        """Whether a running token total is kept per conversation (O8 gate)."""
+        return self.compress_on_append or self.compression_policy is not None
+
+    @staticmethod
+    def _estimate_conversation_tokens(messages: Sequence[ConversationMessage]) -> int:
+        """Raw (unpadded, additive) token estimate for stored conversation messages."""
+        if not messages:
+            return 0
+        from aiecs.domain.context.compression.adapters.conversation_message import conversation_messages_to_llm_messages
+        from aiecs.domain.context.compression.tokens import estimate_raw_message_tokens
+
+        return estimate_raw_message_tokens(conversation_messages_to_llm_messages(messages))
+
+    async def _reconcile_appended_tokens(self, session_id: str, length: int, dropped: List[Any], delta: int, total: int) -> None:
+        """
+        Correct the Redis token counter after a pipelined append.
+
+        The append already added ``delta``. A counter that did not exist while
+        older messages did is discarded instead of being kept as a partial sum,
+        so the next gate check re-seeds it; entries dropped by the trim are
+        subtracted. Both cases cost one extra round trip and are rare.
+        """
+        redis_client = self.redis_client
+        if redis_client is None:
+            return
+        tokens_key = f"conversation_tokens:{session_id}"
+        if length == 1:
+            if total != delta:
+                await redis_client.set(tokens_key, delta, ex=self.session_ttl)
+        elif total == delta:
+            await redis_client.delete(tokens_key)
+        elif dropped:
+            dropped_messages = [ConversationMessage.from_dict(json.loads(d)) for d in dropped]
+            await redis_client.incrby(tokens_key, -self._estimate_conversation_tokens(dropped_messages))
+
+    async def _get_conversation_tokens(self, session_id: str) -> Optional[int]:
+        """Return the tracked raw token total for a conversation, or None if unknown."""
+        if self.redis_client:
+            try:
+                value = await self.redis_client.get(f"conversation_tokens:{session_id}")
+                return int(value) if value is not None else None
+            except Exception as e:
+                logger.error(f"Failed to get conversation token count from Redis: {e}")
+                return None
+
+        return self._memory_conversation_tokens.get(session_id)
+
+    async def _set_conversation_tokens(self, session_id: str, tokens: int) -> None:
+        """Overwrite the tracked raw token total for a conversation."""
+        if self.redis_client:
+            try:
+                await self.redis_client.set(f"conversation_tokens:{session_id}", tokens, ex=self.session_ttl)
+                return
+            except Exception as e:
+                logger.error(f"Failed to store conversation token count to Redis: {e}")
+
+        self._memory_conversation_tokens[session_id] = tokens
+
     # ==================== TaskContext Integration ====================
 
     async def get_task_context(self, session_id: str) -> Optional[TaskContext]:
@@ -983,12 +1066,14 @@ class ContextEngine(IStorageBackend, ICheckpointerBackend):
                 context_dict = context.to_dict()
                 sanitized_dict = self._sanitize_dataclasses(context_dict)
 
-                await self.redis_client.hset(
-                    "task_contexts",
-                    session_id,
-                    json.dumps(sanitized_dict, cls=DateTimeEncoder),
-                )
-                await self.redis_client.expire("task_contexts", self.session_ttl)
+                async with self.redis_client.pipeline(transaction=True) as pipe:
+                    pipe.hset(
+                        "task_contexts",
+                        session_id,
+                        json.dumps(sanitized_dict, cls=DateTimeEncoder),
+                    )
+                    pipe.expire("task_contexts", self.session_ttl)
+                    await pipe.execute()
                 # Dual-write: append task context snapshot
                 if self._permanent_backend:
                     await self._fire_permanent(
@@ -1064,14 +1149,15 @@ class ContextEngine(IStorageBackend, ICheckpointerBackend):
 
         if self.redis_client:
             try:
-                # Store checkpoint
-                await self.redis_client.hset(
-                    f"checkpoints:{thread_id}",
-                    checkpoint_id,
-                    json.dumps(checkpoint, cls=DateTimeEncoder),
-                )
-                # Set TTL
-                await self.redis_client.expire(f"checkpoints:{thread_id}", self.checkpoint_ttl)
+                # Store checkpoint and set TTL in one round trip
+                async with self.redis_client.pipeline(transaction=True) as pipe:
+                    pipe.hset(
+                        f"checkpoints:{thread_id}",
+                        checkpoint_id,
+                        json.dumps(checkpoint, cls=DateTimeEncoder),
+                    )
+                    pipe.expire(f"checkpoints:{thread_id}", self.checkpoint_ttl)
+                    await pipe.execute()
 
                 # Dual-write: append checkpoint to permanent backend
                 if self._permanent_backend:
@@ -1206,20 +1292,23 @@ class ContextEngine(IStorageBackend, ICheckpointerBackend):
         """Clean up all data associated with a session."""
         if self.redis_client:
             try:
-                # Remove session
-                await self.redis_client.hdel("sessions", session_id)
-                # Remove conversation
-                await self.redis_client.delete(f"conversation:{session_id}")
-                # Remove task context
-                await self.redis_client.hdel("task_contexts", session_id)
-                # Remove checkpoints
-                await self.redis_client.delete(f"checkpoints:{session_id}")
+                async with self.redis_client.pipeline(transaction=True) as pipe:
+                    # Remove session
+                    pipe.hdel("sessions", session_id)
+                    # Remove conversation
+                    pipe.delete(f"conversation:{session_id}", f"conversation_tokens:{session_id}")
+                    # Remove task context
+                    pipe.hdel("task_contexts", session_id)
+                    # Remove checkpoints
+                    pipe.delete(f"checkpoints:{session_id}")
+                    await pipe.execute()
             except Exception as e:
                 logger.error(f"Failed to cleanup session data from Redis: {e}")
         else:
             # Memory cleanup
             self._memory_sessions.pop(session_id, None)
             self._memory_conversations.pop(session_id, None)
+            self._memory_conversation_tokens.pop(session_id, None)
             self._memory_contexts.pop(session_id, None)
 
             # Remove checkpoints
@@ -1311,12 +1400,14 @@ class ContextEngine(IStorageBackend, ICheckpointerBackend):
 
         if self.redis_client:
             try:
-                await self.redis_client.hset(
-                    f"checkpoint_writes:{thread_id}",
-                    f"{checkpoint_id}:{task_id}",
-                    json.dumps(writes_payload, cls=DateTimeEncoder),
-                )
-                await self.redis_client.expire(f"checkpoint_writes:{thread_id}", self.checkpoint_ttl)
+                async with self.redis_client.pipeline(transaction=True) as pipe:
+                    pipe.hset(
+                        f"checkpoint_writes:{thread_id}",
+                        f"{checkpoint_id}:{task_id}",
+                        json.dumps(writes_payload, cls=DateTimeEncoder),
+                    )
+                    pipe.expire(f"checkpoint_writes:{thread_id}", self.checkpoint_ttl)
+                    await pipe.execute()
                 # Dual-write: append checkpoint writes
                 if self._permanent_backend:
                     await self._fire_permanent(
@@ -1555,12 +1646,14 @@ class ContextEngine(IStorageBackend, ICheckpointerBackend):
 
         if self.redis_client:
             try:
-                await self.redis_client.hset(
-                    "conversation_sessions",
-                    session_key,
-                    json.dumps(session_data, cls=DateTimeEncoder),
-                )
-                await self.redis_client.expire("conversation_sessions", self.session_ttl)
+                async with self.redis_client.pipeline(transaction=True) as pipe:
+                    pipe.hset(
+                        "conversation_sessions",
+                        session_key,
+                        json.dumps(session_data, cls=DateTimeEncoder),
+                    )
+                    pipe.expire("conversation_sessions", self.session_ttl)
+                    await pipe.execute()
                 # Dual-write: append conversation session
                 if self._permanent_backend:
                     await self._fire_permanent(
@@ -1760,7 +1853,9 @@ class ContextEngine(IStorageBackend, ICheckpointerBackend):
             llm_messages_to_conversation_messages,
         )
         from aiecs.domain.context.compression.llm_compact import compact_conversation
+        from aiecs.domain.context.compression.policy import CompressionPolicy
 
+        policy = self.compression_policy or CompressionPolicy()
         llm_messages = conversation_messages_to_llm_messages(messages)
         custom_instructions = None
         if config.summary_prompt_template:
@@ -1772,7 +1867,9 @@ class ContextEngine(IStorageBackend, ICheckpointerBackend):
             llm_client=self.llm_client,
             preserve_recent=config.keep_recent,
             summary_role=self._resolve_summary_role(),
-            summary_chunk_size=(self.compression_policy.summary_chunk_size if self.compression_policy is not None else None),
+            summary_chunk_size=policy.summary_chunk_size,
+            summary_max_concurrency=policy.summary_max_concurrency,
+            summary_merge_fan_in=policy.summary_merge_fan_in,
             custom_instructions=custom_instructions,
             summary_max_tokens=config.summary_max_tokens,
         )
@@ -1952,18 +2049,18 @@ Summary:"""
         """
         if self.redis_client:
             try:
-                # Clear existing messages
-                await self.redis_client.delete(f"conversation:{session_id}")
-
-                # Store new messages
-                for msg in messages:
-                    await self.redis_client.rpush(
-                        f"conversation:{session_id}",
-                        json.dumps(msg.to_dict(), cls=DateTimeEncoder),
-                    )
-
-                # Set TTL
-                await self.redis_client.expire(f"conversation:{session_id}", self.session_ttl)
+                key = f"conversation:{session_id}"
+                # Atomic bulk swap in one round trip so readers never observe an
+                # empty list. LPUSH of chronological payloads keeps the newest
+                # message at the head, matching _store_conversation_message.
+                async with self.redis_client.pipeline(transaction=True) as pipe:
+                    pipe.delete(key)
+                    if messages:
+                        pipe.lpush(key, *(json.dumps(msg.to_dict(), cls=DateTimeEncoder) for msg in messages))
+                        pipe.expire(key, self.session_ttl)
+                    if self._tracks_conversation_tokens:
+                        pipe.set(f"conversation_tokens:{session_id}", self._estimate_conversation_tokens(messages), ex=self.session_ttl)
+                    await pipe.execute()
 
                 logger.debug(f"Replaced conversation history for {session_id} with {len(messages)} messages")
                 return
@@ -1972,6 +2069,8 @@ Summary:"""
 
         # Fallback to memory
         self._memory_conversations[session_id] = messages
+        if self._tracks_conversation_tokens:
+            self._memory_conversation_tokens[session_id] = self._estimate_conversation_tokens(messages)
         logger.debug(f"Replaced conversation history (memory) for {session_id} with {len(messages)} messages")
 
     async def _compress_with_hybrid(self, messages: List[ConversationMessage], config: CompressionConfig) -> List[ConversationMessage]:
@@ -2062,28 +2161,40 @@ Summary:"""
         *,
         strategy: str | Tuple[str, ...] | None = None,
     ) -> Optional[Dict[str, Any]]:
-        """O8: token-based compress-on-append via ``auto_compact_if_needed``."""
+        """O8: token-based compress-on-append via ``auto_compact_if_needed``.
+
+        A running per-session token total is checked first; the full history is
+        only loaded and converted when that total crosses the policy threshold
+        (or when no total is tracked yet, in which case it is seeded).
+        """
         from aiecs.domain.context.compression.adapters.conversation_message import (
             conversation_messages_to_llm_messages,
             llm_messages_to_conversation_messages,
         )
         from aiecs.domain.context.compression.orchestrator import auto_compact_if_needed
-        from aiecs.domain.context.compression.policy import CompressionPolicy, resolve_compact_chain
+        from aiecs.domain.context.compression.policy import CompressionPolicy, resolve_compact_chain, should_compress_tokens
         from aiecs.domain.context.compression.state import AutoCompactState
         from aiecs.domain.context.compression.metadata import LAYER_CE, build_pre_compact_metadata
-        from aiecs.domain.context.compression.tokens import estimate_message_tokens
+        from aiecs.domain.context.compression.tokens import estimate_raw_message_tokens, padded_token_estimate
 
         policy = self.compression_policy or CompressionPolicy(enabled=False)
         if not policy.enabled and not self.compress_on_append:
             return None
 
+        state = self._auto_compact_states.setdefault(session_id, AutoCompactState())
+        tracked_tokens = await self._get_conversation_tokens(session_id)
+        if tracked_tokens is not None and not should_compress_tokens(padded_token_estimate(tracked_tokens), policy, state=state):
+            return None
+
         messages = await self.get_conversation_history(session_id, limit=0)
         if not messages:
             return None
 
         original_count = len(messages)
         llm_messages = conversation_messages_to_llm_messages(messages)
-        state = self._auto_compact_states.setdefault(session_id, AutoCompactState())
+        raw_tokens = estimate_raw_message_tokens(llm_messages)
+        if raw_tokens != tracked_tokens:
+            await self._set_conversation_tokens(session_id, raw_tokens)
         resolved_chain = resolve_compact_chain(policy, strategy)
 
         if self.llm_client is None and "llm" in resolved_chain:
@@ -2095,7 +2206,7 @@ Summary:"""
         compact_metadata = build_pre_compact_metadata(
             layer=LAYER_CE,
             session_id=session_id,
-            estimated_tokens=estimate_message_tokens(llm_messages),
+            estimated_tokens=padded_token_estimate(raw_tokens),
         )
 
         compacted, did_compact = await auto_compact_if_needed(
@@ -37,6 +37,7 @@ class TaskStepResult:
         status: str = "pending",
         error_code: Optional[str] = None,
         error_message: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
     ):
         self.step = step
         self.result = result
@@ -45,9 +46,10 @@ class TaskStepResult:
         self.status = status
         self.error_code = error_code
         self.error_message = error_message
+        self.metadata = metadata
 
     def dict(self) -> Dict[str, Any]:
-        return {
+        data = {
             "step": self.step,
             "result": self.result,
             "completed": self.completed,
@@ -56,6 +58,9 @@ class TaskStepResult:
             "error_code": self.error_code,
             "error_message": self.error_message,
         }
+        if self.metadata is not None:
+            data["metadata"] = self.metadata
+        return data
 
     def __repr__(self) -> str:
         return f"TaskStepResult(step='{self.step}', status='{self.status}', completed={self.completed})"
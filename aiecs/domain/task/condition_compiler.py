@@ -0,0 +1,245 @@
+# /*---------------------------------------------------------------------------------------------
+#  *  Copyright (c) IRETBL Corporation. All rights reserved.
+#  *  Licensed under the Apache-2.0. See License.txt in the project root for license information.
+#  *--------------------------------------------------------------------------------------------*/
+"""
+Condition compiler for the task DSL.
+
+``compile_condition`` parses a condition string such as
+``"intent.includes('search') AND context.retries < 3"`` into a small tree of
+nodes once; the result is cached by condition string in an LRU, so loop and
+branch conditions are not re-tokenized on every evaluation.  Evaluation does
+no string or regex work and short-circuits ``AND`` / ``OR``.
+
+The grammar and semantics are exactly those of the original
+``DSLProcessor.evaluate_condition``:
+
+- ``" AND "`` splits first (so it binds looser than ``OR``), then ``" OR "``;
+  parts are stripped.
+- Leaves: ``intent.includes('x')``, ``context.f <op> v``, ``input.f <op> v``,
+  ``result[i].f <op> v``.  A ``context`` / ``input`` / ``result`` leaf raises
+  when its source is empty or the result entry is missing, and an unrecognised
+  leaf raises — both only when the leaf is actually evaluated.
+- Every failure is raised as ``ValueError("Failed to evaluate condition '<c>': ...")``,
+  wrapped once per enclosing compound condition.
+"""
+
+import logging
+import operator
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+logger = logging.getLogger(__name__)
+
+CONDITION_CACHE_SIZE = 1024
+
+_INTENT_RE = re.compile(r"intent\.includes\('([^']+)'\)")
+_CONTEXT_RE = re.compile(r"context\.(\w+)\s*(==|!=|>|<|>=|<=)\s*(.+)")
+_INPUT_RE = re.compile(r"input\.(\w+)\s*(==|!=|>|<|>=|<=)\s*(.+)")
+_RESULT_RE = re.compile(r"result\[(\d+)\]\.(\w+)\s*(==|!=|>|<|>=|<=)\s*(.+)")
+
+_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
+
+def parse_value(value_str: str) -> Any:
+    """Parse a literal from a condition (quoted string, boolean, int, float, else raw string)"""
+    value_str = value_str.strip()
+
+    # String value
+    if value_str.startswith('"') and value_str.endswith('"'):
+        return value_str[1:-1]
+    if value_str.startswith("'") and value_str.endswith("'"):
+        return value_str[1:-1]
+
+    # Boolean value
+    if value_str.lower() == "true":
+        return True
+    if value_str.lower() == "false":
+        return False
+
+    # Numeric value
+    try:
+        if "." in value_str:
+            return float(value_str)
+        else:
+            return int(value_str)
+    except ValueError:
+        pass
+
+    # Default return string
+    return value_str
+
+
+def evaluate_comparison(left_value: Any, op: str, right_value: Any) -> bool:
+    """Evaluate ``left_value <op> right_value``; ``False`` when the types don't compare"""
+    compare = _OPERATORS.get(op)
+    if compare is None:
+        raise ValueError(f"Unsupported operator: {op}")
+    try:
+        return cast(bool, compare(left_value, right_value))
+    except TypeError:
+        # Return False when types don't match
+        return False
+
+
+class ConditionNode:
+    """Compiled condition node; ``evaluate`` wraps failures like the original evaluator"""
+
+    __slots__ = ("source",)
+
+    def __init__(self, source: str):
+        self.source = source
+
+    def evaluate(
+        self,
+        intent_categories: List[str],
+        context: Optional[Dict[str, Any]],
+        input_data: Optional[Dict[str, Any]],
+        results: Optional[List[Any]],
+    ) -> bool:
+        try:
+            return self._evaluate(intent_categories, context, input_data, results)
+        except Exception as e:
+            logger.error(f"Failed to evaluate condition '{self.source}': {e}")
+            raise ValueError(f"Failed to evaluate condition '{self.source}': {e}")
+
+    def _evaluate(self, intent_categories, context, input_data, results) -> bool:
+        raise NotImplementedError
+
+
+class _And(ConditionNode):
+    __slots__ = ("parts",)
+
+    def __init__(self, source: str, parts: Tuple[ConditionNode, ...]):
+        super().__init__(source)
+        self.parts = parts
+
+    def _evaluate(self, intent_categories, context, input_data, results) -> bool:
+        for part in self.parts:
+            if not part.evaluate(intent_categories, context, input_data, results):
+                return False
+        return True
+
+
+class _Or(ConditionNode):
+    __slots__ = ("parts",)
+
+    def __init__(self, source: str, parts: Tuple[ConditionNode, ...]):
+        super().__init__(source)
+        self.parts = parts
+
+    def _evaluate(self, intent_categories, context, input_data, results) -> bool:
+        for part in self.parts:
+            if part.evaluate(intent_categories, context, input_data, results):
+                return True
+        return False
+
+
+class _IntentIncludes(ConditionNode):
+    __slots__ = ("category",)
+
+    def __init__(self, source: str, category: str):
+        super().__init__(source)
+        self.category = category
+
+    def _evaluate(self, intent_categories, context, input_data, results) -> bool:
+        return self.category in intent_categories
+
+
+class _FieldComparison(ConditionNode):
+    """``context.field`` / ``input.field`` comparison against a pre-parsed literal"""
+
+    __slots__ = ("use_input", "field", "op", "compare", "value")
+
+    def __init__(self, source: str, use_input: bool, field: str, op: str, value: Any):
+        super().__init__(source)
+        self.use_input = use_input
+        self.field = field
+        self.op = op
+        self.compare = _OPERATORS[op]
+        self.value = value
+
+    def _evaluate(self, intent_categories, context, input_data, results) -> bool:
+        data = input_data if self.use_input else context
+        if not data:
+            raise ValueError(f"Unsupported condition format: {self.source}")
+        try:
+            return cast(bool, self.compare(data.get(self.field), self.value))
+        except TypeError:
+            return False
+
+
+class _ResultComparison(ConditionNode):
+    """``result[index].field`` comparison against a pre-parsed literal"""
+
+    __slots__ = ("index", "field", "op", "compare", "value")
+
+    def __init__(self, source: str, index: int, field: str, op: str, value: Any):
+        super().__init__(source)
+        self.index = index
+        self.field = field
+        self.op = op
+        self.compare = _OPERATORS[op]
+        self.value = value
+
+    def _evaluate(self, intent_categories, context, input_data, results) -> bool:
+        if results and self.index < len(results):
+            result = results[self.index].result
+            if result:
+                result_value = result.get(self.field) if isinstance(result, dict) else None
+                try:
+                    return cast(bool, self.compare(result_value, self.value))
+                except TypeError:
+                    return False
+        raise ValueError(f"Unsupported condition format: {self.source}")
+
+
+class _Unsupported(ConditionNode):
+    __slots__ = ()
+
+    def _evaluate(self, intent_categories, context, input_data, results) -> bool:
+        raise ValueError(f"Unsupported condition format: {self.source}")
+
+
+def _parse(condition: str) -> ConditionNode:
+    # 1. Compound condition: AND (highest priority)
+    if " AND " in condition:
+        return _And(condition, tuple(_parse(part.strip()) for part in condition.split(" AND ")))
+
+    # 2. Compound condition: OR (second priority)
+    if " OR " in condition:
+        return _Or(condition, tuple(_parse(part.strip()) for part in condition.split(" OR ")))
+
+    # 3. Intent condition: intent.includes('category')
+    match = _INTENT_RE.fullmatch(condition)
+    if match:
+        return _IntentIncludes(condition, match.group(1))
+
+    # 4./5. Context and input conditions: context.field == value
+    for use_input, pattern in ((False, _CONTEXT_RE), (True, _INPUT_RE)):
+        match = pattern.fullmatch(condition)
+        if match:
+            field, op, value = match.groups()
+            return _FieldComparison(condition, use_input, field, op, parse_value(value))
+
+    # 6. Result condition: result[0].field == value
+    match = _RESULT_RE.fullmatch(condition)
+    if match:
+        index, field, op, value = match.groups()
+        return _ResultComparison(condition, int(index), field, op, parse_value(value))
+
+    return _Unsupported(condition)
+
+
+@lru_cache(maxsize=CONDITION_CACHE_SIZE)
+def compile_condition(condition: str) -> ConditionNode:
+    """Compile *condition* to an evaluable node tree (LRU-cached by condition string)"""
+    return _parse(condition)
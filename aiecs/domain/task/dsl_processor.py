@@ -2,14 +2,52 @@
 #  *  Copyright (c) IRETBL Corporation. All rights reserved.
 #  *  Licensed under the Apache-2.0. See License.txt in the project root for license information.
 #  *--------------------------------------------------------------------------------------------*/
+import asyncio
 import re
 import json
 import logging
-from typing import Dict, List, Any, Callable, Optional, cast
+from typing import Dict, List, Any, Callable, Optional
 from aiecs.domain.execution.model import TaskStepResult, TaskStatus, ErrorCode
+from aiecs.domain.task.condition_compiler import compile_condition, evaluate_comparison, parse_value
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SEQUENCE_CONCURRENCY = 4
+
+# References that make a sequence child depend on the children before it
+_DEPENDENCY_REF_RE = re.compile(r"result\[\d+\]|context\.\w+")
+
+
+def _references_prior_state(value: Any) -> bool:
+    """Return True when a DSL step (recursively) reads ``result[...]`` or ``context.`` values"""
+    if isinstance(value, str):
+        return _DEPENDENCY_REF_RE.search(value) is not None
+    if isinstance(value, dict):
+        return any(_references_prior_state(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_references_prior_state(v) for v in value)
+    return False
+
+
+def infer_sequence_dependencies(sequence_steps: List[Dict]) -> List[List[int]]:
+    """
+    Infer the dependency DAG of a sequence's children
+
+    Every child appends to the shared results and tasks receive their inputs via
+    parameters, so a child that reads ``result[...]`` / ``$result[...]`` or
+    ``context.`` (in conditions or parameter values) depends on all earlier
+    children; any other child has no dependencies.
+    """
+    return [list(range(i)) if _references_prior_state(sub_step) else [] for i, sub_step in enumerate(sequence_steps)]
+
+
+def critical_path_length(dependencies: List[List[int]]) -> int:
+    """Length (in steps) of the longest dependency chain of a sequence DAG"""
+    depth: List[int] = []
+    for deps in dependencies:
+        depth.append(1 + max((depth[d] for d in deps), default=0))
+    return max(depth, default=0)
+
 
 class DSLProcessor:
     """
@@ -46,117 +84,23 @@ class DSLProcessor:
         """
         Evaluate condition expression, supporting multiple condition types
         Following optimized check order: AND -> OR -> intent.includes -> context -> input -> result
-        """
-        try:
-            # 1. Compound condition: support AND (highest priority)
-            if " AND " in condition:
-                parts = condition.split(" AND ")
-                return all(
-                    self.evaluate_condition(
-                        part.strip(),
-                        intent_categories,
-                        context,
-                        input_data,
-                        results,
-                    )
-                    for part in parts
-                )
 
-            # 2. Compound condition: support OR (second priority)
-            if " OR " in condition:
-                parts = condition.split(" OR ")
-                return any(
-                    self.evaluate_condition(
-                        part.strip(),
-                        intent_categories,
-                        context,
-                        input_data,
-                        results,
-                    )
-                    for part in parts
-                )
-
-            # 3. Intent condition: intent.includes('category')
-            match = re.fullmatch(r"intent\.includes\('([^']+)'\)", condition)
-            if match:
-                category = match.group(1)
-                return category in intent_categories
-
-            # 4. Context condition: context.field == value
-            match = re.fullmatch(r"context\.(\w+)\s*(==|!=|>|<|>=|<=)\s*(.+)", condition)
-            if match and context:
-                field, operator, value = match.groups()
-                return self._evaluate_comparison(context.get(field), operator, self._parse_value(value))
-
-            # 5. Input condition: input.field == value
-            match = re.fullmatch(r"input\.(\w+)\s*(==|!=|>|<|>=|<=)\s*(.+)", condition)
-            if match and input_data:
-                field, operator, value = match.groups()
-                return self._evaluate_comparison(input_data.get(field), operator, self._parse_value(value))
-
-            # 6. Result condition: result[0].field == value
-            match = re.fullmatch(r"result\[(\d+)\]\.(\w+)\s*(==|!=|>|<|>=|<=)\s*(.+)", condition)
-            if match and results:
-                index, field, operator, value = match.groups()
-                index = int(index)
-                if index < len(results) and results[index].result:
-                    result_value = results[index].result.get(field) if isinstance(results[index].result, dict) else None
-                    return self._evaluate_comparison(result_value, operator, self._parse_value(value))
-
-            raise ValueError(f"Unsupported condition format: {condition}")
-
-        except Exception as e:
-            logger.error(f"Failed to evaluate condition '{condition}': {e}")
-            raise ValueError(f"Failed to evaluate condition '{condition}': {e}")
+        The condition is compiled once (see ``condition_compiler``) and the
+        compiled form is cached by condition string, so loop and branch
+        conditions are not re-parsed on every iteration.
+        """
+        if not isinstance(condition, str):
+            logger.error(f"Failed to evaluate condition '{condition}': condition must be a string")
+            raise ValueError(f"Failed to evaluate condition '{condition}': condition must be a string")
+        return compile_condition(condition).evaluate(intent_categories, context, input_data, results)
 
     def _evaluate_comparison(self, left_value: Any, operator: str, right_value: Any) -> bool:
         """Evaluate comparison operation"""
-        try:
-            if operator == "==":
-                return cast(bool, left_value == right_value)
-            elif operator == "!=":
-                return cast(bool, left_value != right_value)
-            elif operator == ">":
-                return cast(bool, left_value > right_value)
-            elif operator == "<":
-                return cast(bool, left_value < right_value)
-            elif operator == ">=":
-                return cast(bool, left_value >= right_value)
-            elif operator == "<=":
-                return cast(bool, left_value <= right_value)
-            else:
-                raise ValueError(f"Unsupported operator: {operator}")
-        except TypeError:
-            # Return False when types don't match
-            return False
+        return evaluate_comparison(left_value, operator, right_value)
 
     def _parse_value(self, value_str: str) -> Any:
         """Parse value string to appropriate type"""
-        value_str = value_str.strip()
-
-        # String value
-        if value_str.startswith('"') and value_str.endswith('"'):
-            return value_str[1:-1]
-        if value_str.startswith("'") and value_str.endswith("'"):
-            return value_str[1:-1]
-
-        # Boolean value
-        if value_str.lower() == "true":
-            return True
-        if value_str.lower() == "false":
-            return False
-
-        # Numeric value
-        try:
-            if "." in value_str:
-                return float(value_str)
-            else:
-                return int(value_str)
-        except ValueError:
-            pass
-
-        # Default return string
-        return value_str
+        return parse_value(value_str)
 
     def validate_condition_syntax(self, condition: str) -> bool:
         """Validate condition syntax validity"""
@@ -387,6 +331,18 @@ class DSLProcessor:
         if span:
             span.set_tag("sequence_length", len(sequence_steps))
 
+        if step.get("concurrent", False):
+            return await self._handle_concurrent_sequence_step(
+                step,
+                intent_categories,
+                input_data,
+                context,
+                execute_single_task,
+                execute_batch_task,
+                span,
+                results,
+            )
+
         step_results = []
         for i, sub_step in enumerate(sequence_steps):
             result = await self.execute_dsl_step(
@@ -414,6 +370,97 @@ class DSLProcessor:
             status=(TaskStatus.COMPLETED.value if all(r.status == TaskStatus.COMPLETED.value for r in step_results) else TaskStatus.FAILED.value),
         )
 
+    async def _handle_concurrent_sequence_step(
+        self,
+        step: Dict,
+        intent_categories: List[str],
+        input_data: Dict,
+        context: Dict,
+        execute_single_task: Callable,
+        execute_batch_task: Callable,
+        span=None,
+        results: Optional[List[TaskStepResult]] = None,
+    ) -> TaskStepResult:
+        """
+        Handle a ``sequence`` step with ``concurrent: true``
+
+        Child steps that reference no ``result[...]`` / ``$result[...]`` or
+        ``context.`` values are independent and start immediately (at most
+        ``max_concurrency`` at a time, default 4); a child with such a reference
+        depends on every earlier child and starts only once they have all been
+        committed.  Results are committed to ``results`` in sequence order, so
+        ``result[i]`` indices and the returned result list are the same as
+        sequential execution.
+
+        ``stop_on_failure`` only matches sequential execution for committed
+        results: results after the failed child are discarded and unfinished
+        children are cancelled, but independent children after it may already
+        have started or finished (including their side effects).  Tasks are
+        assumed to communicate through results and parameters, not by mutating
+        the shared context.
+        """
+        sequence_steps = step["sequence"]
+        stop_on_failure = step.get("stop_on_failure", False)
+        semaphore = asyncio.Semaphore(max(1, int(step.get("max_concurrency", DEFAULT_SEQUENCE_CONCURRENCY))))
+        dependencies = infer_sequence_dependencies(sequence_steps)
+        critical_path = critical_path_length(dependencies)
+        if span:
+            span.set_tag("critical_path_length", critical_path)
+
+        async def run_child(sub_step: Dict, child_results: Optional[List[TaskStepResult]]) -> TaskStepResult:
+            async with semaphore:
+                return await self.execute_dsl_step(
+                    sub_step,
+                    intent_categories,
+                    input_data,
+                    context,
+                    execute_single_task,
+                    execute_batch_task,
+                    child_results,
+                )
+
+        # Independent children get a private results buffer, committed in order below
+        buffers: List[Optional[List[TaskStepResult]]] = [None if results is None else [] for _ in sequence_steps]
+        tasks: Dict[int, asyncio.Task] = {i: asyncio.ensure_future(run_child(sub_step, buffers[i])) for i, sub_step in enumerate(sequence_steps) if not dependencies[i]}
+
+        step_results = []
+        try:
+            for i, sub_step in enumerate(sequence_steps):
+                if i in tasks:
+                    result = await tasks[i]
+                    if results is not None:
+                        results.extend(buffers[i] or [])
+                else:
+                    # All earlier children are committed; run against the shared results
+                    result = await run_child(sub_step, results)
+                step_results.append(result)
+                if results is not None:
+                    results.append(result)
+
+                # If step fails and stop_on_failure is set, stop execution
+                if not result.completed and stop_on_failure:
+                    break
+        finally:
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+            # Retrieve every outcome, including failures of children finished after a break
+            if tasks:
+                await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        return TaskStepResult(
+            step=f"sequence_{len(sequence_steps)}_steps",
+            result=[r.dict() for r in step_results],
+            completed=all(r.completed for r in step_results),
+            message=f"Completed sequence execution of {len(step_results)} steps",
+            status=(TaskStatus.COMPLETED.value if all(r.status == TaskStatus.COMPLETED.value for r in step_results) else TaskStatus.FAILED.value),
+            metadata={
+                "execution_mode": "concurrent",
+                "critical_path_length": critical_path,
+                "dependencies": {i: deps for i, deps in enumerate(dependencies) if deps},
+            },
+        )
+
     async def _handle_task_step(
         self,
         step: Dict,
@@ -546,6 +593,9 @@ class DSLProcessor:
         if "sequence" in step:
             if not isinstance(step["sequence"], list):
                 errors.append("'sequence' must be a list of steps")
+            max_concurrency = step.get("max_concurrency")
+            if max_concurrency is not None and (not isinstance(max_concurrency, int) or max_concurrency < 1):
+                errors.append("'max_concurrency' must be a positive integer")
 
         if "loop" in step:
             loop_config = step["loop"]
@@ -568,6 +618,7 @@ class DSLProcessor:
             ],
             "operators": ["==", "!=", ">", "<", ">=", "<="],
             "logical_operators": ["AND", "OR"],
+            "sequence_options": ["stop_on_failure", "concurrent", "max_concurrency"],
             "supported_value_types": ["string", "number", "boolean", "null"],
             "condition_check_order": self.condition_check_order,
             "regex_matching": "fullmatch (exact matching)",
@@ -576,5 +627,6 @@ class DSLProcessor:
                 "Optimize condition check order: AND -> OR -> intent.includes -> context -> input -> result",
                 "Enhance value parsing robustness, support null values",
                 "Add condition syntax validation method",
+                "Compile conditions once and cache them by condition string (LRU)",
             ],
         }
@@ -4,16 +4,38 @@
 #  *--------------------------------------------------------------------------------------------*/
 """L1 temporal memory domain (Port, models, engine)."""
 
-from aiecs.domain.temporal_memory.engine import TemporalMemoryEngine
-from aiecs.domain.temporal_memory.group_id import build_group_ids
-from aiecs.domain.temporal_memory.models import (
-    EpisodeSource,
-    IngestEpisodeRequest,
-    IngestEpisodeResult,
-    SearchFilters,
-    TemporalFact,
-)
-from aiecs.domain.temporal_memory.ports import TemporalMemoryStore
+from typing import TYPE_CHECKING, Dict
+
+from aiecs.utils.lazy_exports import make_lazy_module
+
+# Models and ports stay importable without the engine, which depends on the agent
+# plugin layer (and that, in turn, on the infrastructure stores built on these models).
+_LAZY_IMPORTS: Dict[str, str] = {
+    "TemporalMemoryEngine": ".engine",
+    "build_group_ids": ".group_id",
+    "EpisodeSource": ".models",
+    "IngestEpisodeRequest": ".models",
+    "IngestEpisodeResult": ".models",
+    "SearchFilters": ".models",
+    "TemporalFact": ".models",
+    "TemporalMemoryStore": ".ports",
+}
+
+if TYPE_CHECKING:
+    from aiecs.domain.temporal_memory.engine import TemporalMemoryEngine
+    from aiecs.domain.temporal_memory.group_id import build_group_ids
+    from aiecs.domain.temporal_memory.models import (
+        EpisodeSource,
+        IngestEpisodeRequest,
+        IngestEpisodeResult,
+        SearchFilters,
+        TemporalFact,
+    )
+    from aiecs.domain.temporal_memory.ports import TemporalMemoryStore
+
+
+__getattr__, __dir__ = make_lazy_module(__name__, _LAZY_IMPORTS)
+
 
 __all__ = [
     "EpisodeSource",
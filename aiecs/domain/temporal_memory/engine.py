@@ -8,13 +8,12 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from aiecs.config.config import Settings, get_settings
 from aiecs.domain.temporal_memory.pii import redact_episode_body
 from aiecs.domain.temporal_memory.search_cache import TemporalMemorySearchCache
 from aiecs.infrastructure.temporal_memory.metrics import get_temporal_memory_metrics
-from aiecs.domain.agent.plugins.context import AgentPluginContext
 from aiecs.domain.temporal_memory.group_id import (
     build_group_ids,
     select_ingest_group_ids,
@@ -29,6 +28,10 @@ from aiecs.domain.temporal_memory.models import (
 )
 from aiecs.domain.temporal_memory.ports import TemporalMemoryStore
 
+if TYPE_CHECKING:
+    # Runtime import would cycle: aiecs.domain.agent -> plugins.builtin -> temporal_memory_plugin -> engine
+    from aiecs.domain.agent.plugins.context import AgentPluginContext
+
 logger = logging.getLogger(__name__)
 
 _DEFAULT_SESSION_KEY = "session_id"
@@ -7,12 +7,33 @@
 Contains external system integrations and technical concerns.
 """
 
-from .messaging.celery_task_manager import CeleryTaskManager
-from .messaging.websocket_manager import WebSocketManager, UserConfirmation
-from .persistence.database_manager import DatabaseManager
-from .persistence.redis_client import RedisClient
-from .monitoring.executor_metrics import ExecutorMetrics
-from .monitoring.tracing_manager import TracingManager
+from typing import TYPE_CHECKING, Dict
+
+from aiecs.utils.lazy_exports import make_lazy_module
+
+# Resolved on first access: each component pulls in its own client library
+# (Celery, asyncpg, redis, OpenTelemetry/Jaeger, ...).
+_LAZY_IMPORTS: Dict[str, str] = {
+    "CeleryTaskManager": ".messaging.celery_task_manager",
+    "WebSocketManager": ".messaging.websocket_manager",
+    "UserConfirmation": ".messaging.websocket_manager",
+    "DatabaseManager": ".persistence.database_manager",
+    "RedisClient": ".persistence.redis_client",
+    "ExecutorMetrics": ".monitoring.executor_metrics",
+    "TracingManager": ".monitoring.tracing_manager",
+}
+
+if TYPE_CHECKING:
+    from .messaging.celery_task_manager import CeleryTaskManager
+    from .messaging.websocket_manager import WebSocketManager, UserConfirmation
+    from .persistence.database_manager import DatabaseManager
+    from .persistence.redis_client import RedisClient
+    from .monitoring.executor_metrics import ExecutorMetrics
+    from .monitoring.tracing_manager import TracingManager
+
+
+__getattr__, __dir__ = make_lazy_module(__name__, _LAZY_IMPORTS)
+
 
 __all__ = [
     # Messaging
@@ -7,8 +7,24 @@
 Contains messaging and communication infrastructure.
 """
 
-from .celery_task_manager import CeleryTaskManager
-from .websocket_manager import WebSocketManager, UserConfirmation
+from typing import TYPE_CHECKING, Dict
+
+from aiecs.utils.lazy_exports import make_lazy_module
+
+# Resolved on first access so that WebSocket users do not import Celery.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "CeleryTaskManager": ".celery_task_manager",
+    "WebSocketManager": ".websocket_manager",
+    "UserConfirmation": ".websocket_manager",
+}
+
+if TYPE_CHECKING:
+    from .celery_task_manager import CeleryTaskManager
+    from .websocket_manager import WebSocketManager, UserConfirmation
+
+
+__getattr__, __dir__ = make_lazy_module(__name__, _LAZY_IMPORTS)
+
 
 __all__ = [
     "CeleryTaskManager",
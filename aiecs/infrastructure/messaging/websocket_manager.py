@@ -7,7 +7,8 @@ import json
 import logging
 import uuid
 import websockets
-from typing import Dict, Any, Set, Optional, Callable
+from urllib.parse import parse_qs, urlsplit
+from typing import Dict, Any, Iterable, Set, Optional, Callable
 from websockets import serve, ServerConnection
 from pydantic import BaseModel
 
@@ -29,17 +30,65 @@ class TaskStepResult(BaseModel):
     error_message: Optional[str] = None
 
 
+# Close code sent to clients evicted for not draining their outgoing queue (RFC 6455 "Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+# Handshake header and query parameter that index a connection under a user id on connect
+USER_ID_HEADER = "X-User-Id"
+USER_ID_QUERY_PARAM = "user_id"
+
+
+class _ClientConnection:
+    """Per-connection outgoing queue drained by a single writer task"""
+
+    __slots__ = ("websocket", "queue", "user_ids", "writer")
+
+    def __init__(self, websocket: ServerConnection, max_queue_size: int):
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue_size)
+        self.user_ids: Set[str] = set()
+        self.writer: Optional[asyncio.Task] = None
+
+
 class WebSocketManager:
     """
     Specialized handler for WebSocket server and client communication
+
+    Connections are indexed by user id, so per-user events (step results,
+    heartbeats, cancellations) reach only that user's connections.  A
+    connection is indexed from the handshake (``X-User-Id`` header or
+    ``?user_id=`` query parameter) and/or by sending ``{"action":
+    "subscribe", "user_id": ...}``.  A connection indexed under no user
+    receives broadcasts only; before targeted delivery every connection
+    received every user's events, so clients that relied on that must now
+    identify themselves.
+
+    The user id is taken as given: neither the handshake values nor
+    ``subscribe`` are authenticated, so any client can ask for any user's
+    events.  Deployments that need isolation must authenticate connections
+    in front of this server (e.g. a proxy that sets ``X-User-Id``).
+
+    Payloads are serialized once per event and handed to a bounded
+    per-connection queue; a connection whose queue is full is evicted as a
+    slow consumer instead of stalling delivery to everyone else.
     """
 
-    def __init__(self, host: str = "python-middleware-api", port: int = 8765):
+    def __init__(
+        self,
+        host: str = "python-middleware-api",
+        port: int = 8765,
+        max_queue_size: int = 256,
+    ):
         self.host = host
         self.port = port
         self.server: Optional[Any] = None
         self.callback_registry: Dict[str, Callable] = {}
         self.active_connections: Set[ServerConnection] = set()
+        self.max_queue_size = max_queue_size
+        self._clients: Dict[ServerConnection, _ClientConnection] = {}
+        self._user_connections: Dict[str, Set[ServerConnection]] = {}
+        self._closing_tasks: Set[asyncio.Task] = set()
+        self._evicted_connections = 0
         self._running = False
 
     async def start_server(self):
@@ -66,18 +115,115 @@ class WebSocketManager:
             logger.info("WebSocket server stopped")
 
         # Close all active connections
-        if self.active_connections:
+        connections = list(self.active_connections)
+        for websocket in connections:
+            self._unregister_connection(websocket)
+        if connections:
             await asyncio.gather(
-                *[conn.close() for conn in self.active_connections],
+                *[conn.close() for conn in connections],
                 return_exceptions=True,
             )
             self.active_connections.clear()
 
+    def _register_connection(self, websocket: ServerConnection) -> _ClientConnection:
+        """Track a connection and start its writer task"""
+        client = _ClientConnection(websocket, self.max_queue_size)
+        client.writer = asyncio.create_task(self._drain_client_queue(client))
+        self._clients[websocket] = client
+        self.active_connections.add(websocket)
+        return client
+
+    def _unregister_connection(self, websocket: ServerConnection) -> None:
+        """Drop a connection from all indexes and stop its writer task"""
+        self.active_connections.discard(websocket)
+        client = self._clients.pop(websocket, None)
+        if client is None:
+            return
+        for user_id in client.user_ids:
+            connections = self._user_connections.get(user_id)
+            if connections is not None:
+                connections.discard(websocket)
+                if not connections:
+                    del self._user_connections[user_id]
+        if client.writer is not None and client.writer is not asyncio.current_task():
+            client.writer.cancel()
+
+    def _subscribe_user(self, websocket: ServerConnection, user_id: str) -> None:
+        """Index *websocket* under *user_id* for targeted sends"""
+        client = self._clients.get(websocket)
+        if client is None:
+            return
+        client.user_ids.add(user_id)
+        self._user_connections.setdefault(user_id, set()).add(websocket)
+
+    @staticmethod
+    def _handshake_user_id(websocket: ServerConnection) -> Optional[str]:
+        """User id sent with the opening handshake, if any (not authenticated)"""
+        request = getattr(websocket, "request", None)
+        if request is None:
+            return None
+        user_id = request.headers.get(USER_ID_HEADER)
+        if not user_id:
+            values = parse_qs(urlsplit(request.path).query).get(USER_ID_QUERY_PARAM)
+            user_id = values[0] if values else None
+        return user_id or None
+
+    def get_user_connections(self, user_id: str) -> Set[ServerConnection]:
+        """Get the connections subscribed to *user_id*"""
+        return set(self._user_connections.get(user_id, ()))
+
+    async def _drain_client_queue(self, client: _ClientConnection):
+        """Writer task: send queued payloads to one client in order"""
+        try:
+            while True:
+                payload = await client.queue.get()
+                await client.websocket.send(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"WebSocket writer stopped for {client.websocket.remote_address}: {e}")
+            self._unregister_connection(client.websocket)
+
+    def _evict_slow_consumer(self, client: _ClientConnection) -> None:
+        """Disconnect a client whose outgoing queue is full"""
+        websocket = client.websocket
+        logger.warning(f"Evicting slow WebSocket consumer {websocket.remote_address} ({client.queue.qsize()} queued messages)")
+        self._evicted_connections += 1
+        self._unregister_connection(websocket)
+        task = asyncio.create_task(websocket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="slow consumer"))
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+
+    def _enqueue(self, websockets_: Iterable[ServerConnection], payload: str) -> int:
+        """Queue a serialized payload for each connection; returns the number queued"""
+        queued = 0
+        for websocket in list(websockets_):
+            client = self._clients.get(websocket)
+            if client is None:
+                continue
+            try:
+                client.queue.put_nowait(payload)
+                queued += 1
+            except asyncio.QueueFull:
+                self._evict_slow_consumer(client)
+        return queued
+
+    @staticmethod
+    def _encode(data: Dict[str, Any]) -> Optional[str]:
+        try:
+            return json.dumps(data)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to serialize WebSocket message: {e}")
+            return None
+
     async def _handle_client_connection(self, websocket: ServerConnection):
         """Handle client connection"""
-        self.active_connections.add(websocket)
+        self._register_connection(websocket)
         client_addr = websocket.remote_address
         logger.info(f"New WebSocket connection from {client_addr}")
+        user_id = self._handshake_user_id(websocket)
+        if user_id:
+            self._subscribe_user(websocket, user_id)
 
         try:
             async for message in websocket:
@@ -89,7 +235,7 @@ class WebSocketManager:
         except Exception as e:
             logger.error(f"WebSocket error for {client_addr}: {e}")
         finally:
-            self.active_connections.discard(websocket)
+            self._unregister_connection(websocket)
             try:
                 await websocket.close()
             except Exception:
@@ -148,13 +294,14 @@ class WebSocketManager:
             # Since database manager access is needed, this functionality may
             # need to be implemented through callbacks
             logger.info(f"Task cancellation requested: user={user_id}, task={task_id}")
-            await self.broadcast_message(
+            await self.send_to_user(
+                user_id,
                 {
                     "type": "task_cancelled",
                     "user_id": user_id,
                     "task_id": task_id,
                     "timestamp": asyncio.get_event_loop().time(),
-                }
+                },
             )
         else:
             logger.warning("Invalid cancellation request: missing user_id or task_id")
@@ -169,10 +316,15 @@ class WebSocketManager:
         await self._send_to_client(websocket, pong_data)
 
     async def _handle_subscription(self, websocket: ServerConnection, data: Dict[str, Any]):
-        """Handle subscription request"""
+        """
+        Handle subscription request
+
+        The ``user_id`` is not verified: the connection is indexed under
+        whatever id the client sends (see the class docstring).
+        """
         user_id = data.get("user_id")
         if user_id:
-            # User-specific subscription logic can be implemented here
+            self._subscribe_user(websocket, str(user_id))
             logger.info(f"User {user_id} subscribed to updates")
             await self._send_to_client(
                 websocket,
@@ -190,8 +342,15 @@ class WebSocketManager:
 
     async def _send_to_client(self, websocket: ServerConnection, data: Dict[str, Any]):
         """Send data to specific client"""
+        payload = self._encode(data)
+        if payload is None:
+            return
+        if websocket in self._clients:
+            # Keep ordering with queued events by going through the writer task
+            self._enqueue((websocket,), payload)
+            return
         try:
-            await websocket.send(json.dumps(data))
+            await websocket.send(payload)
         except Exception as e:
             logger.error(f"Failed to send message to client: {e}")
 
@@ -225,9 +384,10 @@ class WebSocketManager:
         }
 
         try:
-            # Broadcast to all connected clients (can be optimized to send only
-            # to specific users)
-            await self.broadcast_message(notification_data)
+            if not await self.send_to_user(user_id, notification_data):
+                # Nobody can confirm, so don't hold the task for the full timeout
+                self.callback_registry.pop(callback_id, None)
+                return UserConfirmation(proceed=True)  # Default to proceed
 
             # Wait for user confirmation with timeout
             try:
@@ -258,7 +418,7 @@ class WebSocketManager:
 
         while self._running:
             try:
-                await self.broadcast_message(heartbeat_data)
+                await self.send_to_user(user_id, heartbeat_data)
                 await asyncio.sleep(interval)
             except Exception as e:
                 logger.error(f"WebSocket heartbeat error: {e}")
@@ -270,29 +430,24 @@ class WebSocketManager:
             logger.debug("No active WebSocket connections for broadcast")
             return
 
-        # Filter out closed connections (use try-except to handle closed connections)
-        active_connections = []
-        for conn in list(self.active_connections):
-            try:
-                # Try to check if connection is still valid
-                active_connections.append(conn)
-            except Exception:
-                pass  # Connection is closed, skip it
-        self.active_connections = set(active_connections)
+        payload = self._encode(message)
+        if payload is None:
+            return
+        queued = self._enqueue(self.active_connections, payload)
+        logger.debug(f"Broadcasted message to {queued} clients")
 
-        if active_connections:
-            await asyncio.gather(
-                *[self._send_to_client(conn, message) for conn in active_connections],
-                return_exceptions=True,
-            )
-            logger.debug(f"Broadcasted message to {len(active_connections)} clients")
+    async def send_to_user(self, user_id: str, message: Dict[str, Any]) -> int:
+        """Send message to the connections subscribed to *user_id*; returns the number queued"""
+        connections = self._user_connections.get(user_id)
+        if not connections:
+            logger.debug(f"No WebSocket connections subscribed for user {user_id}")
+            return 0
 
-    async def send_to_user(self, user_id: str, message: Dict[str, Any]):
-        """Send message to specific user (requires user connection mapping implementation)"""
-        # User ID to WebSocket connection mapping can be implemented here
-        # Currently simplified to broadcast
         message["target_user_id"] = user_id
-        await self.broadcast_message(message)
+        payload = self._encode(message)
+        if payload is None:
+            return 0
+        return self._enqueue(connections, payload)
 
     def get_connection_count(self) -> int:
         """Get active connection count"""
@@ -305,5 +460,7 @@ class WebSocketManager:
             "host": self.host,
             "port": self.port,
             "active_connections": self.get_connection_count(),
+            "subscribed_users": len(self._user_connections),
+            "evicted_connections": self._evicted_connections,
             "pending_callbacks": len(self.callback_registry),
         }
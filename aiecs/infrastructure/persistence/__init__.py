@@ -7,27 +7,60 @@
 Contains data persistence and storage infrastructure.
 """
 
-from .database_manager import DatabaseManager
-from .redis_client import RedisClient, get_redis_client
-from .context_engine_client import (
-    initialize_context_engine,
-    get_context_engine,
-    close_context_engine,
-    is_context_engine_initialized,
-    reset_context_engine,
-)
-from .clickhouse_client import (
-    ClickHouseClient,
-    get_clickhouse_client,
-    initialize_clickhouse_client,
-    close_clickhouse_client,
-)
-from .clickhouse_permanent_backend import ClickHousePermanentBackend
-from .postgres_permanent_backend import PostgresPermanentBackend
-from .permanent_backend_factory import (
-    create_permanent_backend,
-    resolve_permanent_backend_kind,
-)
+from typing import TYPE_CHECKING, Dict
+
+from aiecs.utils.lazy_exports import make_lazy_module
+
+# Resolved on first access so that, e.g., using the Redis client does not import
+# asyncpg, ClickHouse and the domain models behind DatabaseManager.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "DatabaseManager": ".database_manager",
+    "RedisClient": ".redis_client",
+    "get_redis_client": ".redis_client",
+    "initialize_context_engine": ".context_engine_client",
+    "get_context_engine": ".context_engine_client",
+    "close_context_engine": ".context_engine_client",
+    "is_context_engine_initialized": ".context_engine_client",
+    "reset_context_engine": ".context_engine_client",
+    "ClickHouseClient": ".clickhouse_client",
+    "get_clickhouse_client": ".clickhouse_client",
+    "initialize_clickhouse_client": ".clickhouse_client",
+    "close_clickhouse_client": ".clickhouse_client",
+    "ClickHouseBatchWriter": ".clickhouse_batch_writer",
+    "ClickHouseBatchWriterConfig": ".clickhouse_batch_writer",
+    "ClickHousePermanentBackend": ".clickhouse_permanent_backend",
+    "PostgresPermanentBackend": ".postgres_permanent_backend",
+    "create_permanent_backend": ".permanent_backend_factory",
+    "resolve_permanent_backend_kind": ".permanent_backend_factory",
+}
+
+if TYPE_CHECKING:
+    from .database_manager import DatabaseManager
+    from .redis_client import RedisClient, get_redis_client
+    from .context_engine_client import (
+        initialize_context_engine,
+        get_context_engine,
+        close_context_engine,
+        is_context_engine_initialized,
+        reset_context_engine,
+    )
+    from .clickhouse_client import (
+        ClickHouseClient,
+        get_clickhouse_client,
+        initialize_clickhouse_client,
+        close_clickhouse_client,
+    )
+    from .clickhouse_batch_writer import ClickHouseBatchWriter, ClickHouseBatchWriterConfig
+    from .clickhouse_permanent_backend import ClickHousePermanentBackend
+    from .postgres_permanent_backend import PostgresPermanentBackend
+    from .permanent_backend_factory import (
+        create_permanent_backend,
+        resolve_permanent_backend_kind,
+    )
+
+
+__getattr__, __dir__ = make_lazy_module(__name__, _LAZY_IMPORTS)
+
 
 __all__ = [
     "DatabaseManager",
@@ -42,6 +75,8 @@ __all__ = [
     "get_clickhouse_client",
     "initialize_clickhouse_client",
     "close_clickhouse_client",
+    "ClickHouseBatchWriter",
+    "ClickHouseBatchWriterConfig",
     "ClickHousePermanentBackend",
     "PostgresPermanentBackend",
     "create_permanent_backend",
@@ -0,0 +1,265 @@
+# /*---------------------------------------------------------------------------------------------
+#  *  Copyright (c) IRETBL Corporation. All rights reserved.
+#  *  Licensed under the Apache-2.0. See License.txt in the project root for license information.
+#  *--------------------------------------------------------------------------------------------*/
+"""
+Buffered, batching writer for ClickHouse dual-writes.
+
+ClickHouse strongly prefers few large inserts over many single-row ones. The
+writer buffers rows per table and flushes a table when its buffer reaches
+``max_batch_rows``, when its oldest row is older than ``max_batch_age_seconds``,
+or on shutdown. Buffers are bounded; when full the writer either waits for
+space (backpressure) or drops rows according to ``overflow_policy``. Failed
+batches are retried with exponential backoff before being counted as dropped.
+
+The background task and its asyncio primitives belong to one event loop. When
+the writer is used from a different loop (e.g. successive ``asyncio.run``
+calls), they are rebuilt on that loop; rows still buffered are flushed by the
+new task.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Literal, Optional
+
+from .clickhouse_client import ClickHouseClient
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["block", "drop_newest", "drop_oldest"]
+
+
+@dataclass
+class ClickHouseBatchWriterConfig:
+    """
+    Tuning knobs for ClickHouseBatchWriter.
+
+    Attributes:
+        max_batch_rows: Flush a table as soon as this many rows are buffered.
+        max_batch_age_seconds: Flush a table once its oldest buffered row is this old.
+        max_buffer_rows: Upper bound of buffered rows per table.
+        overflow_policy: ``block`` waits for space (up to ``block_timeout_seconds``,
+            then drops), ``drop_newest`` rejects the new row, ``drop_oldest`` evicts
+            the oldest buffered row.
+        block_timeout_seconds: Maximum backpressure wait under the ``block`` policy.
+        max_retries: Retries for a failed batch before its rows are dropped.
+        retry_backoff_seconds: Base delay for exponential retry backoff.
+    """
+
+    max_batch_rows: int = 1000
+    max_batch_age_seconds: float = 1.0
+    max_buffer_rows: int = 100_000
+    overflow_policy: OverflowPolicy = "block"
+    block_timeout_seconds: float = 5.0
+    max_retries: int = 3
+    retry_backoff_seconds: float = 0.5
+
+
+@dataclass
+class _TableBuffer:
+    columns: List[str]
+    rows: List[List[Any]] = field(default_factory=list)
+    oldest_at: float = 0.0
+
+
+class ClickHouseBatchWriter:
+    """
+    Per-table row buffer flushed to ClickHouse by a background task.
+
+    Example:
+        writer = ClickHouseBatchWriter(client, ClickHouseBatchWriterConfig(max_batch_rows=500))
+        await writer.start()
+        await writer.add("context_conversations", row)
+        await writer.close()  # flushes remaining rows
+    """
+
+    def __init__(self, client: ClickHouseClient, config: Optional[ClickHouseBatchWriterConfig] = None) -> None:
+        self._client = client
+        self.config = config or ClickHouseBatchWriterConfig()
+        self._buffers: Dict[str, _TableBuffer] = {}
+        self._space_available = asyncio.Condition()
+        self._flush_requested = asyncio.Event()
+        self._flush_locks: Dict[str, asyncio.Lock] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed = False
+        # Metrics
+        self._rows_written = 0
+        self._rows_dropped = 0
+        self._batches_written = 0
+        self._batches_failed = 0
+        self._retries = 0
+        self._flush_latency_total = 0.0
+        self._flush_latency_max = 0.0
+        self._batch_size_max = 0
+
+    async def start(self) -> None:
+        """Start the background flush task (idempotent; an explicit call also reopens a closed writer)."""
+        self._bind_loop()
+        if self._task is None or self._task.done():
+            self._closed = False
+            self._task = asyncio.create_task(self._run(), name="clickhouse-batch-writer")
+
+    async def add(self, table: str, row: Dict[str, Any]) -> bool:
+        """
+        Buffer one row for ``table``.
+
+        A True result only means the row was accepted into the buffer, not that
+        it is persisted: it is written by a later flush and can still be dropped
+        if that batch exhausts its retries (see ``rows_dropped`` in
+        :meth:`get_metrics`). Await :meth:`flush` or :meth:`close` when the
+        caller needs the row in ClickHouse.
+
+        Returns:
+            True if the row was buffered, False if it was dropped by the overflow
+            policy or the writer has been closed.
+        """
+        if self._closed:
+            self._rows_dropped += 1
+            logger.warning(f"ClickHouse batch writer is closed; dropping row for {table}")
+            return False
+        self._bind_loop()
+        if self._task is None or self._task.done():
+            await self.start()
+
+        buffer = self._buffers.get(table)
+        if buffer is None:
+            buffer = self._buffers[table] = _TableBuffer(columns=list(row.keys()))
+
+        if len(buffer.rows) >= self.config.max_buffer_rows:
+            if not await self._make_room(table, buffer):
+                self._rows_dropped += 1
+                return False
+
+        if not buffer.rows:
+            buffer.oldest_at = time.monotonic()
+        buffer.rows.append([row.get(c) for c in buffer.columns])
+        if len(buffer.rows) >= self.config.max_batch_rows:
+            self._flush_requested.set()
+        return True
+
+    async def _make_room(self, table: str, buffer: _TableBuffer) -> bool:
+        policy = self.config.overflow_policy
+        if policy == "drop_newest":
+            return False
+        if policy == "drop_oldest":
+            buffer.rows.pop(0)
+            self._rows_dropped += 1
+            return True
+
+        self._flush_requested.set()
+        try:
+            async with self._space_available:
+                await asyncio.wait_for(
+                    self._space_available.wait_for(lambda: len(buffer.rows) < self.config.max_buffer_rows),
+                    self.config.block_timeout_seconds,
+                )
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"ClickHouse batch buffer for {table} full; dropping row after backpressure timeout")
+            return False
+
+    async def flush(self, table: Optional[str] = None) -> None:
+        """Flush ``table`` (or every table) immediately."""
+        self._bind_loop()
+        tables = [table] if table else list(self._buffers)
+        for name in tables:
+            await self._flush_table(name)
+
+    async def close(self) -> None:
+        """Stop the background task and flush all buffered rows; later :meth:`add` calls are rejected."""
+        self._closed = True
+        self._bind_loop()
+        self._flush_requested.set()
+        if self._task is not None:
+            try:
+                await self._task
+            except Exception as e:
+                logger.warning(f"ClickHouse batch writer task ended with error: {e}")
+            self._task = None
+        await self.flush()
+
+    def _bind_loop(self) -> None:
+        """Rebuild the loop-bound primitives and drop the task if the running loop changed."""
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        if self._loop is not None:
+            logger.debug("ClickHouse batch writer moved to a new event loop; restarting its flush task")
+        self._loop = loop
+        self._space_available = asyncio.Condition()
+        self._flush_requested = asyncio.Event()
+        self._flush_locks = {}
+        # The previous task belongs to the old loop (asyncio.run cancels it on exit)
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self._next_deadline())
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            if self._closed:
+                break
+            now = time.monotonic()
+            for name, buffer in list(self._buffers.items()):
+                if not buffer.rows:
+                    continue
+                if len(buffer.rows) >= self.config.max_batch_rows or now - buffer.oldest_at >= self.config.max_batch_age_seconds:
+                    await self._flush_table(name)
+
+    def _next_deadline(self) -> float:
+        now = time.monotonic()
+        waits = [self.config.max_batch_age_seconds - (now - b.oldest_at) for b in self._buffers.values() if b.rows]
+        return max(0.0, min(waits)) if waits else self.config.max_batch_age_seconds
+
+    async def _flush_table(self, table: str) -> None:
+        lock = self._flush_locks.setdefault(table, asyncio.Lock())
+        async with lock:
+            buffer = self._buffers.get(table)
+            if buffer is None or not buffer.rows:
+                return
+            while buffer.rows:
+                rows = buffer.rows[: self.config.max_batch_rows]
+                del buffer.rows[: len(rows)]
+                if buffer.rows:
+                    buffer.oldest_at = time.monotonic()
+                async with self._space_available:
+                    self._space_available.notify_all()
+                await self._write_batch(table, buffer.columns, rows)
+
+    async def _write_batch(self, table: str, columns: List[str], rows: List[List[Any]]) -> None:
+        start = time.monotonic()
+        for attempt in range(self.config.max_retries + 1):
+            if attempt:
+                self._retries += 1
+                await asyncio.sleep(self.config.retry_backoff_seconds * (2 ** (attempt - 1)))
+            if await self._client.insert_rows(table, rows, columns):
+                latency = time.monotonic() - start
+                self._rows_written += len(rows)
+                self._batches_written += 1
+                self._flush_latency_total += latency
+                self._flush_latency_max = max(self._flush_latency_max, latency)
+                self._batch_size_max = max(self._batch_size_max, len(rows))
+                return
+        self._batches_failed += 1
+        self._rows_dropped += len(rows)
+        logger.error(f"ClickHouse batch for {table} dropped after {self.config.max_retries} retries ({len(rows)} rows)")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return buffer, flush latency, batch size and drop counters."""
+        return {
+            "rows_buffered": sum(len(b.rows) for b in self._buffers.values()),
+            "rows_written": self._rows_written,
+            "rows_dropped": self._rows_dropped,
+            "batches_written": self._batches_written,
+            "batches_failed": self._batches_failed,
+            "retries": self._retries,
+            "avg_batch_size": self._rows_written / self._batches_written if self._batches_written else 0.0,
+            "max_batch_size": self._batch_size_max,
+            "avg_flush_latency": self._flush_latency_total / self._batches_written if self._batches_written else 0.0,
+            "max_flush_latency": self._flush_latency_max,
+        }
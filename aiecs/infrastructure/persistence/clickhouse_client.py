@@ -105,23 +105,42 @@ class ClickHouseClient:
         if not self._client:
             return False
 
-        try:
-            if not data:
-                return True
+        if not data:
+            return True
 
+        try:
             if column_names:
                 columns = column_names
                 rows = [[row.get(c) for c in columns] for row in data]
             else:
                 columns = list(data[0].keys())
                 rows = [[row[c] for c in columns] for row in data]
+        except Exception as e:
+            logger.error(f"ClickHouse insert failed for table {table}: {e}")
+            return False
+
+        return await self.insert_rows(table, rows, columns)
+
+    async def insert_rows(self, table: str, rows: List[List[Any]], column_names: List[str]) -> bool:
+        """
+        Insert pre-built row lists (values ordered as ``column_names``) in one batch.
 
+        Returns:
+            True on success, False on failure (logs error)
+        """
+        if not self._client:
+            return False
+
+        if not rows:
+            return True
+
+        try:
             async with self._lock:
                 await asyncio.to_thread(
                     self._client.insert,
                     table,
                     rows,
-                    column_names=columns,
+                    column_names=column_names,
                 )
             return True
         except Exception as e:
@@ -7,7 +7,8 @@ ClickHouse permanent storage backend for ContextEngine dual-write.
 
 Implements IPermanentStorageBackend for append-only disk persistence.
 Used alongside Redis (hot cache) - writes are fire-and-forget, failures
-do not block the primary path.
+do not block the primary path. By default rows are buffered per table and
+written in large batches by ClickHouseBatchWriter.
 """
 
 import json
@@ -17,6 +18,7 @@ from typing import Any, Dict, List, Optional
 
 from aiecs.core.interface.storage_interface import IPermanentStorageBackend
 
+from .clickhouse_batch_writer import ClickHouseBatchWriter, ClickHouseBatchWriterConfig
 from .clickhouse_client import ClickHouseClient
 
 logger = logging.getLogger(__name__)
@@ -35,6 +37,11 @@ class ClickHousePermanentBackend(IPermanentStorageBackend):
 
     Append-only storage for sessions, conversations, checkpoints.
     Auto-creates tables on first use if auto_create_tables=True.
+
+    With ``batching=True`` (default) appends only buffer the row and return True;
+    rows reach ClickHouse when the batch writer flushes (size, age, or close()),
+    so True is not a durable write. Call flush() when durability matters.
+    Appends after close() return False.
     """
 
     def __init__(
@@ -45,6 +52,8 @@ class ClickHousePermanentBackend(IPermanentStorageBackend):
         password: Optional[str] = None,
         database: Optional[str] = None,
         auto_create_tables: bool = True,
+        batching: bool = True,
+        batch_config: Optional[ClickHouseBatchWriterConfig] = None,
     ) -> None:
         self._client = ClickHouseClient(
             host=host,
@@ -55,6 +64,7 @@ class ClickHousePermanentBackend(IPermanentStorageBackend):
         )
         self._auto_create_tables = auto_create_tables
         self._tables_created = False
+        self._batch_writer: Optional[ClickHouseBatchWriter] = ClickHouseBatchWriter(self._client, batch_config) if batching else None
 
     async def initialize(self) -> bool:
         """Initialize ClickHouse connection and optionally create tables."""
@@ -65,12 +75,34 @@ class ClickHousePermanentBackend(IPermanentStorageBackend):
             await self._ensure_tables()
             self._tables_created = True
 
+        if self._batch_writer is not None:
+            await self._batch_writer.start()
+
         return True
 
     async def close(self) -> None:
-        """Close ClickHouse connection."""
+        """Flush buffered rows and close ClickHouse connection."""
+        if self._batch_writer is not None:
+            await self._batch_writer.close()
         await self._client.close()
 
+    async def flush(self) -> None:
+        """Write all buffered rows now."""
+        if self._batch_writer is not None:
+            await self._batch_writer.flush()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Batch writer metrics (flush latency, batch size, dropped rows); empty when batching is off."""
+        if self._batch_writer is None:
+            return {}
+        return self._batch_writer.get_metrics()
+
+    async def _write(self, table: str, row: Dict[str, Any]) -> bool:
+        """Route a row through the batch writer, or insert it directly when batching is off."""
+        if self._batch_writer is not None:
+            return await self._batch_writer.add(table, row)
+        return await self._client.insert(table, [row])
+
     async def _ensure_tables(self) -> None:
         """Create tables if they do not exist."""
         tables_sql = [
@@ -153,7 +185,7 @@ class ClickHousePermanentBackend(IPermanentStorageBackend):
             "payload": _safe_json_dumps(payload),
             "created_at": dt,
         }
-        return await self._client.insert("context_sessions", [row])
+        return await self._write("context_sessions", row)
 
     async def append_conversation_message(
         self,
@@ -175,7 +207,7 @@ class ClickHousePermanentBackend(IPermanentStorageBackend):
             "metadata": _safe_json_dumps(metadata or {}),
             "created_at": dt,
         }
-        return await self._client.insert("context_conversations", [row])
+        return await self._write("context_conversations", row)
 
     async def append_checkpoint(
         self,
@@ -197,7 +229,7 @@ class ClickHousePermanentBackend(IPermanentStorageBackend):
             "metadata": _safe_json_dumps(metadata or {}),
             "created_at": dt,
         }
-        return await self._client.insert("context_checkpoints", [row])
+        return await self._write("context_checkpoints", row)
 
     async def append_checkpoint_writes(
         self,
@@ -219,7 +251,7 @@ class ClickHousePermanentBackend(IPermanentStorageBackend):
             "writes_data": _safe_json_dumps(writes_data),
             "created_at": dt,
         }
-        return await self._client.insert("context_checkpoint_writes", [row])
+        return await self._write("context_checkpoint_writes", row)
 
     async def append_conversation_session(
         self,
@@ -237,7 +269,7 @@ class ClickHousePermanentBackend(IPermanentStorageBackend):
             "session_data": _safe_json_dumps(session_data),
             "created_at": dt,
         }
-        return await self._client.insert("context_conversation_sessions", [row])
+        return await self._write("context_conversation_sessions", row)
 
     async def append_task_context_snapshot(
         self,
@@ -255,4 +287,4 @@ class ClickHousePermanentBackend(IPermanentStorageBackend):
             "context_data": _safe_json_dumps(context_data),
             "created_at": dt,
         }
-        return await self._client.insert("context_task_contexts", [row])
+        return await self._write("context_task_contexts", row)
@@ -5,7 +5,15 @@
 """
 Postgres-backed temporal memory store (L1 optional SQL audit backend).
 
-No graphiti_core imports. Search MVP: ILIKE on tm_fact + validity window.
+No graphiti_core imports.
+
+Search: ranked full-text match on ``tm_fact.text_tsv`` (``tsvector`` written on
+insert, GIN index) scored with ``ts_rank_cd`` inside the validity window.  With
+``TM_POSTGRES_TRIGRAM=true`` and ``pg_trgm`` installed, substring (``ILIKE``) and
+fuzzy (``<%``) matches on the trigram index are included as well.  Rows written
+before the ``text_tsv`` column existed are matched with ``ILIKE`` until they are
+backfilled (see ``003_temporal_memory_fulltext.sql``); schemas without the
+column fall back to the unranked ``ILIKE`` search.
 """
 
 from __future__ import annotations
@@ -56,8 +64,58 @@ _TM_TABLE_DDL = [
     )
     """,
     "CREATE INDEX IF NOT EXISTS idx_tm_fact_group_valid ON tm_fact (group_id, valid_at)",
+    "ALTER TABLE tm_fact ADD COLUMN IF NOT EXISTS text_tsv tsvector",
+    "CREATE INDEX IF NOT EXISTS idx_tm_fact_text_tsv ON tm_fact USING GIN (text_tsv)",
+    "CREATE INDEX IF NOT EXISTS idx_tm_fact_tsv_pending ON tm_fact (group_id) WHERE text_tsv IS NULL",
 ]
 
+_TM_TRIGRAM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_tm_fact_text_trgm ON tm_fact USING GIN (text gin_trgm_ops)",
+]
+
+_TSV_BACKFILL_BATCH = 10_000
+
+# $1 group_ids, $2 query, $3 as_of, $4 limit, $5 regconfig, $6 ILIKE pattern (legacy rows)
+_SEARCH_FULLTEXT_SQL = """
+    SELECT fact_id, group_id, text, valid_at, invalid_at, confidence,
+           source_episode_id, metadata, ts_rank_cd(text_tsv, q.tsq) AS rank
+    FROM tm_fact, websearch_to_tsquery($5::regconfig, $2) AS q(tsq)
+    WHERE group_id = ANY($1::varchar[])
+      AND (text_tsv @@ q.tsq OR (text_tsv IS NULL AND text ILIKE $6 ESCAPE '\\'))
+      AND (valid_at IS NULL OR valid_at <= $3)
+      AND (invalid_at IS NULL OR invalid_at > $3)
+    ORDER BY rank DESC, valid_at DESC NULLS LAST
+    LIMIT $4
+"""
+
+# Same parameters; adds substring and word-similarity matches served by the trigram index
+_SEARCH_TRIGRAM_SQL = """
+    SELECT fact_id, group_id, text, valid_at, invalid_at, confidence,
+           source_episode_id, metadata, ts_rank_cd(text_tsv, q.tsq) AS rank,
+           word_similarity($2, text) AS similarity
+    FROM tm_fact, websearch_to_tsquery($5::regconfig, $2) AS q(tsq)
+    WHERE group_id = ANY($1::varchar[])
+      AND (text_tsv @@ q.tsq OR text ILIKE $6 ESCAPE '\\' OR $2 <% text)
+      AND (valid_at IS NULL OR valid_at <= $3)
+      AND (invalid_at IS NULL OR invalid_at > $3)
+    ORDER BY rank DESC, similarity DESC, valid_at DESC NULLS LAST
+    LIMIT $4
+"""
+
+# Schemas without text_tsv: $1 group_ids, $2 ILIKE pattern, $3 as_of, $4 limit
+_SEARCH_ILIKE_SQL = """
+    SELECT fact_id, group_id, text, valid_at, invalid_at, confidence,
+           source_episode_id, metadata
+    FROM tm_fact
+    WHERE group_id = ANY($1::varchar[])
+      AND text ILIKE $2 ESCAPE '\\'
+      AND (valid_at IS NULL OR valid_at <= $3)
+      AND (invalid_at IS NULL OR invalid_at > $3)
+    ORDER BY valid_at DESC NULLS LAST
+    LIMIT $4
+"""
+
 
 def _escape_ilike_pattern(value: str) -> str:
     return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -102,6 +160,10 @@ class PostgresTemporalMemoryStore:
         self._settings = settings or get_settings()
         self._pool: asyncpg.Pool | None = None
         self._pending_ingest_tasks: set[asyncio.Task[None]] = set()
+        self._text_search_config = getattr(self._settings, "tm_postgres_text_search_config", "simple") or "simple"
+        # Schema capabilities; confirmed against the database in initialize()
+        self._fulltext = True
+        self._trigram = bool(getattr(self._settings, "tm_postgres_trigram", False))
 
     def _resolve_dsn(self) -> str:
         dsn = (self._settings.tm_postgres_url or self._settings.postgres_url or "").strip()
@@ -127,11 +189,57 @@ class PostgresTemporalMemoryStore:
                 )
                 if not exists:
                     raise RuntimeError("tm_episode table missing; apply " "aiecs/scripts/migrations/postgres/002_temporal_memory_tables.sql " "or set TM_POSTGRES_AUTO_CREATE_TABLES=true")
-        logger.info("PostgresTemporalMemoryStore initialized")
+                await self._detect_search_capabilities(conn)
+        logger.info(
+            "PostgresTemporalMemoryStore initialized (fulltext=%s, trigram=%s)",
+            self._fulltext,
+            self._trigram,
+        )
 
     async def _ensure_tables(self, conn: asyncpg.Connection) -> None:
         for ddl in _TM_TABLE_DDL:
             await conn.execute(ddl)
+        await self._backfill_text_tsv(conn)
+        if self._trigram:
+            try:
+                for ddl in _TM_TRIGRAM_DDL:
+                    await conn.execute(ddl)
+            except asyncpg.PostgresError as exc:
+                logger.warning("pg_trgm unavailable; trigram search disabled: %s", exc)
+                self._trigram = False
+
+    async def _backfill_text_tsv(self, conn: asyncpg.Connection) -> None:
+        """Populate ``text_tsv`` for rows written before the column existed, in batches."""
+        while True:
+            status = await conn.execute(
+                """
+                UPDATE tm_fact SET text_tsv = to_tsvector($1::regconfig, text)
+                WHERE fact_id IN (
+                    SELECT fact_id FROM tm_fact WHERE text_tsv IS NULL LIMIT $2
+                )
+                """,
+                self._text_search_config,
+                _TSV_BACKFILL_BATCH,
+            )
+            if not status or status.split()[-1] == "0":
+                return
+
+    async def _detect_search_capabilities(self, conn: asyncpg.Connection) -> None:
+        """Check for the ``text_tsv`` column and ``pg_trgm`` on migration-managed schemas."""
+        self._fulltext = bool(
+            await conn.fetchval(
+                """
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = 'public' AND table_name = 'tm_fact' AND column_name = 'text_tsv'
+                """
+            )
+        )
+        if not self._fulltext:
+            logger.warning("tm_fact.text_tsv missing; falling back to ILIKE search. " "Apply aiecs/scripts/migrations/postgres/003_temporal_memory_fulltext.sql")
+        if self._trigram:
+            self._trigram = bool(await conn.fetchval("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"))
+            if not self._trigram:
+                logger.warning("TM_POSTGRES_TRIGRAM=true but pg_trgm is not installed; trigram search disabled")
 
     async def close(self) -> None:
         pending = list(self._pending_ingest_tasks)
@@ -178,19 +286,35 @@ class PostgresTemporalMemoryStore:
                     ref_time,
                     metadata_json,
                 )
-                await conn.execute(
-                    """
-                    INSERT INTO tm_fact (
-                        fact_id, group_id, text, valid_at, source_episode_id, metadata
+                if self._fulltext:
+                    await conn.execute(
+                        """
+                        INSERT INTO tm_fact (
+                            fact_id, group_id, text, valid_at, source_episode_id, metadata, text_tsv
+                        )
+                        VALUES ($1::uuid, $2, $3, $4, $5::uuid, '{}'::jsonb, to_tsvector($6::regconfig, $3))
+                        """,
+                        fact_id,
+                        request.group_id,
+                        request.body,
+                        ref_time,
+                        episode_id,
+                        self._text_search_config,
+                    )
+                else:
+                    await conn.execute(
+                        """
+                        INSERT INTO tm_fact (
+                            fact_id, group_id, text, valid_at, source_episode_id, metadata
+                        )
+                        VALUES ($1::uuid, $2, $3, $4, $5::uuid, '{}'::jsonb)
+                        """,
+                        fact_id,
+                        request.group_id,
+                        request.body,
+                        ref_time,
+                        episode_id,
                     )
-                    VALUES ($1::uuid, $2, $3, $4, $5::uuid, '{}'::jsonb)
-                    """,
-                    fact_id,
-                    request.group_id,
-                    request.body,
-                    ref_time,
-                    episode_id,
-                )
 
         return IngestEpisodeResult(
             episode_id=str(episode_id),
@@ -261,23 +385,18 @@ class PostgresTemporalMemoryStore:
         as_of = _ensure_utc(valid_at) or datetime.now(timezone.utc)
         pattern = f"%{_escape_ilike_pattern(q)}%"
 
-        rows = await pool.fetch(
-            """
-            SELECT fact_id, group_id, text, valid_at, invalid_at, confidence,
-                   source_episode_id, metadata
-            FROM tm_fact
-            WHERE group_id = ANY($1::varchar[])
-              AND text ILIKE $2 ESCAPE '\\'
-              AND (valid_at IS NULL OR valid_at <= $3)
-              AND (invalid_at IS NULL OR invalid_at > $3)
-            ORDER BY valid_at DESC NULLS LAST
-            LIMIT $4
-            """,
-            group_ids,
-            pattern,
-            as_of,
-            limit,
-        )
+        if not self._fulltext:
+            rows = await pool.fetch(_SEARCH_ILIKE_SQL, group_ids, pattern, as_of, limit)
+        else:
+            rows = await pool.fetch(
+                _SEARCH_TRIGRAM_SQL if self._trigram else _SEARCH_FULLTEXT_SQL,
+                group_ids,
+                q,
+                as_of,
+                limit,
+                self._text_search_config,
+                pattern,
+            )
         return [_row_to_fact(row) for row in rows]
 
     async def get_fact(self, fact_id: str, *, group_ids: list[str]) -> TemporalFact | None:
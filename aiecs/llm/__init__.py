@@ -15,54 +15,103 @@ Package Structure:
 - utils/: Utility functions and scripts
 """
 
-# Import from organized subpackages
-from .clients import (
-    BaseLLMClient,
-    CacheControl,
-    LLMMessage,
-    LLMResponse,
-    LLMClientError,
-    ProviderNotAvailableError,
-    RateLimitError,
-    OpenAIClient,
-    VertexAIClient,
-    GoogleAIClient,
-    XAIClient,
-    AnthropicVertexClient,
-    VertexMaaSClient,
-)
+from typing import TYPE_CHECKING, Dict
 
-from .protocols import LLMClientProtocol
+from aiecs.utils.lazy_exports import make_lazy_module
 
-from .client_factory import (
-    AIProvider,
-    LLMClientFactory,
-    LLMClientManager,
-    get_llm_manager,
-    generate_text,
-    stream_text,
-)
+# Export name -> defining module. Resolved on first access so that importing
+# the package (or only the base types) does not load every provider SDK.
+_LAZY_IMPORTS: Dict[str, str] = {
+    # Base classes and types
+    "BaseLLMClient": ".clients.base_client",
+    "CacheControl": ".clients.base_client",
+    "LLMMessage": ".clients.base_client",
+    "LLMResponse": ".clients.base_client",
+    "LLMClientError": ".clients.base_client",
+    "ProviderNotAvailableError": ".clients.base_client",
+    "RateLimitError": ".clients.base_client",
+    # Individual clients
+    "OpenAIClient": ".clients.openai_client",
+    "VertexAIClient": ".clients.vertex_client",
+    "GoogleAIClient": ".clients.googleai_client",
+    "XAIClient": ".clients.xai_client",
+    "AnthropicVertexClient": ".clients.anthropic_client",
+    "VertexMaaSClient": ".clients.vertex_maas_client",
+    # Protocols
+    "LLMClientProtocol": ".protocols",
+    # Factory, manager and convenience functions
+    "AIProvider": ".client_factory",
+    "LLMClientFactory": ".client_factory",
+    "LLMClientManager": ".client_factory",
+    "get_llm_manager": ".client_factory",
+    "generate_text": ".client_factory",
+    "stream_text": ".client_factory",
+    # Configuration management
+    "ModelCostConfig": ".config",
+    "ModelCapabilities": ".config",
+    "ModelDefaultParams": ".config",
+    "ModelConfig": ".config",
+    "ProviderConfig": ".config",
+    "LLMModelsConfig": ".config",
+    "LLMConfigLoader": ".config",
+    "get_llm_config_loader": ".config",
+    "get_llm_config": ".config",
+    "reload_llm_config": ".config",
+    # Callbacks
+    "CustomAsyncCallbackHandler": ".callbacks",
+    # Client resolution helpers
+    "resolve_llm_client": ".client_resolver",
+    "clear_client_cache": ".client_resolver",
+    "get_cached_providers": ".client_resolver",
+}
+
+if TYPE_CHECKING:
+    from .clients import (
+        BaseLLMClient,
+        CacheControl,
+        LLMMessage,
+        LLMResponse,
+        LLMClientError,
+        ProviderNotAvailableError,
+        RateLimitError,
+        OpenAIClient,
+        VertexAIClient,
+        GoogleAIClient,
+        XAIClient,
+        AnthropicVertexClient,
+        VertexMaaSClient,
+    )
+    from .protocols import LLMClientProtocol
+    from .client_factory import (
+        AIProvider,
+        LLMClientFactory,
+        LLMClientManager,
+        get_llm_manager,
+        generate_text,
+        stream_text,
+    )
+    from .config import (
+        ModelCostConfig,
+        ModelCapabilities,
+        ModelDefaultParams,
+        ModelConfig,
+        ProviderConfig,
+        LLMModelsConfig,
+        LLMConfigLoader,
+        get_llm_config_loader,
+        get_llm_config,
+        reload_llm_config,
+    )
+    from .callbacks import CustomAsyncCallbackHandler
+    from .client_resolver import (
+        resolve_llm_client,
+        clear_client_cache,
+        get_cached_providers,
+    )
 
-from .config import (
-    ModelCostConfig,
-    ModelCapabilities,
-    ModelDefaultParams,
-    ModelConfig,
-    ProviderConfig,
-    LLMModelsConfig,
-    LLMConfigLoader,
-    get_llm_config_loader,
-    get_llm_config,
-    reload_llm_config,
-)
 
-from .callbacks import CustomAsyncCallbackHandler
+__getattr__, __dir__ = make_lazy_module(__name__, _LAZY_IMPORTS)
 
-from .client_resolver import (
-    resolve_llm_client,
-    clear_client_cache,
-    get_cached_providers,
-)
 
 __all__ = [
     # Base classes and types
@@ -8,22 +8,52 @@ LLM Client implementations.
 This package contains all LLM provider client implementations.
 """
 
-from .base_client import (
-    BaseLLMClient,
-    CacheControl,
-    LLMMessage,
-    LLMResponse,
-    LLMClientError,
-    ProviderNotAvailableError,
-    RateLimitError,
-)
-from .openai_compatible_mixin import StreamChunk
-from .openai_client import OpenAIClient
-from .vertex_client import VertexAIClient
-from .googleai_client import GoogleAIClient
-from .xai_client import XAIClient
-from .anthropic_client import AnthropicVertexClient
-from .vertex_maas_client import VertexMaaSClient
+from typing import TYPE_CHECKING, Dict
+
+from aiecs.utils.lazy_exports import make_lazy_module
+
+# Provider clients are imported on first access; each one pulls in its SDK.
+_LAZY_IMPORTS: Dict[str, str] = {
+    # Base classes
+    "BaseLLMClient": ".base_client",
+    "CacheControl": ".base_client",
+    "LLMMessage": ".base_client",
+    "LLMResponse": ".base_client",
+    "LLMClientError": ".base_client",
+    "ProviderNotAvailableError": ".base_client",
+    "RateLimitError": ".base_client",
+    # Streaming support
+    "StreamChunk": ".openai_compatible_mixin",
+    # Client implementations
+    "OpenAIClient": ".openai_client",
+    "VertexAIClient": ".vertex_client",
+    "GoogleAIClient": ".googleai_client",
+    "XAIClient": ".xai_client",
+    "AnthropicVertexClient": ".anthropic_client",
+    "VertexMaaSClient": ".vertex_maas_client",
+}
+
+if TYPE_CHECKING:
+    from .base_client import (
+        BaseLLMClient,
+        CacheControl,
+        LLMMessage,
+        LLMResponse,
+        LLMClientError,
+        ProviderNotAvailableError,
+        RateLimitError,
+    )
+    from .openai_compatible_mixin import StreamChunk
+    from .openai_client import OpenAIClient
+    from .vertex_client import VertexAIClient
+    from .googleai_client import GoogleAIClient
+    from .xai_client import XAIClient
+    from .anthropic_client import AnthropicVertexClient
+    from .vertex_maas_client import VertexMaaSClient
+
+
+__getattr__, __dir__ = make_lazy_module(__name__, _LAZY_IMPORTS)
+
 
 __all__ = [
     # Base classes
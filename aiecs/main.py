@@ -20,7 +20,7 @@ import socketio
 from aiecs.config.config import get_settings
 
 # Import WebSocket server
-from aiecs.ws.socket_server import sio
+from aiecs.ws.socket_server import sio, start_progress_relay, stop_progress_relay
 
 # Import infrastructure
 from aiecs.infrastructure.persistence.database_manager import DatabaseManager
@@ -120,6 +120,13 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"ClickHouse client initialization failed: {e}")
 
+    # Relay task progress published by workers to this replica's Socket.IO clients
+    try:
+        await start_progress_relay()
+        logger.info("Progress relay started")
+    except Exception as e:
+        logger.warning(f"Progress relay failed to start (continuing without it): {e}")
+
     # Application startup complete
     logger.info("AIECS startup complete")
 
@@ -128,6 +135,13 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down AIECS...")
 
+    # Stop progress relay
+    try:
+        await stop_progress_relay()
+        logger.info("Progress relay stopped")
+    except Exception as e:
+        logger.warning(f"Error stopping progress relay: {e}")
+
     # Close ContextEngine
     try:
         await close_context_engine()
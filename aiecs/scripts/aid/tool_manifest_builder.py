@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# /*---------------------------------------------------------------------------------------------
+#  *  Copyright (c) IRETBL Corporation. All rights reserved.
+#  *  Licensed under the Apache-2.0. See License.txt in the project root for license information.
+#  *--------------------------------------------------------------------------------------------*/
+"""
+AIECS Tool Manifest Builder
+
+Regenerates ``aiecs/tools/tool_manifest.json``, the prebuilt index of tools
+registered in the tool sources that ``aiecs.tools`` loads at import time
+instead of scanning every file. By default the manifest is content-only, as
+committed. Deployments can run it once more after installing with
+``--record-stats``: the manifest then also records file stats, and files whose
+stat still matches are not even read at import time.
+
+Usage:
+    python -m aiecs.scripts.aid.tool_manifest_builder
+    aiecs-build-tool-manifest [--output PATH] [--check] [--record-stats]
+"""
+
+import argparse
+import sys
+
+from aiecs.tools.tool_manifest import DEFAULT_MANIFEST_PATH, build_manifest, load_manifest, manifest_content, write_manifest
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        prog="aiecs-build-tool-manifest",
+        description="Regenerate the prebuilt AIECS tool manifest used for fast tool discovery",
+    )
+    parser.add_argument("--output", "-o", type=str, default=DEFAULT_MANIFEST_PATH, help="Manifest path (default: the packaged aiecs/tools/tool_manifest.json)")
+    parser.add_argument("--check", action="store_true", help="Do not write; exit with status 1 if the manifest is missing or stale")
+    parser.add_argument(
+        "--record-stats",
+        action="store_true",
+        help="Also record file mtimes and sizes for stat-only discovery (deploy-time runs; keep off for the committed manifest)",
+    )
+
+    args = parser.parse_args()
+
+    manifest = build_manifest(record_stats=args.record_stats)
+    tool_count = sum(len(entry["tools"]) for entry in manifest["modules"].values())
+
+    if args.check:
+        current = load_manifest(args.output)
+        if current is None or manifest_content(current) != manifest_content(manifest):
+            print(f"Tool manifest {args.output} is out of date; run aiecs-build-tool-manifest", file=sys.stderr)
+            sys.exit(1)
+        print(f"Tool manifest {args.output} is up to date ({tool_count} tools)")
+        return
+
+    write_manifest(manifest, args.output)
+    print(f"Wrote {args.output}: {len(manifest['modules'])} modules, {tool_count} tools")
+
+
+if __name__ == "__main__":
+    main()
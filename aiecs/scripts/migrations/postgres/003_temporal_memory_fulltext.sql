@@ -0,0 +1,35 @@
+-- L1 Temporal Memory — ranked full-text search on tm_fact (requires 002)
+-- Apply: psql "$TM_POSTGRES_URL" -f aiecs/scripts/migrations/postgres/003_temporal_memory_fulltext.sql
+--
+-- Safe on populated tables: the column is added without a rewrite, existing rows
+-- are backfilled in committed batches, and indexes are built CONCURRENTLY (do not
+-- wrap this file in a transaction; psql runs each statement in autocommit mode).
+-- Until the backfill finishes, rows with NULL text_tsv are still found via ILIKE.
+--
+-- The text search configuration must match TM_POSTGRES_TEXT_SEARCH_CONFIG
+-- (default 'simple'); replace 'simple' below if you use another one.
+
+ALTER TABLE tm_fact ADD COLUMN IF NOT EXISTS text_tsv tsvector;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tm_fact_tsv_pending ON tm_fact (group_id) WHERE text_tsv IS NULL;
+
+DO $$
+DECLARE
+    updated INTEGER;
+BEGIN
+    LOOP
+        UPDATE tm_fact SET text_tsv = to_tsvector('simple', text)
+        WHERE fact_id IN (SELECT fact_id FROM tm_fact WHERE text_tsv IS NULL LIMIT 10000);
+        GET DIAGNOSTICS updated = ROW_COUNT;
+        EXIT WHEN updated = 0;
+        COMMIT;
+    END LOOP;
+END
+$$;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tm_fact_text_tsv ON tm_fact USING GIN (text_tsv);
+
+-- Optional: substring / fuzzy matching (TM_POSTGRES_TRIGRAM=true). Requires the
+-- pg_trgm extension (contrib); skip these two statements if it is unavailable.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tm_fact_text_trgm ON tm_fact USING GIN (text gin_trgm_ops);
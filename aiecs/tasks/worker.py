@@ -4,12 +4,15 @@
 #  *--------------------------------------------------------------------------------------------*/
 from aiecs.domain.execution.model import TaskStatus
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from aiecs.config.config import get_settings
-from aiecs.ws.socket_server import push_progress
+from aiecs.ws.progress_channel import publish_progress, set_progress_channel
 from aiecs.core.registry import get_ai_service
-import logging
 import asyncio
-from typing import Dict, Any
+import inspect
+import logging
+import threading
+from typing import Dict, Any, Awaitable, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +40,137 @@ celery_app.conf.update(
 )
 
 
+class WorkerEventLoop:
+    """
+    Long-lived event loop running on a daemon thread, one per worker process.
+
+    Task bodies are synchronous; coroutines (async service methods, async
+    client setup/teardown) are submitted here instead of ``asyncio.run``, so
+    the loop and any clients bound to it survive across tasks.
+    """
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+
+                def _run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(started.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=_run, name="aiecs-worker-loop", daemon=True)
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+            return self._loop
+
+    def reset_after_fork(self) -> None:
+        """Forget a loop inherited from the parent process (its thread did not survive the fork)"""
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Run *coro* on the worker loop and block until it finishes"""
+        loop = self.start()
+        return asyncio.run_coroutine_threadsafe(_as_coroutine(coro), loop).result(timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        async def _cancel_pending() -> None:
+            current = asyncio.current_task()
+            pending = [task for task in asyncio.all_tasks() if task is not current]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_cancel_pending(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Error cancelling worker loop tasks: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+        loop.close()
+
+
+async def _as_coroutine(awaitable: Awaitable[Any]) -> Any:
+    return await awaitable
+
+
+worker_loop = WorkerEventLoop()
+
+# Service instances reused across tasks in this worker process, keyed by (mode, service)
+_service_instances: Dict[Tuple[str, str], Any] = {}
+_service_lock = threading.Lock()
+
+
+def get_service_instance(mode: str, service: str) -> Any:
+    """Return the worker's service instance for (mode, service), creating it on first use"""
+    if not settings.celery_worker_reuse_services:
+        return get_ai_service(mode, service)()
+    key = (mode, service)
+    instance = _service_instances.get(key)
+    if instance is None:
+        with _service_lock:
+            instance = _service_instances.get(key)
+            if instance is None:
+                instance = get_ai_service(mode, service)()
+                _service_instances[key] = instance
+    return instance
+
+
+def shutdown_services() -> None:
+    """Close cached service instances (``aclose``/``close``/``shutdown`` when defined)"""
+    with _service_lock:
+        instances = list(_service_instances.items())
+        _service_instances.clear()
+    for (mode, service), instance in instances:
+        for name in ("aclose", "close", "shutdown"):
+            closer = getattr(instance, name, None)
+            if callable(closer):
+                try:
+                    result = closer()
+                    if inspect.isawaitable(result):
+                        worker_loop.run(result, timeout=10)
+                except Exception as e:
+                    logger.warning(f"Error closing service {mode}/{service}: {e}")
+                break
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**kwargs):
+    # Forked children must not reuse the parent's loop, service instances or broker connections
+    _service_instances.clear()
+    set_progress_channel(None)
+    worker_loop.reset_after_fork()
+    worker_loop.start()
+    logger.info("Worker event loop started")
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**kwargs):
+    shutdown_services()
+    worker_loop.stop()
+    logger.info("Worker services and event loop shut down")
+
+
 @celery_app.task(bind=True, name="aiecs.tasks.worker.execute_task")
 def execute_task(
     self,
@@ -114,23 +248,21 @@ def _execute_service_task(
     """
     try:
         # 1. Push started status
-        asyncio.run(
-            push_progress(
-                user_id,
-                {
-                    "status": TaskStatus.RUNNING.value,
-                    "step": step,
-                    "task": task_name,
-                    "message": f"Executing task: {task_name}",
-                },
-            )
+        publish_progress(
+            user_id,
+            {
+                "status": TaskStatus.RUNNING.value,
+                "task_id": task_id,
+                "step": step,
+                "task": task_name,
+                "message": f"Executing task: {task_name}",
+            },
         )
 
-        # 2. Get the service instance
+        # 2. Get the service instance (reused across tasks in this worker)
         # Note: get_ai_service is imported at module level from aiecs.core.registry
         # The registry is now in the core layer to prevent circular imports
-        service_cls = get_ai_service(mode, service)
-        service_instance = service_cls()
+        service_instance = get_service_instance(mode, service)
 
         # 3. Execute the task
         if hasattr(service_instance, task_name) and callable(getattr(service_instance, task_name)):
@@ -140,19 +272,20 @@ def _execute_service_task(
             # Fallback to a generic execution method if the specific task
             # method doesn't exist
             result = service_instance.execute_task(task_name, input_data, context)
+        if inspect.isawaitable(result):
+            result = worker_loop.run(result)
 
         # 4. Push completed status
-        asyncio.run(
-            push_progress(
-                user_id,
-                {
-                    "status": TaskStatus.COMPLETED.value,
-                    "step": step,
-                    "task": task_name,
-                    "result": result,
-                    "message": f"Completed task: {task_name}",
-                },
-            )
+        publish_progress(
+            user_id,
+            {
+                "status": TaskStatus.COMPLETED.value,
+                "task_id": task_id,
+                "step": step,
+                "task": task_name,
+                "result": result,
+                "message": f"Completed task: {task_name}",
+            },
         )
 
         return {
@@ -163,17 +296,16 @@ def _execute_service_task(
     except Exception as e:
         logger.error(f"Error executing task {task_name}: {str(e)}", exc_info=True)
         # Push error status
-        asyncio.run(
-            push_progress(
-                user_id,
-                {
-                    "status": TaskStatus.FAILED.value,
-                    "step": step,
-                    "task": task_name,
-                    "error": str(e),
-                    "message": f"Failed to execute task: {task_name}",
-                },
-            )
+        publish_progress(
+            user_id,
+            {
+                "status": TaskStatus.FAILED.value,
+                "task_id": task_id,
+                "step": step,
+                "task": task_name,
+                "error": str(e),
+                "message": f"Failed to execute task: {task_name}",
+            },
         )
 
         return {
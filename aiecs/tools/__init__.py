@@ -12,6 +12,7 @@ import pkgutil
 from typing import Dict, Any
 
 from aiecs.tools.base_tool import BaseTool
+from aiecs.tools.tool_manifest import discover_tools_from_manifest
 
 logger = logging.getLogger(__name__)
 
@@ -186,95 +187,13 @@ def _ensure_task_tools_available():
 
 
 def _auto_discover_tools():
-    """Automatically discover all tools by scanning tool directories"""
-    import re
-
-    # Define tool directories and their categories
-    tool_dirs = [
-        ("task_tools", "task"),
-        ("search_tool", "task"),
-    ]
-
-    discovered_tools = []
-
-    for dir_name, category in tool_dirs:
-        dir_path = os.path.join(os.path.dirname(__file__), dir_name)
-        if not os.path.exists(dir_path):
-            continue
-
-        # Check if this is a package (has __init__.py) or a directory of
-        # modules
-        init_file = os.path.join(dir_path, "__init__.py")
-        files_to_scan = []
-
-        if os.path.isfile(init_file):
-            # Scan __init__.py for package-level registrations
-            files_to_scan.append(("__init__.py", init_file))
-
-        # Scan all other Python files in the directory
-        for filename in os.listdir(dir_path):
-            if filename.endswith(".py") and not filename.startswith("__"):
-                file_path = os.path.join(dir_path, filename)
-                files_to_scan.append((filename, file_path))
-
-        # Process all files
-        for filename, file_path in files_to_scan:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                    # Find @register_tool decorators (two patterns)
-                    # Pattern 1: @register_tool("name") decorator syntax
-                    decorator_pattern = r'@register_tool\([\'"]([^\'"]+)[\'"]\)'
-                    decorator_matches = re.findall(decorator_pattern, content)
-
-                    # Pattern 2: register_tool("name")(ClassName) function call
-                    # syntax
-                    function_pattern = r'register_tool\([\'"]([^\'"]+)[\'"]\)\([A-Za-z_][A-Za-z0-9_]*\)'
-                    function_matches = re.findall(function_pattern, content)
-
-                    # Combine all matches
-                    all_matches = list(set(decorator_matches + function_matches))
-
-                    for tool_name in all_matches:
-                        # Try to extract description from class docstring or
-                        # module docstring
-                        description = f"{tool_name} tool"
-
-                        # Method 1: Look for class definition after the
-                        # decorator
-                        class_pattern = rf'@register_tool\([\'"]({tool_name})[\'"]\)\s*class\s+\w+.*?"""(.*?)"""'
-                        class_match = re.search(class_pattern, content, re.DOTALL)
-                        if class_match:
-                            doc = class_match.group(2).strip()
-                            # Get first line of docstring
-                            first_line = doc.split("\n")[0].strip()
-                            if first_line and len(first_line) < 200:
-                                description = first_line
-
-                        # Method 2: For __init__.py files, try to extract from
-                        # module docstring
-                        if not class_match and filename == "__init__.py":
-                            module_doc_pattern = r'^"""(.*?)"""'
-                            module_doc_match = re.search(
-                                module_doc_pattern,
-                                content,
-                                re.DOTALL | re.MULTILINE,
-                            )
-                            if module_doc_match:
-                                doc = module_doc_match.group(1).strip()
-                                # Get first non-empty line
-                                for line in doc.split("\n"):
-                                    line = line.strip()
-                                    if line and not line.startswith("#") and len(line) < 200:
-                                        description = line
-                                        break
-
-                        discovered_tools.append((tool_name, description, category))
-            except Exception as e:
-                logger.debug(f"Error scanning {filename}: {e}")
+    """
+    Automatically discover all tools in the tool directories.
 
-    return discovered_tools
+    Uses the prebuilt tool manifest (``tool_manifest.json``) for files whose
+    hash is unchanged and regex-scans only new or modified sources.
+    """
+    return discover_tools_from_manifest()
 
 
 def _register_known_tools():
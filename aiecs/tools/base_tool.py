@@ -2,9 +2,13 @@
 #  *  Copyright (c) IRETBL Corporation. All rights reserved.
 #  *  Licensed under the Apache-2.0. See License.txt in the project root for license information.
 #  *--------------------------------------------------------------------------------------------*/
+import hashlib
 import inspect
+import json
 import logging
-from typing import Any, Dict, List, Optional, Type
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Type, Union, cast
 
 from pydantic import BaseModel, ValidationError
 import re
@@ -20,6 +24,37 @@ from aiecs.tools.schema_generator import generate_schema_from_method
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; applied to every string argument by BaseTool._sanitize_kwargs
+_MALICIOUS_INPUT_PATTERN = re.compile(r"(\bSELECT\b|\bINSERT\b|--|;|/\*)", re.IGNORECASE)
+
+_NO_CONFIG_CLASS = object()
+
+
+class _ClassIntrospection:
+    """Schemas, async method names and coverage generated for one tool class."""
+
+    __slots__ = ("schemas", "async_methods", "schema_coverage")
+
+    def __init__(self, schemas: Dict[str, Type[BaseModel]], async_methods: List[str], schema_coverage: Dict[str, Any]):
+        self.schemas = dict(schemas)
+        self.async_methods = list(async_methods)
+        self.schema_coverage = dict(schema_coverage)
+
+
+# Per-class caches. Schema generation and introspection only depend on the class
+# (plus BaseTool._schema_fingerprint), so instances after the first reuse them.
+# Weak keys let dynamically created tool classes be garbage collected.
+_introspection_cache: "weakref.WeakKeyDictionary[type, Dict[str, _ClassIntrospection]]" = weakref.WeakKeyDictionary()
+_config_class_cache: "weakref.WeakKeyDictionary[type, Union[Type[BaseModel], object]]" = weakref.WeakKeyDictionary()
+_cache_lock = threading.Lock()
+
+
+def clear_tool_class_cache() -> None:
+    """Drop cached per-class schemas and introspection (e.g. after patching a tool class)."""
+    with _cache_lock:
+        _introspection_cache.clear()
+        _config_class_cache.clear()
+
 
 class BaseTool:
     """
@@ -49,6 +84,10 @@ class BaseTool:
                 pass
     """
 
+    # Tools whose operations are read-only and free of shared side effects may set
+    # this to True so agents can run several of their calls concurrently.
+    parallel_safe: bool = False
+
     def __init__(self, config: Optional[Dict[str, Any]] = None, tool_name: Optional[str] = None):
         """
         Initialize the tool with optional configuration.
@@ -123,7 +162,10 @@ class BaseTool:
         # Extract only executor-related config fields to avoid passing tool-specific
         # fields (e.g., user_agent, temp_dir) to ExecutorConfig
         executor_config = self._extract_executor_config(self._config)
+        # Executors are shared between tools with equivalent executor settings;
+        # the namespace keeps this tool's cache entries apart from other tools'.
         self._executor = get_executor(executor_config)
+        self._cache_namespace = self._build_cache_namespace(self._config)
         self._schemas: Dict[str, Type[BaseModel]] = {}
         self._async_methods: List[str] = []
         # Schema coverage tracking
@@ -134,10 +176,60 @@ class BaseTool:
             "missing_schemas": 0,
             "schema_quality": {},
         }
-        self._register_schemas()
-        self._register_async_methods()
-        # Log schema coverage after registration
-        self._log_schema_coverage()
+        self._load_class_introspection()
+
+    def _schema_fingerprint(self) -> str:
+        """
+        Fingerprint of the configuration that affects schema generation.
+
+        Schemas are generated once per class and fingerprint. The default schemas
+        only depend on the class, so this returns an empty string; override it if
+        a subclass derives its schemas from configuration.
+        """
+        return ""
+
+    def _load_class_introspection(self) -> None:
+        """
+        Populate schemas and async methods from the per-class cache, generating
+        them (and logging coverage) on the first instantiation only.
+        """
+        cls = self.__class__
+        fingerprint = self._schema_fingerprint()
+        cached = _introspection_cache.get(cls, {}).get(fingerprint)
+
+        if cached is None:
+            self._register_schemas()
+            self._register_async_methods()
+            # Log schema coverage after registration
+            self._log_schema_coverage()
+            with _cache_lock:
+                _introspection_cache.setdefault(cls, {})[fingerprint] = _ClassIntrospection(self._schemas, self._async_methods, self._schema_coverage)
+            return
+
+        # Copies: _get_method_schema may register further schemas per instance
+        self._schemas = dict(cached.schemas)
+        self._async_methods = list(cached.async_methods)
+        self._schema_coverage = dict(cached.schema_coverage)
+
+    def _build_cache_namespace(self, config: Dict[str, Any]) -> str:
+        """
+        Build the executor cache namespace for this tool.
+
+        Instances of the same class with the same configuration share cache
+        entries; a different class or configuration gets its own namespace.
+
+        Args:
+            config (Dict[str, Any]): Loaded tool configuration.
+
+        Returns:
+            str: ``module.ClassName:<config digest>``.
+        """
+        try:
+            blob = json.dumps(config, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            blob = repr(config)
+        digest = hashlib.blake2b(blob.encode("utf-8"), digest_size=8).hexdigest()
+        return f"{self.__class__.__module__}.{self.__class__.__qualname__}:{digest}"
 
     def _extract_executor_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -173,6 +265,17 @@ class BaseTool:
         Returns:
             Config class if found, None otherwise
         """
+        cached = _config_class_cache.get(self.__class__)
+        if cached is None:
+            found = self._find_config_class()
+            cached = _NO_CONFIG_CLASS if found is None else found
+            with _cache_lock:
+                _config_class_cache[self.__class__] = cached
+        if cached is _NO_CONFIG_CLASS:
+            return None
+        return cast(Type[BaseModel], cached)
+
+    def _find_config_class(self) -> Optional[Type[BaseModel]]:
         # Check current class and all base classes
         for cls in [self.__class__] + list(self.__class__.__mro__):
             if hasattr(cls, "Config"):
@@ -444,7 +547,7 @@ class BaseTool:
         """
         sanitized = {}
         for k, v in kwargs.items():
-            if isinstance(v, str) and re.search(r"(\bSELECT\b|\bINSERT\b|--|;|/\*)", v, re.IGNORECASE):
+            if isinstance(v, str) and _MALICIOUS_INPUT_PATTERN.search(v):
                 raise SecurityError(f"Input parameter '{k}' contains potentially malicious content")
             sanitized[k] = v
         return sanitized
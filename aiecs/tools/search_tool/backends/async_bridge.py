@@ -8,30 +8,219 @@ Optional async→sync bridge for **custom** grounding backends only (M-D.5 §3.4
 Built-in Gemini / Grok / Google CSE backends are synchronous and **must not**
 import or call this module. Consumers with async-only HTTP clients (e.g. Exa)
 may use ``run_async_from_sync`` inside their ``GroundingSearchBackend.search()``.
+
+Coroutines run on one long-lived event loop in a daemon thread per process, so
+sync calls do not pay loop creation/teardown, and async HTTP clients obtained
+with ``get_shared_async_client`` keep their connection pools across calls::
+
+    async def _search(self, params):
+        client = await get_shared_async_client("exa", lambda: httpx.AsyncClient(base_url=EXA_URL))
+        response = await client.post("/search", json={"query": params.query})
+        ...
+
+    def search(self, params):
+        return run_async_from_sync(self._search(params), timeout=params.timeout_seconds)
+
+The loop and shared clients are closed by ``shutdown_async_bridge`` (registered
+with ``atexit``). A forked child drops the parent's loop and clients without
+touching them and starts its own on first use.
 """
 
 from __future__ import annotations
 
 import asyncio
+import atexit
 import concurrent.futures
-from typing import Any, Coroutine, TypeVar
+import inspect
+import logging
+import os
+import threading
+from typing import Any, Callable, Coroutine, Dict, Optional, TypeVar
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
+# Extra time for the loop thread to deliver a wait_for timeout before the caller gives up
+_RESULT_GRACE_SECONDS = 1.0
+_SHUTDOWN_TIMEOUT_SECONDS = 5.0
+
+
+class _BackgroundLoop:
+    """Event loop running forever in a daemon thread, plus its shared async clients."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.clients: Dict[str, Any] = {}
+        self._ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="aiecs-search-async-bridge", daemon=True)
+        self.thread.start()
+        self._ready.wait()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        self.loop.run_forever()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    async def _drain(self) -> None:
+        """Close shared clients and cancel leftover tasks (runs on the loop)."""
+        clients, self.clients = list(self.clients.items()), {}
+        for key, client in clients:
+            try:
+                await _close_client(client)
+            except Exception as exc:  # pragma: no cover - best effort on shutdown
+                logger.warning(f"Failed to close shared async client '{key}': {exc}")
+
+        current = asyncio.current_task()
+        pending = [task for task in asyncio.all_tasks() if task is not current]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await self.loop.shutdown_asyncgens()
+
+    def stop(self, timeout: float) -> None:
+        if self.loop.is_closed():
+            return
+        if self.thread.is_alive():
+            try:
+                asyncio.run_coroutine_threadsafe(self._drain(), self.loop).result(timeout)
+            except Exception as exc:
+                logger.warning(f"Async bridge drain did not complete cleanly: {exc}")
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout)
+        if not self.thread.is_alive():
+            self.loop.close()
+
+
+_lock = threading.Lock()
+_background: Optional[_BackgroundLoop] = None
+
+
+def _get_background_loop() -> _BackgroundLoop:
+    global _background
+    background = _background
+    if background is not None:
+        return background
+    with _lock:
+        if _background is None:
+            _background = _BackgroundLoop()
+        return _background
+
+
+def _run_isolated(coro: Coroutine[Any, Any, T], *, timeout: float) -> T:
+    """Run on a throwaway loop in a worker thread (re-entrant calls from the bridge loop)."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(lambda: asyncio.run(asyncio.wait_for(coro, timeout=timeout)))
+        return future.result()
+
 
 def run_async_from_sync(coro: Coroutine[Any, Any, T], *, timeout: float) -> T:
     """
     Run a coroutine from a sync ``search()`` implementation safely.
 
-    * No running loop → ``asyncio.run(wait_for(...))``.
-    * Running loop present → isolate in a worker thread (never nest ``asyncio.run``
-      on the caller's loop).
+    The coroutine runs on the process-wide background loop; the caller blocks
+    until it finishes or ``timeout`` elapses (``TimeoutError``). This works the
+    same whether or not the calling thread has a running loop of its own, and
+    never nests ``asyncio.run`` on the caller's loop. A call made from a
+    coroutine already running on the background loop falls back to a
+    throwaway loop in a worker thread instead of deadlocking.
     """
+    background = _get_background_loop()
+    if threading.current_thread() is background.thread:
+        return _run_isolated(coro, timeout=timeout)
+
+    future = background.submit(asyncio.wait_for(coro, timeout=timeout))
     try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(asyncio.wait_for(coro, timeout=timeout))
+        return future.result(timeout + _RESULT_GRACE_SECONDS)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-        future = pool.submit(lambda: asyncio.run(asyncio.wait_for(coro, timeout=timeout)))
-        return future.result()
+
+async def get_shared_async_client(key: str, factory: Callable[[], Any]) -> Any:
+    """
+    Get (or create) a process-wide async client bound to the bridge loop.
+
+    Must be awaited from a coroutine running through ``run_async_from_sync``.
+    The client is created by ``factory`` on first use, reused by every later
+    call with the same ``key``, and closed (``aclose()`` or ``close()``) by
+    ``shutdown_async_bridge`` / ``close_shared_async_client``.
+
+    Args:
+        key: Registry key, e.g. the backend name
+        factory: Zero-argument callable returning the client (e.g. ``httpx.AsyncClient``)
+
+    Raises:
+        RuntimeError: If not called on the bridge loop
+    """
+    background = _background
+    if background is None or asyncio.get_running_loop() is not background.loop:
+        raise RuntimeError("get_shared_async_client must be awaited inside run_async_from_sync")
+    client = background.clients.get(key)
+    if client is None:
+        client = factory()
+        if inspect.isawaitable(client):
+            client = await client
+        # The loop is single-threaded, but the factory may have awaited.
+        client = background.clients.setdefault(key, client)
+    return client
+
+
+def close_shared_async_client(key: str, *, timeout: float = _SHUTDOWN_TIMEOUT_SECONDS) -> bool:
+    """
+    Close and forget one shared async client (e.g. after a credential change).
+
+    Returns:
+        True if a client was registered under ``key``
+    """
+    background = _background
+    if background is None:
+        return False
+
+    async def _close() -> bool:
+        client = background.clients.pop(key, None)
+        if client is None:
+            return False
+        await _close_client(client)
+        return True
+
+    return background.submit(_close()).result(timeout)
+
+
+def shutdown_async_bridge(timeout: float = _SHUTDOWN_TIMEOUT_SECONDS) -> None:
+    """
+    Close shared clients, cancel pending work and stop the background loop.
+
+    Registered with ``atexit``; safe to call more than once. A later
+    ``run_async_from_sync`` starts a fresh loop.
+    """
+    global _background
+    with _lock:
+        background, _background = _background, None
+    if background is not None:
+        background.stop(timeout)
+
+
+async def _close_client(client: Any) -> None:
+    close = getattr(client, "aclose", None) or getattr(client, "close", None)
+    if close is None:
+        return
+    result = close()
+    if inspect.isawaitable(result):
+        await result
+
+
+def _reset_after_fork() -> None:
+    """In a forked child the loop thread does not exist; drop parent state untouched."""
+    global _background, _lock
+    _lock = threading.Lock()
+    _background = None
+
+
+atexit.register(shutdown_async_bridge)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -12,7 +12,11 @@ intelligent caching, and comprehensive metrics.
 from __future__ import annotations
 
 import logging
+import math
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Sequence, cast
 
 from pydantic import Field
@@ -71,6 +75,26 @@ from .cache_fingerprint import (
 from .normalizer import normalize_grounding_result
 from .router import BatchRoutingContext, GroundingRouter, RoutingMetadata
 
+# Router failures that always raise (Tier A, §3.10) and abort a batch
+_TIER_A_ERROR_TYPES = ("rate_limit_exceeded", "circuit_open")
+
+
+@dataclass
+class _BatchQueryCall:
+    """One ``search_batch`` query between preparation, routing and bucket assembly."""
+
+    query: str
+    query_index: int
+    num_results: int
+    enhanced_query: str
+    intent_analysis: Optional[Dict[str, Any]]
+    params: SearchCallParams
+    query_start: float
+    raw: Optional[BackendRawResult] = None
+    routing: Optional[RoutingMetadata] = None
+    used_pinned: bool = False
+    response_time: float = 0.0
+
 
 class SearchTool(BaseTool):
     """
@@ -201,6 +225,12 @@ class SearchTool(BaseTool):
             default=15.0,
             description="Total wall-clock budget for search_batch (§3.7)",
         )
+        batch_max_concurrency: int = Field(
+            default=1,
+            ge=1,
+            le=10,
+            description=("Worker threads for search_batch fan-out once routing is settled " "(pinned backend or per_query mode); 1 dispatches queries sequentially"),
+        )
         grounding_timeout_seconds: float = Field(
             default=30.0,
             description="Per-backend HTTP timeout cap for grounding search",
@@ -1142,7 +1172,7 @@ class SearchTool(BaseTool):
         cse_only = is_cse_only_deployment(self.config, registry=self._registry) and not non_cse_failed
 
         # Tier A: rate limit / circuit always raise
-        if raw.error_type in ("rate_limit_exceeded", "circuit_open"):
+        if raw.error_type in _TIER_A_ERROR_TYPES:
             try:
                 self._raise_from_cse_backend_result(raw)
             except (RateLimitError, CircuitBreakerOpenError) as exc:
@@ -1382,32 +1412,54 @@ class SearchTool(BaseTool):
         ctx.start_deadline()
         router = GroundingRouter(self._registry, self.config, logger=self.logger)
 
+        query_kwargs: Dict[str, Any] = {
+            "num_results": num_results,
+            "language": language,
+            "country": country,
+            "safe_search": safe_search,
+            "date_restrict": date_restrict,
+            "file_type": file_type,
+            "exclude_terms": exclude_terms,
+            "allowed_domains": allowed_domains,
+            "blocked_domains": blocked_domains,
+            "auto_enhance": auto_enhance,
+        }
+        workers = min(int(getattr(self.config, "batch_max_concurrency", 1) or 1), len(cleaned_queries))
         per_query_buckets: List[Dict[str, Any]] = []
-        failed_query_indices: List[int] = []
 
-        for query_index, query in enumerate(cleaned_queries):
-            remaining_queries = len(cleaned_queries) - query_index
-            bucket = self._search_batch_one_query(
-                router=router,
-                ctx=ctx,
-                query=query,
-                query_index=query_index,
-                remaining_queries=remaining_queries,
-                num_results=num_results,
-                language=language,
-                country=country,
-                safe_search=safe_search,
-                date_restrict=date_restrict,
-                file_type=file_type,
-                exclude_terms=exclude_terms,
-                allowed_domains=allowed_domains,
-                blocked_domains=blocked_domains,
-                auto_enhance=auto_enhance,
-                grounding_provider=grounding_provider,
+        # Dispatch sequentially until routing is settled: in pin_on_first_success
+        # mode the pin comes from the first successful chain walk.
+        query_index = 0
+        while query_index < len(cleaned_queries):
+            if workers > 1 and (ctx.mode == "per_query" or ctx.pinned_backend is not None):
+                break
+            per_query_buckets.append(
+                self._search_batch_one_query(
+                    router=router,
+                    ctx=ctx,
+                    query=cleaned_queries[query_index],
+                    query_index=query_index,
+                    remaining_queries=len(cleaned_queries) - query_index,
+                    grounding_provider=grounding_provider,
+                    **query_kwargs,
+                )
             )
-            if bucket.get("success") is False:
-                failed_query_indices.append(query_index)
-            per_query_buckets.append(bucket)
+            query_index += 1
+
+        if query_index < len(cleaned_queries):
+            per_query_buckets.extend(
+                self._search_batch_fan_out(
+                    router=router,
+                    ctx=ctx,
+                    queries=cleaned_queries,
+                    start_index=query_index,
+                    workers=workers,
+                    grounding_provider=grounding_provider,
+                    query_kwargs=query_kwargs,
+                )
+            )
+
+        failed_query_indices = [index for index, bucket in enumerate(per_query_buckets) if bucket.get("success") is False]
 
         merged_results: List[Dict[str, Any]] = []
         merged_low_signal: List[Dict[str, Any]] = []
@@ -1457,6 +1509,7 @@ class SearchTool(BaseTool):
             "batch_first_query_chain_attempted": list(ctx.first_query_chain_attempted),
             "per_query_backend_used": list(ctx.per_query_backend_used),
             "batch_p95_budget_seconds": ctx.budget_seconds,
+            "batch_max_concurrency": workers,
             "batch_elapsed_ms": response_time,
         }
         if failed_query_indices:
@@ -1493,6 +1546,93 @@ class SearchTool(BaseTool):
         grounding_provider: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Run one batch query through router pin/chain rules and partition."""
+        call = self._prepare_batch_query(
+            query=query,
+            query_index=query_index,
+            num_results=num_results,
+            language=language,
+            country=country,
+            safe_search=safe_search,
+            date_restrict=date_restrict,
+            file_type=file_type,
+            exclude_terms=exclude_terms,
+            allowed_domains=allowed_domains,
+            blocked_domains=blocked_domains,
+            auto_enhance=auto_enhance,
+        )
+        self._route_batch_query(router, ctx, call, remaining_queries=remaining_queries, grounding_provider=grounding_provider)
+        return self._finish_batch_query(call)
+
+    def _search_batch_fan_out(
+        self,
+        *,
+        router: GroundingRouter,
+        ctx: BatchRoutingContext,
+        queries: List[str],
+        start_index: int,
+        workers: int,
+        grounding_provider: Optional[str],
+        query_kwargs: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """
+        Route ``queries[start_index:]`` on a bounded thread pool (§3.7 fan-out).
+
+        Only the router/backend calls run concurrently. Buckets are finished on
+        the calling thread in query order, so metrics, search context and Tier
+        A/B raises behave as in sequential dispatch. Each query takes its
+        timeout from the remaining budget when it starts, shared across the
+        worker slots still ahead of it; once a query hits a rate limit or open
+        circuit, queries that have not started yet are skipped and the batch
+        raises that query's error.
+        """
+        calls = [self._prepare_batch_query(query=query, query_index=index, **query_kwargs) for index, query in enumerate(queries[start_index:], start=start_index)]
+        lock = threading.Lock()
+        abort = threading.Event()
+        unstarted = len(calls)
+
+        def route(call: _BatchQueryCall) -> None:
+            nonlocal unstarted
+            with lock:
+                remaining_slots = math.ceil(unstarted / workers)
+                unstarted -= 1
+            if abort.is_set():
+                return
+            self._route_batch_query(router, ctx, call, remaining_queries=remaining_slots, grounding_provider=grounding_provider)
+            if call.raw is not None and call.raw.error_type in _TIER_A_ERROR_TYPES:
+                abort.set()
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search-batch")
+        try:
+            futures = [executor.submit(route, call) for call in calls]
+            buckets: List[Dict[str, Any]] = []
+            for call, future in zip(calls, futures):
+                future.result()
+                if call.raw is None:
+                    # Skipped after a sibling's Tier A failure; finishing that
+                    # sibling raises for the whole batch, so no bucket is needed.
+                    continue
+                buckets.append(self._finish_batch_query(call))
+            return buckets
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _prepare_batch_query(
+        self,
+        *,
+        query: str,
+        query_index: int,
+        num_results: int,
+        language: str,
+        country: str,
+        safe_search: str,
+        date_restrict: Optional[str],
+        file_type: Optional[str],
+        exclude_terms: Optional[List[str]],
+        allowed_domains: Optional[List[str]] = None,
+        blocked_domains: Optional[List[str]] = None,
+        auto_enhance: bool,
+    ) -> _BatchQueryCall:
+        """Intent rewrite and backend params for one batch query."""
         query_start = time.time()
         intent_analysis = None
         enhanced_query = query
@@ -1521,16 +1661,43 @@ class SearchTool(BaseTool):
             allowed_domains=allowed_domains,
             blocked_domains=blocked_domains,
         )
+        return _BatchQueryCall(
+            query=query,
+            query_index=query_index,
+            num_results=num_results,
+            enhanced_query=enhanced_query,
+            intent_analysis=intent_analysis,
+            params=params,
+            query_start=query_start,
+        )
 
-        raw, routing, used_pinned = router.search_for_batch(
+    def _route_batch_query(
+        self,
+        router: GroundingRouter,
+        ctx: BatchRoutingContext,
+        call: _BatchQueryCall,
+        *,
+        remaining_queries: int,
+        grounding_provider: Optional[str],
+    ) -> None:
+        """Dispatch a prepared batch query through the router (safe to run on a worker thread)."""
+        call.raw, call.routing, call.used_pinned = router.search_for_batch(
             ctx,
-            params,
-            query_index=query_index,
+            call.params,
+            query_index=call.query_index,
             grounding_timeout_seconds=float(self.config.grounding_timeout_seconds),
             remaining_queries=remaining_queries,
             grounding_provider=grounding_provider,
         )
-        response_time = (time.time() - query_start) * 1000
+        call.response_time = (time.time() - call.query_start) * 1000
+
+    def _finish_batch_query(self, call: _BatchQueryCall) -> Dict[str, Any]:
+        """Failure envelope or normalized, partitioned bucket for a routed batch query."""
+        assert call.raw is not None and call.routing is not None
+        raw, routing, used_pinned = call.raw, call.routing, call.used_pinned
+        query, query_index, num_results = call.query, call.query_index, call.num_results
+        enhanced_query, intent_analysis, params = call.enhanced_query, call.intent_analysis, call.params
+        query_start, response_time = call.query_start, call.response_time
 
         search_metadata: Dict[str, Any] = {
             "backend_used": routing.backend_used or (raw.backend if raw.success else None),
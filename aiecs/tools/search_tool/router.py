@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any
@@ -49,6 +50,15 @@ class BatchRoutingContext:
     per_query_backend_used: list[str] = field(default_factory=list)
     budget_seconds: float = 15.0
     deadline: float | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_backend_used(self, query_index: int, backend: str) -> None:
+        """Record the backend for ``query_index`` by slot, so concurrent fan-out keeps query order."""
+        with self._lock:
+            used = self.per_query_backend_used
+            if len(used) <= query_index:
+                used.extend([""] * (query_index + 1 - len(used)))
+            used[query_index] = backend
 
     def start_deadline(self, *, now: float | None = None) -> None:
         """Set monotonic deadline from budget (call once at batch start)."""
@@ -170,7 +180,7 @@ class GroundingRouter:
             if ctx.mode == "pin_on_first_success" and raw.success and routing.backend_used:
                 ctx.pinned_backend = routing.backend_used
                 ctx.chain_tail = routing.chain_tail_after(routing.backend_used)
-            ctx.per_query_backend_used.append(routing.backend_used or raw.backend or "")
+            ctx.record_backend_used(query_index, routing.backend_used or raw.backend or "")
             return raw, routing, False
 
         pinned = ctx.pinned_backend
@@ -182,7 +192,7 @@ class GroundingRouter:
         raw = self.search_pinned(params, backend=pinned)
         if raw.success:
             routing.backend_used = pinned
-            ctx.per_query_backend_used.append(pinned)
+            ctx.record_backend_used(query_index, pinned)
             return raw, routing, True
 
         routing.provider_chain_failed.append(self._failure_record(pinned, raw))
@@ -192,10 +202,10 @@ class GroundingRouter:
             routing.provider_chain_skipped.extend(tail_meta.provider_chain_skipped)
             routing.provider_chain_failed.extend(tail_meta.provider_chain_failed)
             routing.backend_used = tail_meta.backend_used
-            ctx.per_query_backend_used.append(tail_meta.backend_used or raw.backend or pinned)
+            ctx.record_backend_used(query_index, tail_meta.backend_used or raw.backend or pinned)
             return raw, routing, True
 
-        ctx.per_query_backend_used.append(raw.backend or pinned)
+        ctx.record_backend_used(query_index, raw.backend or pinned)
         return raw, routing, True
 
     def _search_forced(
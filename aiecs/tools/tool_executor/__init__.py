@@ -14,6 +14,8 @@ from .tool_executor import (
     ExecutorConfig,
     ToolExecutorStats,
     get_executor,
+    get_executor_pool_stats,
+    reset_executor_pool,
     validate_input,
     cache_result,
     cache_result_with_strategy,
@@ -21,6 +23,7 @@ from .tool_executor import (
     measure_execution_time,
     sanitize_input,
 )
+from .bulkhead import Bulkhead, BulkheadConfig, BulkheadRejectedError
 
 __all__ = [
     "ToolExecutor",
@@ -32,10 +35,15 @@ __all__ = [
     "ExecutorConfig",
     "ToolExecutorStats",
     "get_executor",
+    "get_executor_pool_stats",
+    "reset_executor_pool",
     "validate_input",
     "cache_result",
     "cache_result_with_strategy",
     "run_in_executor",
     "measure_execution_time",
     "sanitize_input",
+    "Bulkhead",
+    "BulkheadConfig",
+    "BulkheadRejectedError",
 ]
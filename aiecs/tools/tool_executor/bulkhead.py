@@ -0,0 +1,222 @@
+# /*---------------------------------------------------------------------------------------------
+#  *  Copyright (c) IRETBL Corporation. All rights reserved.
+#  *  Licensed under the Apache-2.0. See License.txt in the project root for license information.
+#  *--------------------------------------------------------------------------------------------*/
+"""
+Bulkheads isolating tools and operations inside the shared ToolExecutor.
+
+Each bulkhead bounds how many calls may run at once, how many may wait in its
+queue, and how long a caller may wait for a slot. A slow tool can therefore
+only exhaust its own capacity instead of starving every other tool that shares
+the executor's thread pool.
+
+Bulkheads are thread-safe and not bound to one event loop: waiters are woken
+on the loop they are waiting on, so a process-wide executor may be used from
+several loops. Synchronous callers share the same slots and queue through
+:meth:`Bulkhead.acquire_sync` / :meth:`Bulkhead.slot_sync`.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, Optional, Union
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class BulkheadConfig(BaseModel):
+    """
+    Limits for one bulkhead.
+
+    Attributes:
+        max_concurrent (int): Maximum calls running at the same time.
+        max_queue (int): Maximum callers waiting for a slot; further callers are rejected.
+        queue_timeout (Optional[float]): Seconds a caller may wait for a slot (None waits forever).
+    """
+
+    max_concurrent: int = Field(default=4, ge=1)
+    max_queue: int = Field(default=100, ge=0)
+    queue_timeout: Optional[float] = Field(default=30.0, gt=0)
+
+
+class BulkheadRejectedError(Exception):
+    """Raised when a bulkhead queue is full or the queue-wait timeout expires."""
+
+    def __init__(self, bulkhead: str, reason: str):
+        self.bulkhead = bulkhead
+        self.reason = reason
+        super().__init__(f"Bulkhead '{bulkhead}' rejected call: {reason}")
+
+
+class _Waiter:
+    __slots__ = ("loop", "future", "granted")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.future: asyncio.Future = loop.create_future()
+        self.granted = False
+
+    def wake(self) -> None:
+        self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+class _ThreadWaiter:
+    __slots__ = ("event", "granted")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.granted = False
+
+    def wake(self) -> None:
+        self.event.set()
+
+
+class Bulkhead:
+    """
+    Bounded concurrency slot pool with a FIFO wait queue.
+
+    Example:
+        bulkhead = Bulkhead("ImageTool", BulkheadConfig(max_concurrent=2, max_queue=10))
+        async with bulkhead.slot():
+            await run_image_operation()
+    """
+
+    def __init__(self, name: str, config: BulkheadConfig):
+        self.name = name
+        self.config = config
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: Deque[Union[_Waiter, _ThreadWaiter]] = deque()
+        # Counters
+        self._acquired = 0
+        self._rejected_queue_full = 0
+        self._rejected_timeout = 0
+        self._total_queue_wait = 0.0
+        self._max_queue_wait = 0.0
+
+    async def acquire(self) -> None:
+        """
+        Acquire a slot, waiting in the queue when the bulkhead is saturated.
+
+        Raises:
+            BulkheadRejectedError: If the queue is full or the wait times out.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._in_flight < self.config.max_concurrent and not self._waiters:
+                self._in_flight += 1
+                self._acquired += 1
+                return
+            if len(self._waiters) >= self.config.max_queue:
+                self._rejected_queue_full += 1
+                raise BulkheadRejectedError(self.name, f"queue full ({self.config.max_queue} waiting)")
+            waiter = _Waiter(loop)
+            self._waiters.append(waiter)
+
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), self.config.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            with self._lock:
+                if waiter.granted:
+                    # The slot was handed over while we gave up; pass it on.
+                    granted = True
+                else:
+                    granted = False
+                    self._waiters.remove(waiter)
+                    if isinstance(e, asyncio.TimeoutError):
+                        self._rejected_timeout += 1
+            if granted:
+                self.release()
+            if isinstance(e, asyncio.TimeoutError):
+                raise BulkheadRejectedError(self.name, f"queue wait exceeded {self.config.queue_timeout}s") from None
+            raise
+        self._record_wait(time.monotonic() - start)
+
+    def acquire_sync(self) -> None:
+        """
+        Blocking variant of :meth:`acquire` for synchronous callers.
+
+        Raises:
+            BulkheadRejectedError: If the queue is full or the wait times out.
+        """
+        with self._lock:
+            if self._in_flight < self.config.max_concurrent and not self._waiters:
+                self._in_flight += 1
+                self._acquired += 1
+                return
+            if len(self._waiters) >= self.config.max_queue:
+                self._rejected_queue_full += 1
+                raise BulkheadRejectedError(self.name, f"queue full ({self.config.max_queue} waiting)")
+            waiter = _ThreadWaiter()
+            self._waiters.append(waiter)
+
+        start = time.monotonic()
+        if not waiter.event.wait(self.config.queue_timeout):
+            with self._lock:
+                # A slot handed over right at the deadline is kept
+                if not waiter.granted:
+                    self._waiters.remove(waiter)
+                    self._rejected_timeout += 1
+                    raise BulkheadRejectedError(self.name, f"queue wait exceeded {self.config.queue_timeout}s")
+        self._record_wait(time.monotonic() - start)
+
+    def _record_wait(self, waited: float) -> None:
+        with self._lock:
+            self._acquired += 1
+            self._total_queue_wait += waited
+            self._max_queue_wait = max(self._max_queue_wait, waited)
+
+    def release(self) -> None:
+        """Release a slot, handing it to the oldest waiter if any."""
+        with self._lock:
+            if self._waiters:
+                waiter = self._waiters.popleft()
+                waiter.granted = True
+            else:
+                self._in_flight -= 1
+                return
+        waiter.wake()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Async context manager holding one slot for the duration of the block."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @contextmanager
+    def slot_sync(self) -> Iterator[None]:
+        """Context manager holding one slot, blocking the calling thread while queued."""
+        self.acquire_sync()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return a snapshot of capacity usage and rejection counters."""
+        with self._lock:
+            return {
+                "max_concurrent": self.config.max_concurrent,
+                "max_queue": self.config.max_queue,
+                "in_flight": self._in_flight,
+                "queued": len(self._waiters),
+                "acquired": self._acquired,
+                "rejected_queue_full": self._rejected_queue_full,
+                "rejected_timeout": self._rejected_timeout,
+                "avg_queue_wait": self._total_queue_wait / self._acquired if self._acquired else 0.0,
+                "max_queue_wait": self._max_queue_wait,
+            }
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
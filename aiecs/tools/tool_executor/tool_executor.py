@@ -5,16 +5,19 @@
 import os
 import asyncio
 import functools
+import hashlib
 import inspect
+import json
 import logging
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Callable, Dict, List, Optional, Type, Union
-from contextlib import contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
 
 from aiecs.utils.execution_utils import ExecutionUtils
 from aiecs.utils.cache_provider import ICacheProvider, LRUCacheProvider
+from aiecs.tools.tool_executor.bulkhead import Bulkhead, BulkheadConfig, BulkheadRejectedError
 import re
 from pydantic import BaseModel, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -59,7 +62,7 @@ class ExecutorConfig(BaseSettings):
         cache_size (int): Maximum number of cache entries.
         cache_ttl (int): Cache time-to-live in seconds.
         max_workers (int): Maximum number of thread pool workers.
-        io_concurrency (int): Maximum concurrent I/O operations.
+        io_concurrency (int): Maximum concurrent I/O operations (also bounds execute_batch).
         chunk_size (int): Chunk size for processing large data.
         max_file_size (int): Maximum file size in bytes.
         log_level (str): Logging level (e.g., 'INFO', 'DEBUG').
@@ -72,6 +75,12 @@ class ExecutorConfig(BaseSettings):
         enable_redis_cache (bool): Enable Redis as L2 cache (requires enable_dual_cache=True).
         redis_cache_ttl (int): Redis cache TTL in seconds (for L2 cache).
         l1_cache_ttl (int): L1 cache TTL in seconds (for dual-layer cache).
+        enable_single_flight (bool): Coalesce concurrent identical cacheable async calls
+            into one in-flight execution.
+        bulkheads (Dict[str, BulkheadConfig]): Bulkhead limits keyed by tool class name
+            (e.g. ``"ImageTool"``) or ``"ToolClass.operation"`` for a single operation.
+        default_tool_bulkhead (Optional[BulkheadConfig]): Limits applied to every tool
+            without an explicit entry in ``bulkheads``; None leaves such tools unbounded.
     """
 
     model_config = SettingsConfigDict(env_prefix="TOOL_EXECUTOR_")
@@ -96,6 +105,13 @@ class ExecutorConfig(BaseSettings):
     redis_cache_ttl: int = 86400  # 1 day
     l1_cache_ttl: int = 300  # 5 minutes
 
+    # Request coalescing
+    enable_single_flight: bool = True
+
+    # Bulkheads (per-tool / per-operation isolation)
+    bulkheads: Dict[str, BulkheadConfig] = {}
+    default_tool_bulkhead: Optional[BulkheadConfig] = None
+
 
 # Metrics counter
 
@@ -109,6 +125,7 @@ class ToolExecutorStats:
         self.requests: int = 0
         self.failures: int = 0
         self.cache_hits: int = 0
+        self.coalesced_hits: int = 0
         self.processing_times: List[float] = []
 
     def record_request(self, processing_time: float):
@@ -121,11 +138,15 @@ class ToolExecutorStats:
     def record_cache_hit(self):
         self.cache_hits += 1
 
+    def record_coalesced_hit(self):
+        self.coalesced_hits += 1
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "requests": self.requests,
             "failures": self.failures,
             "cache_hits": self.cache_hits,
+            "coalesced_hits": self.coalesced_hits,
             "avg_processing_time": (sum(self.processing_times) / len(self.processing_times) if self.processing_times else 0.0),
         }
 
@@ -178,7 +199,7 @@ def cache_result(ttl: Optional[int] = None) -> Callable:
         def wrapper(self, *args, **kwargs):
             if not hasattr(self, "_executor") or not self._executor.config.enable_cache:
                 return func(self, *args, **kwargs)
-            cache_key = self._executor._get_cache_key(func.__name__, args, kwargs)
+            cache_key = self._executor._get_cache_key(func.__name__, args, kwargs, getattr(self, "_cache_namespace", None))
             result = self._executor._get_from_cache(cache_key)
             if result is not None:
                 logger.debug(f"Cache hit for {func.__name__}")
@@ -241,7 +262,7 @@ def cache_result_with_strategy(
                 return func(self, *args, **call_kwargs)
 
             # Generate cache key (includes `_cache_*` fingerprint kwargs)
-            cache_key = self._executor._get_cache_key(func.__name__, args, kwargs)
+            cache_key = self._executor._get_cache_key(func.__name__, args, kwargs, getattr(self, "_cache_namespace", None))
 
             # Check cache
             cached = self._executor._get_from_cache(cache_key)
@@ -386,6 +407,7 @@ class ToolExecutor:
         self,
         config: Optional[Dict[str, Any]] = None,
         cache_provider: Optional[ICacheProvider] = None,
+        thread_pool: Optional[ThreadPoolExecutor] = None,
     ):
         """
         Initialize the executor with optional configuration.
@@ -393,6 +415,8 @@ class ToolExecutor:
         Args:
             config (Dict[str, Any], optional): Configuration overrides for ExecutorConfig.
             cache_provider (ICacheProvider, optional): Custom cache provider. If None, uses default based on config.
+            thread_pool (ThreadPoolExecutor, optional): Shared thread pool for sync operations.
+                If None, the executor creates its own.
 
         Raises:
             ValueError: If config is invalid.
@@ -402,8 +426,11 @@ class ToolExecutor:
             level=getattr(logging, self.config.log_level),
             format="%(asctime)s %(levelname)s %(name)s: %(message)s",
         )
-        self._thread_pool = ThreadPoolExecutor(max_workers=max(os.cpu_count() or 4, self.config.max_workers))
+        self._thread_pool = thread_pool or ThreadPoolExecutor(max_workers=_worker_count(self.config))
         self._locks: Dict[str, threading.Lock] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._bulkheads: Dict[str, Bulkhead] = {}
+        self._bulkheads_lock = threading.Lock()
         self._metrics = ToolExecutorStats()
         self.execution_utils = ExecutionUtils(
             cache_size=self.config.cache_size,
@@ -475,7 +502,13 @@ class ToolExecutor:
             logger.warning(f"Failed to initialize dual-layer cache: {e}, falling back to LRU")
             return LRUCacheProvider(self.execution_utils)
 
-    def _get_cache_key(self, func_name: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+    def _get_cache_key(
+        self,
+        func_name: str,
+        args: tuple,
+        kwargs: Dict[str, Any],
+        namespace: Optional[str] = None,
+    ) -> str:
         """
         Generate a context-aware cache key from function name, user ID, task ID, and arguments.
 
@@ -483,12 +516,16 @@ class ToolExecutor:
             func_name (str): Name of the function.
             args (tuple): Positional arguments.
             kwargs (Dict[str, Any]): Keyword arguments.
+            namespace (str, optional): Tool cache namespace (``BaseTool._cache_namespace``).
+                Keeps entries of different tools apart when they share an executor.
 
         Returns:
             str: Cache key.
         """
         user_id = kwargs.get("user_id", "anonymous")
         task_id = kwargs.get("task_id", "none")
+        if namespace:
+            func_name = f"{namespace}.{func_name}"
         return self.execution_utils.generate_cache_key(func_name, user_id, task_id, args, kwargs)
 
     def _calculate_ttl_from_strategy(
@@ -626,14 +663,101 @@ class ToolExecutor:
             self._locks[resource_id] = threading.Lock()
         return self._locks[resource_id]
 
+    def _get_bulkhead(self, key: str) -> Optional[Bulkhead]:
+        """
+        Get or lazily create the bulkhead for a tool or ``tool.operation`` key.
+
+        Args:
+            key (str): Tool class name or ``"ToolClass.operation"``.
+
+        Returns:
+            Optional[Bulkhead]: Bulkhead, or None when the key is not bounded.
+        """
+        bulkhead = self._bulkheads.get(key)
+        if bulkhead is not None:
+            return bulkhead
+        bulkhead_config = self.config.bulkheads.get(key)
+        if bulkhead_config is None and "." not in key:
+            bulkhead_config = self.config.default_tool_bulkhead
+        if bulkhead_config is None:
+            return None
+        with self._bulkheads_lock:
+            return self._bulkheads.setdefault(key, Bulkhead(key, bulkhead_config))
+
+    def _bulkheads_for(self, tool_instance: Any, operation: str) -> List[Bulkhead]:
+        """Return the configured tool-level and operation-level bulkheads, in acquisition order."""
+        tool_key = tool_instance.__class__.__name__
+        return [b for b in (self._get_bulkhead(tool_key), self._get_bulkhead(f"{tool_key}.{operation}")) if b is not None]
+
+    @asynccontextmanager
+    async def _bulkhead_slots(self, tool_instance: Any, operation: str) -> AsyncIterator[None]:
+        """
+        Hold the tool-level and then the operation-level bulkhead slot, when configured.
+
+        Raises:
+            BulkheadRejectedError: If a bulkhead queue is full or its queue wait times out.
+        """
+        bulkheads = self._bulkheads_for(tool_instance, operation)
+        if not bulkheads:
+            yield
+            return
+        async with AsyncExitStack() as stack:
+            for bulkhead in bulkheads:
+                await stack.enter_async_context(bulkhead.slot())
+            yield
+
+    @contextmanager
+    def _bulkhead_slots_sync(self, tool_instance: Any, operation: str) -> Iterator[None]:
+        """
+        Blocking variant of :meth:`_bulkhead_slots` for :meth:`execute`.
+
+        Raises:
+            BulkheadRejectedError: If a bulkhead queue is full or its queue wait times out.
+        """
+        with ExitStack() as stack:
+            for bulkhead in self._bulkheads_for(tool_instance, operation):
+                stack.enter_context(bulkhead.slot_sync())
+            yield
+
+    async def _run_in_thread_pool(self, tool_instance: Any, operation: str, func: Callable[[], Any]) -> Any:
+        """
+        Run a sync operation on the thread pool while holding its bulkhead slots.
+
+        The slots are released when the worker thread finishes, not when the
+        awaiting attempt is cancelled by a timeout or retry: the thread keeps
+        running, so it must keep counting against the bulkhead.
+
+        Raises:
+            BulkheadRejectedError: If a bulkhead queue is full or its queue wait times out.
+        """
+        acquired: List[Bulkhead] = []
+        try:
+            for bulkhead in self._bulkheads_for(tool_instance, operation):
+                await bulkhead.acquire()
+                acquired.append(bulkhead)
+            future = self._thread_pool.submit(func)
+        except BaseException:
+            for bulkhead in reversed(acquired):
+                bulkhead.release()
+            raise
+        if acquired:
+            future.add_done_callback(functools.partial(_release_bulkheads, acquired))
+        return await asyncio.wrap_future(future)
+
     def get_metrics(self) -> Dict[str, Any]:
         """
         Get current executor metrics.
 
         Returns:
-            Dict[str, Any]: Metrics including request count, failures, cache hits, and average processing time.
+            Dict[str, Any]: Metrics including request count, failures, cache hits,
+            coalesced (single-flight) hits, average processing time, per-bulkhead
+            in-flight/queue counts, queue-wait times and rejection counters, and
+            process-wide executor, thread pool and thread counts (``process``).
         """
-        return self._metrics.to_dict()
+        metrics = self._metrics.to_dict()
+        metrics["bulkheads"] = {name: bulkhead.get_stats() for name, bulkhead in list(self._bulkheads.items())}
+        metrics["process"] = get_executor_pool_stats()
+        return metrics
 
     @contextmanager
     def timeout_context(self, seconds: int):
@@ -652,6 +776,8 @@ class ToolExecutor:
         """
         Execute an operation with retries for transient errors.
 
+        Bulkhead rejections are not transient errors and are raised without retrying.
+
         Args:
             func (Callable): Function to execute.
             *args: Positional arguments.
@@ -663,7 +789,7 @@ class ToolExecutor:
         Raises:
             OperationError: If all retries fail.
         """
-        return await self.execution_utils.execute_with_retry_and_timeout(func, self.config.timeout, *args, **kwargs)
+        return await self.execution_utils.execute_with_retry_and_timeout(func, self.config.timeout, *args, give_up_on=(BulkheadRejectedError,), **kwargs)
 
     def execute(self, tool_instance: Any, operation: str, **kwargs) -> Any:
         """
@@ -681,6 +807,7 @@ class ToolExecutor:
             ToolExecutionError: If the operation fails.
             InputValidationError: If input parameters are invalid.
             SecurityError: If inputs contain malicious content.
+            BulkheadRejectedError: If a tool or operation bulkhead rejects the call.
         """
         method = getattr(tool_instance, operation, None)
         if not method or not callable(method) or operation.startswith("_"):
@@ -696,14 +823,15 @@ class ToolExecutor:
                         raise SecurityError(f"Input parameter '{k}' contains potentially malicious content")
             # Use cache if enabled
             if self.config.enable_cache:
-                cache_key = self._get_cache_key(operation, (), kwargs)
+                cache_key = self._get_cache_key(operation, (), kwargs, getattr(tool_instance, "_cache_namespace", None))
                 cached_result = self._get_from_cache(cache_key)
                 if cached_result is not None:
                     self._metrics.record_cache_hit()
                     logger.debug(f"Cache hit for {operation}")
                     return cached_result
 
-            result = method(**kwargs)
+            with self._bulkhead_slots_sync(tool_instance, operation):
+                result = method(**kwargs)
             self._metrics.record_request(time.time() - start_time)
             if self.config.log_execution_time:
                 logger.info(f"{tool_instance.__class__.__name__}.{operation} executed in {time.time() - start_time:.4f} seconds")
@@ -712,6 +840,10 @@ class ToolExecutor:
             if self.config.enable_cache:
                 self._add_to_cache(cache_key, result)
             return result
+        except BulkheadRejectedError as e:
+            self._metrics.record_failure()
+            logger.warning(f"{tool_instance.__class__.__name__}.{operation} rejected: {e}")
+            raise
         except Exception as e:
             self._metrics.record_failure()
             logger.error(
@@ -736,6 +868,7 @@ class ToolExecutor:
             ToolExecutionError: If the operation fails.
             InputValidationError: If input parameters are invalid.
             SecurityError: If inputs contain malicious content.
+            BulkheadRejectedError: If a tool or operation bulkhead rejects the call.
         """
         method = getattr(tool_instance, operation, None)
         if not method or not callable(method) or operation.startswith("_"):
@@ -752,20 +885,27 @@ class ToolExecutor:
                         raise SecurityError(f"Input parameter '{k}' contains potentially malicious content")
             # Use cache if enabled (async)
             if self.config.enable_cache:
-                cache_key = self._get_cache_key(operation, (), kwargs)
+                cache_key = self._get_cache_key(operation, (), kwargs, getattr(tool_instance, "_cache_namespace", None))
                 cached_result = await self._get_from_cache_async(cache_key)
                 if cached_result is not None:
                     self._metrics.record_cache_hit()
                     logger.debug(f"Cache hit for {operation} (async)")
                     return cached_result
 
-            async def _execute():
-                if is_async:
+            async def _attempt():
+                # Slots are taken per attempt so retry backoff does not hold bulkhead capacity
+                if not is_async:
+                    return await self._run_in_thread_pool(tool_instance, operation, functools.partial(method, **kwargs))
+                async with self._bulkhead_slots(tool_instance, operation):
                     return await method(**kwargs)
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(self._thread_pool, functools.partial(method, **kwargs))
 
-            result = await self._retry_operation(_execute)
+            async def _run():
+                return await self._retry_operation(_attempt)
+
+            if self.config.enable_cache and self.config.enable_single_flight:
+                result = await self._execute_single_flight(cache_key, _run)
+            else:
+                result = await _run()
             self._metrics.record_request(time.time() - start_time)
             if self.config.log_execution_time:
                 logger.info(f"{tool_instance.__class__.__name__}.{operation} executed in {time.time() - start_time:.4f} seconds")
@@ -774,6 +914,10 @@ class ToolExecutor:
             if self.config.enable_cache:
                 await self._add_to_cache_async(cache_key, result)
             return result
+        except BulkheadRejectedError as e:
+            self._metrics.record_failure()
+            logger.warning(f"{tool_instance.__class__.__name__}.{operation} rejected: {e}")
+            raise
         except Exception as e:
             self._metrics.record_failure()
             logger.error(
@@ -782,10 +926,63 @@ class ToolExecutor:
             )
             raise OperationError(f"Error executing {operation}: {str(e)}") from e
 
+    async def _execute_single_flight(self, key: str, func: Callable) -> Any:
+        """
+        Run ``func`` once for all concurrent callers sharing ``key``.
+
+        ``func`` is expected to apply retries itself.
+
+        The first caller executes the operation; callers arriving while it is in
+        flight await the same future and are counted as coalesced hits. Futures
+        are bound to the caller's event loop, so callers on another loop run
+        independently.
+
+        Args:
+            key (str): Cache key identifying identical calls.
+            func (Callable): Zero-argument coroutine function performing the call.
+
+        Returns:
+            Any: Result of the shared execution.
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            self._metrics.record_coalesced_hit()
+            logger.debug(f"Coalesced in-flight call for key {key}")
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The leader was cancelled; this caller was not, so run on its own.
+                if not pending.cancelled():
+                    raise
+                return await func()
+
+        future: asyncio.Future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception nobody else awaited is not logged.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
     async def execute_batch(self, tool_instance: Any, operations: List[Dict[str, Any]]) -> List[Any]:
         """
         Execute multiple tool operations in parallel.
 
+        At most ``config.io_concurrency`` operations of the batch run at once; each
+        operation is additionally subject to its tool/operation bulkheads.
+
         Args:
             tool_instance (Any): The tool instance to execute operations on.
             operations (List[Dict[str, Any]]): List of operation dictionaries with 'op' and 'kwargs'.
@@ -797,13 +994,19 @@ class ToolExecutor:
             ToolExecutionError: If any operation fails.
             InputValidationError: If input parameters are invalid.
         """
+        semaphore = asyncio.Semaphore(max(1, self.config.io_concurrency))
+
+        async def _bounded(op: str, kwargs: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self.execute_async(tool_instance, op, **kwargs)
+
         tasks = []
         for op_data in operations:
             op = op_data.get("op")
             kwargs = op_data.get("kwargs", {})
             if not op:
                 raise InputValidationError("Operation name missing in batch request")
-            tasks.append(self.execute_async(tool_instance, op, **kwargs))
+            tasks.append(_bounded(op, kwargs))
         results = await asyncio.gather(*tasks, return_exceptions=True)
         for i, result in enumerate(results):
             if isinstance(result, Exception):
@@ -811,32 +1014,156 @@ class ToolExecutor:
         return results
 
 
-# Singleton executor instance (for backward compatibility)
+# Shared executors, thread pools and cache providers (process-wide)
 _default_executor = None
+_executors: Dict[str, ToolExecutor] = {}
+_thread_pools: Dict[int, Tuple[ThreadPoolExecutor, int]] = {}
+_cache_providers: Dict[Tuple[Any, ...], ICacheProvider] = {}
+_pool_lock = threading.Lock()
+
+# Process-wide cap on worker threads across shared pools (TOOL_EXECUTOR_MAX_TOTAL_WORKERS)
+_DEFAULT_MAX_TOTAL_WORKERS = max(32, 4 * (os.cpu_count() or 4))
+
+
+def _release_bulkheads(bulkheads: List[Bulkhead], _future: Any) -> None:
+    """Executor-future done callback releasing slots taken by :meth:`ToolExecutor._run_in_thread_pool`."""
+    for bulkhead in reversed(bulkheads):
+        bulkhead.release()
+
+
+def _worker_count(config: ExecutorConfig) -> int:
+    return max(os.cpu_count() or 4, config.max_workers)
+
+
+def _max_total_workers() -> int:
+    try:
+        return max(1, int(os.environ.get("TOOL_EXECUTOR_MAX_TOTAL_WORKERS", _DEFAULT_MAX_TOTAL_WORKERS)))
+    except ValueError:
+        return _DEFAULT_MAX_TOTAL_WORKERS
+
+
+def _config_fingerprint(config: ExecutorConfig) -> str:
+    """Stable digest of a normalized (defaults and environment applied) executor config."""
+    blob = json.dumps(config.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cache_settings_key(config: ExecutorConfig) -> Tuple[Any, ...]:
+    """Settings that must match for executors to share one cache provider."""
+    return (
+        config.cache_size,
+        config.cache_ttl,
+        config.enable_dual_cache,
+        config.enable_redis_cache,
+        config.redis_cache_ttl,
+        config.l1_cache_ttl,
+    )
+
+
+def _acquire_thread_pool(workers: int) -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool for a worker count, creating it within the process cap.
+
+    Pools are shared by every executor requesting the same number of workers. When
+    a new pool would push the total past ``TOOL_EXECUTOR_MAX_TOTAL_WORKERS``, the
+    largest existing pool is reused instead.
+    """
+    with _pool_lock:
+        entry = _thread_pools.get(workers)
+        if entry is not None:
+            return entry[0]
+
+        cap = _max_total_workers()
+        allocated = sum(size for _, size in _thread_pools.values())
+        if _thread_pools and allocated + workers > cap:
+            pool, size = max(_thread_pools.values(), key=lambda e: e[1])
+            logger.warning(f"Worker thread cap {cap} reached ({allocated} allocated); " f"sharing existing {size}-worker pool instead of creating a {workers}-worker pool")
+            return pool
+
+        size = min(workers, cap)
+        pool = ThreadPoolExecutor(max_workers=size, thread_name_prefix=f"aiecs-tool-{size}")
+        _thread_pools[workers] = (pool, size)
+        return pool
 
 
 def get_executor(config: Optional[Dict[str, Any]] = None) -> ToolExecutor:
     """
-    Get or create executor instance.
+    Get a shared executor instance for a configuration.
 
-    If config is provided, creates a new executor with that config.
-    If config is None, returns the default singleton executor.
+    Executors are pooled by a fingerprint of the normalized ExecutorConfig, so
+    tools with equivalent executor settings (including an empty config and None)
+    share one executor. Executors also share thread pools (by worker count,
+    within the process-wide ``TOOL_EXECUTOR_MAX_TOTAL_WORKERS`` cap) and cache
+    providers (by cache settings). Tool cache entries are kept apart by
+    ``BaseTool._cache_namespace``.
 
     Args:
-        config (Dict[str, Any], optional): Configuration overrides.
-            If provided, creates a new executor instance.
-            If None, returns the default singleton.
+        config (Dict[str, Any], optional): Configuration overrides for ExecutorConfig.
 
     Returns:
-        ToolExecutor: Executor instance.
+        ToolExecutor: Shared executor instance.
     """
     global _default_executor
 
-    # If config is provided, create a new executor with that config
-    if config is not None:
-        return ToolExecutor(config)
+    executor_config = ExecutorConfig(**(config or {}))
+    fingerprint = _config_fingerprint(executor_config)
+    executor = _executors.get(fingerprint)
+    if executor is None:
+        thread_pool = _acquire_thread_pool(_worker_count(executor_config))
+        with _pool_lock:
+            executor = _executors.get(fingerprint)
+            if executor is None:
+                cache_key = _cache_settings_key(executor_config)
+                executor = ToolExecutor(
+                    config,
+                    cache_provider=_cache_providers.get(cache_key),
+                    thread_pool=thread_pool,
+                )
+                _cache_providers.setdefault(cache_key, executor.cache_provider)
+                _executors[fingerprint] = executor
+                logger.debug(f"Created shared tool executor {fingerprint[:8]} ({len(_executors)} in process)")
+
+    if config is None:
+        _default_executor = executor
+    return executor
+
+
+def get_executor_pool_stats() -> Dict[str, Any]:
+    """
+    Get process-wide counts for shared executors and their resources.
+
+    Returns:
+        Dict[str, Any]: Shared executor, thread pool and cache provider counts,
+        allocated worker threads against the cap, and live process threads.
+    """
+    with _pool_lock:
+        return {
+            "executors": len(_executors),
+            "thread_pools": len({id(pool) for pool, _ in _thread_pools.values()}),
+            "cache_providers": len({id(provider) for provider in _cache_providers.values()}),
+            "worker_threads_allocated": sum(size for _, size in _thread_pools.values()),
+            "worker_threads_cap": _max_total_workers(),
+            "process_threads": threading.active_count(),
+        }
+
+
+def reset_executor_pool(wait: bool = False) -> None:
+    """
+    Drop all shared executors and shut down their thread pools.
+
+    Tools created earlier keep their executor; the next get_executor() call
+    builds fresh shared resources.
+
+    Args:
+        wait (bool): Wait for running thread pool tasks to finish.
+    """
+    global _default_executor
 
-    # Otherwise, return the default singleton
-    if _default_executor is None:
-        _default_executor = ToolExecutor()
-    return _default_executor
+    with _pool_lock:
+        pools = [pool for pool, _ in _thread_pools.values()]
+        _executors.clear()
+        _thread_pools.clear()
+        _cache_providers.clear()
+        _default_executor = None
+    for pool in pools:
+        pool.shutdown(wait=wait)
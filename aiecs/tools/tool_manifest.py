@@ -0,0 +1,262 @@
+# /*---------------------------------------------------------------------------------------------
+#  *  Copyright (c) IRETBL Corporation. All rights reserved.
+#  *  Licensed under the Apache-2.0. See License.txt in the project root for license information.
+#  *--------------------------------------------------------------------------------------------*/
+"""
+Prebuilt tool manifest for placeholder discovery.
+
+``aiecs.tools`` registers placeholders for known tools at import time by
+finding ``register_tool`` calls in the tool sources. The manifest records the
+result of that scan per module, together with the SHA-256 of each source file.
+Discovery hashes each file and regex-scans only the files whose hash no longer
+matches (or that are missing from the manifest).
+
+Regenerate with ``aiecs-build-tool-manifest`` (or
+``python -m aiecs.scripts.aid.tool_manifest_builder``). The committed manifest
+is content-only. Checkouts and installs give files new mtimes, so deployments
+can run ``aiecs-build-tool-manifest --record-stats`` once after installing to
+also record each file's ``(st_mtime_ns, st_size)``; files whose stat still
+matches are then not even read. The recorded stats are not part of the
+staleness check.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+MANIFEST_FILENAME = "tool_manifest.json"
+DEFAULT_MANIFEST_PATH = os.path.join(os.path.dirname(__file__), MANIFEST_FILENAME)
+
+# Tool directories (relative to aiecs/tools) and their categories
+TOOL_DIRS: Tuple[Tuple[str, str], ...] = (
+    ("task_tools", "task"),
+    ("search_tool", "task"),
+)
+
+# (tool_name, description, category)
+DiscoveredTool = Tuple[str, str, str]
+
+# Pattern 1: @register_tool("name") decorator syntax
+_DECORATOR_PATTERN = re.compile(r'@register_tool\([\'"]([^\'"]+)[\'"]\)')
+# Pattern 2: register_tool("name")(ClassName) function call syntax
+_FUNCTION_PATTERN = re.compile(r'register_tool\([\'"]([^\'"]+)[\'"]\)\([A-Za-z_][A-Za-z0-9_]*\)')
+_MODULE_DOC_PATTERN = re.compile(r'^"""(.*?)"""', re.DOTALL | re.MULTILINE)
+
+# Per-module entry fields that describe the local files rather than their content
+_STAT_FIELDS = ("mtime_ns", "size")
+
+
+def scan_tool_source(filename: str, content: str) -> List[Tuple[str, str]]:
+    """
+    Find tools registered in a tool source file.
+
+    Args:
+        filename: Base name of the file (``__init__.py`` enables the module
+            docstring fallback for descriptions)
+        content: Source text
+
+    Returns:
+        List of ``(tool_name, description)`` tuples
+    """
+    all_matches = set(_DECORATOR_PATTERN.findall(content)) | set(_FUNCTION_PATTERN.findall(content))
+
+    tools = []
+    for tool_name in sorted(all_matches):
+        # Try to extract description from class docstring or module docstring
+        description = f"{tool_name} tool"
+
+        # Method 1: Look for class definition after the decorator
+        class_pattern = rf'@register_tool\([\'"]({re.escape(tool_name)})[\'"]\)\s*class\s+\w+.*?"""(.*?)"""'
+        class_match = re.search(class_pattern, content, re.DOTALL)
+        if class_match:
+            doc = class_match.group(2).strip()
+            # Get first line of docstring
+            first_line = doc.split("\n")[0].strip()
+            if first_line and len(first_line) < 200:
+                description = first_line
+
+        # Method 2: For __init__.py files, try to extract from module docstring
+        if not class_match and filename == "__init__.py":
+            module_doc_match = _MODULE_DOC_PATTERN.search(content)
+            if module_doc_match:
+                doc = module_doc_match.group(1).strip()
+                # Get first non-empty line
+                for line in doc.split("\n"):
+                    line = line.strip()
+                    if line and not line.startswith("#") and len(line) < 200:
+                        description = line
+                        break
+
+        tools.append((tool_name, description))
+
+    return tools
+
+
+def _module_name(dir_name: str, filename: str) -> str:
+    stem = filename[: -len(".py")]
+    if stem == "__init__":
+        return f"aiecs.tools.{dir_name}"
+    return f"aiecs.tools.{dir_name}.{stem}"
+
+
+def _iter_tool_files(tools_dir: str, tool_dirs: Sequence[Tuple[str, str]]):
+    """Yield ``(module, filename, file_path, category)`` for every tool source file."""
+    for dir_name, category in tool_dirs:
+        dir_path = os.path.join(tools_dir, dir_name)
+        if not os.path.isdir(dir_path):
+            continue
+
+        # Package-level registrations first, then the other modules
+        init_file = os.path.join(dir_path, "__init__.py")
+        if os.path.isfile(init_file):
+            yield _module_name(dir_name, "__init__.py"), "__init__.py", init_file, category
+
+        for filename in sorted(os.listdir(dir_path)):
+            if filename.endswith(".py") and not filename.startswith("__"):
+                yield _module_name(dir_name, filename), filename, os.path.join(dir_path, filename), category
+
+
+def _scan_file(filename: str, data: bytes) -> List[Tuple[str, str]]:
+    return scan_tool_source(filename, data.decode("utf-8"))
+
+
+def build_manifest(
+    tools_dir: Optional[str] = None,
+    tool_dirs: Sequence[Tuple[str, str]] = TOOL_DIRS,
+    record_stats: bool = False,
+) -> Dict[str, Any]:
+    """
+    Scan all tool sources and build a manifest.
+
+    Args:
+        tools_dir: Root of the tool directories (defaults to ``aiecs/tools``)
+        tool_dirs: ``(directory, category)`` pairs to scan
+        record_stats: Also record each file's ``mtime_ns`` and ``size`` for the
+            stat-only fast path; only meaningful for the installed files, so
+            leave it off for the committed manifest
+
+    Returns:
+        Manifest dictionary, keyed by module under ``"modules"``
+    """
+    tools_dir = tools_dir or os.path.dirname(__file__)
+    modules: Dict[str, Any] = {}
+
+    for module, filename, file_path, category in _iter_tool_files(tools_dir, tool_dirs):
+        with open(file_path, "rb") as f:
+            st = os.fstat(f.fileno())
+            data = f.read()
+        entry: Dict[str, Any] = {
+            "path": os.path.relpath(file_path, tools_dir).replace(os.sep, "/"),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "category": category,
+            "tools": [{"name": name, "description": desc} for name, desc in _scan_file(filename, data)],
+        }
+        if record_stats:
+            entry.update(mtime_ns=st.st_mtime_ns, size=st.st_size)
+        modules[module] = entry
+
+    return {"version": MANIFEST_VERSION, "modules": modules}
+
+
+def manifest_content(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """Return ``manifest`` without the recorded file stats, for staleness comparisons."""
+    modules = {module: {k: v for k, v in entry.items() if k not in _STAT_FIELDS} for module, entry in manifest.get("modules", {}).items()}
+    return {**manifest, "modules": modules}
+
+
+def write_manifest(manifest: Dict[str, Any], path: str = DEFAULT_MANIFEST_PATH) -> None:
+    """Write a manifest as stable, diff-friendly JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+
+
+def load_manifest(path: str = DEFAULT_MANIFEST_PATH) -> Optional[Dict[str, Any]]:
+    """
+    Load a manifest, returning None if it is missing, unreadable or of another version.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable tool manifest {path}: {e}")
+        return None
+
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        logger.debug(f"Ignoring tool manifest {path}: unsupported version")
+        return None
+    return manifest
+
+
+def _stat_matches(entry: Dict[str, Any], file_path: str) -> bool:
+    if "mtime_ns" not in entry or "size" not in entry:
+        return False
+    st = os.stat(file_path)
+    return (st.st_mtime_ns, st.st_size) == (entry["mtime_ns"], entry["size"])
+
+
+def _entry_tools(entry: Dict[str, Any]) -> List[Tuple[str, str]]:
+    return [(t["name"], t["description"]) for t in entry.get("tools", [])]
+
+
+def discover_tools_from_manifest(
+    tools_dir: Optional[str] = None,
+    tool_dirs: Sequence[Tuple[str, str]] = TOOL_DIRS,
+    manifest_path: Optional[str] = DEFAULT_MANIFEST_PATH,
+) -> List[DiscoveredTool]:
+    """
+    Discover registered tools, using the manifest for unchanged files.
+
+    A file whose ``(st_mtime_ns, st_size)`` matches its manifest entry (see
+    ``record_stats`` in :func:`build_manifest`) is trusted without being
+    read. Otherwise it is hashed, and only files that
+    are new or whose hash differs are regex-scanned. Without a usable manifest
+    every file is scanned.
+
+    Args:
+        tools_dir: Root of the tool directories (defaults to ``aiecs/tools``)
+        tool_dirs: ``(directory, category)`` pairs to scan
+        manifest_path: Manifest to load, or None to always scan
+
+    Returns:
+        List of ``(tool_name, description, category)`` tuples
+    """
+    tools_dir = tools_dir or os.path.dirname(__file__)
+    manifest = load_manifest(manifest_path) if manifest_path else None
+    entries: Dict[str, Any] = manifest["modules"] if manifest else {}
+
+    discovered: List[DiscoveredTool] = []
+    rescanned = 0
+
+    for module, filename, file_path, category in _iter_tool_files(tools_dir, tool_dirs):
+        try:
+            entry = entries.get(module)
+            if entry is not None and _stat_matches(entry, file_path):
+                tools = _entry_tools(entry)
+            else:
+                with open(file_path, "rb") as f:
+                    data = f.read()
+                if entry is not None and entry.get("sha256") == hashlib.sha256(data).hexdigest():
+                    tools = _entry_tools(entry)
+                else:
+                    rescanned += 1
+                    tools = _scan_file(filename, data)
+
+            discovered.extend((name, description, category) for name, description in tools)
+        except Exception as e:
+            logger.debug(f"Error scanning {filename}: {e}")
+
+    if manifest is not None and rescanned:
+        logger.debug(f"Tool manifest is stale for {rescanned} file(s); run aiecs-build-tool-manifest to regenerate it")
+
+    return discovered
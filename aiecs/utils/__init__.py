@@ -12,15 +12,35 @@ This module provides utility functions including:
 - Cache provider interfaces and implementations
 """
 
-from .prompt_loader import get_prompt
-from .token_usage_repository import TokenUsageRepository
-from .execution_utils import ExecutionUtils
-from .cache_provider import (
-    ICacheProvider,
-    LRUCacheProvider,
-    DualLayerCacheProvider,
-    RedisCacheProvider,
-)
+from typing import TYPE_CHECKING, Dict
+
+from .lazy_exports import make_lazy_module
+
+# Resolved on first access: the token usage repository and Redis cache provider
+# import redis, and every lazily exporting aiecs package imports this package.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "get_prompt": ".prompt_loader",
+    "TokenUsageRepository": ".token_usage_repository",
+    "ExecutionUtils": ".execution_utils",
+    "ICacheProvider": ".cache_provider",
+    "LRUCacheProvider": ".cache_provider",
+    "DualLayerCacheProvider": ".cache_provider",
+    "RedisCacheProvider": ".cache_provider",
+}
+
+if TYPE_CHECKING:
+    from .prompt_loader import get_prompt
+    from .token_usage_repository import TokenUsageRepository
+    from .execution_utils import ExecutionUtils
+    from .cache_provider import (
+        ICacheProvider,
+        LRUCacheProvider,
+        DualLayerCacheProvider,
+        RedisCacheProvider,
+    )
+
+
+__getattr__, __dir__ = make_lazy_module(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "get_prompt",
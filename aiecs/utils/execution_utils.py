@@ -2,19 +2,32 @@
 #  *  Copyright (c) IRETBL Corporation. All rights reserved.
 #  *  Licensed under the Apache-2.0. See License.txt in the project root for license information.
 #  *--------------------------------------------------------------------------------------------*/
+import hashlib
 import json
 import asyncio
 import threading
 import time
-from typing import Any, Callable, Dict, Optional, MutableMapping
+from typing import Any, Callable, Dict, Optional, MutableMapping, Tuple, Type
 from cachetools import LRUCache
 from contextlib import contextmanager
 import logging
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception_type, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 
 logger = logging.getLogger(__name__)
 
 
+def _canonical_json_default(value: Any) -> Any:
+    """Encode values json cannot handle natively in an order-independent way."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex()
+    model_dump = getattr(value, "model_dump", None)
+    if callable(model_dump):
+        return model_dump()
+    return repr(value)
+
+
 class ExecutionUtils:
     """
     Provides common utility set for execution layer, including caching and retry logic.
@@ -72,11 +85,13 @@ class ExecutionUtils:
             "args": args,
             "kwargs": {k: v for k, v in kwargs.items() if k != "self"},
         }
+        # Stable digest over a canonical encoding: unlike hash(), it is not salted
+        # per process, so shared (e.g. Redis L2) caches hit across workers.
         try:
-            key_str = json.dumps(key_dict, sort_keys=True)
+            key_str = json.dumps(key_dict, sort_keys=True, separators=(",", ":"), default=_canonical_json_default)
         except (TypeError, ValueError):
             key_str = str(key_dict)
-        return hash(key_str).__str__()
+        return hashlib.blake2b(key_str.encode("utf-8"), digest_size=16).hexdigest()
 
     def get_from_cache(self, cache_key: str) -> Optional[Any]:
         """
@@ -116,12 +131,13 @@ class ExecutionUtils:
             if ttl > 0:
                 self._cache_ttl_dict[cache_key] = time.time() + ttl
 
-    def create_retry_strategy(self, metric_name: Optional[str] = None) -> Callable:
+    def create_retry_strategy(self, metric_name: Optional[str] = None, give_up_on: Tuple[Type[BaseException], ...] = ()) -> Callable:
         """
         Create retry strategy for execution operations.
 
         Args:
             metric_name (Optional[str]): Metric name for logging
+            give_up_on (Tuple[Type[BaseException], ...]): Exceptions raised immediately instead of retried
 
         Returns:
             Callable: Retry decorator
@@ -131,6 +147,7 @@ class ExecutionUtils:
             logger.warning(f"Retry {retry_state.attempt_number}/{self.retry_attempts} for {metric_name or 'operation'} after {retry_state.idle_for}s: {retry_state.outcome.exception()}")
 
         return retry(
+            retry=retry_if_exception_type() & retry_if_not_exception_type(give_up_on),
             stop=stop_after_attempt(self.retry_attempts),
             wait=wait_exponential(multiplier=self.retry_backoff, min=1, max=10),
             after=after_retry,
@@ -158,7 +175,7 @@ class ExecutionUtils:
         finally:
             handle.cancel()
 
-    async def execute_with_retry_and_timeout(self, func: Callable, timeout: int, *args, **kwargs) -> Any:
+    async def execute_with_retry_and_timeout(self, func: Callable, timeout: int, *args, give_up_on: Tuple[Type[BaseException], ...] = (), **kwargs) -> Any:
         """
         Execute operation with retry and timeout mechanism.
 
@@ -166,6 +183,7 @@ class ExecutionUtils:
             func (Callable): Function to execute
             timeout (int): Timeout duration (seconds)
             *args: Positional arguments
+            give_up_on (Tuple[Type[BaseException], ...]): Exceptions raised immediately instead of retried
             **kwargs: Keyword arguments
 
         Returns:
@@ -174,7 +192,7 @@ class ExecutionUtils:
         Raises:
             OperationError: If all retry attempts fail
         """
-        retry_strategy = self.create_retry_strategy(func.__name__)
+        retry_strategy = self.create_retry_strategy(func.__name__, give_up_on)
         try:
             return await asyncio.wait_for(retry_strategy(func)(*args, **kwargs), timeout=timeout)
         except asyncio.TimeoutError:
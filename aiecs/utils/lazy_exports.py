@@ -0,0 +1,49 @@
+# /*---------------------------------------------------------------------------------------------
+#  *  Copyright (c) IRETBL Corporation. All rights reserved.
+#  *  Licensed under the Apache-2.0. See License.txt in the project root for license information.
+#  *--------------------------------------------------------------------------------------------*/
+"""
+Lazy package exports (PEP 562).
+
+A package lists its public names and their defining modules, then installs
+the module-level ``__getattr__`` / ``__dir__`` returned by
+:func:`make_lazy_module`::
+
+    _LAZY_IMPORTS = {"WebSocketManager": ".websocket_manager"}
+    __getattr__, __dir__ = make_lazy_module(__name__, _LAZY_IMPORTS)
+
+This module must stay free of ``aiecs`` imports: every lazily exporting
+package, including ``aiecs`` itself, imports it during initialization.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+def make_lazy_module(module_name: str, lazy_imports: Mapping[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build ``__getattr__`` and ``__dir__`` for the package ``module_name``.
+
+    Args:
+        module_name: The package's ``__name__``
+        lazy_imports: Export name -> defining module (relative to the package or absolute)
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign at package level
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name: str) -> Any:
+        target = lazy_imports.get(name)
+        if target is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(target, module_name), name)
+        # Cache on the module so later lookups skip __getattr__
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)) | set(lazy_imports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,301 @@
+# /*---------------------------------------------------------------------------------------------
+#  *  Copyright (c) IRETBL Corporation. All rights reserved.
+#  *  Licensed under the Apache-2.0. See License.txt in the project root for license information.
+#  *--------------------------------------------------------------------------------------------*/
+"""
+Task progress pub/sub channel.
+
+Celery workers run in processes with no Socket.IO clients, so progress is
+published to a channel that every Socket.IO replica consumes and delivers to
+its locally connected users (see :mod:`aiecs.ws.socket_server`).
+
+- :class:`RedisProgressChannel` (default) — Redis PUBLISH/SUBSCRIBE on
+  ``PROGRESS_CHANNEL_URL`` (falls back to ``CELERY_BROKER_URL``).
+- :class:`InMemoryProgressChannel` — single-process fan-out for tests and
+  local runs (``PROGRESS_CHANNEL_BACKEND=memory``).
+
+:class:`ProgressCoalescer` keeps only the latest non-terminal update per
+``(user, task, step)`` within a short window; terminal updates (completed,
+failed, cancelled, timed out) are delivered immediately.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from aiecs.config.config import get_settings
+from aiecs.domain.execution.model import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROGRESS_CHANNEL = "aiecs:progress"
+
+TERMINAL_STATUSES = frozenset(
+    {
+        TaskStatus.COMPLETED.value,
+        TaskStatus.FAILED.value,
+        TaskStatus.CANCELLED.value,
+        TaskStatus.TIMED_OUT.value,
+    }
+)
+
+ProgressMessage = Tuple[str, Dict[str, Any]]
+DeliverCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+def encode_progress(user_id: str, data: Dict[str, Any]) -> str:
+    """Serialize a progress update for the wire (non-JSON values are stringified)"""
+    return json.dumps({"user_id": user_id, "data": data}, default=str)
+
+
+def decode_progress(raw: Any) -> Optional[ProgressMessage]:
+    """Parse a wire message; returns None for malformed payloads"""
+    try:
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        message = json.loads(raw)
+        return str(message["user_id"]), dict(message["data"])
+    except (ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Dropping malformed progress message: {e}")
+        return None
+
+
+class ProgressChannel(ABC):
+    """Pub/sub transport for task progress updates"""
+
+    @abstractmethod
+    def publish_sync(self, user_id: str, data: Dict[str, Any]) -> None:
+        """Publish from synchronous code (Celery task bodies)"""
+
+    @abstractmethod
+    async def publish(self, user_id: str, data: Dict[str, Any]) -> None:
+        """Publish from a running event loop"""
+
+    @abstractmethod
+    def listen(self) -> AsyncIterator[ProgressMessage]:
+        """Yield ``(user_id, data)`` for every update published after subscribing"""
+
+    async def close(self) -> None:
+        """Release connections held by the channel"""
+        return None
+
+
+class InMemoryProgressChannel(ProgressChannel):
+    """Process-local channel; publishers may run on any thread"""
+
+    def __init__(self) -> None:
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Queue[ProgressMessage]"]] = []
+        self._lock = threading.Lock()
+
+    def publish_sync(self, user_id: str, data: Dict[str, Any]) -> None:
+        decoded = decode_progress(encode_progress(user_id, data))
+        if decoded is None:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, decoded)
+            except RuntimeError:
+                pass  # Subscriber loop already closed
+
+    async def publish(self, user_id: str, data: Dict[str, Any]) -> None:
+        self.publish_sync(user_id, data)
+
+    async def listen(self) -> AsyncIterator[ProgressMessage]:
+        queue: "asyncio.Queue[ProgressMessage]" = asyncio.Queue()
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers.append(subscriber)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            with self._lock:
+                self._subscribers.remove(subscriber)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+
+class RedisProgressChannel(ProgressChannel):
+    """Redis PUBLISH/SUBSCRIBE channel shared by workers and Socket.IO replicas"""
+
+    def __init__(self, url: str, channel: str = DEFAULT_PROGRESS_CHANNEL) -> None:
+        self.url = url
+        self.channel = channel
+        self._sync_client: Any = None
+        self._async_client: Any = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def publish_sync(self, user_id: str, data: Dict[str, Any]) -> None:
+        if self._sync_client is None:
+            with self._lock:
+                if self._sync_client is None:
+                    import redis
+
+                    self._sync_client = redis.Redis.from_url(self.url)
+        self._sync_client.publish(self.channel, encode_progress(user_id, data))
+
+    def _client_for_running_loop(self) -> Any:
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            import redis.asyncio as aioredis
+
+            # redis.asyncio connections are bound to the loop that opened them
+            self._async_client = aioredis.Redis.from_url(self.url)
+            self._async_loop = loop
+        return self._async_client
+
+    async def publish(self, user_id: str, data: Dict[str, Any]) -> None:
+        await self._client_for_running_loop().publish(self.channel, encode_progress(user_id, data))
+
+    async def listen(self) -> AsyncIterator[ProgressMessage]:
+        import redis.asyncio as aioredis
+
+        client = aioredis.Redis.from_url(self.url)
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self.channel)
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                decoded = decode_progress(message.get("data"))
+                if decoded is not None:
+                    yield decoded
+        finally:
+            try:
+                await pubsub.aclose()
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing progress subscription: {e}")
+
+    async def close(self) -> None:
+        if self._async_client is not None:
+            try:
+                await self._async_client.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing progress publisher: {e}")
+            self._async_client = None
+            self._async_loop = None
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+
+class ProgressCoalescer:
+    """
+    Coalesce high-frequency progress per ``(user_id, task, step)``.
+
+    Non-terminal updates are held for ``interval`` seconds and only the latest
+    per key is delivered; a terminal update replaces anything pending for its
+    key and is delivered immediately.  ``interval <= 0`` disables coalescing.
+    """
+
+    def __init__(self, deliver: DeliverCallback, interval: float) -> None:
+        self._deliver = deliver
+        self.interval = interval
+        self._pending: Dict[Tuple[str, Any, Any], ProgressMessage] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self.received = 0
+        self.delivered = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def _key(user_id: str, data: Dict[str, Any]) -> Tuple[str, Any, Any]:
+        return user_id, data.get("task_id") or data.get("task"), data.get("step")
+
+    async def add(self, user_id: str, data: Dict[str, Any]) -> None:
+        self.received += 1
+        if self.interval <= 0:
+            await self._send(user_id, data)
+            return
+        key = self._key(user_id, data)
+        if key in self._pending:
+            self.coalesced += 1
+        if data.get("status") in TERMINAL_STATUSES:
+            self._pending.pop(key, None)
+            await self._send(user_id, data)
+            return
+        self._pending[key] = (user_id, data)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self.interval)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Deliver everything pending now"""
+        # Pop one entry per send: a terminal update arriving while a send is
+        # awaited must find (and replace) its key's stale update in _pending
+        while self._pending:
+            user_id, data = self._pending.pop(next(iter(self._pending)))
+            await self._send(user_id, data)
+
+    async def close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+
+    async def _send(self, user_id: str, data: Dict[str, Any]) -> None:
+        try:
+            await self._deliver(user_id, data)
+            self.delivered += 1
+        except Exception as e:
+            logger.error(f"Failed to deliver progress to user {user_id}: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "received": self.received,
+            "delivered": self.delivered,
+            "coalesced": self.coalesced,
+            "pending": len(self._pending),
+        }
+
+
+_channel: Optional[ProgressChannel] = None
+_channel_lock = threading.Lock()
+
+
+def create_progress_channel() -> ProgressChannel:
+    """Build the channel selected by ``PROGRESS_CHANNEL_BACKEND``"""
+    settings = get_settings()
+    backend = settings.progress_channel_backend.strip().lower()
+    if backend == "memory":
+        return InMemoryProgressChannel()
+    if backend == "redis":
+        return RedisProgressChannel(settings.progress_channel_url or settings.celery_broker_url)
+    raise ValueError(f"Unsupported PROGRESS_CHANNEL_BACKEND: {settings.progress_channel_backend}")
+
+
+def get_progress_channel() -> ProgressChannel:
+    """Return the process-wide progress channel"""
+    global _channel
+    if _channel is None:
+        with _channel_lock:
+            if _channel is None:
+                _channel = create_progress_channel()
+    return _channel
+
+
+def set_progress_channel(channel: Optional[ProgressChannel]) -> None:
+    """Install a custom channel (``None`` re-creates from settings on next use)"""
+    global _channel
+    with _channel_lock:
+        _channel = channel
+
+
+def publish_progress(user_id: str, data: Dict[str, Any]) -> None:
+    """Publish a progress update from synchronous code; failures are logged, not raised"""
+    try:
+        get_progress_channel().publish_sync(user_id, data)
+    except Exception as e:
+        logger.warning(f"Failed to publish progress for user {user_id}: {e}")
@@ -2,10 +2,15 @@
 #  *  Copyright (c) IRETBL Corporation. All rights reserved.
 #  *  Licensed under the Apache-2.0. See License.txt in the project root for license information.
 #  *--------------------------------------------------------------------------------------------*/
-from typing import Any, Dict
+import asyncio
+import logging
+from typing import Any, Dict, Optional
 
 import socketio
 from aiecs.config.config import get_settings
+from aiecs.ws.progress_channel import ProgressChannel, ProgressCoalescer, get_progress_channel
+
+logger = logging.getLogger(__name__)
 
 settings = get_settings()
 # In production, this should be set to specific origins
@@ -48,7 +53,74 @@ async def register(sid, data):
 # Send progress update to user
 
 
-async def push_progress(user_id: str, data: dict):
+async def deliver_progress(user_id: str, data: dict):
+    """Emit a progress update to the user's socket if it is connected to this process"""
     sid = connected_clients.get(user_id)
     if sid:
         await sio.emit("progress", data, to=sid)
+
+
+async def push_progress(user_id: str, data: dict):
+    """Publish a progress update; every replica delivers it to its own connected clients"""
+    await get_progress_channel().publish(user_id, data)
+
+
+class ProgressRelay:
+    """Consumes the progress channel and delivers updates to locally connected clients"""
+
+    def __init__(self, channel: ProgressChannel, coalesce_seconds: float, retry_max_seconds: float = 30.0):
+        self.channel = channel
+        self.coalescer = ProgressCoalescer(deliver_progress, coalesce_seconds)
+        self.retry_max_seconds = retry_max_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.coalescer.close()
+
+    async def _run(self) -> None:
+        delay = 1.0
+        while True:
+            try:
+                async for user_id, data in self.channel.listen():
+                    delay = 1.0
+                    await self.coalescer.add(user_id, data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Progress channel subscription failed, retrying in {delay:.0f}s: {e}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.retry_max_seconds)
+
+
+progress_relay: Optional[ProgressRelay] = None
+
+
+async def start_progress_relay(channel: Optional[ProgressChannel] = None) -> ProgressRelay:
+    """Start consuming progress updates for this replica (idempotent)"""
+    global progress_relay
+    if progress_relay is None:
+        progress_relay = ProgressRelay(
+            channel or get_progress_channel(),
+            coalesce_seconds=settings.progress_coalesce_ms / 1000,
+        )
+        progress_relay.start()
+    return progress_relay
+
+
+async def stop_progress_relay() -> None:
+    """Stop the progress relay and flush pending updates"""
+    global progress_relay
+    if progress_relay is not None:
+        await progress_relay.stop()
+        progress_relay = None
@@ -0,0 +1,34 @@
+"""
+Shared configuration for the performance benchmarks.
+
+``test/performance`` is part of the default test run, where wall-clock
+comparisons are too noisy to gate on. Benchmarks always check correctness and
+print their timings; the timing comparison itself only fails the test when
+``AIECS_PERF_ASSERT=1`` is set (dedicated, otherwise idle perf runs).
+"""
+
+import os
+
+import pytest
+
+PERF_ASSERT = os.environ.get("AIECS_PERF_ASSERT", "").strip().lower() in ("1", "true", "yes")
+
+
+@pytest.fixture
+def check_speedup():
+    """
+    Compare a baseline and a candidate timing.
+
+    Call as ``check_speedup(label, baseline_s, candidate_s, min_speedup=...)``;
+    prints the ratio and, under ``AIECS_PERF_ASSERT=1``, asserts that the
+    candidate is at least ``min_speedup`` times faster. Pick ``min_speedup``
+    well below the speed-up observed on a quiet machine.
+    """
+
+    def check(label: str, baseline_s: float, candidate_s: float, min_speedup: float = 1.0) -> None:
+        speedup = baseline_s / candidate_s if candidate_s > 0 else float("inf")
+        print(f"\n{label}: {speedup:.1f}x (required {min_speedup:.1f}x under AIECS_PERF_ASSERT=1)")
+        if PERF_ASSERT:
+            assert speedup >= min_speedup, f"{label}: {speedup:.2f}x speed-up, expected at least {min_speedup:.1f}x"
+
+    return check
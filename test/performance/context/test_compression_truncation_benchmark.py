@@ -0,0 +1,116 @@
+"""
+Token-budget truncation micro-benchmark on 10k-message transcripts.
+
+Compares ``compress_preserve_recent`` and the summarize-chunk text splitters
+with the previous implementations, which re-estimated the whole candidate
+list (or rebuilt an ``LLMMessage``) on every probe.
+
+Run with ``pytest test/performance/context -m performance -s`` (timing ratios are
+only asserted with ``AIECS_PERF_ASSERT=1``).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, List, Tuple
+
+import pytest
+
+from aiecs.domain.context.compression.llm_compact import _split_text_for_token_budget, _truncate_text_for_token_budget
+from aiecs.domain.context.compression.pairs import split_preserving_tool_pairs
+from aiecs.domain.context.compression.tokens import estimate_message_tokens
+from aiecs.domain.context.compression.truncation import compress_preserve_recent, compress_with_earlier_placeholder
+from aiecs.llm import LLMMessage
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+MESSAGES = 10_000
+
+
+def _legacy_compress_preserve_recent(messages: List[LLMMessage], *, max_tokens: int) -> List[LLMMessage]:
+    """Previous tail search: rebuild and re-estimate the candidate list per step."""
+    message_list = list(messages)
+    if estimate_message_tokens(message_list) <= max_tokens:
+        return message_list
+    system_indices = {i for i, m in enumerate(message_list) if m.role == "system"}
+    system_msgs = [message_list[i] for i in sorted(system_indices)]
+    for tail_count in range(len(message_list), 0, -1):
+        split_at = split_preserving_tool_pairs(message_list, len(message_list) - tail_count)
+        candidate = [message_list[i] for i in range(split_at, len(message_list)) if i not in system_indices]
+        if estimate_message_tokens(system_msgs + candidate) <= max_tokens:
+            return system_msgs + candidate
+    return compress_with_earlier_placeholder(message_list, max_tokens=max_tokens)
+
+
+def _legacy_split_text(text: str, max_tokens: int) -> List[str]:
+    """Previous splitter: binary search re-estimating an LLMMessage per probe."""
+
+    def _fits(chunk: str) -> bool:
+        return estimate_message_tokens([LLMMessage(role="user", content=chunk)]) <= max_tokens
+
+    if _fits(text):
+        return [text]
+    parts: List[str] = []
+    start = 0
+    while start < len(text):
+        low, high, best = 1, len(text) - start, 1
+        while low <= high:
+            mid = (low + high) // 2
+            if _fits(text[start : start + mid]):
+                best, low = mid, mid + 1
+            else:
+                high = mid - 1
+        parts.append(text[start : start + best])
+        start += best
+    return parts
+
+
+def _transcript(count: int) -> List[LLMMessage]:
+    messages: List[LLMMessage] = [LLMMessage(role="system", content="You are a helpful agent.")]
+    index = 0
+    while len(messages) < count:
+        call_id = f"call_{index}"
+        messages.append(LLMMessage(role="user", content=f"request {index} " + "detail " * 20))
+        messages.append(
+            LLMMessage(
+                role="assistant",
+                content=None,
+                tool_calls=[{"id": call_id, "type": "function", "function": {"name": "read_file", "arguments": "{}"}}],
+            )
+        )
+        messages.append(LLMMessage(role="tool", content="line " * 40, tool_call_id=call_id))
+        messages.append(LLMMessage(role="assistant", content=f"answer {index} " + "text " * 15))
+        index += 1
+    return messages[:count]
+
+
+def _timed(func: Callable[[], Any]) -> Tuple[float, Any]:
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def test_compress_preserve_recent_10k_messages(check_speedup) -> None:
+    messages = _transcript(MESSAGES)
+    # Keep ~95% of the transcript so the tail search walks a few hundred steps.
+    max_tokens = int(estimate_message_tokens(messages) * 0.95)
+
+    new_seconds, compressed = _timed(lambda: compress_preserve_recent(messages, max_tokens=max_tokens))
+    legacy_seconds, expected = _timed(lambda: _legacy_compress_preserve_recent(messages, max_tokens=max_tokens))
+
+    assert [id(m) for m in compressed] == [id(m) for m in expected]
+    print(f"\ncompress_preserve_recent ({MESSAGES} msgs): legacy {legacy_seconds:.3f}s, linear {new_seconds:.3f}s ({legacy_seconds / new_seconds:.0f}x)")
+    check_speedup("compress_preserve_recent", legacy_seconds, new_seconds, min_speedup=5.0)
+
+
+def test_split_text_for_token_budget_large_tool_output(check_speedup) -> None:
+    text = "tool output line\n" * 200_000
+    max_tokens = 2_000
+
+    new_seconds, parts = _timed(lambda: _split_text_for_token_budget(text, max_tokens))
+    legacy_seconds, expected = _timed(lambda: _legacy_split_text(text, max_tokens))
+    truncate_seconds, _ = _timed(lambda: _truncate_text_for_token_budget(text, max_tokens))
+
+    assert parts == expected
+    print(f"\n_split_text_for_token_budget ({len(text)} chars): legacy {legacy_seconds:.3f}s, arithmetic {new_seconds:.4f}s; truncate {truncate_seconds:.4f}s")
+    check_speedup("_split_text_for_token_budget", legacy_seconds, new_seconds, min_speedup=5.0)
@@ -0,0 +1,173 @@
+"""
+ContextEngine Redis round-trip benchmark.
+
+Runs the conversation hot paths against a local Redis stand-in that charges a
+fixed latency per round trip, once with pipelines executed as a single round
+trip and once with every queued command paying its own round trip. History
+replacement is compared against the previous delete + per-message RPUSH loop.
+
+Run with ``pytest test/performance/context -m performance -s``; round-trip
+counts are always checked, the timing ratio only with ``AIECS_PERF_ASSERT=1``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from aiecs.domain.context.compression.policy import CompressionPolicy
+from aiecs.domain.context.context_engine import ContextEngine, ConversationMessage
+
+pytestmark = [pytest.mark.performance]
+
+ROUND_TRIP_SECONDS = 0.0005
+APPENDS = 200
+REPLACE_SIZE = 500
+
+
+class _LatencyRedis:
+    """Dict-backed Redis stand-in with a fixed per-round-trip latency."""
+
+    def __init__(self, pipelined: bool) -> None:
+        self.pipelined = pipelined
+        self.round_trips = 0
+        self.lists: Dict[str, List[str]] = {}
+        self.values: Dict[str, int] = {}
+        self.hashes: Dict[str, Dict[str, Any]] = {}
+
+    async def _round_trip(self, count: int = 1) -> None:
+        self.round_trips += count
+        await asyncio.sleep(ROUND_TRIP_SECONDS * count)
+
+    def _apply(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        if name in ("lpush", "rpush"):
+            items = self.lists.setdefault(args[0], [])
+            for value in args[1:]:
+                items.insert(0, value) if name == "lpush" else items.append(value)
+            return len(items)
+        if name in ("lrange", "ltrim"):
+            key, start, end = args
+            items = self.lists.get(key, [])
+            n = len(items)
+            start = max(start + n, 0) if start < 0 else start
+            end = end + n if end < 0 else end
+            selected = items[start : end + 1] if end >= start else []
+            if name == "ltrim":
+                self.lists[key] = selected
+            return selected
+        if name == "incrby":
+            self.values[args[0]] = self.values.get(args[0], 0) + args[1]
+            return self.values[args[0]]
+        if name == "set":
+            self.values[args[0]] = int(args[1])
+            return True
+        if name == "get":
+            return self.values.get(args[0])
+        if name == "hset":
+            self.hashes.setdefault(args[0], {})[args[1]] = args[2]
+            return 1
+        if name == "hget":
+            return self.hashes.get(args[0], {}).get(args[1])
+        if name in ("hdel",):
+            return self.hashes.get(args[0], {}).pop(args[1], None)
+        if name == "delete":
+            for key in args:
+                self.lists.pop(key, None)
+                self.values.pop(key, None)
+                self.hashes.pop(key, None)
+            return len(args)
+        if name == "expire":
+            return True
+        raise AttributeError(name)
+
+    def __getattr__(self, name: str) -> Any:
+        async def command(*args: Any, **kwargs: Any) -> Any:
+            await self._round_trip()
+            return self._apply(name, *args, **kwargs)
+
+        return command
+
+    def pipeline(self, transaction: bool = True) -> "_LatencyPipeline":
+        return _LatencyPipeline(self)
+
+
+class _LatencyPipeline:
+    def __init__(self, redis: _LatencyRedis) -> None:
+        self._redis = redis
+        self._queued: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
+
+    async def __aenter__(self) -> "_LatencyPipeline":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self._queued = []
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> "_LatencyPipeline":
+            self._queued.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> List[Any]:
+        await self._redis._round_trip(1 if self._redis.pipelined else len(self._queued))
+        queued, self._queued = self._queued, []
+        return [self._redis._apply(name, *args, **kwargs) for name, args, kwargs in queued]
+
+
+async def _legacy_replace(engine: ContextEngine, session_id: str, messages: List[ConversationMessage]) -> None:
+    """The pre-pipelining replace: delete, one RPUSH per message, expire."""
+    key = f"conversation:{session_id}"
+    await engine.redis_client.delete(key)
+    for msg in messages:
+        await engine.redis_client.rpush(key, str(msg.to_dict()))
+    await engine.redis_client.expire(key, engine.session_ttl)
+
+
+async def _run(pipelined: bool) -> Dict[str, float]:
+    engine = ContextEngine(compression_policy=CompressionPolicy(enabled=True))
+    redis = _LatencyRedis(pipelined)
+    engine.redis_client = redis
+    await engine.create_session("bench", "user")
+
+    start = time.perf_counter()
+    for i in range(APPENDS):
+        await engine.add_conversation_message("bench", "user", f"message {i}")
+    append_seconds = time.perf_counter() - start
+    append_trips = redis.round_trips
+
+    messages = [ConversationMessage(role="user", content=f"m{i}", timestamp=datetime.utcnow()) for i in range(REPLACE_SIZE)]
+    start = time.perf_counter()
+    if pipelined:
+        await engine._replace_conversation_history("bench", messages)
+    else:
+        await _legacy_replace(engine, "bench", messages)
+    replace_seconds = time.perf_counter() - start
+
+    return {
+        "append_ms": append_seconds * 1000 / APPENDS,
+        "append_trips": append_trips / APPENDS,
+        "replace_ms": replace_seconds * 1000,
+        "replace_trips": redis.round_trips - append_trips,
+    }
+
+
+@pytest.mark.asyncio
+async def test_pipelined_writes_reduce_round_trips(check_speedup) -> None:
+    unpipelined = await _run(pipelined=False)
+    pipelined = await _run(pipelined=True)
+
+    print(f"\nRound trip latency: {ROUND_TRIP_SECONDS * 1000:.1f}ms")
+    for label, result in (("unpipelined", unpipelined), ("pipelined", pipelined)):
+        print(
+            f"{label:>12}: append {result['append_ms']:.2f}ms ({result['append_trips']:.1f} trips), "
+            f"replace {REPLACE_SIZE} msgs {result['replace_ms']:.2f}ms ({result['replace_trips']:.0f} trips)"
+        )
+
+    assert pipelined["append_trips"] < unpipelined["append_trips"]
+    assert pipelined["replace_trips"] == 1
+    check_speedup("history replace", unpipelined["replace_ms"], pipelined["replace_ms"], min_speedup=2.0)
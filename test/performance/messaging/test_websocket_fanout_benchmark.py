@@ -0,0 +1,118 @@
+"""
+WebSocketManager fan-out over 5k local connections.
+
+Opens ``CONNECTIONS`` real client sockets against a local server, subscribing
+them to ``USERS`` users, then measures:
+
+- broadcast: one event delivered to every connection (serialized once)
+- targeted send: one user's event via ``send_to_user``, against the previous
+  behaviour of broadcasting every per-user event and serializing it once per
+  connection
+
+Run with ``pytest test/performance/messaging -m performance -s`` (timing ratios are
+only asserted with ``AIECS_PERF_ASSERT=1``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import resource
+import time
+
+import pytest
+import websockets
+
+from aiecs.infrastructure.messaging.websocket_manager import WebSocketManager
+
+CONNECTIONS = int(os.environ.get("WS_BENCH_CONNECTIONS", "5000"))
+USERS = CONNECTIONS // 5
+TARGETED_EVENTS = 200
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        resource.getrlimit(resource.RLIMIT_NOFILE)[0] < 2 * CONNECTIONS + 256,
+        reason="open-file limit too low for the WebSocket fan-out benchmark",
+    ),
+]
+
+
+class _Receiver:
+    """Client connection that counts received messages"""
+
+    def __init__(self, client):
+        self.client = client
+        self.received = 0
+        self.task = asyncio.create_task(self._read())
+
+    async def _read(self):
+        async for _ in self.client:
+            self.received += 1
+
+
+async def _wait_for(receivers, expected_total: int, timeout: float = 60.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while sum(r.received for r in receivers) < expected_total:
+        if time.perf_counter() > deadline:
+            raise AssertionError("timed out waiting for delivery")
+        await asyncio.sleep(0.001)
+
+
+async def _legacy_broadcast(manager: WebSocketManager, message: dict) -> None:
+    """Previous delivery path: every event to every connection, json.dumps per connection"""
+    await asyncio.gather(*[conn.send(json.dumps(message)) for conn in manager.active_connections], return_exceptions=True)
+
+
+async def test_websocket_fanout_5k_connections(check_speedup):
+    manager = WebSocketManager(host="127.0.0.1", port=0, max_queue_size=1024)
+    server = await manager.start_server()
+    port = next(iter(server.sockets)).getsockname()[1]
+    receivers = []
+    try:
+        for start in range(0, CONNECTIONS, 500):
+            clients = await asyncio.gather(*[websockets.connect(f"ws://127.0.0.1:{port}", max_queue=None) for _ in range(start, min(start + 500, CONNECTIONS))])
+            for offset, client in enumerate(clients):
+                await client.send(json.dumps({"action": "subscribe", "user_id": f"user-{(start + offset) % USERS}"}))
+                receivers.append(_Receiver(client))
+        await _wait_for(receivers, CONNECTIONS)
+        assert manager.get_connection_count() == CONNECTIONS
+
+        event = {"type": "task_step_result", "result": {"rows": list(range(50))}, "message": "step done"}
+
+        baseline = sum(r.received for r in receivers)
+        start = time.perf_counter()
+        await manager.broadcast_message(dict(event))
+        await _wait_for(receivers, baseline + CONNECTIONS)
+        broadcast_s = time.perf_counter() - start
+
+        baseline = sum(r.received for r in receivers)
+        start = time.perf_counter()
+        for i in range(TARGETED_EVENTS):
+            await manager.send_to_user(f"user-{i % USERS}", dict(event))
+        await _wait_for(receivers, baseline + TARGETED_EVENTS * (CONNECTIONS // USERS))
+        targeted_s = time.perf_counter() - start
+
+        legacy_events = 5
+        baseline = sum(r.received for r in receivers)
+        start = time.perf_counter()
+        for _ in range(legacy_events):
+            await _legacy_broadcast(manager, dict(event))
+        await _wait_for(receivers, baseline + legacy_events * CONNECTIONS)
+        legacy_per_event_s = (time.perf_counter() - start) / legacy_events
+    finally:
+        for receiver in receivers:
+            await receiver.client.close()
+            receiver.task.cancel()
+        await manager.stop_server()
+
+    targeted_per_event_s = targeted_s / TARGETED_EVENTS
+    print(
+        f"\n{CONNECTIONS} connections / {USERS} users: broadcast {broadcast_s * 1000:.1f}ms, "
+        f"targeted send {targeted_per_event_s * 1000:.2f}ms/event "
+        f"(legacy broadcast-per-user-event {legacy_per_event_s * 1000:.1f}ms/event, "
+        f"{legacy_per_event_s / targeted_per_event_s:.0f}x)"
+    )
+    check_speedup("targeted fan-out", legacy_per_event_s, targeted_per_event_s, min_speedup=50.0)
@@ -0,0 +1,109 @@
+"""
+Sync→async bridge per-call overhead against a local HTTP stub.
+
+Compares 1,000 sync ``search()``-style calls through the previous bridge
+(``asyncio.run`` per call, so each call also needs its own ``httpx.AsyncClient``
+and TCP connection) with the persistent background loop and a shared client
+from ``get_shared_async_client``.
+
+Run with ``pytest test/performance/search_tool -m performance -s`` (timing ratios are
+only asserted with ``AIECS_PERF_ASSERT=1``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Coroutine, Iterator, TypeVar
+
+import httpx
+import pytest
+
+from aiecs.tools.search_tool.backends.async_bridge import get_shared_async_client, run_async_from_sync, shutdown_async_bridge
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+T = TypeVar("T")
+CALLS = 1_000
+BODY = b'{"results": [{"url": "https://example.com", "title": "Example"}]}'
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+
+@pytest.fixture(scope="module")
+def stub_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _legacy_run_async_from_sync(coro: Coroutine[Any, Any, T], *, timeout: float) -> T:
+    """The previous bridge: a fresh loop (and, under a running loop, a fresh pool) per call."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(asyncio.wait_for(coro, timeout=timeout))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(lambda: asyncio.run(asyncio.wait_for(coro, timeout=timeout)))
+        return future.result()
+
+
+def _timed(call: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        call()
+    return time.perf_counter() - start
+
+
+def test_persistent_loop_and_shared_client_per_call_overhead(stub_url: str, check_speedup) -> None:
+    async def legacy_search() -> int:
+        # A client cannot outlive the per-call loop, so each call opens a new connection.
+        async with httpx.AsyncClient(base_url=stub_url) as client:
+            return (await client.get("/search")).status_code
+
+    async def shared_search() -> int:
+        client = await get_shared_async_client("bench", lambda: httpx.AsyncClient(base_url=stub_url))
+        return (await client.get("/search")).status_code
+
+    async def noop() -> None:
+        return None
+
+    try:
+        assert run_async_from_sync(shared_search(), timeout=5.0) == 200  # warm the loop and pool
+        legacy_http = _timed(lambda: _legacy_run_async_from_sync(legacy_search(), timeout=5.0))
+        shared_http = _timed(lambda: run_async_from_sync(shared_search(), timeout=5.0))
+        legacy_noop = _timed(lambda: _legacy_run_async_from_sync(noop(), timeout=5.0))
+        shared_noop = _timed(lambda: run_async_from_sync(noop(), timeout=5.0))
+    finally:
+        shutdown_async_bridge()
+
+    def per_call_us(seconds: float) -> float:
+        return seconds / CALLS * 1e6
+
+    print(f"\n{CALLS} sync calls against a local HTTP stub:")
+    print(f"  HTTP GET  legacy {per_call_us(legacy_http):8.0f}us/call  persistent+shared {per_call_us(shared_http):8.0f}us/call ({legacy_http / shared_http:.1f}x)")
+    print(f"  bridge    legacy {per_call_us(legacy_noop):8.0f}us/call  persistent        {per_call_us(shared_noop):8.0f}us/call ({legacy_noop / shared_noop:.1f}x)")
+
+    check_speedup("HTTP GET", legacy_http, shared_http, min_speedup=3.0)
+    check_speedup("bridge", legacy_noop, shared_noop, min_speedup=1.3)
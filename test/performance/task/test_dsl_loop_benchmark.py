@@ -0,0 +1,79 @@
+"""
+DSL loop condition cost: compiled, cached conditions vs. per-iteration parsing.
+
+Runs a ``loop`` step for ``ITERATIONS`` iterations whose ``while`` condition
+combines context, input and intent checks, once with ``DSLProcessor`` and once
+with a processor using the previous evaluator (split + regex on every call).
+
+Run with ``pytest test/performance/task -m performance -s`` (timing ratios are
+only asserted with ``AIECS_PERF_ASSERT=1``).
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from aiecs.domain.task.condition_compiler import compile_condition, evaluate_comparison, parse_value
+from aiecs.domain.task.dsl_processor import DSLProcessor
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+ITERATIONS = 10_000
+CONDITION = "context.counter < 10000 AND input.mode == 'batch' AND intent.includes('process') OR context.force == true"
+
+
+class _LegacyDSLProcessor(DSLProcessor):
+    """Previous evaluator: re-tokenizes and runs regexes on every call."""
+
+    def evaluate_condition(
+        self,
+        condition: str,
+        intent_categories: List[str],
+        context: Optional[Dict[str, Any]] = None,
+        input_data: Optional[Dict[str, Any]] = None,
+        results: Optional[List[Any]] = None,
+    ) -> bool:
+        if " AND " in condition:
+            return all(self.evaluate_condition(p.strip(), intent_categories, context, input_data, results) for p in condition.split(" AND "))
+        if " OR " in condition:
+            return any(self.evaluate_condition(p.strip(), intent_categories, context, input_data, results) for p in condition.split(" OR "))
+        match = re.fullmatch(r"intent\.includes\('([^']+)'\)", condition)
+        if match:
+            return match.group(1) in intent_categories
+        match = re.fullmatch(r"context\.(\w+)\s*(==|!=|>|<|>=|<=)\s*(.+)", condition)
+        if match and context:
+            field, operator, value = match.groups()
+            return evaluate_comparison(context.get(field), operator, parse_value(value))
+        match = re.fullmatch(r"input\.(\w+)\s*(==|!=|>|<|>=|<=)\s*(.+)", condition)
+        if match and input_data:
+            field, operator, value = match.groups()
+            return evaluate_comparison(input_data.get(field), operator, parse_value(value))
+        raise ValueError(f"Unsupported condition format: {condition}")
+
+
+async def _run_loop(processor: DSLProcessor) -> float:
+    context: Dict[str, Any] = {"counter": 0, "force": False}
+
+    async def execute_single_task(task_name, input_data, ctx):
+        ctx["counter"] += 1
+        return {"step": task_name, "result": None, "completed": True}
+
+    step = {"loop": {"while": CONDITION, "max_iterations": ITERATIONS + 1, "steps": [{"task": "tick"}]}}
+    start = time.perf_counter()
+    result = await processor._handle_loop_step(step, ["process"], {"mode": "batch"}, context, execute_single_task, None)
+    elapsed = time.perf_counter() - start
+    assert result.message == f"Completed loop with {ITERATIONS} iterations"
+    return elapsed
+
+
+async def test_loop_10k_iterations(check_speedup):
+    compile_condition.cache_clear()
+    legacy_s = await _run_loop(_LegacyDSLProcessor())
+    compiled_s = await _run_loop(DSLProcessor())
+
+    print(f"\n{ITERATIONS}-iteration loop: legacy {legacy_s * 1000:.0f}ms, compiled {compiled_s * 1000:.0f}ms " f"({legacy_s / compiled_s:.1f}x)")
+    check_speedup("DSL loop", legacy_s, compiled_s, min_speedup=1.5)
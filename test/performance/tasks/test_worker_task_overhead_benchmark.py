@@ -0,0 +1,87 @@
+"""
+Per-task overhead of the Celery worker body.
+
+Runs ``TASKS`` short tasks against a service with an async method and an
+async client created on first use, comparing:
+
+- before: a new service instance per task, the coroutine driven by its own
+  ``asyncio.run`` and two more ``asyncio.run`` calls for the started and
+  completed progress pushes (so the client is rebuilt with every loop)
+- after: ``_execute_service_task`` with the pooled service and the
+  persistent worker event loop
+
+Progress publishing goes to an in-memory channel in both cases.
+
+Run with ``pytest test/performance/tasks -m performance -s`` (timing ratios are
+only asserted with ``AIECS_PERF_ASSERT=1``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from aiecs.ws.progress_channel import InMemoryProgressChannel, set_progress_channel
+
+worker = pytest.importorskip("aiecs.tasks.worker")
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+TASKS = 2_000
+
+
+class ShortService:
+    """Service whose async client (a semaphore-guarded session) is bound to a loop"""
+
+    def __init__(self):
+        self._session = None
+
+    async def _client(self):
+        if self._session is None:
+            await asyncio.sleep(0)  # connection setup
+            self._session = asyncio.Semaphore(8)
+        return self._session
+
+    async def lookup(self, input_data, context):
+        async with await self._client():
+            return {"value": input_data["value"] * 2}
+
+
+def _legacy_task(channel: InMemoryProgressChannel, value: int) -> dict:
+    asyncio.run(channel.publish("u1", {"status": "running", "task": "lookup", "step": 0}))
+    service = ShortService()
+    result = asyncio.run(service.lookup({"value": value}, {}))
+    asyncio.run(channel.publish("u1", {"status": "completed", "task": "lookup", "step": 0, "result": result}))
+    return result
+
+
+def test_worker_per_task_overhead(monkeypatch, check_speedup):
+    channel = InMemoryProgressChannel()
+    set_progress_channel(channel)
+    monkeypatch.setattr(worker, "get_ai_service", lambda mode, service: ShortService)
+    worker._service_instances.clear()
+    try:
+        start = time.perf_counter()
+        for i in range(TASKS):
+            assert _legacy_task(channel, i) == {"value": i * 2}
+        before_s = time.perf_counter() - start
+
+        worker.worker_loop.start()
+        start = time.perf_counter()
+        for i in range(TASKS):
+            outcome = worker._execute_service_task(None, "lookup", "u1", "t1", 0, "execute", "short", {"value": i}, {})
+            assert outcome["result"] == {"value": i * 2}
+        after_s = time.perf_counter() - start
+    finally:
+        worker._service_instances.clear()
+        worker.worker_loop.stop()
+        set_progress_channel(None)
+
+    print(
+        f"\n{TASKS} tasks: before {before_s / TASKS * 1e6:.0f}us/task "
+        f"(new instance + 3x asyncio.run), after {after_s / TASKS * 1e6:.0f}us/task "
+        f"(pooled instance + persistent loop), {before_s / after_s:.1f}x"
+    )
+    check_speedup("worker per-task overhead", before_s, after_s, min_speedup=3.0)
@@ -0,0 +1,126 @@
+"""
+Postgres temporal memory search: legacy ILIKE scan vs ranked full-text (tsvector / GIN).
+
+Loads ``FACTS`` facts into a scratch schema, then times the legacy
+``text ILIKE '%q%'`` query and the ``websearch_to_tsquery`` query for a
+selective term at several group cardinalities.
+
+Default CI: skipped unless ``TM_POSTGRES_BENCH_URL`` points at a disposable
+database (the scratch schema is dropped afterwards)::
+
+    TM_POSTGRES_BENCH_URL=postgresql://... pytest test/performance/temporal_memory -m performance -s
+
+The timing ratio is only asserted with ``AIECS_PERF_ASSERT=1``.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from aiecs.config.config import Settings
+from aiecs.infrastructure.temporal_memory.postgres import store as store_mod
+from aiecs.infrastructure.temporal_memory.postgres.store import PostgresTemporalMemoryStore
+
+_BENCH_URL = os.environ.get("TM_POSTGRES_BENCH_URL", "").strip()
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.slow,
+    pytest.mark.skipif(not _BENCH_URL, reason="Set TM_POSTGRES_BENCH_URL to run the Postgres search benchmark"),
+]
+
+FACTS = int(os.environ.get("TM_POSTGRES_BENCH_FACTS", "1000000"))
+GROUP_COUNTS = (1, 10, 100)
+REPEATS = 20
+
+_WORDS = [f"w{i:04d}" for i in range(5_000)]
+_NEEDLE = "zebracorn"
+
+
+def _fact_rows(group_count: int):
+    rng = random.Random(20)
+    now = datetime.now(timezone.utc)
+    for i in range(FACTS):
+        words = rng.choices(_WORDS, k=12)
+        if i % 10_000 == 0:
+            words[rng.randrange(len(words))] = _NEEDLE
+        yield (
+            uuid.uuid4(),
+            f"g{i % group_count}",
+            " ".join(words),
+            now,
+            None,
+            None,
+            None,
+            "{}",
+        )
+
+
+async def _timed(conn, sql: str, *args) -> float:
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        await conn.fetch(sql, *args)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("group_count", GROUP_COUNTS)
+async def test_fulltext_vs_ilike(group_count: int, check_speedup) -> None:
+    asyncpg = pytest.importorskip("asyncpg")
+    schema = f"tm_bench_{uuid.uuid4().hex[:8]}"
+    conn = await asyncpg.connect(_BENCH_URL)
+    try:
+        await conn.execute(f"CREATE SCHEMA {schema}")
+        await conn.execute(f"SET search_path TO {schema}, public")
+        store = PostgresTemporalMemoryStore(settings=Settings(TM_POSTGRES_URL=_BENCH_URL))
+        await store._ensure_tables(conn)
+
+        await conn.copy_records_to_table(
+            "tm_fact",
+            records=_fact_rows(group_count),
+            columns=[
+                "fact_id",
+                "group_id",
+                "text",
+                "valid_at",
+                "invalid_at",
+                "confidence",
+                "source_episode_id",
+                "metadata",
+            ],
+        )
+        await store._backfill_text_tsv(conn)
+        await conn.execute("ANALYZE tm_fact")
+
+        group_ids = ["g0"]
+        as_of = datetime.now(timezone.utc)
+        pattern = f"%{_NEEDLE}%"
+        ilike_s = await _timed(conn, store_mod._SEARCH_ILIKE_SQL, group_ids, pattern, as_of, 10)
+        fulltext_s = await _timed(
+            conn,
+            store_mod._SEARCH_FULLTEXT_SQL,
+            group_ids,
+            _NEEDLE,
+            as_of,
+            10,
+            store._text_search_config,
+            pattern,
+        )
+    finally:
+        await conn.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        await conn.close()
+
+    print(
+        f"\n{FACTS} facts / {group_count} groups: ILIKE {ilike_s * 1000:.1f}ms, "
+        f"full-text {fulltext_s * 1000:.1f}ms, {ilike_s / fulltext_s:.1f}x"
+    )
+    check_speedup(f"full-text search ({group_count} groups)", ilike_s, fulltext_s, min_speedup=2.0)
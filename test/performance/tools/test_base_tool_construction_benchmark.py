@@ -0,0 +1,69 @@
+"""
+BaseTool construction cost with per-class schema and introspection caching.
+
+Constructs ``INSTANCES`` instances of a tool with ``METHODS`` public methods,
+once with the per-class cache cleared before every construction (the previous
+behaviour: schemas generated with pydantic ``create_model`` per instance) and
+once with the cache warm.
+
+Run with ``pytest test/performance/tools -m performance -s`` (timing ratios are
+only asserted with ``AIECS_PERF_ASSERT=1``).
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from aiecs.tools.base_tool import BaseTool, clear_tool_class_cache
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+INSTANCES = 1_000
+METHODS = 20
+
+
+def _make_tool_class() -> type:
+    def make_method(i: int):
+        def method(self, query: str, limit: int = 10, verbose: bool = False) -> str:
+            """
+            Synthetic operation.
+
+            Args:
+                query: Search query
+                limit: Maximum number of results
+                verbose: Include details
+            """
+            return query
+
+        method.__name__ = f"operation_{i}"
+        return method
+
+    namespace = {f"operation_{i}": make_method(i) for i in range(METHODS)}
+    return type("BenchmarkTool", (BaseTool,), namespace)
+
+
+def _construct(tool_class: type, clear_each: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(INSTANCES):
+        if clear_each:
+            clear_tool_class_cache()
+        tool_class(config={})
+    return time.perf_counter() - start
+
+
+def test_construct_1000_instances(check_speedup):
+    tool_class = _make_tool_class()
+
+    uncached_s = _construct(tool_class, clear_each=True)
+    clear_tool_class_cache()
+    cached_s = _construct(tool_class, clear_each=False)
+    clear_tool_class_cache()
+
+    print(
+        f"\n{INSTANCES} x {METHODS}-method tool: uncached {uncached_s * 1000:.0f}ms "
+        f"({uncached_s / INSTANCES * 1e6:.0f}us/instance), cached {cached_s * 1000:.0f}ms "
+        f"({cached_s / INSTANCES * 1e6:.0f}us/instance), {uncached_s / cached_s:.1f}x"
+    )
+    check_speedup("BaseTool construction", uncached_s, cached_s, min_speedup=4.0)
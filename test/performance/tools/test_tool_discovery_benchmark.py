@@ -0,0 +1,87 @@
+"""
+Tool placeholder discovery startup cost: prebuilt manifest vs. source scanning.
+
+Builds a synthetic tool tree (``TOOL_FILES`` modules of realistic size) and
+times ``discover_tools_from_manifest`` with a fresh manifest (stat only) and
+without one (regex scan of every file, the previous behaviour).
+
+Run with ``pytest test/performance/tools -m performance -s`` (timing ratios are
+only asserted with ``AIECS_PERF_ASSERT=1``).
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from aiecs.tools.tool_manifest import build_manifest, discover_tools_from_manifest, write_manifest
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+TOOL_FILES = 60
+ROUNDS = 20
+TOOL_DIRS = (("task_tools", "task"),)
+
+_METHOD = '''
+    def operation_{i}(self, value: str) -> str:
+        """
+        Operation {i}.
+
+        Args:
+            value: Input value
+
+        Returns:
+            Processed value
+        """
+        return value.strip() + "{i}"
+'''
+
+
+def _tool_source(index: int) -> str:
+    methods = "".join(_METHOD.format(i=i) for i in range(40))
+    return (
+        "from aiecs.tools import register_tool\n"
+        "from aiecs.tools.base_tool import BaseTool\n\n\n"
+        f'@register_tool("tool_{index}")\n'
+        f"class Tool{index}(BaseTool):\n"
+        f'    """Synthetic tool {index} for the discovery benchmark."""\n'
+        f"{methods}"
+    )
+
+
+@pytest.fixture(scope="module")
+def tool_tree(tmp_path_factory):
+    root = tmp_path_factory.mktemp("tools")
+    pkg = root / "task_tools"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text('"""Synthetic task tools."""\n')
+    for index in range(TOOL_FILES):
+        (pkg / f"tool_{index}.py").write_text(_tool_source(index))
+    manifest_path = str(root / "tool_manifest.json")
+    write_manifest(build_manifest(str(root), TOOL_DIRS, record_stats=True), manifest_path)
+    return str(root), manifest_path
+
+
+def _best_of(fn) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_manifest_discovery_faster_than_scanning(tool_tree, check_speedup):
+    tools_dir, manifest_path = tool_tree
+
+    scanned = discover_tools_from_manifest(tools_dir, TOOL_DIRS, None)
+    cached = discover_tools_from_manifest(tools_dir, TOOL_DIRS, manifest_path)
+    assert sorted(cached) == sorted(scanned)
+    assert len(cached) == TOOL_FILES
+
+    scan_s = _best_of(lambda: discover_tools_from_manifest(tools_dir, TOOL_DIRS, None))
+    manifest_s = _best_of(lambda: discover_tools_from_manifest(tools_dir, TOOL_DIRS, manifest_path))
+
+    print(f"\n{TOOL_FILES} tool files: scan {scan_s * 1000:.2f}ms, manifest {manifest_s * 1000:.2f}ms " f"({scan_s / manifest_s:.1f}x)")
+    check_speedup("manifest discovery", scan_s, manifest_s, min_speedup=1.5)
@@ -0,0 +1,189 @@
+"""
+Unit tests for the DAWP compile cache (compile_cache.py, document_loader.compile_file / compile_cached).
+
+Covers:
+- Unchanged files are compiled once and served without re-reading
+- Edited files (new mtime/size) are recompiled; touched files with same content hit by digest
+- Limits and document-path policy partition entries
+- Inline documents cached by content digest; failures are never cached
+- Cached workflows are frozen
+- LRU bound and eviction counter
+- Hit/miss metrics recorded per source
+"""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from aiecs.domain.agent.plugins.dawp import document_loader
+from aiecs.domain.agent.plugins.dawp import metrics as metrics_mod
+from aiecs.domain.agent.plugins.dawp.compile_cache import (
+    DawpCompileCache,
+    get_compile_cache,
+    reset_compile_cache_for_tests,
+)
+from aiecs.domain.agent.plugins.dawp.document_loader import compile_cached, compile_file
+from aiecs.domain.agent.plugins.dawp.document_path_policy import document_path_policy_key
+from aiecs.domain.agent.plugins.dawp.schema import DawpDocumentError
+
+_DOC = """\
+---
+name: {name}
+placement: pre_main_loop
+---
+
+## Contract
+
+### Action
+
+Do work.
+
+### Prompt Completion Marker: `<STEP_DONE>`
+
+### DAWP Completion Marker: `<DAWP_HANDOFF>`
+
+## Prompt
+
+<Prompt 0>
+### First step
+
+Do something.
+</Prompt 0>
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    reset_compile_cache_for_tests()
+    metrics_mod.reset_dawp_metrics_for_tests()
+    yield
+    reset_compile_cache_for_tests()
+    metrics_mod.reset_dawp_metrics_for_tests()
+
+
+@pytest.fixture
+def doc_path(tmp_path):
+    path = tmp_path / "wf.dawp.md"
+    path.write_text(_DOC.format(name="cached-wf"), encoding="utf-8")
+    return path
+
+
+def _count_compiles():
+    return patch.object(document_loader, "compile", wraps=document_loader.compile)
+
+
+class TestCompileFileCache:
+    def test_unchanged_file_compiled_once(self, doc_path):
+        with _count_compiles() as spy:
+            first = compile_file(doc_path)
+            second = compile_file(str(doc_path))
+
+        assert spy.call_count == 1
+        assert second is first
+        assert get_compile_cache().stats()["hits"] == 1
+
+    def test_unchanged_file_not_reread(self, doc_path):
+        compile_file(doc_path)
+        with patch.object(type(doc_path), "read_text", side_effect=AssertionError("re-read")):
+            assert compile_file(doc_path).metadata.name == "cached-wf"
+
+    def test_edited_file_recompiled(self, doc_path):
+        first = compile_file(doc_path)
+        doc_path.write_text(_DOC.format(name="edited-wf-name"), encoding="utf-8")
+
+        second = compile_file(doc_path)
+
+        assert first.metadata.name == "cached-wf"
+        assert second.metadata.name == "edited-wf-name"
+
+    def test_touched_file_with_same_content_hits(self, doc_path):
+        first = compile_file(doc_path)
+        st = doc_path.stat()
+        os.utime(doc_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        with _count_compiles() as spy:
+            assert compile_file(doc_path) is first
+        assert spy.call_count == 0
+
+    def test_limits_and_policy_partition_entries(self, doc_path):
+        plain = compile_file(doc_path)
+        limited = compile_file(doc_path, dynamic_workflow_limits={"max_iterations_per_prompt": 2})
+        other_policy = compile_file(doc_path, policy_key=document_path_policy_key({"dawp.allowed_document_roots": ["/srv"]}))
+
+        assert plain.steps[0].max_iterations is None
+        assert limited.steps[0].max_iterations == 2
+        assert other_policy is not plain
+        assert get_compile_cache().stats()["entries"] == 3
+
+    def test_use_cache_false_always_compiles(self, doc_path):
+        with _count_compiles() as spy:
+            compile_file(doc_path, use_cache=False)
+            compile_file(doc_path, use_cache=False)
+        assert spy.call_count == 2
+        assert get_compile_cache().stats()["entries"] == 0
+
+
+class TestInlineCache:
+    def test_inline_cached_by_digest(self):
+        source = _DOC.format(name="inline-wf")
+        with _count_compiles() as spy:
+            first = compile_cached(source, dynamic_workflow_limits={"max_prompts": 4})
+            second = compile_cached(source, dynamic_workflow_limits={"max_prompts": 4})
+            compile_cached(source + "\n")
+        assert second is first
+        assert spy.call_count == 2
+
+    def test_failures_not_cached(self):
+        with _count_compiles() as spy:
+            for _ in range(2):
+                with pytest.raises(DawpDocumentError):
+                    compile_cached("no front matter")
+        assert spy.call_count == 2
+        assert get_compile_cache().stats()["entries"] == 0
+
+
+class TestImmutability:
+    def test_cached_workflow_is_frozen(self, doc_path):
+        workflow = compile_file(doc_path)
+        with pytest.raises(ValidationError):
+            workflow.steps[0].max_iterations = 1
+        with pytest.raises(ValidationError):
+            workflow.metadata.name = "other"
+
+    def test_dynamic_limits_do_not_touch_shared_entry(self, doc_path):
+        shared = compile_file(doc_path)
+        compile_file(doc_path, dynamic_workflow_limits={"max_iterations_per_prompt": 1})
+        assert shared.steps[0].max_iterations is None
+
+
+class TestBoundsAndMetrics:
+    def test_lru_eviction(self):
+        cache = DawpCompileCache(max_entries=2)
+        workflow = compile_cached(_DOC.format(name="lru-wf"))
+        cache.put("a", workflow)
+        cache.put("b", workflow)
+        assert cache.get("a", source="inline") is workflow
+        cache.put("c", workflow)
+
+        assert cache.get("b", source="inline") is None
+        assert cache.get("a", source="inline") is workflow
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["entries"] == 2
+
+    def test_metrics_record_hits_and_misses(self, doc_path):
+        recorded = []
+        metrics = metrics_mod.get_dawp_metrics()
+        with patch.object(metrics, "record_compile_cache", side_effect=lambda **kw: recorded.append(kw)):
+            compile_file(doc_path)
+            compile_file(doc_path)
+            compile_cached(_DOC.format(name="inline-wf"))
+
+        assert recorded == [
+            {"source": "file", "hit": False},
+            {"source": "file", "hit": True},
+            {"source": "inline", "hit": False},
+        ]
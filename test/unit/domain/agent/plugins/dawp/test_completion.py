@@ -14,12 +14,16 @@ Additional coverage:
 - marker_detected: whole-line exact match only
 - prompt_step_complete: all branches of the state machine
 - matches_response_trigger: trigger_once guard, re-trigger prevention
+- MarkerMatcher / IncrementalMarkerScanner: same hits as the per-token scan at every checkpoint
 """
 
 import pytest
 
 from aiecs.domain.agent.plugins.dawp.completion import (
+    IncrementalMarkerScanner,
+    MarkerMatcher,
     _visible_assistant_text,
+    get_marker_matcher,
     iter_scannable_lines,
     marker_detected,
     matches_response_trigger,
@@ -460,3 +464,79 @@ class TestMatchesResponseTrigger:
         state: dict = {}
         matches_response_trigger("nothing here", "<START_WF>", trigger_once=True, plugin_state=state)
         assert "dawp.triggered.<START_WF>" not in state
+
+
+# ---------------------------------------------------------------------------
+# MarkerMatcher / IncrementalMarkerScanner
+# ---------------------------------------------------------------------------
+
+_TOKENS = ("<STEP_DONE>", "<DAWP_HANDOFF>", "<START_A>", "<START_B>")
+
+_STREAMED_TEXT = (
+    "Working on it.\n"
+    "<thinking>maybe emit\n<STEP_DONE>\nnot yet</thinking>\n"
+    "```\n<START_A>\n```\n"
+    "> <START_B>\n"
+    "  <START_B>  \n"
+    "part<thinking>x</thinking>ial\n"
+    "<THINKING>\n<DAWP_HANDOFF>\n"
+    "still thinking</thinking>\n"
+    "<STEP_DONE>\r\n"
+    "<START_A> trailing\n"
+    "<thinking>unclosed\n<DAWP_HANDOFF>\n"
+)
+
+
+def _reference(text: str) -> set[str]:
+    visible = _visible_assistant_text(text)
+    return {token for token in _TOKENS if marker_detected(visible, token)}
+
+
+@pytest.mark.unit
+class TestMarkerMatcher:
+    def test_single_pass_matches_per_token_scan(self):
+        matcher = get_marker_matcher(_TOKENS)
+        for end in range(len(_STREAMED_TEXT) + 1):
+            assert matcher.scan(_STREAMED_TEXT[:end]) == _reference(_STREAMED_TEXT[:end])
+
+    def test_matcher_shared_per_token_set(self):
+        assert get_marker_matcher(["<A>", "<B>"]) is get_marker_matcher(("<B>", "<A>"))
+
+
+@pytest.mark.unit
+class TestIncrementalMarkerScanner:
+    @pytest.mark.parametrize("step", [1, 3, 7, 40])
+    def test_incremental_matches_full_scan_at_every_checkpoint(self, step):
+        scanner = IncrementalMarkerScanner(get_marker_matcher(_TOKENS))
+        for end in list(range(0, len(_STREAMED_TEXT), step)) + [len(_STREAMED_TEXT)]:
+            assert scanner.feed(_STREAMED_TEXT[:end]) == _reference(_STREAMED_TEXT[:end]), end
+
+    def test_unclosed_thinking_is_provisional(self):
+        scanner = IncrementalMarkerScanner(get_marker_matcher(_TOKENS))
+        assert scanner.feed("ok\n<thinking>\n<STEP_DONE>\n") == {"<STEP_DONE>"}
+        assert scanner.feed("ok\n<thinking>\n<STEP_DONE>\n</thinking>\n") == set()
+
+    def test_only_new_text_is_scanned(self):
+        scanned: list[str] = []
+
+        class RecordingMatcher(MarkerMatcher):
+            __slots__ = ()
+
+            def match_lines(self, visible_text, fence_state=None):
+                scanned.append(visible_text)
+                return super().match_lines(visible_text, fence_state)
+
+        scanner = IncrementalMarkerScanner(RecordingMatcher(_TOKENS))
+        text = "line\n" * 1000
+        scanner.feed(text)
+        assert scanner.offset == len(text)
+        scanned.clear()
+
+        assert scanner.feed(text + "<DAWP_HANDOFF>\n") == {"<DAWP_HANDOFF>"}
+        assert sum(len(chunk) for chunk in scanned) == len("<DAWP_HANDOFF>\n")
+
+    def test_new_response_resets(self):
+        scanner = IncrementalMarkerScanner(get_marker_matcher(_TOKENS))
+        assert scanner.feed("<STEP_DONE>\nmore\n") == {"<STEP_DONE>"}
+        assert scanner.feed("different response\n") == set()
+        assert scanner.offset == len("different response\n")
@@ -302,7 +302,7 @@ class TestDrainPendingDawpRuns:
         from aiecs.domain.agent.plugins.dawp.schema import DawpAbortMainError
 
         wf = _workflow(name="handoff-wf")
-        wf.steps[0].max_iterations = 1
+        wf = wf.model_copy(update={"steps": [wf.steps[0].model_copy(update={"max_iterations": 1}), *wf.steps[1:]]})
         agent, plugin_ctx = await _make_agent([{"content": "no marker"}])
         budget = TaskIterationBudget(limit=5)
         plugin_ctx.plugin_state["dawp.workflow"] = wf
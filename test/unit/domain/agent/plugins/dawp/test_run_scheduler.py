@@ -339,6 +339,24 @@ class TestMultipleActivations:
         assert runs[0].workflow_id == "wf-a"
         assert runs[1].workflow_id == "wf-b"
 
+    def test_triggers_scanned_once_per_checkpoint(self) -> None:
+        """All triggers share one scanner; growing text is only scanned past the last line."""
+        state = _plugin_state()
+        pairs = [
+            _response_trigger_activation(trigger=_TRIGGER, trigger_once=True, workflow_id="wf-a"),
+            _response_trigger_activation(trigger=_TRIGGER2, trigger_once=True, workflow_id="wf-b"),
+        ]
+        text = "Working.\n"
+        assert schedule_at_checkpoint(pairs, phase="on_iteration_end", plugin_state=state, assistant_text=text) == []
+        scanner = state["dawp._trigger_scanner"]
+        assert scanner.offset == len(text)
+
+        text += f"{_TRIGGER2}\n"
+        runs = schedule_at_checkpoint(pairs, phase="on_iteration_end", plugin_state=state, assistant_text=text)
+        assert [r.workflow_id for r in runs] == ["wf-b"]
+        assert state["dawp._trigger_scanner"] is scanner
+        assert scanner.offset == len(text)
+
     def test_fifo_order_in_pending_queue(self) -> None:
         """Runs are appended in workflow_activations order."""
         state = _plugin_state()
@@ -0,0 +1,239 @@
+"""
+Unit tests for SkillIndex and index-backed SkillMatcher candidate selection.
+"""
+
+import random
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from aiecs.domain.agent.skills.index import SkillIndex, extract_keywords, extract_trigger_phrases, length_window
+from aiecs.domain.agent.skills.matcher import SkillMatcher
+from aiecs.domain.agent.skills.models import SkillDefinition, SkillMetadata
+from aiecs.domain.agent.skills.registry import SkillRegistry
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    """Reset registry before and after each test."""
+    SkillRegistry.reset_instance()
+    yield
+    SkillRegistry.reset_instance()
+
+
+def _skill(name: str, description: str, tags=None) -> SkillDefinition:
+    return SkillDefinition(
+        metadata=SkillMetadata(name=name, description=description, version="1.0.0", tags=tags),
+        skill_path=Path(f"/path/to/{name}"),
+    )
+
+
+def _legacy_score(skill: SkillDefinition, request: str) -> float:
+    """Scoring as implemented before the index: every trigger fuzzy-matched with SequenceMatcher."""
+
+    def fuzzy(s1: str, s2: str) -> float:
+        return SequenceMatcher(None, s1.lower(), s2.lower()).ratio()
+
+    request_lower = request.lower()
+    request_keywords = extract_keywords(request)
+    triggers = extract_trigger_phrases(skill.metadata.description)
+    skill_keywords = extract_keywords(skill.metadata.description)
+    skill_keywords.update(tag.lower() for tag in skill.metadata.tags or [])
+
+    best, matched = 0.0, 0
+    for trigger in triggers:
+        if trigger in request_lower:
+            best, matched = max(best, 1.0), matched + 1
+        else:
+            score = fuzzy(trigger, request_lower)
+            if score > 0.6:
+                best, matched = max(best, score * 0.7), matched + 1
+    trigger_score = min(best + min(0.05 * (matched - 1), 0.15), 1.0) if matched > 1 else best
+
+    keyword_score = 0.0
+    common = request_keywords & skill_keywords
+    if common and request_keywords:
+        keyword_score = min((len(common) / len(request_keywords) + min(len(common) * 0.1, 0.3)) * 0.5, 0.5)
+
+    tag_score = 0.0
+    tag_matches = [tag for tag in skill.metadata.tags or [] if tag.lower() in request_lower]
+    if tag_matches:
+        tag_score = (0.7 + min(len(tag_matches) * 0.1, 0.3)) * 0.4
+
+    if trigger_score > 0:
+        final = trigger_score * 0.6 + keyword_score * 0.25 + tag_score * 0.15
+    elif keyword_score > 0 or tag_score > 0:
+        final = keyword_score * 0.7 + tag_score * 0.5
+    else:
+        final = fuzzy(skill.metadata.description, request) * 0.4
+    return min(max(final, 0.0), 1.0)
+
+
+def _legacy_match(skills: List[SkillDefinition], request: str, threshold: float, max_results: int) -> List[Tuple[str, float]]:
+    scored = [(skill.metadata.name, _legacy_score(skill, request)) for skill in skills]
+    results = [item for item in scored if item[1] >= threshold]
+    results.sort(key=lambda item: item[1], reverse=True)
+    return results[:max_results]
+
+
+WORDS = [
+    "python", "tests", "pytest", "review", "code", "database", "sql", "migrations", "deploy", "docker",
+    "kubernetes", "write", "create", "analyze", "quality", "data", "model", "api", "docs", "refactor",
+    "lint", "debug", "profile", "cache", "queue", "stream", "report", "chart", "email", "schedule",
+]
+
+
+def _random_corpus(rng: random.Random, count: int) -> List[SkillDefinition]:
+    skills = []
+    for i in range(count):
+        triggers = [" ".join(rng.sample(WORDS, rng.randint(1, 3))) for _ in range(rng.randint(0, 4))]
+        filler = " ".join(rng.sample(WORDS, rng.randint(2, 8)))
+        quoted = ", ".join(f'"{t}"' if rng.random() < 0.7 else f"'{t}'" for t in triggers)
+        description = f"Use this skill when the user asks to {quoted} about {filler}." if triggers else f"General helper for {filler}."
+        tags = rng.sample(WORDS, rng.randint(0, 3)) or None
+        skills.append(_skill(f"skill-{i}", description, tags))
+    return skills
+
+
+def _random_requests(rng: random.Random, skills: List[SkillDefinition], count: int) -> List[str]:
+    requests = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.3:
+            requests.append(" ".join(rng.sample(WORDS, rng.randint(1, 6))))
+        elif kind < 0.6:
+            # Near-miss of a trigger phrase: drop or swap a character
+            triggers = extract_trigger_phrases(rng.choice(skills).metadata.description) or ["write tests"]
+            trigger = list(rng.choice(triggers))
+            trigger[rng.randrange(len(trigger))] = rng.choice("abcdexyz ")
+            requests.append("".join(trigger))
+        elif kind < 0.8:
+            # Close to a whole description, exercising the similarity fallback
+            description = rng.choice(skills).metadata.description
+            requests.append(description.replace("the", "a").upper())
+        else:
+            requests.append("unrelated cooking recipe for dinner tonight " * rng.randint(1, 3))
+    return requests
+
+
+class TestSkillIndex:
+    """Tests for index maintenance."""
+
+    def test_register_and_unregister_update_index(self):
+        registry = SkillRegistry.get_instance()
+        skill = _skill("python-testing", 'Use when asked to "write tests" or "pytest".', tags=["Python", "qa"])
+        registry.register_skill(skill)
+
+        index = registry.get_index()
+        assert "python-testing" in index
+        entry = index.get("python-testing")
+        assert entry.triggers == ("write tests", "pytest")
+        assert "python" in entry.keywords
+        assert index.keyword_matches({"python"}) == {"python-testing"}
+        assert index.phrase_matches("please write tests now") == {"python-testing"}
+        assert index.phrase_matches("qa pass") == {"python-testing"}  # short tag, substring match
+
+        registry.unregister_skill("python-testing")
+        assert "python-testing" not in index
+        assert index.keyword_matches({"python"}) == set()
+        assert index.phrase_matches("please write tests now") == set()
+        assert index._phrase_grams == {}
+        assert index._short_phrases == set()
+        assert index._trigger_lengths == {}
+
+    def test_shared_phrases_survive_partial_removal(self):
+        index = SkillIndex()
+        index.add(_skill("first", 'Use for "code review".', tags=["review"]))
+        index.add(_skill("second", 'Use for "code review" too.', tags=["review"]))
+
+        index.remove("first")
+        assert index.phrase_matches("a code review please") == {"second"}
+        assert index.keyword_matches({"review"}) == {"second"}
+
+    def test_clear_empties_index(self):
+        registry = SkillRegistry.get_instance()
+        registry.register_skill(_skill("one", 'Use for "one thing".'))
+        registry.clear()
+        assert len(registry.get_index()) == 0
+
+    def test_get_entries_keeps_registration_order(self):
+        index = SkillIndex()
+        for name in ("zeta", "alpha", "mid"):
+            index.add(_skill(name, "desc"))
+        assert [e.name for e in index.get_entries({"mid", "alpha", "zeta", "missing"})] == ["zeta", "alpha", "mid"]
+
+    @pytest.mark.parametrize("length,cutoff", [(10, 0.6), (37, 0.75), (1, 0.5), (200, 0.99)])
+    def test_length_window_contains_every_reachable_length(self, length, cutoff):
+        low, high = length_window(length, cutoff)
+        for other in range(0, 1000):
+            bound = 2 * min(length, other) / (length + other) if length + other else 0
+            if bound >= cutoff:
+                assert low <= other <= high
+
+    def test_length_window_unreachable_cutoff(self):
+        assert length_window(10, 1.5) is None
+        assert length_window(10, 0.0) == (0, float("inf"))
+
+
+class TestIndexedMatching:
+    """Index-backed matching must return exactly what a full scan returns."""
+
+    @pytest.mark.parametrize("seed", range(3))
+    @pytest.mark.parametrize("threshold", [0.0, 0.1, 0.3, 0.5])
+    def test_matches_legacy_full_scan(self, seed, threshold):
+        rng = random.Random(seed)
+        skills = _random_corpus(rng, 40)
+        registry = SkillRegistry.get_instance()
+        for skill in skills:
+            registry.register_skill(skill)
+        matcher = SkillMatcher(registry, default_max_results=10)
+
+        for request in _random_requests(rng, skills, 25):
+            expected = _legacy_match(skills, request, threshold, 10)
+            actual = [(skill.metadata.name, score) for skill, score in matcher.match(request, threshold=threshold)]
+            assert actual == expected, request
+            # Explicit skill lists take the full-scan path and agree too
+            explicit = [(skill.metadata.name, score) for skill, score in matcher.match(request, threshold=threshold, skills=skills)]
+            assert explicit == expected, request
+
+    def test_non_candidates_are_not_scored(self, monkeypatch):
+        registry = SkillRegistry.get_instance()
+        for i in range(50):
+            registry.register_skill(_skill(f"filler-{i}", f'Use for "filler task {i}" and other padding text. ' + "Lorem ipsum dolor sit amet. " * 5, tags=["filler"]))
+        registry.register_skill(_skill("python-testing", 'Use when asked to "write tests".', tags=["pytest"]))
+
+        scored = []
+        original = SkillMatcher._score_entry
+
+        def spy(self, entry, *args, **kwargs):
+            scored.append(entry.name)
+            return original(self, entry, *args, **kwargs)
+
+        monkeypatch.setattr(SkillMatcher, "_score_entry", spy)
+        matches = SkillMatcher(registry).match("please write tests for the parser module in this repository")
+
+        assert [skill.metadata.name for skill, _ in matches] == ["python-testing"]
+        assert scored == ["python-testing"]
+
+    def test_unregistered_skill_is_no_longer_matched(self):
+        registry = SkillRegistry.get_instance()
+        registry.register_skill(_skill("python-testing", 'Use when asked to "write tests".'))
+        matcher = SkillMatcher(registry)
+        assert matcher.match("write tests")
+
+        registry.unregister_skill("python-testing")
+        registry.register_skill(_skill("python-testing", 'Use when asked to "run benchmarks".'))
+        assert matcher.match("write tests") == []
+        assert [s.metadata.name for s, _ in matcher.match("run benchmarks")] == ["python-testing"]
+
+    def test_subclass_with_custom_extraction_scans_registry(self):
+        class CustomMatcher(SkillMatcher):
+            def extract_keywords(self, text):
+                return {"special"} if "special" in text.lower() else set()
+
+        registry = SkillRegistry.get_instance()
+        registry.register_skill(_skill("special-skill", "Handles special requests.", tags=None))
+        matches = CustomMatcher(registry, default_threshold=0.1).match("something special")
+        assert [s.metadata.name for s, _ in matches] == ["special-skill"]
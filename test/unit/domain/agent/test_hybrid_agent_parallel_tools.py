@@ -0,0 +1,177 @@
+"""Concurrent tool batch execution in HybridAgent._process_tool_calls_batch."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from aiecs.domain.agent import AgentConfiguration, HybridAgent
+from aiecs.domain.agent.tool_loop_core import ToolLoopRunState
+from aiecs.llm import LLMMessage
+
+
+class _RecordingTool:
+    """
+    Tool stub recording concurrency; ``delay`` maps query -> sleep seconds.
+
+    ``events``, when given, receives ``("start", query)`` / ``("finish", query)``
+    so ordering can be checked across tools.
+    """
+
+    parallel_safe = True
+
+    def __init__(self, delays: Dict[str, float], events: Optional[List[Tuple[str, str]]] = None):
+        self.delays = delays
+        self.events = events if events is not None else []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started: List[str] = []
+
+    async def run_async(self, operation=None, **kwargs):
+        query = kwargs.get("q", "")
+        self.started.append(query)
+        self.events.append(("start", query))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(query, 0.01))
+        finally:
+            self.in_flight -= 1
+            self.events.append(("finish", query))
+        return {"query": query}
+
+
+class _SerialTool(_RecordingTool):
+    parallel_safe = False
+
+
+def _agent(tools: Dict[str, Any], **config_overrides) -> HybridAgent:
+    defaults = {"llm_model": "m", "parallel_tool_calls": True}
+    defaults.update(config_overrides)
+    agent = HybridAgent(
+        agent_id="parallel-tools",
+        name="Parallel Tools",
+        config=AgentConfiguration(**defaults),
+        llm_client=MagicMock(),
+        tools=[],
+    )
+    agent._available_tools = list(tools)
+    agent._tool_instances = dict(tools)
+    return agent
+
+
+def _call(index: int, tool: str, query: str) -> Dict[str, Any]:
+    return {
+        "id": f"call_{index}",
+        "type": "function",
+        "function": {"name": f"{tool}_search", "arguments": json.dumps({"q": query})},
+    }
+
+
+async def _run_batch(agent: HybridAgent, calls: List[Dict[str, Any]]):
+    messages: List[LLMMessage] = []
+    events: List[Dict[str, Any]] = []
+    state = ToolLoopRunState()
+
+    async def _collect(event: Dict[str, Any]) -> None:
+        events.append(event)
+
+    outcome = await agent._process_tool_calls_batch(
+        thought_raw="",
+        tool_calls_to_process=calls,
+        messages=messages,
+        iteration=0,
+        state=state,
+        event_callback=_collect,
+    )
+    return outcome, messages, events, state
+
+
+@pytest.mark.asyncio
+async def test_parallel_safe_calls_run_concurrently_and_keep_order() -> None:
+    tool = _RecordingTool({"a": 0.15, "b": 0.05, "c": 0.01})
+    agent = _agent({"web": tool})
+    calls = [_call(0, "web", "a"), _call(1, "web", "b"), _call(2, "web", "c")]
+
+    outcome, messages, events, state = await _run_batch(agent, calls)
+
+    assert outcome.kind == "continue"
+    assert tool.max_in_flight == 3
+    tool_messages = [m for m in messages if m.role == "tool"]
+    assert [m.tool_call_id for m in tool_messages] == ["call_0", "call_1", "call_2"]
+    assert [step["parameters"]["q"] for step in state.steps] == ["a", "b", "c"]
+    results = [e["result"]["query"] for e in events if e["type"] == "tool_result"]
+    assert results == ["a", "b", "c"]
+    assert state.tool_calls_count == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_bounds_in_flight_calls() -> None:
+    tool = _RecordingTool({})
+    agent = _agent({"web": tool}, parallel_tool_calls_max_concurrency=2)
+    calls = [_call(i, "web", str(i)) for i in range(6)]
+
+    await _run_batch(agent, calls)
+
+    assert tool.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_non_parallel_safe_tool_is_a_barrier() -> None:
+    events: List[Tuple[str, str]] = []
+    reader = _RecordingTool({}, events)
+    writer = _SerialTool({"w1": 0.05}, events)
+    agent = _agent({"web": reader, "db": writer})
+    calls = [
+        _call(0, "web", "r1"),
+        _call(1, "web", "r2"),
+        _call(2, "db", "w1"),
+        _call(3, "web", "r3"),
+    ]
+
+    _, messages, _, _ = await _run_batch(agent, calls)
+
+    # r3 must not start before the serial write has finished.
+    assert events.index(("finish", "w1")) < events.index(("start", "r3"))
+    # ...and the write itself waits for the reads before it.
+    assert events.index(("start", "w1")) > max(events.index(("finish", "r1")), events.index(("finish", "r2")))
+    assert reader.started == ["r1", "r2", "r3"]
+    assert writer.started == ["w1"]
+    assert writer.max_in_flight == 1
+    assert [m.tool_call_id for m in messages if m.role == "tool"] == ["call_0", "call_1", "call_2", "call_3"]
+
+
+@pytest.mark.asyncio
+async def test_parallel_mode_disabled_runs_serially() -> None:
+    tool = _RecordingTool({})
+    agent = _agent({"web": tool}, parallel_tool_calls=False)
+
+    await _run_batch(agent, [_call(i, "web", str(i)) for i in range(3)])
+
+    assert tool.max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_config_parallel_safe_tools_opt_in_and_errors_stay_in_order() -> None:
+    class _Failing(_SerialTool):
+        async def run_async(self, operation=None, **kwargs):
+            if kwargs.get("q") == "boom":
+                raise RuntimeError("backend down")
+            return await super().run_async(operation, **kwargs)
+
+    tool = _Failing({})
+    agent = _agent({"web": tool}, parallel_safe_tools=["web"])
+    calls = [_call(0, "web", "ok1"), _call(1, "web", "boom"), _call(2, "web", "ok2")]
+
+    _, messages, events, state = await _run_batch(agent, calls)
+
+    assert tool.max_in_flight == 2
+    tool_messages = [m for m in messages if m.role == "tool"]
+    assert [m.tool_call_id for m in tool_messages] == ["call_0", "call_1", "call_2"]
+    assert "backend down" in tool_messages[1].content
+    assert [e["type"] for e in events if e["type"] in ("tool_result", "tool_error")] == ["tool_result", "tool_error", "tool_result"]
+    assert state.steps[1]["has_error"] is True
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -23,6 +24,7 @@ from aiecs.domain.community.collaborative_workflow import (
     REVIEW_REFINEMENT_PHASE_CONFIG,
     CollaborativeWorkflowEngine,
 )
+from aiecs.domain.community.exceptions import CommunityValidationError
 
 
 def _h1_goal() -> AgentGoal:
@@ -246,3 +248,147 @@ class TestCweVerifier:
         )
         assert built is not None
         assert built.engine is not None
+
+
+def _sleeping_spawn_verifier(delays: dict[str, float], active: list[int] | None = None):
+    async def spawn_verifier(review_task: dict) -> dict:
+        role = review_task["role"]
+        if active is not None:
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        try:
+            await asyncio.sleep(delays[role])
+        finally:
+            if active is not None:
+                active[0] -= 1
+        return {"passed": True, "kind": "PASS", "feedback": f"{role} ok"}
+
+    return spawn_verifier
+
+
+@pytest.mark.unit
+class TestReviewRefinementParallelSpawn:
+    @pytest.mark.asyncio
+    async def test_parallel_roles_overlap_and_report_wall_clock(self) -> None:
+        task, result = _task_and_result()
+
+        payload = await CollaborativeWorkflowEngine().review_refinement(
+            task=task,
+            result=result,
+            criteria=[],
+            spawn_verifier=_sleeping_spawn_verifier({"fact": 0.2, "style": 0.1}),
+            spawn="parallel",
+        )
+
+        phase = payload["phase"]
+        assert phase["spawn"] == "parallel"
+        assert [r["role"] for r in phase["roles_executed"]] == ["fact", "style"]
+        assert all(r["spawn"] == "parallel" and r["status"] == "completed" for r in phase["roles_executed"])
+        assert phase["role_time_ms"] >= 290
+        assert phase["wall_clock_ms"] < 280
+        assert [r["feedback"] for r in payload["role_reviews"]] == ["[fact] fact ok", "[style] style ok"]
+        assert payload["verdict"]["passed"] is True
+
+    @pytest.mark.asyncio
+    async def test_sequential_default_records_timing(self) -> None:
+        task, result = _task_and_result()
+
+        payload = await CollaborativeWorkflowEngine().review_refinement(
+            task=task,
+            result=result,
+            criteria=[],
+            spawn_verifier=_sleeping_spawn_verifier({"fact": 0.05, "style": 0.05}),
+        )
+
+        phase = payload["phase"]
+        assert phase["spawn"] == "sequential"
+        assert all(r["spawn"] == "sequential" for r in phase["roles_executed"])
+        assert phase["wall_clock_ms"] >= phase["role_time_ms"] - 1
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_bounds_parallel_roles(self) -> None:
+        task, result = _task_and_result()
+        active = [0, 0]
+
+        await CollaborativeWorkflowEngine().review_refinement(
+            task=task,
+            result=result,
+            criteria=[],
+            spawn_verifier=_sleeping_spawn_verifier({"fact": 0.02, "style": 0.02}, active),
+            spawn="parallel",
+            max_concurrency=1,
+        )
+
+        assert active[1] == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_role_recorded_as_inconclusive(self) -> None:
+        task, result = _task_and_result()
+        criteria = [AcceptanceCriterion(criterion_id="c1", description="alpha")]
+
+        payload = await CollaborativeWorkflowEngine().review_refinement(
+            task=task,
+            result=result,
+            criteria=criteria,
+            spawn_verifier=_sleeping_spawn_verifier({"fact": 0.01, "style": 5.0}),
+            spawn="parallel",
+            role_timeout_seconds=0.1,
+        )
+
+        statuses = {r["role"]: r["status"] for r in payload["phase"]["roles_executed"]}
+        assert statuses == {"fact": "completed", "style": "timeout"}
+        style = payload["role_reviews"][1]
+        assert style["kind"] == "PARTIAL" and style["passed"] is False
+        assert "inconclusive" in style["feedback"]
+        assert payload["verdict"]["passed"] is False
+        assert payload["verdict"]["kind"] == "PARTIAL"
+
+    @pytest.mark.asyncio
+    async def test_failed_role_recorded_as_inconclusive(self) -> None:
+        task, result = _task_and_result()
+
+        async def spawn_verifier(review_task: dict) -> dict:
+            if review_task["role"] == "fact":
+                raise RuntimeError("subagent crashed")
+            return {"passed": True, "kind": "PASS"}
+
+        payload = await CollaborativeWorkflowEngine().review_refinement(
+            task=task,
+            result=result,
+            criteria=[],
+            spawn_verifier=spawn_verifier,
+            spawn="parallel",
+        )
+
+        fact = payload["phase"]["roles_executed"][0]
+        assert fact["status"] == "error"
+        assert fact["error"] == "subagent crashed"
+        assert payload["role_reviews"][0]["kind"] == "PARTIAL"
+        assert payload["role_reviews"][1]["kind"] == "PASS"
+
+    @pytest.mark.asyncio
+    async def test_unknown_spawn_mode_rejected(self) -> None:
+        task, result = _task_and_result()
+        with pytest.raises(CommunityValidationError):
+            await CollaborativeWorkflowEngine().review_refinement(
+                task=task,
+                result=result,
+                criteria=[],
+                spawn_verifier=_sleeping_spawn_verifier({}),
+                spawn="fanout",  # type: ignore[arg-type]
+            )
+
+    @pytest.mark.asyncio
+    async def test_cwe_verifier_passes_spawn_policy_to_engine(self) -> None:
+        engine = MagicMock(spec=CollaborativeWorkflowEngine)
+        engine.review_refinement = AsyncMock(return_value={"verdict": {"passed": True, "kind": "PASS"}})
+        verifier = CweVerifier(
+            CweVerifierPolicy(enabled=True, spawn="parallel", max_concurrent_roles=2, role_timeout_seconds=30),
+            engine=engine,
+            spawn_verifier=_sleeping_spawn_verifier({}),
+        )
+
+        await verifier.verify(goal=_h1_goal(), result={"output": "x"}, criteria=[], context=_context())
+
+        kwargs = engine.review_refinement.await_args.kwargs
+        assert (kwargs["spawn"], kwargs["max_concurrency"], kwargs["role_timeout_seconds"]) == ("parallel", 2, 30)
@@ -4,12 +4,15 @@ Unit tests for verification_policy (A-2).
 
 from __future__ import annotations
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from aiecs.domain.agent.exceptions import VerificationExhausted
 from aiecs.domain.agent.verification.gates.registry import build_gate_registry_from_config
+from aiecs.domain.agent.verification.models import Verdict
 from aiecs.domain.agent.verification.policy_models import VerificationPolicy, WhenToVerify, resolve_verification_policy
 from aiecs.domain.agent.verification.policy_runner import (
     _VERIFIED_KEY,
@@ -441,3 +444,174 @@ class TestRunGvrPreExit:
         assert continued is False
         hook_handler.assert_awaited_once()
         assert len(messages) == 1
+
+
+class _TimedVerifier:
+    """Verifier stub that sleeps, tracks concurrency and returns a fixed verdict."""
+
+    running = 0
+    peak = 0
+
+    def __init__(self, kind: str, delay: float, passed: bool = True, verdict_kind: str = "PASS") -> None:
+        self.kind = kind
+        self.delay = delay
+        self.passed = passed
+        self.verdict_kind = verdict_kind
+        self.cancelled = False
+
+    async def verify(self, *, goal, result, criteria, context) -> Verdict:
+        type(self).running += 1
+        type(self).peak = max(type(self).peak, type(self).running)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        finally:
+            type(self).running -= 1
+        return Verdict(passed=self.passed, kind=self.verdict_kind, feedback=self.kind)
+
+
+async def _run_policy(verifiers: list[_TimedVerifier], plugin_state: dict, **policy_kwargs) -> Verdict:
+    policy = VerificationPolicy(
+        enabled=True,
+        registered_verifiers=[v.kind for v in verifiers],
+        max_refines_per_goal=5,
+        **policy_kwargs,
+    )
+    result = await run_verification_policy(
+        policy=policy,
+        agent_verifiers=verifiers,
+        messages=[LLMMessage(role="user", content="task")],
+        loop_result={"output": "draft"},
+        goal=None,
+        plugin_state=plugin_state,
+        trigger="on_task_completed",
+        iteration=0,
+    )
+    return result.verdict
+
+
+def _verifier_events(plugin_state: dict) -> dict[str, dict]:
+    return {e["verifier"]: e for e in plugin_state["gvr.verification_events"] if e.get("event") == "verifier_run"}
+
+
+@pytest.mark.unit
+class TestConcurrentVerifiers:
+    @pytest.fixture(autouse=True)
+    def _reset_counters(self):
+        _TimedVerifier.running = _TimedVerifier.peak = 0
+
+    @pytest.mark.asyncio
+    async def test_verifiers_run_concurrently_and_merge_in_registration_order(self) -> None:
+        verifiers = [_TimedVerifier("spec", 0.15), _TimedVerifier("peer", 0.1), _TimedVerifier("cwe", 0.05)]
+        plugin_state: dict = {}
+
+        start = time.perf_counter()
+        verdict = await _run_policy(verifiers, plugin_state)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.25
+        assert _TimedVerifier.peak == 3
+        assert verdict.passed is True
+        assert verdict.feedback == "spec peer cwe"
+        events = _verifier_events(plugin_state)
+        assert [e["index"] for e in events.values()] == [0, 1, 2]
+        assert all(e["status"] == "completed" for e in events.values())
+        assert events["spec"]["latency_ms"] >= 140
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self) -> None:
+        verifiers = [_TimedVerifier(kind, 0.01) for kind in ("spec", "peer", "cwe")]
+
+        await _run_policy(verifiers, {}, max_concurrent_verifiers=1)
+
+        assert _TimedVerifier.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancels_slow_verifier_with_partial_verdict(self) -> None:
+        slow = _TimedVerifier("peer", 5.0)
+        plugin_state: dict = {}
+
+        verdict = await _run_policy([_TimedVerifier("spec", 0.01), slow], plugin_state, verifier_timeout_seconds=0.1)
+
+        assert slow.cancelled is True
+        assert verdict.passed is False
+        assert verdict.kind == "PARTIAL"
+        assert "did not finish" in verdict.feedback
+        events = _verifier_events(plugin_state)
+        assert events["spec"]["status"] == "completed"
+        assert events["peer"]["status"] == "timeout"
+
+    @pytest.mark.asyncio
+    async def test_short_circuit_cancels_remaining_on_fail(self) -> None:
+        slow = _TimedVerifier("spec", 5.0)
+        failing = _TimedVerifier("peer", 0.01, passed=False, verdict_kind="FAIL")
+        plugin_state: dict = {}
+
+        start = time.perf_counter()
+        verdict = await _run_policy([slow, failing], plugin_state, short_circuit_on_failure=True)
+
+        assert time.perf_counter() - start < 1.0
+        assert slow.cancelled is True
+        assert verdict.kind == "FAIL"
+        assert verdict.feedback == "peer"
+        events = _verifier_events(plugin_state)
+        assert events["spec"]["status"] == "cancelled"
+        assert events["spec"]["passed"] is None
+
+    @pytest.mark.asyncio
+    async def test_partial_verdict_does_not_short_circuit(self) -> None:
+        verifiers = [_TimedVerifier("spec", 0.05), _TimedVerifier("peer", 0.01, passed=False, verdict_kind="PARTIAL")]
+
+        verdict = await _run_policy(verifiers, {}, short_circuit_on_failure=True)
+
+        assert verifiers[0].cancelled is False
+        assert verdict.feedback == "spec peer"
+
+    @pytest.mark.asyncio
+    async def test_non_blocking_policy_never_short_circuits(self) -> None:
+        slow = _TimedVerifier("spec", 0.05)
+        failing = _TimedVerifier("peer", 0.01, passed=False, verdict_kind="FAIL")
+
+        verdict = await _run_policy([slow, failing], {}, short_circuit_on_failure=True, blocking=False)
+
+        assert slow.cancelled is False
+        assert verdict.feedback == "spec peer"
+
+    @pytest.mark.asyncio
+    async def test_failed_gate_skips_verifiers_when_short_circuiting(self) -> None:
+        verifier = _TimedVerifier("spec", 0.01)
+        policy = VerificationPolicy(
+            enabled=True,
+            registered_verifiers=["spec_gate", "spec"],
+            short_circuit_on_failure=True,
+        )
+        plugin_state: dict = {}
+
+        result = await run_verification_policy(
+            policy=policy,
+            agent_verifiers=[verifier],
+            messages=[LLMMessage(role="user", content="task")],
+            loop_result={"output": "plain text without structure"},
+            goal=None,
+            plugin_state=plugin_state,
+            trigger="on_task_completed",
+            iteration=0,
+        )
+
+        assert result.verdict.passed is False
+        assert result.skipped_llm is True
+        assert _TimedVerifier.peak == 0
+        assert any(e.get("reason") == "gate_failed" for e in plugin_state["gvr.verification_events"])
+
+    @pytest.mark.asyncio
+    async def test_verifier_error_cancels_others_and_propagates(self) -> None:
+        class _Broken(_TimedVerifier):
+            async def verify(self, **kwargs) -> Verdict:
+                raise RuntimeError("llm down")
+
+        slow = _TimedVerifier("spec", 5.0)
+        with pytest.raises(RuntimeError, match="llm down"):
+            await _run_policy([slow, _Broken("peer", 0)], {})
+        assert slow.cancelled is True
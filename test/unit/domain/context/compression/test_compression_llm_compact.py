@@ -284,3 +284,105 @@ async def test_a5_integration_token_drop_and_single_summary() -> None:
     assert len(result.summary_messages) == 1
     assert len(client.calls) >= 2
     assert "coverage of older segments" in (result.summary_messages[0].content or "")
+
+
+class _ConcurrentLLMClient:
+    """Records concurrency and merge prompts; fails summarize calls containing *poison*."""
+
+    def __init__(self, poison: str | None = None, delay: float = 0.01) -> None:
+        self.poison = poison
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.merge_prompts: list[str] = []
+
+    async def generate_text(self, *, messages, max_tokens, system_prompt=""):
+        import asyncio
+
+        text = "\n".join(message.content or "" for message in messages)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if text.count("Merge the following section summaries"):
+            self.merge_prompts.append(text)
+            return _MockResponse(content="<summary>merged</summary>")
+        if self.poison and self.poison in text:
+            raise RuntimeError("summarizer unavailable")
+        return _MockResponse(content="<summary>chunk</summary>")
+
+
+def _chunked_messages(count: int, poison_index: int | None = None) -> list[LLMMessage]:
+    return [
+        LLMMessage(
+            role="user" if index % 2 == 0 else "assistant",
+            content=("poison " if index == poison_index else f"segment-{index} ") + ("word " * 200),
+        )
+        for index in range(count)
+    ] + [LLMMessage(role="user", content="recent")]
+
+
+@pytest.mark.asyncio
+async def test_chunk_summaries_run_concurrently_within_limit() -> None:
+    client = _ConcurrentLLMClient()
+
+    result = await compact_conversation(
+        _chunked_messages(8),
+        llm_client=client,
+        preserve_recent=1,
+        summary_chunk_size=500,
+        summary_max_concurrency=3,
+    )
+
+    assert client.max_in_flight == 3
+    assert len(client.merge_prompts) == 1
+    assert "merged" in (result.summary_messages[0].content or "")
+
+
+@pytest.mark.asyncio
+async def test_many_chunks_merge_as_tree_with_bounded_fan_in() -> None:
+    client = _ConcurrentLLMClient()
+
+    await compact_conversation(
+        _chunked_messages(10),
+        llm_client=client,
+        preserve_recent=1,
+        summary_chunk_size=500,
+        summary_merge_fan_in=3,
+    )
+
+    # 10 sections -> 4 -> 2 -> 1: three first-level merges, one second-level, one final.
+    assert len(client.merge_prompts) == 5
+    assert all(prompt.count("Section ") <= 3 for prompt in client.merge_prompts)
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_degrades_to_truncated_transcript() -> None:
+    client = _ConcurrentLLMClient(poison="poison")
+
+    result = await compact_conversation(
+        _chunked_messages(6, poison_index=2),
+        llm_client=client,
+        preserve_recent=1,
+        summary_chunk_size=500,
+    )
+
+    assert len(result.summary_messages) == 1
+    merge_prompt = client.merge_prompts[-1]
+    assert "Section summary unavailable" in merge_prompt
+    assert "poison" in merge_prompt
+
+
+@pytest.mark.asyncio
+async def test_all_chunks_failing_raises() -> None:
+    client = _ConcurrentLLMClient(poison="word")
+
+    with pytest.raises(RuntimeError, match="summarizer unavailable"):
+        await compact_conversation(
+            _chunked_messages(6),
+            llm_client=client,
+            preserve_recent=1,
+            summary_chunk_size=500,
+        )
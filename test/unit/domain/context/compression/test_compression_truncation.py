@@ -140,3 +140,132 @@ def test_compress_preserve_recent_keeps_tool_pairs() -> None:
             )
             for message in compressed
         )
+
+
+def _legacy_compress_preserve_recent(messages, *, max_tokens, priority_indices=None, preserve_system=True):
+    """Quadratic reference implementation the linear version must match."""
+    from aiecs.domain.context.compression.tokens import estimate_message_tokens
+
+    def expand(message_list, index):
+        indices = {index}
+        message = message_list[index]
+        if message.role == "tool" and message.tool_call_id:
+            for candidate_index, candidate in enumerate(message_list):
+                if candidate.role == "assistant" and candidate.tool_calls and any(str(tc.get("id")) == message.tool_call_id for tc in candidate.tool_calls):
+                    indices.add(candidate_index)
+        if message.role == "assistant" and message.tool_calls:
+            tool_ids = {str(tc.get("id")) for tc in message.tool_calls if tc.get("id")}
+            for candidate_index, candidate in enumerate(message_list):
+                if candidate.role == "tool" and candidate.tool_call_id in tool_ids:
+                    indices.add(candidate_index)
+        return indices
+
+    message_list = list(messages)
+    if estimate_message_tokens(message_list) <= max_tokens:
+        return message_list
+    priority_indices = priority_indices or set()
+    system_indices = {i for i, m in enumerate(message_list) if m.role == "system"} if preserve_system else set()
+    system_msgs = [message_list[i] for i in sorted(system_indices)]
+    keep_indices: set[int] = set()
+    budget = max_tokens - estimate_message_tokens(system_msgs)
+    for index in sorted(priority_indices):
+        if index >= len(message_list):
+            continue
+        block_indices = expand(message_list, index)
+        block_tokens = estimate_message_tokens([message_list[i] for i in sorted(block_indices)])
+        if block_tokens <= budget:
+            keep_indices |= block_indices
+            budget -= block_tokens
+    best_indices = set(keep_indices)
+    for tail_count in range(len(message_list), 0, -1):
+        split_at = split_preserving_tool_pairs(message_list, len(message_list) - tail_count)
+        candidate_indices = (keep_indices | set(range(split_at, len(message_list)))) - system_indices
+        if estimate_message_tokens(system_msgs + [message_list[i] for i in sorted(candidate_indices)]) <= max_tokens:
+            best_indices = candidate_indices | system_indices
+            break
+    if not best_indices:
+        return compress_with_earlier_placeholder(message_list, max_tokens=max_tokens, preserve_system=preserve_system)
+    compressed = list(system_msgs) + [m for i, m in enumerate(message_list) if i not in system_indices and i in best_indices]
+    if estimate_message_tokens(compressed) <= max_tokens:
+        return compressed
+    return compress_with_earlier_placeholder(message_list, max_tokens=max_tokens, preserve_system=preserve_system)
+
+
+def _random_transcript(rng, count: int) -> list[LLMMessage]:
+    messages: list[LLMMessage] = []
+    call = 0
+    while len(messages) < count:
+        roll = rng.random()
+        if roll < 0.1:
+            messages.append(LLMMessage(role="system", content="rules " * rng.randint(1, 20)))
+        elif roll < 0.3:
+            call += 1
+            messages.append(
+                LLMMessage(
+                    role="assistant",
+                    content=None,
+                    tool_calls=[{"id": f"call_{call}", "type": "function", "function": {"name": "read_file", "arguments": "{}"}}],
+                )
+            )
+            messages.append(LLMMessage(role="tool", content="out " * rng.randint(1, 80), tool_call_id=f"call_{call}"))
+        else:
+            messages.append(LLMMessage(role=rng.choice(["user", "assistant"]), content="word " * rng.randint(1, 60)))
+    return messages
+
+
+def test_compress_preserve_recent_matches_reference_on_random_transcripts() -> None:
+    import random
+
+    from aiecs.domain.context.compression.tokens import estimate_message_tokens
+
+    rng = random.Random(1234)
+    for _ in range(200):
+        messages = _random_transcript(rng, rng.randint(1, 40))
+        total = estimate_message_tokens(messages)
+        max_tokens = rng.randint(0, max(1, total))
+        priority = {rng.randrange(len(messages)) for _ in range(rng.randint(0, 3))}
+        preserve_system = rng.random() < 0.8
+
+        expected = _legacy_compress_preserve_recent(messages, max_tokens=max_tokens, priority_indices=set(priority), preserve_system=preserve_system)
+        actual = compress_preserve_recent(messages, max_tokens=max_tokens, priority_indices=set(priority), preserve_system=preserve_system)
+
+        assert [(m.role, m.content, m.tool_call_id) for m in actual] == [(m.role, m.content, m.tool_call_id) for m in expected]
+
+
+def test_text_budget_split_and_truncate_match_reference() -> None:
+    from aiecs.domain.context.compression.llm_compact import _split_text_for_token_budget, _truncate_text_for_token_budget
+    from aiecs.domain.context.compression.tokens import estimate_message_tokens
+
+    def fits(chunk: str, max_tokens: int) -> bool:
+        return estimate_message_tokens([LLMMessage(role="user", content=chunk)]) <= max_tokens
+
+    def reference_split(text: str, max_tokens: int) -> list[str]:
+        if not text:
+            return [""]
+        if fits(text, max_tokens):
+            return [text]
+        parts, start = [], 0
+        while start < len(text):
+            best = 1
+            for size in range(1, len(text) - start + 1):
+                if fits(text[start : start + size], max_tokens):
+                    best = size
+            parts.append(text[start : start + best])
+            start += best
+        return parts
+
+    def reference_truncate(text: str, max_tokens: int) -> str:
+        if fits(text, max_tokens):
+            return text
+        best = 0
+        for mid in range(len(text) + 1):
+            if fits(text[:mid] + f"\n...[truncated {len(text) - mid} chars for summarize chunk]...", max_tokens):
+                best = mid
+        if best == 0:
+            return text[: max(1, len(text) // 10)] + " chars for summarize chunk]..."
+        return text[:best] + f"\n...[truncated {len(text) - best} chars for summarize chunk]..."
+
+    for text in ("", "a", "abcdefghij" * 7, "x" * 123):
+        for max_tokens in (-1, 0, 1, 2, 5, 13, 40, 200):
+            assert _split_text_for_token_budget(text, max_tokens) == reference_split(text, max_tokens)
+            assert _truncate_text_for_token_budget(text, max_tokens) == reference_truncate(text, max_tokens)
@@ -0,0 +1,121 @@
+"""Shared fixtures for ContextEngine unit tests."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+
+class FakeRedis:
+    """In-memory async Redis stand-in for the commands ContextEngine uses.
+
+    ``round_trips`` counts awaited commands; a pipeline ``execute`` counts as one.
+    """
+
+    def __init__(self) -> None:
+        self.lists: Dict[str, List[str]] = {}
+        self.values: Dict[str, int] = {}
+        self.hashes: Dict[str, Dict[str, Any]] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    def _lpush(self, key: str, *values: str) -> int:
+        items = self.lists.setdefault(key, [])
+        for value in values:
+            items.insert(0, value)
+        return len(items)
+
+    def _rpush(self, key: str, *values: str) -> int:
+        self.lists.setdefault(key, []).extend(values)
+        return len(self.lists[key])
+
+    def _lrange(self, key: str, start: int, end: int) -> List[str]:
+        items = self.lists.get(key, [])
+        n = len(items)
+        start = max(start + n, 0) if start < 0 else start
+        end = end + n if end < 0 else end
+        return items[start : end + 1] if end >= start else []
+
+    def _ltrim(self, key: str, start: int, end: int) -> bool:
+        self.lists[key] = self._lrange(key, start, end)
+        return True
+
+    def _get(self, key: str) -> Optional[bytes]:
+        return str(self.values[key]).encode() if key in self.values else None
+
+    def _set(self, key: str, value: int, ex: Any = None) -> bool:
+        self.values[key] = int(value)
+        return True
+
+    def _incrby(self, key: str, amount: int) -> int:
+        self.values[key] = self.values.get(key, 0) + amount
+        return self.values[key]
+
+    def _expire(self, key: str, ttl: int) -> bool:
+        return True
+
+    def _hget(self, key: str, field: str) -> Any:
+        return self.hashes.get(key, {}).get(field)
+
+    def _hset(self, key: str, field: str, value: Any) -> int:
+        self.hashes.setdefault(key, {})[field] = value
+        return 1
+
+    def _hdel(self, key: str, field: str) -> int:
+        return 1 if self.hashes.get(key, {}).pop(field, None) is not None else 0
+
+    def _delete(self, *keys: str) -> int:
+        removed = 0
+        for key in keys:
+            for store in (self.lists, self.values, self.hashes):
+                if store.pop(key, None) is not None:
+                    removed += 1
+        return removed
+
+    def __getattr__(self, name: str) -> Any:
+        impl = getattr(type(self), f"_{name}", None)
+        if impl is None:
+            raise AttributeError(name)
+
+        async def command(*args: Any, **kwargs: Any) -> Any:
+            self.round_trips += 1
+            return impl(self, *args, **kwargs)
+
+        return command
+
+
+class FakePipeline:
+    """Queues commands and applies them in order on ``execute``."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._queued: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self._queued = []
+
+    def __getattr__(self, name: str) -> Any:
+        if not hasattr(FakeRedis, f"_{name}"):
+            raise AttributeError(name)
+
+        def queue(*args: Any, **kwargs: Any) -> "FakePipeline":
+            self._queued.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> List[Any]:
+        self._redis.round_trips += 1
+        queued, self._queued = self._queued, []
+        return [getattr(FakeRedis, f"_{name}")(self._redis, *args, **kwargs) for name, args, kwargs in queued]
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    return FakeRedis()
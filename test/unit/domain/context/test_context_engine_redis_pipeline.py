@@ -0,0 +1,68 @@
+"""Pipelined Redis writes on ContextEngine hot paths."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from aiecs.domain.context.compression.policy import CompressionPolicy
+from aiecs.domain.context.context_engine import ContextEngine, ConversationMessage
+
+
+def _message(i: int) -> ConversationMessage:
+    return ConversationMessage(role="user", content=f"message {i}", timestamp=datetime.utcnow())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compress_on_append", [False, True])
+async def test_message_append_is_one_round_trip(fake_redis, compress_on_append) -> None:
+    engine = ContextEngine(compression_policy=CompressionPolicy(enabled=True) if compress_on_append else None)
+    engine.redis_client = fake_redis
+
+    for i in range(5):
+        before = fake_redis.round_trips
+        await engine._store_conversation_message("sess", _message(i))
+        assert fake_redis.round_trips - before == 1
+
+    history = await engine.get_conversation_history("sess", limit=0)
+    assert [m.content for m in history] == [f"message {i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_replace_history_is_one_atomic_round_trip_and_keeps_order(fake_redis) -> None:
+    engine = ContextEngine(compression_policy=CompressionPolicy(enabled=True))
+    engine.redis_client = fake_redis
+    for i in range(3):
+        await engine._store_conversation_message("sess", _message(i))
+
+    before = fake_redis.round_trips
+    await engine._replace_conversation_history("sess", [_message(i) for i in range(100, 500)])
+    assert fake_redis.round_trips - before == 1
+
+    history = await engine.get_conversation_history("sess", limit=0)
+    assert [m.content for m in history] == [f"message {i}" for i in range(100, 500)]
+
+    # Appends after a replace continue in chronological order.
+    await engine._store_conversation_message("sess", _message(500))
+    history = await engine.get_conversation_history("sess", limit=0)
+    assert history[-1].content == "message 500"
+
+
+@pytest.mark.asyncio
+async def test_session_store_and_cleanup_are_single_round_trips(fake_redis) -> None:
+    engine = ContextEngine()
+    engine.redis_client = fake_redis
+
+    await engine.create_session("sess", "user-1")
+    before = fake_redis.round_trips
+    await engine.update_session("sess")
+    # hget for the read, one pipeline for hset + expire
+    assert fake_redis.round_trips - before == 2
+
+    await engine._store_conversation_message("sess", _message(0))
+    before = fake_redis.round_trips
+    await engine._cleanup_session_data("sess")
+    assert fake_redis.round_trips - before == 1
+    assert await engine.get_session("sess") is None
+    assert await engine.get_conversation_history("sess", limit=0) == []
@@ -0,0 +1,128 @@
+"""O8 ContextEngine running token counter for compress-on-append."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aiecs.domain.context.compression.adapters.conversation_message import conversation_messages_to_llm_messages
+from aiecs.domain.context.compression.policy import CompressionPolicy
+from aiecs.domain.context.compression.tokens import estimate_message_tokens, estimate_raw_message_tokens
+from aiecs.domain.context.context_engine import ContextEngine
+from aiecs.llm import LLMMessage
+
+
+def _engine(threshold: int = 1_000) -> ContextEngine:
+    return ContextEngine(
+        compression_policy=CompressionPolicy(enabled=True, auto_compact_threshold_tokens=threshold, chain=("microcompact",)),
+        compress_on_append=True,
+    )
+
+
+async def _history_tokens(engine: ContextEngine, session_id: str) -> int:
+    messages = await engine.get_conversation_history(session_id, limit=0)
+    return estimate_raw_message_tokens(conversation_messages_to_llm_messages(messages))
+
+
+@pytest.mark.asyncio
+async def test_appends_below_threshold_do_not_load_history() -> None:
+    engine = _engine()
+    session_id = "sess-tokens"
+
+    with patch.object(engine, "get_conversation_history", wraps=engine.get_conversation_history) as history:
+        for i in range(20):
+            await engine.add_conversation_message(session_id, "user", f"message number {i}")
+
+    history.assert_not_called()
+    assert engine._memory_conversation_tokens[session_id] == await _history_tokens(engine, session_id)
+
+
+@pytest.mark.asyncio
+async def test_crossing_threshold_compacts_and_resets_counter() -> None:
+    engine = _engine(threshold=40)
+    session_id = "sess-cross"
+    compacted = [LLMMessage(role="user", content="summary")]
+
+    with patch(
+        "aiecs.domain.context.compression.orchestrator.auto_compact_if_needed",
+        new=AsyncMock(return_value=(compacted, True)),
+    ) as mock_compact:
+        await engine.add_conversation_message(session_id, "user", "short")
+        mock_compact.assert_not_awaited()
+        await engine.add_conversation_message(session_id, "user", "word " * 40)
+
+    mock_compact.assert_awaited_once()
+    metadata = mock_compact.await_args.kwargs["compact_metadata"]
+    assert metadata["estimated_tokens"] == estimate_message_tokens(mock_compact.await_args.args[0])
+    assert [m.content for m in engine._memory_conversations[session_id]] == ["summary"]
+    assert engine._memory_conversation_tokens[session_id] == await _history_tokens(engine, session_id)
+
+
+@pytest.mark.asyncio
+async def test_untracked_session_is_seeded_once() -> None:
+    engine = _engine()
+    session_id = "sess-seed"
+    await engine.add_conversation_message(session_id, "user", "hello there")
+    engine._memory_conversation_tokens.clear()
+
+    # Appending to a session without a counter must not create a partial one.
+    message = (await engine.get_conversation_history(session_id, limit=0))[0]
+    await engine._store_conversation_message(session_id, message)
+    assert session_id not in engine._memory_conversation_tokens
+
+    with patch.object(engine, "get_conversation_history", wraps=engine.get_conversation_history) as history:
+        await engine.compress_on_append_if_needed(session_id)
+        await engine.compress_on_append_if_needed(session_id)
+
+    assert history.call_count == 1
+    assert engine._memory_conversation_tokens[session_id] == await _history_tokens(engine, session_id)
+
+
+@pytest.mark.asyncio
+async def test_memory_trim_subtracts_dropped_messages() -> None:
+    engine = _engine()
+    engine.conversation_limit = 3
+    session_id = "sess-trim"
+
+    for i in range(6):
+        await engine.add_conversation_message(session_id, "user", "x" * (10 * (i + 1)))
+
+    assert len(engine._memory_conversations[session_id]) == 3
+    assert engine._memory_conversation_tokens[session_id] == await _history_tokens(engine, session_id)
+
+    await engine._cleanup_session_data(session_id)
+    assert session_id not in engine._memory_conversation_tokens
+
+
+@pytest.mark.asyncio
+async def test_redis_counter_tracks_appends_trim_and_replace(fake_redis) -> None:
+    engine = _engine()
+    engine.redis_client = fake_redis
+    engine.conversation_limit = 4
+    session_id = "sess-redis"
+
+    for i in range(6):
+        await engine.add_conversation_message(session_id, "user", f"redis message {i} " * (i + 1))
+
+    assert await engine._get_conversation_tokens(session_id) == await _history_tokens(engine, session_id)
+
+    messages = await engine.get_conversation_history(session_id, limit=0)
+    await engine._replace_conversation_history(session_id, messages[:1])
+    assert await engine._get_conversation_tokens(session_id) == await _history_tokens(engine, session_id)
+
+    await engine._cleanup_session_data(session_id)
+    assert await engine._get_conversation_tokens(session_id) is None
+
+
+@pytest.mark.asyncio
+async def test_redis_counter_missing_for_existing_list_is_not_partial(fake_redis) -> None:
+    engine = _engine()
+    engine.redis_client = fake_redis
+    session_id = "sess-legacy"
+    await engine.add_conversation_message(session_id, "user", "written before counters existed")
+    await engine.redis_client.delete(f"conversation_tokens:{session_id}")
+
+    await engine._store_conversation_message(session_id, (await engine.get_conversation_history(session_id, limit=0))[0])
+
+    assert await engine._get_conversation_tokens(session_id) is None
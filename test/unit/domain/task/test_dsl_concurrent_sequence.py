@@ -0,0 +1,170 @@
+"""
+Unit tests for dependency-aware concurrent ``sequence`` steps in DSLProcessor.
+
+Tests cover:
+- Dependency inference from result[...] / $result[...] / context. references
+- Critical path length
+- Independent children run concurrently under max_concurrency
+- Results and shared result indices committed in sequence order
+- stop_on_failure discards later results and cancels pending children
+- Failures of children finished after a stop_on_failure break are retrieved
+- Same result list as sequential execution
+"""
+
+import asyncio
+import gc
+
+from aiecs.domain.execution.model import TaskStatus, TaskStepResult
+from aiecs.domain.task.dsl_processor import (
+    DSLProcessor,
+    critical_path_length,
+    infer_sequence_dependencies,
+)
+
+
+class Recorder:
+    """execute_single_task stub with per-task delays and concurrency tracking"""
+
+    def __init__(self, delays=None, failures=()):
+        self.delays = delays or {}
+        self.failures = set(failures)
+        self.started = []
+        self.finished = []
+        self.cancelled = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, task_name, input_data, context):
+        self.started.append(task_name)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(task_name, 0.01))
+            if task_name in self.failures:
+                raise RuntimeError(f"{task_name} failed")
+            return {"task": task_name, "value": input_data.get("value")}
+        except asyncio.CancelledError:
+            self.cancelled.append(task_name)
+            raise
+        finally:
+            self.active -= 1
+            self.finished.append(task_name)
+
+
+async def _no_batch(*args, **kwargs):
+    raise AssertionError("batch executor not expected")
+
+
+async def _run(step, recorder, results=None, intent=("process",)):
+    return await DSLProcessor().execute_dsl_step(step, list(intent), {"value": 1}, {"mode": "fast"}, recorder, _no_batch, results)
+
+
+class TestDependencyInference:
+    def test_references_create_dependencies(self):
+        steps = [
+            {"task": "a"},
+            {"task": "b", "params": {"x": "$result[0].value"}},
+            {"task": "c"},
+            {"if": "context.mode == 'fast'", "then": [{"task": "d"}]},
+            {"if": "intent.includes('process')", "then": [{"task": "e"}]},
+            {"loop": {"while": "result[0].value > 1", "steps": [{"task": "f"}]}},
+        ]
+
+        assert infer_sequence_dependencies(steps) == [[], [0], [], [0, 1, 2], [], [0, 1, 2, 3, 4]]
+
+    def test_critical_path_length(self):
+        assert critical_path_length([]) == 0
+        assert critical_path_length([[], [], []]) == 1
+        assert critical_path_length([[], [0], [], [0, 1, 2], []]) == 3
+
+
+class TestConcurrentSequence:
+    async def test_independent_children_run_concurrently(self):
+        recorder = Recorder()
+        step = {"sequence": [{"task": f"t{i}"} for i in range(6)], "concurrent": True, "max_concurrency": 3}
+
+        result = await _run(step, recorder)
+
+        assert recorder.max_active == 3
+        assert [r["step"] for r in result.result] == [f"task_t{i}" for i in range(6)]
+        assert result.metadata["critical_path_length"] == 1
+        assert result.dict()["metadata"]["execution_mode"] == "concurrent"
+
+    async def test_results_committed_in_sequence_order(self):
+        recorder = Recorder(delays={"slow": 0.05, "fast": 0.0})
+        shared = [TaskStepResult(step="earlier", result={"value": 0}, completed=True)]
+        step = {
+            "sequence": [
+                {"task": "slow"},
+                {"if": "intent.includes('process')", "then": [{"task": "fast"}]},
+                {"if": "result[1].task == 'slow'", "then": [{"task": "reader"}]},
+            ],
+            "concurrent": True,
+        }
+
+        result = await _run(step, recorder, results=shared)
+
+        assert recorder.finished.index("fast") < recorder.finished.index("slow")
+        assert [r.step for r in shared] == ["earlier", "task_slow", "task_fast", "if_intent.includes('process')", "task_reader", "if_result[1].task == 'slow'"]
+        assert result.completed is True
+        assert result.metadata["critical_path_length"] == 2
+
+    async def test_matches_sequential_execution(self):
+        children = [
+            {"task": "a"},
+            {"if": "intent.includes('process')", "then": [{"task": "b"}], "else": [{"task": "c"}]},
+            {"task": "d", "params": {"value": "$result[0].value"}},
+            {"sequence": [{"task": "e"}, {"task": "f"}]},
+        ]
+        sequential_results, concurrent_results = [], []
+
+        sequential = await _run({"sequence": children}, Recorder(), results=sequential_results)
+        concurrent = await _run({"sequence": children, "concurrent": True}, Recorder(), results=concurrent_results)
+
+        assert concurrent.result == sequential.result
+        assert [r.dict() for r in concurrent_results] == [r.dict() for r in sequential_results]
+        assert sequential.metadata is None and "metadata" not in sequential.dict()
+
+    async def test_stop_on_failure_keeps_first_failure_semantics(self):
+        recorder = Recorder(delays={"bad": 0.01, "late": 0.2}, failures={"bad"})
+        shared = []
+        step = {
+            "sequence": [{"task": "ok"}, {"task": "bad"}, {"task": "late"}, {"task": "later"}],
+            "concurrent": True,
+            "stop_on_failure": True,
+        }
+
+        result = await _run(step, recorder, results=shared)
+
+        assert [r["step"] for r in result.result] == ["task_ok", "task_bad"]
+        assert result.result[1]["status"] == TaskStatus.FAILED.value
+        assert [r.step for r in shared] == ["task_ok", "task_bad"]
+        # The slow independent child was cancelled once the first failure was committed
+        assert recorder.cancelled == ["late"]
+        assert recorder.active == 0
+
+    async def test_failure_of_child_past_the_break_is_retrieved(self):
+        recorder = Recorder(delays={"bad": 0.05}, failures={"bad"})
+        unhandled = []
+        loop = asyncio.get_running_loop()
+        previous_handler = loop.get_exception_handler()
+        loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+
+        async def failing_batch(*args, **kwargs):
+            raise RuntimeError("batch failed")
+
+        step = {"sequence": [{"task": "bad"}, {"parallel": ["x"]}], "concurrent": True, "stop_on_failure": True}
+        try:
+            result = await DSLProcessor().execute_dsl_step(step, ["process"], {"value": 1}, {}, recorder, failing_batch, [])
+            gc.collect()
+            await asyncio.sleep(0)
+        finally:
+            loop.set_exception_handler(previous_handler)
+
+        assert [r["step"] for r in result.result] == ["task_bad"]
+        # The parallel child raised before the break; its exception must not go unretrieved
+        assert unhandled == []
+
+    async def test_validation_of_max_concurrency(self):
+        errors = DSLProcessor().validate_dsl_step({"sequence": [], "concurrent": True, "max_concurrency": 0})
+        assert errors == ["'max_concurrency' must be a positive integer"]
@@ -0,0 +1,208 @@
+"""
+Differential tests for the compiled DSL condition evaluator.
+
+Every condition is evaluated by ``DSLProcessor.evaluate_condition`` (compiled,
+cached) and by ``_legacy_evaluate_condition`` (the previous regex-per-call
+evaluator, kept here verbatim as the reference) against a matrix of contexts;
+results and error messages must be identical.
+"""
+
+import itertools
+import random
+import re
+from typing import Any, Dict, List, Optional, cast
+
+import pytest
+
+from aiecs.domain.execution.model import TaskStepResult
+from aiecs.domain.task import condition_compiler
+from aiecs.domain.task.condition_compiler import compile_condition
+from aiecs.domain.task.dsl_processor import DSLProcessor
+
+
+def _legacy_evaluate_comparison(left_value: Any, operator: str, right_value: Any) -> bool:
+    try:
+        if operator == "==":
+            return cast(bool, left_value == right_value)
+        elif operator == "!=":
+            return cast(bool, left_value != right_value)
+        elif operator == ">":
+            return cast(bool, left_value > right_value)
+        elif operator == "<":
+            return cast(bool, left_value < right_value)
+        elif operator == ">=":
+            return cast(bool, left_value >= right_value)
+        elif operator == "<=":
+            return cast(bool, left_value <= right_value)
+        else:
+            raise ValueError(f"Unsupported operator: {operator}")
+    except TypeError:
+        return False
+
+
+def _legacy_parse_value(value_str: str) -> Any:
+    value_str = value_str.strip()
+    if value_str.startswith('"') and value_str.endswith('"'):
+        return value_str[1:-1]
+    if value_str.startswith("'") and value_str.endswith("'"):
+        return value_str[1:-1]
+    if value_str.lower() == "true":
+        return True
+    if value_str.lower() == "false":
+        return False
+    try:
+        if "." in value_str:
+            return float(value_str)
+        else:
+            return int(value_str)
+    except ValueError:
+        pass
+    return value_str
+
+
+def _legacy_evaluate_condition(
+    condition: str,
+    intent_categories: List[str],
+    context: Optional[Dict[str, Any]] = None,
+    input_data: Optional[Dict[str, Any]] = None,
+    results: Optional[List[TaskStepResult]] = None,
+) -> bool:
+    """Previous evaluator: re-tokenizes and runs regexes on every call."""
+    try:
+        if " AND " in condition:
+            parts = condition.split(" AND ")
+            return all(_legacy_evaluate_condition(part.strip(), intent_categories, context, input_data, results) for part in parts)
+        if " OR " in condition:
+            parts = condition.split(" OR ")
+            return any(_legacy_evaluate_condition(part.strip(), intent_categories, context, input_data, results) for part in parts)
+        match = re.fullmatch(r"intent\.includes\('([^']+)'\)", condition)
+        if match:
+            return match.group(1) in intent_categories
+        match = re.fullmatch(r"context\.(\w+)\s*(==|!=|>|<|>=|<=)\s*(.+)", condition)
+        if match and context:
+            field, operator, value = match.groups()
+            return _legacy_evaluate_comparison(context.get(field), operator, _legacy_parse_value(value))
+        match = re.fullmatch(r"input\.(\w+)\s*(==|!=|>|<|>=|<=)\s*(.+)", condition)
+        if match and input_data:
+            field, operator, value = match.groups()
+            return _legacy_evaluate_comparison(input_data.get(field), operator, _legacy_parse_value(value))
+        match = re.fullmatch(r"result\[(\d+)\]\.(\w+)\s*(==|!=|>|<|>=|<=)\s*(.+)", condition)
+        if match and results:
+            index, field, operator, value = match.groups()
+            index = int(index)
+            if index < len(results) and results[index].result:
+                result_value = results[index].result.get(field) if isinstance(results[index].result, dict) else None
+                return _legacy_evaluate_comparison(result_value, operator, _legacy_parse_value(value))
+        raise ValueError(f"Unsupported condition format: {condition}")
+    except Exception as e:
+        raise ValueError(f"Failed to evaluate condition '{condition}': {e}")
+
+
+def _outcome(fn, *args):
+    try:
+        return ("ok", fn(*args))
+    except ValueError as e:
+        return ("error", str(e))
+
+
+LEAVES = [
+    "intent.includes('search')",
+    "intent.includes('write')",
+    "intent.includes('')",
+    "context.retries < 3",
+    "context.retries >= 2",
+    "context.retries>2",
+    "context.mode == 'fast'",
+    'context.mode != "slow"',
+    "context.missing == None",
+    "context.flag == true",
+    "context.flag == False",
+    "context.ratio <= 0.5",
+    "context.mode > 3",
+    "input.query == 'hello'",
+    "input.limit > 10",
+    "input.limit == 10.0",
+    "result[0].status == 'ok'",
+    "result[1].score > 0.7",
+    "result[5].status == 'ok'",
+    "result[0].status",
+    "garbage",
+    "",
+    " context.retries < 3",
+    "context.retries < 3 ",
+]
+
+CONTEXTS = [
+    ([], None, None, None),
+    (["search"], {"retries": 1, "mode": "fast", "flag": True, "ratio": 0.25}, {"query": "hello", "limit": 10}, None),
+    (["write", "search"], {"retries": 5, "mode": "slow", "flag": False}, {"query": "x", "limit": "big"}, "results"),
+    (["write"], {}, {}, "empty_results"),
+]
+
+
+def _results(kind):
+    if kind == "results":
+        return [
+            TaskStepResult(step="a", result={"status": "ok", "score": 0.9}),
+            TaskStepResult(step="b", result={"score": "high"}),
+        ]
+    if kind == "empty_results":
+        return [TaskStepResult(step="a", result=None), TaskStepResult(step="b", result=["not", "dict"])]
+    return None
+
+
+def _conditions():
+    conditions = list(LEAVES)
+    for a, b in itertools.product(LEAVES[:17], repeat=2):
+        conditions.append(f"{a} AND {b}")
+        conditions.append(f"{a} OR {b}")
+    rng = random.Random(7)
+    for _ in range(300):
+        parts = rng.sample(LEAVES, rng.randint(3, 5))
+        joined = parts[0]
+        for part in parts[1:]:
+            joined += rng.choice([" AND ", " OR ", " and ", "  AND  "]) + part
+        conditions.append(joined)
+    return conditions
+
+
+@pytest.fixture
+def processor():
+    compile_condition.cache_clear()
+    yield DSLProcessor()
+    compile_condition.cache_clear()
+
+
+@pytest.mark.parametrize("env", range(len(CONTEXTS)))
+def test_matches_legacy_evaluator(processor, env):
+    intent, context, input_data, results_kind = CONTEXTS[env]
+    results = _results(results_kind)
+    for condition in _conditions():
+        args = (condition, intent, context, input_data, results)
+        expected = _outcome(_legacy_evaluate_condition, *args)
+        assert _outcome(processor.evaluate_condition, *args) == expected, condition
+        # Second evaluation is served from the compile cache
+        assert _outcome(processor.evaluate_condition, *args) == expected, condition
+
+
+def test_conditions_compiled_once(processor, monkeypatch):
+    parsed = []
+    original = condition_compiler._parse
+    monkeypatch.setattr(condition_compiler, "_parse", lambda c: parsed.append(c) or original(c))
+
+    for _ in range(100):
+        processor.evaluate_condition("context.retries < 3 AND intent.includes('search')", ["search"], {"retries": 1})
+
+    assert parsed.count("context.retries < 3 AND intent.includes('search')") == 1
+
+
+def test_short_circuit_skips_failing_operands(processor):
+    assert processor.evaluate_condition("intent.includes('a') OR garbage", ["a"]) is True
+    assert processor.evaluate_condition("intent.includes('b') AND garbage", ["a"]) is False
+    with pytest.raises(ValueError, match="Unsupported condition format: garbage"):
+        processor.evaluate_condition("intent.includes('a') AND garbage", ["a"])
+
+
+def test_non_string_condition_rejected(processor):
+    with pytest.raises(ValueError, match="Failed to evaluate condition"):
+        processor.evaluate_condition(None, [])  # type: ignore[arg-type]
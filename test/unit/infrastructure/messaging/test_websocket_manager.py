@@ -0,0 +1,252 @@
+"""
+Unit tests for WebSocketManager delivery.
+
+Tests cover:
+- User → connections index populated on subscribe, cleaned up on disconnect
+- Targeted sends reach only the user's connections and serialize once
+- Step results, heartbeats and cancellations are not broadcast to other users
+- Bounded per-connection queues with slow-consumer eviction
+- notify_user does not wait for a confirmation nobody can send
+- End-to-end subscribe, handshake user ids and targeted delivery over a real socket
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+import websockets
+
+from aiecs.infrastructure.messaging import websocket_manager as ws_mod
+from aiecs.infrastructure.messaging.websocket_manager import (
+    SLOW_CONSUMER_CLOSE_CODE,
+    TaskStepResult,
+    WebSocketManager,
+)
+
+
+class FakeConnection:
+    """In-memory stand-in for a websockets ServerConnection"""
+
+    def __init__(self, name: str, block: bool = False):
+        self.remote_address = (name, 0)
+        self.sent: list = []
+        self.closed_with = None
+        self._gate = asyncio.Event()
+        if not block:
+            self._gate.set()
+
+    async def send(self, payload):
+        await self._gate.wait()
+        self.sent.append(payload)
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        self.closed_with = (code, reason)
+
+    def messages(self):
+        return [json.loads(payload) for payload in self.sent]
+
+
+async def _flush():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def manager():
+    return WebSocketManager(host="127.0.0.1", port=0, max_queue_size=4)
+
+
+def _connect(manager: WebSocketManager, name: str, user_id=None, block: bool = False) -> FakeConnection:
+    conn = FakeConnection(name, block=block)
+    manager._register_connection(conn)
+    if user_id is not None:
+        manager._subscribe_user(conn, user_id)
+    return conn
+
+
+class TestUserIndex:
+    @pytest.mark.asyncio
+    async def test_subscribe_action_indexes_connection(self, manager):
+        conn = _connect(manager, "a")
+        await manager._handle_client_message(conn, json.dumps({"action": "subscribe", "user_id": "u1"}))
+        await _flush()
+
+        assert manager.get_user_connections("u1") == {conn}
+        assert conn.messages()[0]["type"] == "subscription_confirmed"
+        assert manager.get_status()["subscribed_users"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unregister_cleans_index(self, manager):
+        first = _connect(manager, "a", "u1")
+        second = _connect(manager, "b", "u1")
+        manager._subscribe_user(second, "u2")
+
+        manager._unregister_connection(second)
+        assert manager.get_user_connections("u1") == {first}
+        assert "u2" not in manager._user_connections
+
+        manager._unregister_connection(first)
+        assert manager._user_connections == {}
+        assert manager.get_connection_count() == 0
+
+
+class TestTargetedDelivery:
+    @pytest.mark.asyncio
+    async def test_send_to_user_reaches_only_that_user(self, manager):
+        mine = [_connect(manager, "a", "u1"), _connect(manager, "b", "u1")]
+        other = _connect(manager, "c", "u2")
+        anonymous = _connect(manager, "d")
+
+        assert await manager.send_to_user("u1", {"type": "note"}) == 2
+        await _flush()
+
+        assert [conn.messages() for conn in mine] == [[{"type": "note", "target_user_id": "u1"}]] * 2
+        assert other.sent == [] and anonymous.sent == []
+
+    @pytest.mark.asyncio
+    async def test_payload_serialized_once(self, manager):
+        for i in range(3):
+            _connect(manager, f"c{i}", "u1")
+
+        with patch.object(ws_mod.json, "dumps", wraps=json.dumps) as dumps:
+            await manager.send_to_user("u1", {"type": "note"})
+            await manager.broadcast_message({"type": "all"})
+
+        assert dumps.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_gets_nothing(self, manager):
+        conn = _connect(manager, "a", "u1")
+        assert await manager.send_to_user("nobody", {"type": "note"}) == 0
+        await _flush()
+        assert conn.sent == []
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_everyone(self, manager):
+        conns = [_connect(manager, "a", "u1"), _connect(manager, "b")]
+        await manager.broadcast_message({"type": "all"})
+        await _flush()
+        assert all(conn.messages() == [{"type": "all"}] for conn in conns)
+
+    @pytest.mark.asyncio
+    async def test_notify_user_targets_user(self, manager):
+        mine = _connect(manager, "a", "u1")
+        other = _connect(manager, "b", "u2")
+        step = TaskStepResult(step="s1", message="done", status="completed")
+
+        notify = asyncio.create_task(manager.notify_user(step, user_id="u1", task_id="t1", step=1))
+        await _flush()
+        message = mine.messages()[0]
+        await manager._handle_confirmation({"callback_id": message["callback_id"], "proceed": False})
+        confirmation = await notify
+
+        assert message["type"] == "task_step_result"
+        assert confirmation.proceed is False
+        assert other.sent == []
+
+    @pytest.mark.asyncio
+    async def test_notify_user_without_connections_proceeds_at_once(self, manager):
+        step = TaskStepResult(step="s1", message="done", status="completed")
+
+        confirmation = await asyncio.wait_for(manager.notify_user(step, user_id="nobody", task_id="t1", step=1), 1)
+
+        assert confirmation.proceed is True
+        assert manager.callback_registry == {}
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_and_cancellation_target_user(self, manager):
+        mine = _connect(manager, "a", "u1")
+        other = _connect(manager, "b", "u2")
+        manager._running = True
+
+        heartbeat = asyncio.create_task(manager.send_heartbeat("u1", "t1", interval=60))
+        await _flush()
+        manager._running = False
+        heartbeat.cancel()
+        await manager._handle_cancellation({"user_id": "u1", "task_id": "t1"})
+        await _flush()
+
+        assert [m["type"] for m in mine.messages()] == ["heartbeat", "task_cancelled"]
+        assert other.sent == []
+
+
+class TestSlowConsumers:
+    @pytest.mark.asyncio
+    async def test_full_queue_evicts_connection(self, manager):
+        slow = _connect(manager, "slow", "u1", block=True)
+        fast = _connect(manager, "fast", "u1")
+
+        # writer holds one payload in flight; queue holds max_queue_size more
+        for i in range(manager.max_queue_size + 2):
+            await manager.send_to_user("u1", {"seq": i})
+            await _flush()
+
+        assert slow.closed_with == (SLOW_CONSUMER_CLOSE_CODE, "slow consumer")
+        assert manager.get_user_connections("u1") == {fast}
+        assert slow not in manager.active_connections
+        assert [m["seq"] for m in fast.messages()] == list(range(manager.max_queue_size + 2))
+        assert manager.get_status()["evicted_connections"] == 1
+
+    @pytest.mark.asyncio
+    async def test_send_failure_unregisters_connection(self, manager):
+        conn = _connect(manager, "a", "u1")
+
+        async def broken(_payload):
+            raise websockets.exceptions.ConnectionClosedError(None, None)
+
+        conn.send = broken
+        await manager.send_to_user("u1", {"type": "note"})
+        await _flush()
+
+        assert manager.get_user_connections("u1") == set()
+        assert manager.get_connection_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_replies_are_queued_in_order(self, manager):
+        conn = _connect(manager, "a", "u1")
+        await manager.send_to_user("u1", {"type": "first"})
+        await manager._handle_client_message(conn, json.dumps({"action": "ping"}))
+        await _flush()
+        assert [m["type"] for m in conn.messages()] == ["first", "pong"]
+
+
+class TestServerRoundTrip:
+    @pytest.mark.asyncio
+    async def test_subscribe_and_receive_over_socket(self, manager):
+        server = await manager.start_server()
+        port = next(iter(server.sockets)).getsockname()[1]
+        try:
+            async with websockets.connect(f"ws://127.0.0.1:{port}") as alice, websockets.connect(f"ws://127.0.0.1:{port}") as bob:
+                for client, user_id in ((alice, "alice"), (bob, "bob")):
+                    await client.send(json.dumps({"action": "subscribe", "user_id": user_id}))
+                    assert json.loads(await client.recv())["type"] == "subscription_confirmed"
+
+                await manager.send_to_user("alice", {"type": "note", "body": "hi"})
+
+                assert json.loads(await asyncio.wait_for(alice.recv(), 2))["body"] == "hi"
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(bob.recv(), 0.1)
+        finally:
+            await manager.stop_server()
+
+        assert manager._user_connections == {}
+
+    @pytest.mark.asyncio
+    async def test_handshake_user_id_indexes_connection(self, manager):
+        server = await manager.start_server()
+        url = f"ws://127.0.0.1:{next(iter(server.sockets)).getsockname()[1]}"
+        try:
+            async with websockets.connect(f"{url}/?user_id=alice") as alice, websockets.connect(url, additional_headers={"X-User-Id": "bob"}) as bob:
+                await alice.send(json.dumps({"action": "ping"}))
+                await bob.send(json.dumps({"action": "ping"}))
+                assert json.loads(await alice.recv())["type"] == "pong"
+                assert json.loads(await bob.recv())["type"] == "pong"
+
+                await manager.send_to_user("alice", {"type": "note", "to": "alice"})
+                await manager.send_to_user("bob", {"type": "note", "to": "bob"})
+
+                assert json.loads(await asyncio.wait_for(alice.recv(), 2))["to"] == "alice"
+                assert json.loads(await asyncio.wait_for(bob.recv(), 2))["to"] == "bob"
+        finally:
+            await manager.stop_server()
@@ -0,0 +1,178 @@
+"""Unit tests for ClickHouseBatchWriter and batched ClickHousePermanentBackend writes."""
+
+import asyncio
+from typing import Any, List, Tuple
+
+import pytest
+
+from aiecs.infrastructure.persistence.clickhouse_batch_writer import ClickHouseBatchWriter, ClickHouseBatchWriterConfig
+from aiecs.infrastructure.persistence.clickhouse_permanent_backend import ClickHousePermanentBackend
+
+
+class _FakeClient:
+    def __init__(self, failures: int = 0):
+        self.batches: List[Tuple[str, List[str], List[List[Any]]]] = []
+        self.failures = failures
+        self.is_available = True
+
+    async def insert_rows(self, table, rows, column_names):
+        if self.failures:
+            self.failures -= 1
+            return False
+        self.batches.append((table, list(column_names), list(rows)))
+        return True
+
+    async def close(self):
+        self.is_available = False
+
+
+def _row(i: int) -> dict:
+    return {"session_id": "s1", "role": "user", "content": f"m{i}"}
+
+
+@pytest.mark.asyncio
+async def test_flushes_on_batch_size():
+    client = _FakeClient()
+    writer = ClickHouseBatchWriter(client, ClickHouseBatchWriterConfig(max_batch_rows=10, max_batch_age_seconds=60))
+    await writer.start()
+
+    for i in range(25):
+        assert await writer.add("context_conversations", _row(i)) is True
+    await asyncio.sleep(0.05)
+
+    # The size trigger drains the buffer in max_batch_rows chunks.
+    assert [len(rows) for _, _, rows in client.batches] == [10, 10, 5]
+    await writer.close()
+    table, columns, rows = client.batches[0]
+    assert table == "context_conversations"
+    assert columns == ["session_id", "role", "content"]
+    assert rows[0] == ["s1", "user", "m0"]
+    metrics = writer.get_metrics()
+    assert metrics["rows_written"] == 25
+    assert metrics["batches_written"] == 3
+    assert metrics["max_batch_size"] == 10
+    assert metrics["rows_buffered"] == 0
+
+
+@pytest.mark.asyncio
+async def test_flushes_on_age_per_table():
+    client = _FakeClient()
+    writer = ClickHouseBatchWriter(client, ClickHouseBatchWriterConfig(max_batch_rows=1000, max_batch_age_seconds=0.05))
+    await writer.start()
+
+    await writer.add("context_sessions", {"session_id": "s1"})
+    await writer.add("context_checkpoints", {"thread_id": "t1"})
+    await asyncio.sleep(0.2)
+
+    assert sorted(table for table, _, _ in client.batches) == ["context_checkpoints", "context_sessions"]
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_then_dropped():
+    client = _FakeClient(failures=10)
+    writer = ClickHouseBatchWriter(
+        client,
+        ClickHouseBatchWriterConfig(max_batch_rows=100, max_retries=2, retry_backoff_seconds=0.001),
+    )
+    await writer.add("context_sessions", {"session_id": "s1"})
+    await writer.close()
+
+    metrics = writer.get_metrics()
+    assert metrics["retries"] == 2
+    assert metrics["batches_failed"] == 1
+    assert metrics["rows_dropped"] == 1
+
+    client.failures = 1
+    await writer.start()
+    await writer.add("context_sessions", {"session_id": "s2"})
+    await writer.close()
+    assert writer.get_metrics()["rows_written"] == 1
+
+
+@pytest.mark.asyncio
+async def test_add_after_close_is_rejected():
+    client = _FakeClient()
+    writer = ClickHouseBatchWriter(client)
+    await writer.start()
+    await writer.close()
+
+    assert await writer.add("context_sessions", {"session_id": "s1"}) is False
+    assert writer._task is None
+    assert writer.get_metrics()["rows_dropped"] == 1
+    await writer.flush()
+    assert client.batches == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("policy,expected_first", [("drop_newest", "m0"), ("drop_oldest", "m2")])
+async def test_overflow_drop_policies(policy, expected_first):
+    client = _FakeClient()
+    writer = ClickHouseBatchWriter(
+        client,
+        ClickHouseBatchWriterConfig(max_batch_rows=100, max_buffer_rows=3, max_batch_age_seconds=60, overflow_policy=policy),
+    )
+    results = [await writer.add("context_conversations", _row(i)) for i in range(5)]
+    await writer.close()
+
+    assert writer.get_metrics()["rows_dropped"] == 2
+    assert results == ([True, True, True, False, False] if policy == "drop_newest" else [True] * 5)
+    assert client.batches[0][2][0][2] == expected_first
+
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure_until_flush():
+    client = _FakeClient()
+    writer = ClickHouseBatchWriter(
+        client,
+        ClickHouseBatchWriterConfig(max_batch_rows=2, max_buffer_rows=2, max_batch_age_seconds=60, block_timeout_seconds=1.0),
+    )
+    await writer.start()
+    results = [await writer.add("context_conversations", _row(i)) for i in range(6)]
+    await writer.close()
+
+    assert results == [True] * 6
+    assert writer.get_metrics()["rows_dropped"] == 0
+    assert sum(len(rows) for _, _, rows in client.batches) == 6
+
+
+def test_writer_survives_successive_event_loops():
+    client = _FakeClient()
+    writer = ClickHouseBatchWriter(client, ClickHouseBatchWriterConfig(max_batch_rows=2, max_batch_age_seconds=60, max_buffer_rows=2))
+
+    async def first_run():
+        await writer.start()
+        for i in range(3):
+            assert await writer.add("context_conversations", _row(i)) is True
+        await asyncio.sleep(0.05)
+
+    async def second_run():
+        # The leftover row from the first loop plus a full buffer exercise the event, lock and condition
+        assert await writer.add("context_conversations", _row(3)) is True
+        assert await writer.add("context_conversations", _row(4)) is True
+        await asyncio.sleep(0.05)
+        await writer.close()
+
+    asyncio.run(first_run())
+    asyncio.run(second_run())
+
+    contents = [row[2] for _, _, rows in client.batches for row in rows]
+    assert contents == ["m0", "m1", "m2", "m3", "m4"]
+    assert writer.get_metrics()["rows_dropped"] == 0
+
+
+@pytest.mark.asyncio
+async def test_backend_routes_appends_through_batch_writer():
+    backend = ClickHousePermanentBackend(auto_create_tables=False, batch_config=ClickHouseBatchWriterConfig(max_batch_age_seconds=60))
+    client = _FakeClient()
+    backend._client = client
+    backend._batch_writer._client = client
+
+    for i in range(3):
+        assert await backend.append_conversation_message("s1", "user", f"m{i}") is True
+    assert client.batches == []
+
+    await backend.close()
+    assert len(client.batches) == 1
+    assert len(client.batches[0][2]) == 3
+    assert backend.get_metrics()["rows_written"] == 3
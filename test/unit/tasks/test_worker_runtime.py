@@ -0,0 +1,141 @@
+"""
+Unit tests for the Celery worker runtime (aiecs.tasks.worker).
+
+Tests cover:
+- Persistent per-process event loop used for async service methods
+- Service instances cached per (mode, service) and reused across tasks
+- Shutdown hooks closing services and stopping the loop
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+worker = pytest.importorskip("aiecs.tasks.worker")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_runtime():
+    worker._service_instances.clear()
+    yield
+    worker._service_instances.clear()
+    worker.worker_loop.stop()
+
+
+class AsyncService:
+    instances = 0
+
+    def __init__(self):
+        type(self).instances += 1
+        self.loops = []
+        self.client_lock = None
+        self.closed = False
+
+    async def summarize(self, input_data, context):
+        # Loop-bound client created on first use, reused by later tasks
+        if self.client_lock is None:
+            self.client_lock = asyncio.Lock()
+        async with self.client_lock:
+            self.loops.append(asyncio.get_running_loop())
+        return {"text": input_data["text"].upper()}
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _run_task(task_name="summarize", service="async-svc"):
+    with patch.object(worker, "publish_progress"):
+        return worker._execute_service_task(None, task_name, "u1", "t1", 0, "execute", service, {"text": "hi"}, {})
+
+
+class TestServicePool:
+    def test_service_reused_across_tasks(self):
+        AsyncService.instances = 0
+        with patch.object(worker, "get_ai_service", return_value=AsyncService) as lookup:
+            first = _run_task()
+            second = _run_task()
+
+        assert first["status"] == second["status"] == "completed"
+        assert first["result"] == {"text": "HI"}
+        assert AsyncService.instances == 1
+        assert lookup.call_count == 1
+
+    def test_distinct_keys_get_distinct_instances(self):
+        with patch.object(worker, "get_ai_service", side_effect=lambda mode, service: MagicMock):
+            assert worker.get_service_instance("execute", "a") is worker.get_service_instance("execute", "a")
+            assert worker.get_service_instance("execute", "a") is not worker.get_service_instance("execute", "b")
+            assert worker.get_service_instance("plan", "a") is not worker.get_service_instance("execute", "a")
+
+    def test_reuse_can_be_disabled(self):
+        with patch.object(worker, "get_ai_service", return_value=MagicMock), patch.object(worker.settings, "celery_worker_reuse_services", False):
+            assert worker.get_service_instance("execute", "a") is not worker.get_service_instance("execute", "a")
+        assert worker._service_instances == {}
+
+
+class TestWorkerEventLoop:
+    def test_async_methods_share_one_long_lived_loop(self):
+        with patch.object(worker, "get_ai_service", return_value=AsyncService):
+            for _ in range(3):
+                assert _run_task()["status"] == "completed"
+
+        service = worker._service_instances[("execute", "async-svc")]
+        assert len(service.loops) == 3
+        assert len(set(map(id, service.loops))) == 1
+        assert service.loops[0] is worker.worker_loop.start()
+        assert worker.worker_loop.running
+
+    def test_stop_cancels_pending_tasks_and_restart_gives_new_loop(self):
+        loop = worker.worker_loop.start()
+        cancelled = []
+
+        async def background():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        asyncio.run_coroutine_threadsafe(background(), loop)
+        worker.worker_loop.run(asyncio.sleep(0))
+        worker.worker_loop.stop()
+
+        assert cancelled == [True]
+        assert loop.is_closed()
+        assert worker.worker_loop.start() is not loop
+
+    def test_run_propagates_exceptions(self):
+        async def boom():
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError, match="bad input"):
+            worker.worker_loop.run(boom())
+
+
+class TestProcessSignals:
+    def test_init_resets_inherited_state(self):
+        stale = worker.worker_loop.start()
+        worker._service_instances[("execute", "stale")] = object()
+
+        with patch.object(worker, "set_progress_channel") as reset_channel:
+            worker._on_worker_process_init()
+
+        assert worker._service_instances == {}
+        reset_channel.assert_called_once_with(None)
+        assert worker.worker_loop.running
+        assert worker.worker_loop.start() is not stale
+        stale.call_soon_threadsafe(stale.stop)
+
+    def test_shutdown_closes_services_and_stops_loop(self):
+        sync_service = MagicMock(spec=["close"])
+        with patch.object(worker, "get_ai_service", return_value=AsyncService):
+            _run_task()
+        async_service = worker._service_instances[("execute", "async-svc")]
+        worker._service_instances[("execute", "sync-svc")] = sync_service
+
+        worker._on_worker_process_shutdown()
+
+        assert async_service.closed is True
+        sync_service.close.assert_called_once_with()
+        assert worker._service_instances == {}
+        assert not worker.worker_loop.running
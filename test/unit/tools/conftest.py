@@ -0,0 +1,13 @@
+"""Shared fixtures for tool unit tests."""
+
+import pytest
+
+from aiecs.tools.tool_executor import reset_executor_pool
+
+
+@pytest.fixture(autouse=True)
+def _isolated_executor_pool():
+    """Give each test fresh shared executors so cached results never leak between tests."""
+    reset_executor_pool()
+    yield
+    reset_executor_pool()
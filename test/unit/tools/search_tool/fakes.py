@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import threading
+import time
+
 from aiecs.tools.search_tool.backends.protocol import BackendRawResult, SearchCallParams
 from aiecs.tools.search_tool.constants import CircuitBreakerOpenError, RateLimitError, SearchAPIError
 from aiecs.tools.search_tool.resilience import BackendResilienceGuard
@@ -23,6 +26,7 @@ class FakeGroundingBackend:
         grounding_chunks: list[dict] | None = None,
         grounding_supports: list[dict] | None = None,
         resilience: BackendResilienceGuard | None = None,
+        delay_seconds: float = 0.0,
     ) -> None:
         self.name = name
         self._configured = configured
@@ -41,6 +45,10 @@ class FakeGroundingBackend:
             circuit_breaker_timeout=60,
         )
         self.search_calls: list[SearchCallParams] = []
+        self._delay_seconds = delay_seconds
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
 
     def is_configured(self) -> bool:
         return self._configured
@@ -54,6 +62,18 @@ class FakeGroundingBackend:
 
     def search(self, params: SearchCallParams) -> BackendRawResult:
         self.search_calls.append(params)
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            if self._delay_seconds:
+                time.sleep(self._delay_seconds)
+            return self._search(params)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _search(self, params: SearchCallParams) -> BackendRawResult:
         if self._should_succeed():
             citations = list(self._citations)
             provider_native = None
@@ -0,0 +1,138 @@
+"""Persistent loop + shared async clients for the custom-backend sync bridge (M-D.5 §3.4)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from aiecs.tools.search_tool.backends import async_bridge
+from aiecs.tools.search_tool.backends.async_bridge import (
+    close_shared_async_client,
+    get_shared_async_client,
+    run_async_from_sync,
+    shutdown_async_bridge,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_bridge():
+    shutdown_async_bridge()
+    yield
+    shutdown_async_bridge()
+
+
+class _FakeAsyncClient:
+    instances: list["_FakeAsyncClient"] = []
+
+    def __init__(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+        _FakeAsyncClient.instances.append(self)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+async def _loop_identity() -> tuple[int, int]:
+    return id(asyncio.get_running_loop()), threading.get_ident()
+
+
+def test_calls_share_one_background_loop() -> None:
+    first = run_async_from_sync(_loop_identity(), timeout=5.0)
+    second = run_async_from_sync(_loop_identity(), timeout=5.0)
+    assert first == second
+    assert first[1] != threading.get_ident()
+
+
+def test_works_from_a_thread_with_a_running_loop() -> None:
+    async def caller() -> tuple[int, int]:
+        # A sync backend called from async code: must not nest asyncio.run.
+        return run_async_from_sync(_loop_identity(), timeout=5.0)
+
+    bridge_loop_id, _ = run_async_from_sync(_loop_identity(), timeout=5.0)
+    assert asyncio.run(caller())[0] == bridge_loop_id
+
+
+def test_timeout_and_exceptions_propagate() -> None:
+    async def slow() -> None:
+        await asyncio.sleep(5)
+
+    async def boom() -> None:
+        raise ValueError("backend failed")
+
+    with pytest.raises(TimeoutError):
+        run_async_from_sync(slow(), timeout=0.05)
+    with pytest.raises(ValueError, match="backend failed"):
+        run_async_from_sync(boom(), timeout=5.0)
+    # The loop survives both.
+    assert run_async_from_sync(_loop_identity(), timeout=5.0)
+
+
+def test_reentrant_call_from_bridge_loop_does_not_deadlock() -> None:
+    async def inner() -> int:
+        return 7
+
+    async def outer() -> int:
+        # A sync helper invoked from a coroutine already on the bridge loop
+        return run_async_from_sync(inner(), timeout=5.0)
+
+    assert run_async_from_sync(outer(), timeout=5.0) == 7
+
+
+def test_shared_client_is_reused_and_closed_on_shutdown() -> None:
+    _FakeAsyncClient.instances.clear()
+
+    async def use_client() -> int:
+        client = await get_shared_async_client("exa", _FakeAsyncClient)
+        assert client.loop is asyncio.get_running_loop()
+        return id(client)
+
+    assert run_async_from_sync(use_client(), timeout=5.0) == run_async_from_sync(use_client(), timeout=5.0)
+    assert len(_FakeAsyncClient.instances) == 1
+
+    shutdown_async_bridge()
+    assert _FakeAsyncClient.instances[0].closed is True
+
+    # A new loop (and client) after shutdown
+    run_async_from_sync(use_client(), timeout=5.0)
+    assert len(_FakeAsyncClient.instances) == 2
+
+
+def test_close_shared_client_by_key() -> None:
+    async def use_client() -> _FakeAsyncClient:
+        return await get_shared_async_client("exa", _FakeAsyncClient)
+
+    client = run_async_from_sync(use_client(), timeout=5.0)
+    assert close_shared_async_client("exa") is True
+    assert client.closed is True
+    assert close_shared_async_client("exa") is False
+    assert run_async_from_sync(use_client(), timeout=5.0) is not client
+
+
+def test_shared_client_requires_bridge_loop() -> None:
+    async def outside() -> None:
+        await get_shared_async_client("exa", _FakeAsyncClient)
+
+    with pytest.raises(RuntimeError, match="run_async_from_sync"):
+        asyncio.run(outside())
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_starts_its_own_loop() -> None:
+    parent_loop_id, _ = run_async_from_sync(_loop_identity(), timeout=5.0)
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child process
+        try:
+            assert async_bridge._background is None
+            run_async_from_sync(_loop_identity(), timeout=5.0)
+            os._exit(0)
+        except BaseException:
+            os._exit(1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    # Parent loop untouched by the child
+    assert run_async_from_sync(_loop_identity(), timeout=5.0)[0] == parent_loop_id
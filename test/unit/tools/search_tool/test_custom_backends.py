@@ -8,6 +8,7 @@ import pytest
 
 from aiecs.tools.search_tool.backends.async_bridge import run_async_from_sync
 from aiecs.tools.search_tool.core import SearchTool
+from aiecs.tools.tool_executor import reset_executor_pool
 from test.unit.tools.search_tool.fakes import FakeGroundingBackend
 
 
@@ -118,6 +119,8 @@ def test_custom_backend_appears_in_fingerprint_cache_miss_vs_without() -> None:
 
     # Same query + different fingerprint must not reuse plain-tool cache semantics:
     # exercise miss on a single instance by registering custom after a hit.
+    # tool_plain has the same config, so start from fresh shared executors/caches.
+    reset_executor_pool()
     gemini_same = FakeGroundingBackend("gemini", citations=citations)
     tool = SearchTool(
         config=_base_config(grounding_provider_chain="gemini,google_cse"),
@@ -0,0 +1,217 @@
+"""search_batch concurrent fan-out (batch_max_concurrency, M-D.5 §3.7)."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+from typing import Callable
+
+import pytest
+
+from aiecs.tools.search_tool import core
+from aiecs.tools.search_tool.backends.registry import GroundingBackendRegistry
+from aiecs.tools.search_tool.constants import RateLimitError
+from aiecs.tools.search_tool.core import SearchTool
+from aiecs.tools.search_tool.resilience import BackendResilienceGuard
+from aiecs.tools.search_tool.router import BatchRoutingContext
+from test.unit.tools.search_tool.fakes import FakeGroundingBackend
+
+QUERIES = ["q1 alpha", "q2 beta", "q3 gamma", "q4 delta", "q5 epsilon", "q6 zeta"]
+
+
+def _tool(*, gemini: FakeGroundingBackend, grok: FakeGroundingBackend, cse: FakeGroundingBackend, **overrides: object) -> SearchTool:
+    config: dict[str, object] = {
+        "grounding_provider": "auto",
+        "grounding_provider_chain": "gemini,grok,google_cse",
+        "batch_routing_mode": "pin_on_first_success",
+        "batch_p95_budget_seconds": 15.0,
+        "grounding_timeout_seconds": 30.0,
+        "enable_intent_analysis": False,
+        "enable_context_tracking": False,
+        "enable_intelligent_cache": False,
+        "enable_quality_analysis": False,
+        "enable_deduplication": False,
+        "max_batch_queries": 6,
+        "batch_max_concurrency": 3,
+    }
+    config.update(overrides)
+    tool = SearchTool(config=config)
+    registry = GroundingBackendRegistry()
+    for backend in (gemini, grok, cse):
+        registry.register(backend)
+    tool._registry = registry
+    return tool
+
+
+def test_pin_runs_first_query_then_fans_out_on_pinned_backend() -> None:
+    gemini = FakeGroundingBackend("gemini", succeed=False, error="gemini down")
+    grok = FakeGroundingBackend("grok", delay_seconds=0.05)
+    cse = FakeGroundingBackend("google_cse")
+    tool = _tool(gemini=gemini, grok=grok, cse=cse)
+
+    result = tool.search_batch(queries=QUERIES, num_results=2, auto_enhance=False)
+
+    metadata = result["_metadata"]
+    assert metadata["batch_pinned_backend"] == "grok"
+    assert metadata["batch_max_concurrency"] == 3
+    assert metadata["batch_first_query_chain_attempted"] == ["gemini", "grok"]
+    assert metadata["per_query_backend_used"] == ["grok"] * len(QUERIES)
+    # Only the first query walked the chain; the rest went straight to the pin.
+    assert len(gemini.search_calls) == 1
+    assert len(grok.search_calls) == len(QUERIES)
+    assert grok.search_calls[0].original_query == QUERIES[0]
+    assert grok.max_in_flight > 1
+    assert len(cse.search_calls) == 0
+
+    assert [bucket["query"] for bucket in result["per_query"]] == QUERIES
+    assert [bucket["_search_metadata"]["batch_query_index"] for bucket in result["per_query"]] == list(range(len(QUERIES)))
+    assert result["per_query"][0]["_search_metadata"]["batch_used_pinned_backend"] is False
+    assert all(bucket["_search_metadata"]["batch_used_pinned_backend"] for bucket in result["per_query"][1:])
+
+
+def test_fan_out_waits_for_a_pin_before_going_concurrent() -> None:
+    # Q1 exhausts the chain (Tier C), Q2 pins gemini, Q3+ fan out on it.
+    gemini = FakeGroundingBackend("gemini", succeed_sequence=[False, True, True, True, True, True], delay_seconds=0.02)
+    grok = FakeGroundingBackend("grok", succeed=False, error="grok down")
+    cse = FakeGroundingBackend("google_cse", succeed=False, error="cse down")
+    tool = _tool(gemini=gemini, grok=grok, cse=cse, search_error_mode="return_dict")
+
+    result = tool.search_batch(queries=QUERIES, num_results=2, auto_enhance=False)
+
+    assert result["_metadata"]["batch_pinned_backend"] == "gemini"
+    assert result["_metadata"]["failed_query_indices"] == [0]
+    assert [call.original_query for call in gemini.search_calls[:2]] == QUERIES[:2]
+    assert len(grok.search_calls) == 1
+    assert len(cse.search_calls) == 1
+
+
+def test_per_query_mode_fans_out_every_query_in_order() -> None:
+    # Breaker threshold above the batch size so every query walks gemini first.
+    guard = BackendResilienceGuard("gemini", rate_limit_requests=60, rate_limit_window=3600, circuit_breaker_threshold=100, circuit_breaker_timeout=60)
+    gemini = FakeGroundingBackend("gemini", succeed=False, error="gemini down", resilience=guard)
+    grok = FakeGroundingBackend("grok", configured=False)
+    cse = FakeGroundingBackend("google_cse", delay_seconds=0.05)
+    tool = _tool(gemini=gemini, grok=grok, cse=cse, batch_routing_mode="per_query")
+
+    result = tool.search_batch(queries=QUERIES, num_results=2, auto_enhance=False, batch_routing_mode="per_query")
+
+    assert result["_metadata"]["batch_pinned_backend"] is None
+    assert result["_metadata"]["batch_first_query_chain_attempted"] == ["gemini", "grok", "google_cse"]
+    assert result["_metadata"]["per_query_backend_used"] == ["google_cse"] * len(QUERIES)
+    assert [bucket["query"] for bucket in result["per_query"]] == QUERIES
+    assert len(gemini.search_calls) == len(QUERIES)
+    assert cse.max_in_flight > 1
+
+
+def test_fan_out_timeouts_share_remaining_budget_per_worker_slot() -> None:
+    gemini = FakeGroundingBackend("gemini")
+    tool = _tool(
+        gemini=gemini,
+        grok=FakeGroundingBackend("grok"),
+        cse=FakeGroundingBackend("google_cse"),
+        batch_p95_budget_seconds=12.0,
+        batch_max_concurrency=2,
+    )
+
+    tool.search_batch(queries=QUERIES[:5], num_results=2, auto_enhance=False)
+
+    timeouts = [call.timeout_seconds for call in gemini.search_calls]
+    # Q1 sequential: 12 / 5 slots
+    assert timeouts[0] == pytest.approx(2.4, abs=0.05)
+    # Q2..Q5 on 2 workers: first two starts see ceil(4/2) = 2 slots left, last two 1 slot
+    assert sorted(timeouts[1:]) == pytest.approx([6.0, 6.0, 12.0, 12.0], abs=0.1)
+
+
+def test_rate_limit_during_fan_out_raises_and_stops_unstarted_queries() -> None:
+    gemini = FakeGroundingBackend(
+        "gemini",
+        succeed_sequence=[True],
+        error="gemini rate limited",
+        error_type="rate_limit_exceeded",
+        delay_seconds=0.02,
+    )
+    tool = _tool(
+        gemini=gemini,
+        grok=FakeGroundingBackend("grok", configured=False),
+        cse=FakeGroundingBackend("google_cse", configured=False),
+        grounding_provider="gemini",
+        batch_max_concurrency=2,
+    )
+
+    with pytest.raises(RateLimitError):
+        tool.search_batch(queries=QUERIES, num_results=2, auto_enhance=False, grounding_provider="gemini")
+
+    # Q1 pinned; Q2 and Q3 were in flight when the limit hit; Q4+ never dispatched.
+    assert len(gemini.search_calls) == 3
+
+
+class _ReversedExecutor:
+    """Runs submitted work in reverse order on first result(), so earlier queries start last."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        self._pending: list[tuple[Future, Callable[..., None], tuple]] = []
+
+    def submit(self, fn: Callable[..., None], *args: object) -> Future:
+        future: Future = _LazyFuture(self)
+        self._pending.append((future, fn, args))
+        return future
+
+    def run_all(self) -> None:
+        pending, self._pending = self._pending, []
+        for future, fn, args in reversed(pending):
+            future.set_result(fn(*args))
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        self._pending = []
+
+
+class _LazyFuture(Future):
+    def __init__(self, executor: _ReversedExecutor) -> None:
+        super().__init__()
+        self._executor = executor
+
+    def result(self, timeout: float | None = None) -> object:
+        if not self.done():
+            self._executor.run_all()
+        return super().result(timeout)
+
+
+def test_queries_skipped_by_an_abort_are_not_routed_afterwards(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(core, "ThreadPoolExecutor", _ReversedExecutor)
+    gemini = FakeGroundingBackend(
+        "gemini",
+        succeed_sequence=[True],
+        error="gemini rate limited",
+        error_type="rate_limit_exceeded",
+    )
+    tool = _tool(
+        gemini=gemini,
+        grok=FakeGroundingBackend("grok", configured=False),
+        cse=FakeGroundingBackend("google_cse", configured=False),
+        grounding_provider="gemini",
+        batch_max_concurrency=2,
+    )
+
+    with pytest.raises(RateLimitError):
+        tool.search_batch(queries=QUERIES, num_results=2, auto_enhance=False, grounding_provider="gemini")
+
+    # Q1 pinned; Q6 started first in the fan-out and hit the limit; Q2..Q5 were skipped.
+    assert [call.original_query for call in gemini.search_calls] == [QUERIES[0], QUERIES[-1]]
+
+
+def test_single_worker_dispatches_sequentially() -> None:
+    gemini = FakeGroundingBackend("gemini")
+    tool = _tool(gemini=gemini, grok=FakeGroundingBackend("grok"), cse=FakeGroundingBackend("google_cse"), batch_max_concurrency=1)
+
+    result = tool.search_batch(queries=QUERIES[:3], num_results=2, auto_enhance=False)
+
+    assert result["_metadata"]["batch_max_concurrency"] == 1
+    assert gemini.max_in_flight == 1
+    assert [call.original_query for call in gemini.search_calls] == QUERIES[:3]
+
+
+def test_record_backend_used_keeps_query_slots() -> None:
+    ctx = BatchRoutingContext(mode="per_query")
+    ctx.record_backend_used(2, "grok")
+    ctx.record_backend_used(0, "gemini")
+    ctx.record_backend_used(1, "google_cse")
+    assert ctx.per_query_backend_used == ["gemini", "google_cse", "grok"]
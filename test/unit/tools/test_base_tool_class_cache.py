@@ -0,0 +1,140 @@
+"""
+Unit tests for BaseTool per-class schema and introspection caching.
+
+Tests cover:
+- Schemas are generated once per class, not per instance
+- Instances get independent copies of the cached maps
+- The schema fingerprint hook keys separate cache entries
+- Config class detection is cached
+- Input sanitization with the precompiled pattern
+"""
+
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel, Field
+
+from aiecs.tools import base_tool
+from aiecs.tools.base_tool import BaseTool, clear_tool_class_cache
+from aiecs.tools.tool_executor import SecurityError
+
+
+class CachedTool(BaseTool):
+    """Tool with a manual schema, an auto-generated schema and an async method"""
+
+    class ReadSchema(BaseModel):
+        path: str = Field(description="File path")
+
+    def read(self, path: str):
+        return path
+
+    def write(self, path: str, content: str):
+        return content
+
+    async def fetch(self, url: str):
+        return url
+
+
+class ModeTool(BaseTool):
+    """Tool whose schemas depend on configuration"""
+
+    def _schema_fingerprint(self) -> str:
+        return str(self._config.get("mode", ""))
+
+    def echo(self, value: str):
+        return value
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_tool_class_cache()
+    yield
+    clear_tool_class_cache()
+
+
+class TestClassIntrospectionCache:
+    """Test that introspection runs once per class"""
+
+    def test_schemas_generated_once(self):
+        with patch.object(base_tool, "generate_schema_from_method", wraps=base_tool.generate_schema_from_method) as generate:
+            first = CachedTool(config={})
+            calls = generate.call_count
+            second = CachedTool(config={})
+
+        assert calls > 0
+        assert generate.call_count == calls
+        assert second._schemas == first._schemas
+        assert second._schemas["read"] is CachedTool.ReadSchema
+        assert second._async_methods == first._async_methods
+        assert "fetch" in second._async_methods
+        assert second.get_schema_coverage()["total_methods"] == first.get_schema_coverage()["total_methods"]
+
+    def test_instances_get_independent_copies(self):
+        first = CachedTool(config={})
+        second = CachedTool(config={})
+
+        first._schemas["extra"] = CachedTool.ReadSchema
+        first._async_methods.append("extra")
+        first._schema_coverage["manual_schemas"] += 1
+
+        third = CachedTool(config={})
+        assert "extra" not in second._schemas and "extra" not in third._schemas
+        assert "extra" not in third._async_methods
+        assert third._schema_coverage["manual_schemas"] == second._schema_coverage["manual_schemas"]
+
+    def test_fingerprint_keys_cache_entries(self):
+        with patch.object(base_tool, "generate_schema_from_method", wraps=base_tool.generate_schema_from_method) as generate:
+            ModeTool(config={"mode": "a"})
+            after_a = generate.call_count
+            ModeTool(config={"mode": "a"})
+            assert generate.call_count == after_a
+            ModeTool(config={"mode": "b"})
+            assert generate.call_count > after_a
+
+    def test_clear_cache_regenerates(self):
+        with patch.object(base_tool, "generate_schema_from_method", wraps=base_tool.generate_schema_from_method) as generate:
+            CachedTool(config={})
+            calls = generate.call_count
+            clear_tool_class_cache()
+            CachedTool(config={})
+
+        assert generate.call_count == 2 * calls
+
+    def test_config_class_detection_cached(self):
+        class ConfiguredTool(BaseTool):
+            class Config(BaseModel):
+                timeout: int = 30
+
+        calls = []
+        original = BaseTool._find_config_class
+
+        def find(self):
+            calls.append(self)
+            return original(self)
+
+        with patch.object(ConfiguredTool, "_find_config_class", find):
+            ConfiguredTool()
+            ConfiguredTool()
+            assert ConfiguredTool().settings.timeout == 30
+
+        assert len(calls) == 1
+
+    def test_missing_config_class_cached(self):
+        with patch.object(CachedTool, "_find_config_class", return_value=None) as find:
+            CachedTool(config={})
+            CachedTool(config={})
+
+        assert find.call_count == 1
+
+
+class TestSanitizeKwargs:
+    """Test input sanitization"""
+
+    @pytest.mark.parametrize("value", ["select * from users", "a; b", "x -- y", "/* c */", "INSERT into t"])
+    def test_rejects_malicious_input(self, value):
+        with pytest.raises(SecurityError):
+            CachedTool(config={})._sanitize_kwargs({"path": value})
+
+    def test_passes_clean_input(self):
+        kwargs = {"path": "/tmp/selected.txt", "count": 3}
+        assert CachedTool(config={})._sanitize_kwargs(kwargs) == kwargs
@@ -0,0 +1,396 @@
+"""Unit tests for ToolExecutor cache keys and single-flight coalescing."""
+
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aiecs.tools.base_tool import BaseTool
+from aiecs.tools.tool_executor import (
+    BulkheadRejectedError,
+    OperationError,
+    ToolExecutor,
+    get_executor,
+    get_executor_pool_stats,
+)
+from aiecs.utils.execution_utils import ExecutionUtils
+
+
+class _SlowTool:
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = 0
+
+    async def lookup(self, query: str):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"query": query, "call": self.calls}
+
+    async def broken(self, query: str):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        raise ValueError(f"bad {query}")
+
+
+def _executor(**overrides) -> ToolExecutor:
+    config = {"log_execution_time": False, "retry_attempts": 1, "retry_backoff": 0.0}
+    config.update(overrides)
+    return ToolExecutor(config)
+
+
+@pytest.mark.unit
+def test_cache_key_is_stable_across_processes():
+    script = "from aiecs.utils.execution_utils import ExecutionUtils;" "print(ExecutionUtils().generate_cache_key('op', 'u', 't', (1, 'a'), {'b': {2, 1}, 'a': 'x'}))"
+    keys = set()
+    for seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        out = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+        keys.add(out.stdout.strip().splitlines()[-1])
+    local = ExecutionUtils().generate_cache_key("op", "u", "t", (1, "a"), {"a": "x", "b": {1, 2}})
+    assert keys == {local}
+    assert len(local) == 32
+
+
+@pytest.mark.unit
+def test_cache_key_distinguishes_arguments():
+    utils = ExecutionUtils()
+    assert utils.generate_cache_key("op", "u", "t", (), {"q": 1}) != utils.generate_cache_key("op", "u", "t", (), {"q": 2})
+    assert utils.generate_cache_key("op", "u", "t", (), {"q": 1}) != utils.generate_cache_key("op2", "u", "t", (), {"q": 1})
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_execution():
+    executor = _executor()
+    tool = _SlowTool()
+
+    results = await asyncio.gather(*(executor.execute_async(tool, "lookup", query="ai") for _ in range(5)))
+
+    assert tool.calls == 1
+    assert all(r == results[0] for r in results)
+    metrics = executor.get_metrics()
+    assert metrics["coalesced_hits"] == 4
+    assert metrics["requests"] == 5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_distinct_calls_are_not_coalesced():
+    executor = _executor()
+    tool = _SlowTool()
+
+    await asyncio.gather(executor.execute_async(tool, "lookup", query="a"), executor.execute_async(tool, "lookup", query="b"))
+
+    assert tool.calls == 2
+    assert executor.get_metrics()["coalesced_hits"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_coalesced_callers_share_failure():
+    executor = _executor()
+    tool = _SlowTool()
+
+    results = await asyncio.gather(*(executor.execute_async(tool, "broken", query="x") for _ in range(3)), return_exceptions=True)
+
+    assert tool.calls == 1
+    assert all(isinstance(r, OperationError) for r in results)
+    assert executor.get_metrics()["failures"] == 3
+    assert not executor._inflight
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_single_flight_can_be_disabled():
+    executor = _executor(enable_single_flight=False)
+    tool = _SlowTool()
+
+    await asyncio.gather(*(executor.execute_async(tool, "lookup", query="ai") for _ in range(3)))
+
+    assert tool.calls == 3
+
+
+class _ConcurrencyTool:
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def work(self, n: int):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return n
+
+    async def other(self, n: int):
+        return await self.work(n)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_tool_bulkhead_bounds_concurrency_and_reports_metrics():
+    executor = _executor(enable_cache=False, bulkheads={"_ConcurrencyTool": {"max_concurrent": 2}})
+    tool = _ConcurrencyTool()
+
+    results = await asyncio.gather(*(executor.execute_async(tool, "work", n=i) for i in range(6)))
+
+    assert results == list(range(6))
+    assert tool.max_in_flight == 2
+    stats = executor.get_metrics()["bulkheads"]["_ConcurrencyTool"]
+    assert stats["acquired"] == 6
+    assert stats["in_flight"] == 0
+    assert stats["queued"] == 0
+    assert stats["max_queue_wait"] > 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_operation_bulkhead_only_limits_that_operation():
+    executor = _executor(enable_cache=False, bulkheads={"_ConcurrencyTool.work": {"max_concurrent": 1}})
+    tool = _ConcurrencyTool()
+
+    await asyncio.gather(*(executor.execute_async(tool, "work", n=i) for i in range(3)))
+    assert tool.max_in_flight == 1
+
+    tool.max_in_flight = 0
+    await asyncio.gather(*(executor.execute_async(tool, "other", n=i) for i in range(3)))
+    assert tool.max_in_flight == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulkhead_rejects_when_queue_full():
+    executor = _executor(enable_cache=False, bulkheads={"_ConcurrencyTool": {"max_concurrent": 1, "max_queue": 1}})
+    tool = _ConcurrencyTool()
+
+    results = await asyncio.gather(*(executor.execute_async(tool, "work", n=i) for i in range(3)), return_exceptions=True)
+
+    rejected = [r for r in results if isinstance(r, BulkheadRejectedError)]
+    assert len(rejected) == 1
+    assert executor.get_metrics()["bulkheads"]["_ConcurrencyTool"]["rejected_queue_full"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulkhead_queue_wait_timeout():
+    executor = _executor(
+        enable_cache=False,
+        bulkheads={"_ConcurrencyTool": {"max_concurrent": 1, "queue_timeout": 0.01}},
+    )
+    tool = _ConcurrencyTool(delay=0.1)
+
+    results = await asyncio.gather(*(executor.execute_async(tool, "work", n=i) for i in range(2)), return_exceptions=True)
+
+    assert results[0] == 0
+    assert isinstance(results[1], BulkheadRejectedError)
+    stats = executor.get_metrics()["bulkheads"]["_ConcurrencyTool"]
+    assert stats["rejected_timeout"] == 1
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_default_tool_bulkhead_and_batch_bound():
+    executor = _executor(enable_cache=False, io_concurrency=3, default_tool_bulkhead={"max_concurrent": 5})
+    tool = _ConcurrencyTool()
+
+    results = await executor.execute_batch(tool, [{"op": "work", "kwargs": {"n": i}} for i in range(8)])
+
+    assert results == list(range(8))
+    assert tool.max_in_flight == 3
+    assert "_ConcurrencyTool" in executor.get_metrics()["bulkheads"]
+
+
+class _FlakyTool:
+    def __init__(self):
+        self.attempts = 0
+        self.finished = []
+
+    async def flaky(self, n: int):
+        self.attempts += 1
+        if self.attempts == 1:
+            raise ConnectionError("backend flapped")
+        self.finished.append(n)
+        return n
+
+    async def steady(self, n: int):
+        self.finished.append(n)
+        return n
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulkhead_slot_is_released_during_retry_backoff():
+    executor = _executor(enable_cache=False, retry_attempts=2, bulkheads={"_FlakyTool": {"max_concurrent": 1}})
+    tool = _FlakyTool()
+
+    flaky = asyncio.create_task(executor.execute_async(tool, "flaky", n=1))
+    await asyncio.sleep(0.05)
+    # The first attempt failed and is backing off; its slot must be free
+    assert await asyncio.wait_for(executor.execute_async(tool, "steady", n=2), 0.5) == 2
+    assert await flaky == 1
+
+    assert tool.finished == [2, 1]
+    assert executor.get_metrics()["bulkheads"]["_FlakyTool"]["acquired"] == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulkhead_rejection_is_not_retried():
+    executor = _executor(enable_cache=False, retry_attempts=3, bulkheads={"_ConcurrencyTool": {"max_concurrent": 1, "max_queue": 0}})
+    tool = _ConcurrencyTool()
+
+    results = await asyncio.gather(*(executor.execute_async(tool, "work", n=i) for i in range(2)), return_exceptions=True)
+
+    assert results[0] == 0
+    assert isinstance(results[1], BulkheadRejectedError)
+    assert executor.get_metrics()["bulkheads"]["_ConcurrencyTool"]["rejected_queue_full"] == 1
+
+
+class _BlockingTool:
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def work(self, n: int):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return n
+
+
+@pytest.mark.unit
+def test_sync_execute_shares_the_bulkhead():
+    executor = _executor(enable_cache=False, bulkheads={"_BlockingTool": {"max_concurrent": 2}})
+    tool = _BlockingTool()
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        results = list(pool.map(lambda i: executor.execute(tool, "work", n=i), range(6)))
+
+    assert results == list(range(6))
+    assert tool.max_in_flight == 2
+    stats = executor.get_metrics()["bulkheads"]["_BlockingTool"]
+    assert stats["acquired"] == 6
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.unit
+def test_sync_execute_rejected_when_queue_wait_times_out():
+    executor = _executor(enable_cache=False, bulkheads={"_BlockingTool": {"max_concurrent": 1, "queue_timeout": 0.01}})
+    tool = _BlockingTool(delay=0.2)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(executor.execute, tool, "work", n=0)
+        time.sleep(0.05)
+        with pytest.raises(BulkheadRejectedError):
+            executor.execute(tool, "work", n=1)
+        assert first.result() == 0
+
+    stats = executor.get_metrics()["bulkheads"]["_BlockingTool"]
+    assert stats["rejected_timeout"] == 1
+    assert stats["queued"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sync_tool_timeout_keeps_slot_until_thread_finishes():
+    executor = _executor(enable_cache=False, timeout=1, bulkheads={"_BlockingTool": {"max_concurrent": 1}})
+    tool = _BlockingTool(delay=1.5)
+
+    with pytest.raises(OperationError, match="timed out"):
+        await executor.execute_async(tool, "work", n=0)
+    # The attempt gave up but its worker thread is still running and holds the slot
+    assert executor.get_metrics()["bulkheads"]["_BlockingTool"]["in_flight"] == 1
+
+    tool.delay = 0.0
+    assert await executor.execute_async(tool, "work", n=1) == 1
+
+    assert tool.max_in_flight == 1
+    stats = executor.get_metrics()["bulkheads"]["_BlockingTool"]
+    assert stats["in_flight"] == 0
+    assert stats["max_queue_wait"] > 0.2
+
+
+@pytest.mark.unit
+def test_get_executor_pools_by_normalized_config():
+    default = get_executor()
+
+    assert get_executor({}) is default
+    assert get_executor({"max_workers": 4}) is default
+    assert get_executor({"timeout": 60}) is get_executor({"timeout": 60})
+    assert get_executor({"timeout": 60}) is not default
+    assert get_executor_pool_stats()["executors"] == 2
+
+
+@pytest.mark.unit
+def test_executors_share_compatible_thread_pool_and_cache():
+    default = get_executor()
+    slow = get_executor({"timeout": 60})
+    small_cache = get_executor({"cache_size": 10})
+
+    assert slow._thread_pool is default._thread_pool
+    assert slow.cache_provider is default.cache_provider
+    assert small_cache.cache_provider is not default.cache_provider
+    stats = get_executor_pool_stats()
+    assert stats["thread_pools"] == 1
+    assert stats["cache_providers"] == 2
+
+
+@pytest.mark.unit
+def test_worker_threads_capped_per_process(monkeypatch):
+    monkeypatch.setenv("TOOL_EXECUTOR_MAX_TOTAL_WORKERS", str((os.cpu_count() or 4) + 8))
+    base = get_executor()
+    bigger = get_executor({"max_workers": (os.cpu_count() or 4) + 16})
+
+    stats = get_executor_pool_stats()
+    assert bigger._thread_pool is base._thread_pool
+    assert stats["thread_pools"] == 1
+    assert stats["worker_threads_allocated"] <= stats["worker_threads_cap"]
+
+
+@pytest.mark.unit
+def test_executor_metrics_report_process_counts():
+    executor = get_executor()
+
+    process = executor.get_metrics()["process"]
+
+    assert process["executors"] == 1
+    assert process["thread_pools"] == 1
+    assert process["process_threads"] >= 1
+
+
+class _EchoToolA(BaseTool):
+    def echo(self, value: str):
+        return f"A:{value}"
+
+
+class _EchoToolB(BaseTool):
+    def echo(self, value: str):
+        return f"B:{value}"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_tools_sharing_an_executor_keep_separate_cache_entries():
+    tool_a = _EchoToolA(config={})
+    tool_b = _EchoToolB(config={})
+    assert tool_a._executor is tool_b._executor
+
+    assert await tool_a.run_async("echo", value="x") == "A:x"
+    assert await tool_b.run_async("echo", value="x") == "B:x"
+    assert tool_a.run("echo", value="x") == "A:x"
+    assert _EchoToolA(config={})._cache_namespace == tool_a._cache_namespace
+    assert _EchoToolA(config={"mode": "other"})._cache_namespace != tool_a._cache_namespace
@@ -0,0 +1,188 @@
+"""
+Unit tests for the prebuilt tool manifest used by placeholder discovery.
+"""
+
+import json
+import os
+
+import pytest
+
+from aiecs.tools import tool_manifest
+from aiecs.tools.tool_manifest import (
+    MANIFEST_VERSION,
+    build_manifest,
+    discover_tools_from_manifest,
+    load_manifest,
+    manifest_content,
+    scan_tool_source,
+    write_manifest,
+)
+
+TOOL_DIRS = (("task_tools", "task"),)
+
+ALPHA_SOURCE = '''
+from aiecs.tools import register_tool
+
+
+@register_tool("alpha")
+class AlphaTool:
+    """Alpha tool for testing."""
+'''
+
+BETA_SOURCE = '''
+register_tool("beta")(BetaTool)
+'''
+
+
+@pytest.fixture
+def tools_dir(tmp_path):
+    pkg = tmp_path / "task_tools"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text('"""Task tools."""\n')
+    (pkg / "alpha_tool.py").write_text(ALPHA_SOURCE)
+    (pkg / "beta_tool.py").write_text(BETA_SOURCE)
+    return tmp_path
+
+
+@pytest.fixture
+def manifest_path(tools_dir, tmp_path):
+    path = str(tmp_path / "tool_manifest.json")
+    write_manifest(build_manifest(str(tools_dir), TOOL_DIRS, record_stats=True), path)
+    return path
+
+
+class TestScanToolSource:
+    def test_decorator_with_class_docstring(self):
+        assert scan_tool_source("alpha_tool.py", ALPHA_SOURCE) == [("alpha", "Alpha tool for testing.")]
+
+    def test_function_call_registration(self):
+        assert scan_tool_source("beta_tool.py", BETA_SOURCE) == [("beta", "beta tool")]
+
+    def test_init_uses_module_docstring(self):
+        content = '"""Search Package\n\nMore text."""\nregister_tool("search")(SearchTool)\n'
+        assert scan_tool_source("__init__.py", content) == [("search", "Search Package")]
+
+
+class TestBuildManifest:
+    def test_keyed_by_module_with_hashes(self, tools_dir):
+        manifest = build_manifest(str(tools_dir), TOOL_DIRS)
+
+        assert manifest["version"] == MANIFEST_VERSION
+        modules = manifest["modules"]
+        assert set(modules) == {
+            "aiecs.tools.task_tools",
+            "aiecs.tools.task_tools.alpha_tool",
+            "aiecs.tools.task_tools.beta_tool",
+        }
+        alpha = modules["aiecs.tools.task_tools.alpha_tool"]
+        assert alpha["path"] == "task_tools/alpha_tool.py"
+        assert alpha["category"] == "task"
+        assert len(alpha["sha256"]) == 64
+        assert alpha["tools"] == [{"name": "alpha", "description": "Alpha tool for testing."}]
+        # Content-only by default, so the committed manifest does not depend on the checkout
+        assert "mtime_ns" not in alpha and "size" not in alpha
+        assert manifest_content(manifest) == manifest
+
+    def test_record_stats(self, tools_dir):
+        alpha = build_manifest(str(tools_dir), TOOL_DIRS, record_stats=True)["modules"]["aiecs.tools.task_tools.alpha_tool"]
+
+        assert alpha["size"] == len(ALPHA_SOURCE)
+        assert alpha["mtime_ns"] == os.stat(tools_dir / "task_tools" / "alpha_tool.py").st_mtime_ns
+
+    def test_roundtrip(self, tools_dir, manifest_path):
+        assert load_manifest(manifest_path) == build_manifest(str(tools_dir), TOOL_DIRS, record_stats=True)
+
+
+class TestLoadManifest:
+    def test_missing_file(self, tmp_path):
+        assert load_manifest(str(tmp_path / "missing.json")) is None
+
+    def test_invalid_json(self, tmp_path):
+        path = tmp_path / "tool_manifest.json"
+        path.write_text("{not json")
+        assert load_manifest(str(path)) is None
+
+    def test_other_version(self, tmp_path):
+        path = tmp_path / "tool_manifest.json"
+        path.write_text(json.dumps({"version": MANIFEST_VERSION + 1, "modules": {}}))
+        assert load_manifest(str(path)) is None
+
+
+class TestDiscoverToolsFromManifest:
+    def test_matches_full_scan(self, tools_dir, manifest_path):
+        from_manifest = discover_tools_from_manifest(str(tools_dir), TOOL_DIRS, manifest_path)
+        scanned = discover_tools_from_manifest(str(tools_dir), TOOL_DIRS, None)
+
+        assert sorted(from_manifest) == sorted(scanned)
+        assert ("alpha", "Alpha tool for testing.", "task") in from_manifest
+
+    def test_unchanged_files_are_not_scanned(self, tools_dir, manifest_path, monkeypatch):
+        scanned = []
+        original = tool_manifest._scan_file
+        monkeypatch.setattr(tool_manifest, "_scan_file", lambda name, data: scanned.append(name) or original(name, data))
+
+        discover_tools_from_manifest(str(tools_dir), TOOL_DIRS, manifest_path)
+
+        assert scanned == []
+
+    def test_unchanged_stat_skips_hashing(self, tools_dir, manifest_path, monkeypatch):
+        hashed = []
+        original = tool_manifest.hashlib.sha256
+        monkeypatch.setattr(tool_manifest.hashlib, "sha256", lambda data: hashed.append(data) or original(data))
+
+        tools = discover_tools_from_manifest(str(tools_dir), TOOL_DIRS, manifest_path)
+
+        assert hashed == []
+        assert ("beta", "beta tool", "task") in tools
+
+    def test_touched_file_is_hashed_not_scanned(self, tools_dir, manifest_path, monkeypatch):
+        beta = tools_dir / "task_tools" / "beta_tool.py"
+        st = os.stat(beta)
+        os.utime(beta, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        hashed = []
+        original_hash = tool_manifest.hashlib.sha256
+        monkeypatch.setattr(tool_manifest.hashlib, "sha256", lambda data: hashed.append(data) or original_hash(data))
+        scanned = []
+        original_scan = tool_manifest._scan_file
+        monkeypatch.setattr(tool_manifest, "_scan_file", lambda name, data: scanned.append(name) or original_scan(name, data))
+
+        discover_tools_from_manifest(str(tools_dir), TOOL_DIRS, manifest_path)
+
+        assert hashed == [BETA_SOURCE.encode()]
+        assert scanned == []
+
+    def test_manifest_without_stats_falls_back_to_hashes(self, tools_dir, manifest_path, monkeypatch):
+        write_manifest(build_manifest(str(tools_dir), TOOL_DIRS), manifest_path)
+        scanned = []
+        original = tool_manifest._scan_file
+        monkeypatch.setattr(tool_manifest, "_scan_file", lambda name, data: scanned.append(name) or original(name, data))
+
+        tools = discover_tools_from_manifest(str(tools_dir), TOOL_DIRS, manifest_path)
+
+        assert scanned == []
+        assert len(tools) == 2
+
+    def test_changed_and_new_files_are_rescanned(self, tools_dir, manifest_path, monkeypatch):
+        (tools_dir / "task_tools" / "beta_tool.py").write_text('register_tool("beta2")(BetaTool)\n')
+        (tools_dir / "task_tools" / "gamma_tool.py").write_text('register_tool("gamma")(GammaTool)\n')
+        scanned = []
+        original = tool_manifest._scan_file
+        monkeypatch.setattr(tool_manifest, "_scan_file", lambda name, data: scanned.append(name) or original(name, data))
+
+        tools = discover_tools_from_manifest(str(tools_dir), TOOL_DIRS, manifest_path)
+
+        assert sorted(scanned) == ["beta_tool.py", "gamma_tool.py"]
+        names = {name for name, _, _ in tools}
+        assert names == {"alpha", "beta2", "gamma"}
+
+    def test_removed_files_are_dropped(self, tools_dir, manifest_path):
+        os.remove(tools_dir / "task_tools" / "alpha_tool.py")
+
+        tools = discover_tools_from_manifest(str(tools_dir), TOOL_DIRS, manifest_path)
+
+        assert [name for name, _, _ in tools] == ["beta"]
+
+
+def test_packaged_manifest_is_up_to_date():
+    """The shipped manifest must match the tool sources (regenerate with aiecs-build-tool-manifest)."""
+    assert manifest_content(load_manifest()) == manifest_content(build_manifest())
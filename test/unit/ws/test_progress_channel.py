@@ -0,0 +1,256 @@
+"""
+Unit tests for the cross-process task progress channel.
+
+Tests cover:
+- In-memory channel fan-out, including publishes from worker threads
+- Redis channel wire format and publisher
+- Per-task coalescing of non-terminal updates
+- Socket.IO relay delivering channel updates to locally connected users
+- Celery worker publishing progress through the channel
+"""
+
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from aiecs.config.config import Settings
+from aiecs.ws import progress_channel as channel_mod
+from aiecs.ws import socket_server
+from aiecs.ws.progress_channel import (
+    InMemoryProgressChannel,
+    ProgressCoalescer,
+    RedisProgressChannel,
+    create_progress_channel,
+    decode_progress,
+    encode_progress,
+    set_progress_channel,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_channel():
+    set_progress_channel(None)
+    yield
+    set_progress_channel(None)
+
+
+async def _next(listener, timeout: float = 1.0):
+    return await asyncio.wait_for(listener.__anext__(), timeout)
+
+
+async def _until_subscribed(channel: InMemoryProgressChannel, count: int = 1):
+    while channel.subscriber_count() < count:
+        await asyncio.sleep(0)
+
+
+class TestInMemoryChannel:
+    @pytest.mark.asyncio
+    async def test_every_listener_receives_updates(self):
+        channel = InMemoryProgressChannel()
+        first, second = channel.listen(), channel.listen()
+        # Subscription happens on first iteration
+        pending = [asyncio.ensure_future(_next(first)), asyncio.ensure_future(_next(second))]
+        await _until_subscribed(channel, 2)
+
+        await channel.publish("u1", {"status": "running"})
+
+        assert await asyncio.gather(*pending) == [("u1", {"status": "running"})] * 2
+        await first.aclose()
+        await second.aclose()
+        assert channel.subscriber_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_publish_sync_from_worker_thread(self):
+        channel = InMemoryProgressChannel()
+        listener = channel.listen()
+        pending = asyncio.ensure_future(_next(listener))
+        await _until_subscribed(channel)
+
+        thread = threading.Thread(target=channel.publish_sync, args=("u1", {"step": 1, "result": object()}))
+        thread.start()
+        thread.join()
+
+        user_id, data = await pending
+        assert user_id == "u1" and data["step"] == 1
+        assert isinstance(data["result"], str)
+        await listener.aclose()
+
+
+class TestRedisChannel:
+    def test_wire_format_roundtrip(self):
+        assert decode_progress(encode_progress("u1", {"a": 1}).encode()) == ("u1", {"a": 1})
+        assert decode_progress("not json") is None
+        assert decode_progress(json.dumps({"data": {}})) is None
+
+    def test_publish_sync_uses_one_client(self):
+        client = MagicMock()
+        with patch("redis.Redis.from_url", return_value=client) as from_url:
+            channel = RedisProgressChannel("redis://broker:6379/0")
+            channel.publish_sync("u1", {"status": "running"})
+            channel.publish_sync("u1", {"status": "completed"})
+
+        from_url.assert_called_once_with("redis://broker:6379/0")
+        assert client.publish.call_count == 2
+        name, payload = client.publish.call_args.args
+        assert name == "aiecs:progress"
+        assert decode_progress(payload) == ("u1", {"status": "completed"})
+
+    def test_factory_selects_backend(self):
+        with patch.object(channel_mod, "get_settings", return_value=Settings(PROGRESS_CHANNEL_BACKEND="memory")):
+            assert isinstance(create_progress_channel(), InMemoryProgressChannel)
+        settings = Settings(PROGRESS_CHANNEL_BACKEND="redis", CELERY_BROKER_URL="redis://broker:6379/2")
+        with patch.object(channel_mod, "get_settings", return_value=settings):
+            channel = create_progress_channel()
+        assert isinstance(channel, RedisProgressChannel) and channel.url == "redis://broker:6379/2"
+        with patch.object(channel_mod, "get_settings", return_value=Settings(PROGRESS_CHANNEL_BACKEND="kafka")):
+            with pytest.raises(ValueError):
+                create_progress_channel()
+
+    def test_publish_progress_swallows_errors(self):
+        broken = MagicMock()
+        broken.publish_sync.side_effect = ConnectionError("down")
+        set_progress_channel(broken)
+        channel_mod.publish_progress("u1", {"status": "running"})
+        broken.publish_sync.assert_called_once()
+
+
+class TestCoalescer:
+    @pytest.mark.asyncio
+    async def test_latest_non_terminal_update_per_task_wins(self):
+        delivered = []
+        coalescer = ProgressCoalescer(AsyncMock(side_effect=lambda u, d: delivered.append((u, d))), interval=0.05)
+
+        for pct in range(100):
+            await coalescer.add("u1", {"task": "t", "step": 1, "status": "running", "pct": pct})
+        await coalescer.add("u1", {"task": "t", "step": 2, "status": "running", "pct": 0})
+        assert delivered == []
+        await asyncio.sleep(0.1)
+
+        assert [(d["step"], d["pct"]) for _, d in delivered] == [(1, 99), (2, 0)]
+        assert coalescer.stats()["coalesced"] == 99
+
+    @pytest.mark.asyncio
+    async def test_terminal_update_delivered_immediately(self):
+        delivered = []
+        coalescer = ProgressCoalescer(AsyncMock(side_effect=lambda u, d: delivered.append(d["status"])), interval=10)
+
+        await coalescer.add("u1", {"task": "t", "step": 1, "status": "running"})
+        await coalescer.add("u1", {"task": "t", "step": 1, "status": "completed"})
+
+        assert delivered == ["completed"]
+        await coalescer.close()
+        assert delivered == ["completed"]
+
+    @pytest.mark.asyncio
+    async def test_terminal_update_during_flush_is_not_overtaken(self):
+        delivered = []
+
+        async def deliver(user_id, data):
+            await asyncio.sleep(0)
+            delivered.append((user_id, data["task_id"], data["status"]))
+
+        coalescer = ProgressCoalescer(deliver, interval=10)
+        await coalescer.add("a", {"task_id": "t1", "step": 1, "status": "running"})
+        await coalescer.add("b", {"task_id": "t2", "step": 1, "status": "running"})
+
+        flush = asyncio.ensure_future(coalescer.flush())
+        await asyncio.sleep(0)
+        await coalescer.add("b", {"task_id": "t2", "step": 1, "status": "completed"})
+        await flush
+        await coalescer.close()
+
+        assert [d for d in delivered if d[0] == "b"] == [("b", "t2", "completed")]
+
+    @pytest.mark.asyncio
+    async def test_tasks_with_same_name_and_step_are_kept_apart(self):
+        deliver = AsyncMock()
+        coalescer = ProgressCoalescer(deliver, interval=10)
+
+        await coalescer.add("u1", {"task_id": "a", "task": "summarize", "step": 1, "status": "running"})
+        await coalescer.add("u1", {"task_id": "b", "task": "summarize", "step": 1, "status": "running"})
+        await coalescer.close()
+
+        assert [call.args[1]["task_id"] for call in deliver.await_args_list] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_zero_interval_passes_through(self):
+        deliver = AsyncMock()
+        coalescer = ProgressCoalescer(deliver, interval=0)
+        for _ in range(3):
+            await coalescer.add("u1", {"task": "t", "status": "running"})
+        assert deliver.await_count == 3
+
+
+class TestProgressRelay:
+    @pytest.mark.asyncio
+    async def test_worker_publish_reaches_connected_user(self):
+        channel = InMemoryProgressChannel()
+        relay = socket_server.ProgressRelay(channel, coalesce_seconds=0)
+        with patch.object(socket_server.sio, "emit", new=AsyncMock()) as emit, patch.dict(socket_server.connected_clients, {"u1": "sid-1"}, clear=True):
+            relay.start()
+            await _until_subscribed(channel)
+
+            worker = threading.Thread(target=channel.publish_sync, args=("u1", {"status": "running", "step": 1}))
+            worker.start()
+            worker.join()
+            channel.publish_sync("u2", {"status": "running"})
+            for _ in range(20):
+                await asyncio.sleep(0)
+            await relay.stop()
+
+        emit.assert_awaited_once_with("progress", {"status": "running", "step": 1}, to="sid-1")
+        assert channel.subscriber_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_push_progress_publishes_to_channel(self):
+        channel = MagicMock()
+        channel.publish = AsyncMock()
+        set_progress_channel(channel)
+
+        await socket_server.push_progress("u1", {"status": "running"})
+
+        channel.publish.assert_awaited_once_with("u1", {"status": "running"})
+
+    @pytest.mark.asyncio
+    async def test_relay_retries_after_subscription_failure(self):
+        class FlakyChannel(InMemoryProgressChannel):
+            attempts = 0
+
+            def listen(self):
+                FlakyChannel.attempts += 1
+                if FlakyChannel.attempts == 1:
+                    raise ConnectionError("redis down")
+                return super().listen()
+
+        real_sleep = asyncio.sleep
+
+        async def no_backoff(_delay):
+            await real_sleep(0)
+
+        channel = FlakyChannel()
+        relay = socket_server.ProgressRelay(channel, coalesce_seconds=0)
+        with patch.object(socket_server.asyncio, "sleep", new=no_backoff):
+            relay.start()
+            await _until_subscribed(channel)
+        assert FlakyChannel.attempts == 2
+        await relay.stop()
+
+
+class TestWorkerPublishes:
+    def test_execute_service_task_publishes_progress(self):
+        worker = pytest.importorskip("aiecs.tasks.worker")
+        published = []
+        service = MagicMock()
+        service.return_value.summarize.return_value = {"ok": True}
+
+        with patch.dict(worker._service_instances, clear=True), patch.object(worker, "get_ai_service", return_value=service), patch.object(
+            worker, "publish_progress", side_effect=lambda u, d: published.append((u, d["task_id"], d["status"]))
+        ):
+            result = worker._execute_service_task(None, "summarize", "u1", "t1", 0, "mode", "svc", {}, {})
+
+        assert result["status"] == "completed"
+        # task_id keeps concurrent runs of the same task and step apart when coalescing
+        assert published == [("u1", "t1", "running"), ("u1", "t1", "completed")]